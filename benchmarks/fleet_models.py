@@ -0,0 +1,127 @@
+"""Benchmark per-window models against shared fleet-level models.
+
+Trains the anomaly detector on simulated telemetry in both model scopes
+and compares model memory, total retrain time and detection quality (ROC
+AUC on held-out normal samples vs. samples with an injected fault).
+
+Usage:
+    python benchmarks/fleet_models.py --uavs 100 --samples 100
+"""
+
+import argparse
+import asyncio
+import pickle
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import numpy as np
+from loguru import logger
+from sklearn.metrics import roc_auc_score
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.agents.power_agent import PowerAgent
+from src.agents.propulsion_agent import PropulsionAgent
+from src.agents.navigation_agent import NavigationAgent
+from src.agents.communication_agent import CommunicationAgent
+from src.anomaly.anomaly_detector import AnomalyDetector
+from src.utils.config import config
+
+
+# Agent class and the fault used for the held-out anomalous samples
+SUBSYSTEMS = {
+    "Power": (PowerAgent, {"type": "voltage_drop", "drop_factor": 0.1}),
+    "Propulsion": (PropulsionAgent, {"type": "thrust_reduction", "reduction_factor": 0.15}),
+    "Navigation": (NavigationAgent, {"type": "compass_error", "error_angle": 45}),
+    "Communication": (CommunicationAgent, {"type": "interference", "interference_level": 0.5})
+}
+
+
+async def _train(scope: str, agents: List, samples: int) -> AnomalyDetector:
+    """Feed training telemetry; every model is fitted once its windows fill up."""
+    config.set("anomaly_detection.retraining.executor", "inline")
+    config.set("anomaly_detection.retraining.min_samples", samples)
+    config.set("anomaly_detection.window_size", samples)
+    config.set("anomaly_detection.model_scope", scope)
+    detector = AnomalyDetector()
+    
+    for _ in range(samples):
+        telemetry = [await agent.generate_telemetry() for agent in agents]
+        await asyncio.gather(*(detector.process_telemetry(t) for t in telemetry))
+    
+    # Retrains run as tasks; let the last ones finish
+    while detector._retrain_tasks:
+        await asyncio.sleep(0)
+    
+    assert len(detector.trained_windows) == len(agents)
+    return detector
+
+
+def _score(detector: AnomalyDetector, window_key: str, rows: np.ndarray) -> np.ndarray:
+    """Get raw anomaly scores (higher means more anomalous)."""
+    model = detector.models[detector.model_keys[window_key]]
+    return -model.decision_function(detector.scalers[window_key].transform(rows))
+
+
+async def _evaluate(detector: AnomalyDetector, agents: List, rounds: int) -> Dict[str, float]:
+    """Compute ROC AUC per subsystem on fresh normal and faulty samples."""
+    labels: Dict[str, List[int]] = {name: [] for name in SUBSYSTEMS}
+    scores: Dict[str, List[float]] = {name: [] for name in SUBSYSTEMS}
+    
+    for _ in range(rounds):
+        for agent in agents:
+            _, fault = SUBSYSTEMS[agent.subsystem_name]
+            window_key = f"{agent.uav_id}_{agent.subsystem_name}"
+            plan = detector.feature_compiler.plans[agent.subsystem_name]
+            
+            # Payloads may share the agent's state dicts, so copy before faulting
+            normal = plan.extract((await agent.generate_telemetry()).data)
+            telemetry = (await agent.generate_telemetry()).model_copy(deep=True)
+            faulty = plan.extract((await agent.apply_fault(telemetry, fault)).data)
+            rows = np.array([normal, faulty])
+            
+            labels[agent.subsystem_name] += [0, 1]
+            scores[agent.subsystem_name] += _score(detector, window_key, rows).tolist()
+    
+    return {name: roc_auc_score(labels[name], scores[name]) for name in SUBSYSTEMS}
+
+
+async def _run(scope: str, uavs: int, samples: int, seed: int) -> Tuple[int, int, float, Dict[str, float]]:
+    config.set("system.seed", seed)
+    agents = [
+        agent_class(f"UAV_{i:04d}")
+        for i in range(uavs)
+        for agent_class, _ in SUBSYSTEMS.values()
+    ]
+    
+    detector = await _train(scope, agents, samples)
+    stats = detector.get_statistics()
+    memory = len(pickle.dumps((detector.models, detector.scalers)))
+    quality = await _evaluate(detector, agents, rounds=5)
+    await detector.stop()
+    
+    return stats["model_retrains"], memory, stats["retrain_time_total"], quality
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--uavs", type=int, default=100, help="Number of simulated UAVs")
+    parser.add_argument("--samples", type=int, default=100, help="Training samples per UAV and subsystem")
+    parser.add_argument("--seed", type=int, default=7, help="Simulation seed")
+    args = parser.parse_args()
+    
+    logger.remove()
+    
+    print(f"{args.uavs} UAVs x {len(SUBSYSTEMS)} subsystems, {args.samples} training samples each")
+    print(f"{'scope':<8} {'retrains':>8} {'memory':>10} {'retrain':>9}  " +
+          "  ".join(f"{name[:8]:>8}" for name in SUBSYSTEMS))
+    
+    for scope in ("window", "fleet"):
+        retrains, memory, retrain_time, quality = asyncio.run(_run(scope, args.uavs, args.samples, args.seed))
+        print(f"{scope:<8} {retrains:>8} {memory / 2**20:>8.1f}MB {retrain_time:>8.2f}s  " +
+              "  ".join(f"{quality[name]:>8.3f}" for name in SUBSYSTEMS))
+
+
+if __name__ == "__main__":
+    main()
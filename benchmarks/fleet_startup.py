@@ -0,0 +1,78 @@
+"""Benchmark spinning a fleet up and down, one UAV at a time vs. in bulk.
+
+Times adding every UAV, starting the manager, stopping it and removing
+every UAV, once through add_uav/remove_uav per UAV and once through the
+bulk add_uavs/remove_uavs calls. Logging goes to a null sink at INFO level,
+so the cost of formatting log records is included.
+
+Usage:
+    python benchmarks/fleet_startup.py --uavs 1000
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+from loguru import logger
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.agents.telemetry_manager import TelemetryManager
+
+
+async def _run(bulk: bool, uav_ids: List[str]) -> Dict[str, float]:
+    manager = TelemetryManager()
+    timings = {}
+    
+    started = time.perf_counter()
+    if bulk:
+        await manager.add_uavs(uav_ids)
+    else:
+        for uav_id in uav_ids:
+            await manager.add_uav(uav_id)
+    timings["add"] = time.perf_counter() - started
+    
+    started = time.perf_counter()
+    await manager.start()
+    timings["start"] = time.perf_counter() - started
+    
+    started = time.perf_counter()
+    await manager.stop()
+    timings["stop"] = time.perf_counter() - started
+    
+    started = time.perf_counter()
+    if bulk:
+        await manager.remove_uavs(uav_ids)
+    else:
+        for uav_id in uav_ids:
+            await manager.remove_uav(uav_id)
+    timings["remove"] = time.perf_counter() - started
+    
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--uavs", type=int, default=1000, help="Number of simulated UAVs")
+    args = parser.parse_args()
+    
+    logger.remove()
+    logger.add(open(os.devnull, "w"), level="INFO")
+    
+    uav_ids = [f"UAV_{i:04d}" for i in range(args.uavs)]
+    print(f"{args.uavs} UAVs")
+    print(f"{'mode':<10} {'add':>8} {'start':>8} {'stop':>8} {'remove':>8} {'total':>8}")
+    
+    for bulk in (False, True):
+        timings = asyncio.run(_run(bulk, uav_ids))
+        print(f"{'bulk' if bulk else 'per-UAV':<10} " +
+              " ".join(f"{timings[phase]:>7.3f}s" for phase in ("add", "start", "stop", "remove")) +
+              f" {sum(timings.values()):>7.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Benchmark grid-indexed geofence checks against scanning every zone.
+
+Scatters circular and hexagonal no-fly zones over the area NavigationAgent
+flies in (0.2 degrees around Los Angeles) and, per zone count, times
+compiling the grid, one vectorized fleet check through the grid and the
+same check done by scanning every zone for every UAV (NumPy over zones),
+which is how per-UAV constraint checks scale without an index.
+
+Usage:
+    python benchmarks/geofence.py --zones 1000 10000 50000 --uavs 1000 --cell-size 250
+"""
+
+import argparse
+import math
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+from loguru import logger
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.agents.geofence import GeofenceEngine
+from src.agents.spatial_index import METERS_PER_DEGREE
+
+
+def _build(zones: int, cell_size: float, rng: np.random.Generator) -> GeofenceEngine:
+    engine = GeofenceEngine(cell_size=cell_size)
+    latitude = 34.0522 + rng.uniform(-0.1, 0.1, zones)
+    longitude = -118.2437 + rng.uniform(-0.1, 0.1, zones)
+    radius = rng.uniform(20, 200, zones)
+    angles = np.linspace(0, 2 * math.pi, 6, endpoint=False)
+    for zone in range(zones):
+        if zone % 2:
+            engine.add_circle(latitude[zone], longitude[zone], radius[zone])
+        else:
+            size = radius[zone] / METERS_PER_DEGREE
+            engine.add_polygon(np.column_stack([latitude[zone] + size * np.sin(angles),
+                                                longitude[zone] + size * np.cos(angles)]))
+    return engine
+
+
+def _linear_scan(engine: GeofenceEngine, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """Containment of every point, testing each point against every zone."""
+    inside = np.zeros(len(x), dtype=bool)
+    center, radius = engine._circle_xy, engine._circle_radius
+    start, end = engine._edge_start, engine._edge_end
+    for point in range(len(x)):
+        in_circle = np.hypot(x[point] - center[:, 0], y[point] - center[:, 1]) < radius
+        straddles = (start[:, 1] > y[point]) != (end[:, 1] > y[point])
+        with np.errstate(divide="ignore", invalid="ignore"):
+            crossing = straddles & (x[point] < start[:, 0] + (y[point] - start[:, 1])
+                                    * (end[:, 0] - start[:, 0]) / (end[:, 1] - start[:, 1]))
+        in_polygon = np.add.reduceat(crossing.astype(np.intp), engine._vertex_start[:-1]) % 2 == 1
+        inside[point] = in_circle.any() or in_polygon.any()
+    return inside
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--zones", type=int, nargs="+", default=[1000, 10000, 50000], help="Zone counts")
+    parser.add_argument("--uavs", type=int, default=1000, help="Fleet size")
+    parser.add_argument("--cell-size", type=float, default=250.0,
+                        help="Grid cell size (distance horizon) in meters")
+    parser.add_argument("--repeat", type=int, default=10, help="Repetitions per grid check")
+    args = parser.parse_args()
+    
+    logger.remove()
+    rng = np.random.default_rng(7)
+    latitude = 34.0522 + rng.uniform(-0.1, 0.1, args.uavs)
+    longitude = -118.2437 + rng.uniform(-0.1, 0.1, args.uavs)
+    
+    print(f"{args.uavs:,} UAVs per fleet check")
+    print(f"{'zones':>7} {'compile':>10} {'grid check':>11} {'linear scan':>12} {'speedup':>8} "
+          f"{'pairs/uav':>10} {'inside':>7}")
+    for zones in args.zones:
+        engine = _build(zones, args.cell_size, rng)
+        started = time.perf_counter()
+        engine.compile()
+        compile_time = time.perf_counter() - started
+        
+        started = time.perf_counter()
+        for _ in range(args.repeat):
+            result = engine.evaluate(latitude, longitude)
+        grid = (time.perf_counter() - started) / args.repeat
+        
+        x, y = engine._project(latitude, longitude)
+        started = time.perf_counter()
+        inside = _linear_scan(engine, x, y)
+        scan = time.perf_counter() - started
+        assert np.array_equal(inside, result["inside"])
+        
+        pairs = engine.stats["pairs_checked"] / args.repeat / args.uavs
+        print(f"{zones:>7,} {compile_time * 1e3:>8.1f}ms {grid * 1e3:>9.2f}ms {scan * 1e3:>10.1f}ms "
+              f"{scan / grid:>7.0f}x {pairs:>10.1f} {int(inside.sum()):>7}")
+
+
+if __name__ == "__main__":
+    main()
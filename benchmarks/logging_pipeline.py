@@ -0,0 +1,76 @@
+"""Benchmark synchronous telemetry logging against the batched JSON-lines writer.
+
+Calls UAVLogger.log_telemetry the way the simulator does for every
+sample, with the console going to /dev/null, and reports the time spent
+in the caller (the event loop, in the simulator) and until every line is
+on disk: with synchronous loguru handlers, with the asynchronous
+JSON-lines writer, and with the writer plus 1-in-N telemetry sampling.
+
+Usage:
+    python benchmarks/logging_pipeline.py --lines 100000 --sample 100
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from loguru import logger
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.monitoring.logger import UAVLogger
+from src.utils.config import config
+
+
+def _run(directory: Path, lines: int, asynchronous: bool, sample: int):
+    config.set("monitoring.log_file", str(directory / "uav_simulator.log"))
+    config.set("monitoring.logging.async", asynchronous)
+    config.set("monitoring.logging.sampling", {"telemetry": sample})
+    uav_logger = UAVLogger()
+    
+    started = time.perf_counter()
+    for index in range(lines):
+        uav_logger.log_telemetry(f"UAV_{index % 50:03d}", "Power", {})
+    caller = time.perf_counter() - started
+    uav_logger.flush()
+    total = time.perf_counter() - started
+    
+    stats = uav_logger.get_log_statistics()
+    logger.remove()
+    if uav_logger.writer is not None:
+        uav_logger.writer.close()
+    return caller, total, stats["log_file_size"], stats.get("writer", {}).get("dropped", 0)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lines", type=int, default=100000, help="Telemetry lines to log")
+    parser.add_argument("--sample", type=int, default=100, help="Keep 1 in N telemetry lines when sampling")
+    args = parser.parse_args()
+    
+    logger.remove()
+    rows = []
+    stdout = sys.stdout
+    with open(os.devnull, "w") as console:
+        sys.stdout = console
+        try:
+            for name, asynchronous, sample in (("sync loguru handlers", False, 1),
+                                               ("async json lines", True, 1),
+                                               (f"async + 1/{args.sample} sampling", True, args.sample)):
+                with tempfile.TemporaryDirectory() as directory:
+                    rows.append((name, *_run(Path(directory), args.lines, asynchronous, sample)))
+        finally:
+            sys.stdout = stdout
+    
+    print(f"{args.lines:,} log_telemetry calls")
+    print(f"{'pipeline':<28} {'caller':>9} {'per call':>10} {'on disk':>9} {'size':>9} {'dropped':>8}")
+    for name, caller, total, size, dropped in rows:
+        print(f"{name:<28} {caller:>8.2f}s {caller / args.lines * 1e6:>8.2f}us {total:>8.2f}s "
+              f"{size / 2**20:>7.1f}MB {dropped:>8,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Benchmark the fleet flight physics step against per-UAV stepping.
+
+Times one FlightPhysics step for the whole fleet (autopilot, motors,
+airframe and battery for every row at once) against stepping the same
+physics one UAV at a time, which is what coupling the subsystems inside
+each agent would cost. The 50 Hz column is the share of a 20 ms tick the
+fleet step takes.
+
+Usage:
+    python benchmarks/physics.py --uavs 100 1000 10000
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+from loguru import logger
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.agents.physics import FlightPhysics
+
+
+def _fleet(n: int, seed: int) -> FlightPhysics:
+    physics = FlightPhysics(seed=seed)
+    for i in range(n):
+        physics.add(f"UAV_{i:05d}")
+    return physics
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--uavs", type=int, nargs="+", default=[100, 1000, 10000], help="Fleet sizes")
+    parser.add_argument("--repeat", type=int, default=50, help="Fleet steps per fleet size")
+    parser.add_argument("--rate", type=float, default=50.0, help="Physics rate in Hz")
+    args = parser.parse_args()
+    
+    logger.remove()
+    dt = 1.0 / args.rate
+    
+    print(f"{'uavs':>6} {'fleet step':>11} {f'{args.rate:g} Hz':>7} {'per UAV':>10} {'speedup':>8}")
+    for n in args.uavs:
+        physics = _fleet(n, seed=5)
+        started = time.perf_counter()
+        for _ in range(args.repeat):
+            physics.step(dt)
+        fleet = (time.perf_counter() - started) / args.repeat
+        
+        # One single-row physics per UAV
+        sample = min(n, 200)
+        singles = [_fleet(1, seed=i) for i in range(sample)]
+        started = time.perf_counter()
+        for single in singles:
+            single.step(dt)
+        per_uav = (time.perf_counter() - started) / sample * n
+        
+        print(f"{n:>6} {fleet * 1e3:>9.2f}ms {fleet * args.rate:>6.1%} {per_uav * 1e3:>8.1f}ms "
+              f"{per_uav / fleet:>7.0f}x")
+
+
+if __name__ == "__main__":
+    main()
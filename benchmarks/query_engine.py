@@ -0,0 +1,101 @@
+"""Benchmark recorded telemetry queries against scanning in-memory lists.
+
+Records a long synthetic Propulsion run, then answers "max motor
+temperature per UAV in the 5 minutes before each fault" twice: by
+scanning a list of report-style dicts, the way ReportGenerator kept
+telemetry, and through the query engine with time-range and UAV pushdown.
+Also reports a full-recording downsample as used by the dashboard charts.
+
+Usage:
+    python benchmarks/query_engine.py --uavs 20 --hours 2 --faults 20
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from loguru import logger
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.monitoring.telemetry_recorder import TelemetryRecorder
+from src.storage.query_engine import TelemetryQueryEngine
+from src.utils.models import TelemetryRecord
+
+
+FIELD = "motors.motor_1.temperature"
+WINDOW = timedelta(minutes=5)
+
+
+def _records(uavs: int, hours: float, rate: float):
+    start = datetime(2024, 1, 1)
+    rng = random.Random(7)
+    for step in range(int(hours * 3600 * rate)):
+        timestamp = start + timedelta(seconds=step / rate)
+        for uav in range(uavs):
+            motors = {f"motor_{i}": {"temperature": 40 + rng.random() * 30, "rpm": 5000.0} for i in range(1, 5)}
+            yield TelemetryRecord("Propulsion", f"UAV_{uav:03d}", {"motors": motors}, timestamp=timestamp)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--uavs", type=int, default=20, help="Number of UAVs")
+    parser.add_argument("--hours", type=float, default=2.0, help="Recorded hours")
+    parser.add_argument("--rate", type=float, default=2.0, help="Samples per UAV per second")
+    parser.add_argument("--faults", type=int, default=20, help="Faults to look back from")
+    args = parser.parse_args()
+    
+    logger.remove()
+    with tempfile.TemporaryDirectory() as directory:
+        recorder = TelemetryRecorder(directory)
+        points = []
+        for record in _records(args.uavs, args.hours, args.rate):
+            recorder.append(record)
+            points.append({"timestamp": record.timestamp.isoformat(), "uav_id": record.uav_id,
+                           "subsystem": record.subsystem, "data": record.data})
+        recorder.close()
+        
+        rng = random.Random(11)
+        begin = datetime(2024, 1, 1) + WINDOW
+        faults = [(f"UAV_{rng.randrange(args.uavs):03d}",
+                   begin + timedelta(seconds=rng.random() * (args.hours * 3600 - WINDOW.total_seconds())))
+                  for _ in range(args.faults)]
+        
+        started = time.perf_counter()
+        scanned = []
+        for uav_id, injected in faults:
+            low, high = (injected - WINDOW).isoformat(), injected.isoformat()
+            scanned.append(max(point["data"]["motors"]["motor_1"]["temperature"] for point in points
+                               if point["uav_id"] == uav_id and low <= point["timestamp"] <= high))
+        list_time = time.perf_counter() - started
+        
+        engine = TelemetryQueryEngine(directory)
+        started = time.perf_counter()
+        queried = [
+            engine.aggregate([FIELD], ["max"], by=[], subsystems=["Propulsion"], uav_ids=[uav_id],
+                             start=injected - WINDOW, end=injected)[f"{FIELD}_max"][0]
+            for uav_id, injected in faults
+        ]
+        query_time = time.perf_counter() - started
+        assert scanned == queried
+        
+        started = time.perf_counter()
+        series = engine.downsample(FIELD, 1000)
+        downsample_time = time.perf_counter() - started
+        
+        stats = engine.get_statistics()
+    
+    print(f"{len(points):,} records in {stats['chunks']} chunks, {args.faults} pre-fault windows")
+    print(f"{'query':<32} {'time':>10} {'per query':>10}")
+    print(f"{'list scan (pre-fault max)':<32} {list_time:>9.3f}s {list_time / args.faults * 1e3:>8.2f}ms")
+    print(f"{'query engine (pre-fault max)':<32} {query_time:>9.3f}s {query_time / args.faults * 1e3:>8.2f}ms")
+    print(f"{'downsample to 1000 x UAV':<32} {downsample_time:>9.3f}s {len(series['rows']):>8} buckets")
+    print(f"chunks skipped {stats['chunks_skipped']:,}, scanned {stats['chunks_scanned']:,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Benchmark fleet route tracking against per-UAV full-route scans.
+
+Gives every UAV a lawnmower survey route and places it part way along
+it, then times one RouteEngine update (windowed leg search for the whole
+fleet plus the binary-search waypoint lookup) against locating each UAV
+by scanning every leg of its route with NumPy, one UAV at a time. The
+25 Hz column is the share of a 40 ms tick the update takes.
+
+Usage:
+    python benchmarks/route_engine.py --uavs 100 1000 --waypoints 100 1000 5000
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+from loguru import logger
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.agents.route_engine import RouteEngine, EARTH_RADIUS, _angular_distance, _bearing
+
+
+def _survey(n: int, offset: float):
+    return [{"lat": 34.0 + offset + 0.0005 * (i // 2), "lon": -118.2 + 0.01 * ((i + 1) // 2 % 2)}
+            for i in range(n)]
+
+
+def _full_scan(routes, latitude: np.ndarray, longitude: np.ndarray) -> np.ndarray:
+    """Along-track distance of each UAV from a scan of every leg of its route."""
+    along_track = np.empty(len(routes))
+    for row, points in enumerate(routes):
+        lat1, lon1, lat2, lon2 = points[:-1, 0], points[:-1, 1], points[1:, 0], points[1:, 1]
+        lat, lon = latitude[row], longitude[row]
+        length = _angular_distance(lat1, lon1, lat2, lon2)
+        distance = _angular_distance(lat1, lon1, lat, lon)
+        angle = _bearing(lat1, lon1, lat, lon) - _bearing(lat1, lon1, lat2, lon2)
+        cross = np.abs(np.arcsin(np.sin(distance) * np.sin(angle)))
+        along = np.arctan2(np.sin(distance) * np.cos(angle), np.cos(distance))
+        gap = np.where(along < 0, distance, np.where(along > length, _angular_distance(lat2, lon2, lat, lon), cross))
+        leg = int(np.argmin(gap))
+        along_track[row] = (length[:leg].sum() + np.clip(along[leg], 0, length[leg])) * EARTH_RADIUS
+    return along_track
+
+
+def _timed(function, repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter() - started) / repeat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--uavs", type=int, nargs="+", default=[100, 1000], help="Fleet sizes")
+    parser.add_argument("--waypoints", type=int, nargs="+", default=[100, 1000, 5000], help="Waypoints per route")
+    parser.add_argument("--repeat", type=int, default=20, help="Repetitions per engine update")
+    args = parser.parse_args()
+    
+    logger.remove()
+    rng = np.random.default_rng(9)
+    print(f"{'uavs':>6} {'waypoints':>10} {'compile':>9} {'update':>9} {'25 Hz':>7} {'full scan':>11} {'speedup':>8}")
+    for n in args.uavs:
+        for waypoints in args.waypoints:
+            uav_ids = [f"UAV_{i:05d}" for i in range(n)]
+            routes = [_survey(waypoints, 0.001 * i) for i in range(n)]
+            engine = RouteEngine(window=4)
+            legs = rng.integers(0, waypoints - 1, n)
+            for uav_id, route, leg in zip(uav_ids, routes, legs):
+                engine.set_route(uav_id, route, current_leg=int(leg))
+            started = time.perf_counter()
+            engine.compile()
+            compile_time = time.perf_counter() - started
+            
+            # Each UAV a little way along its current leg
+            latitude = np.array([route[leg]["lat"] + 0.3 * (route[leg + 1]["lat"] - route[leg]["lat"])
+                                 for route, leg in zip(routes, legs)])
+            longitude = np.array([route[leg]["lon"] + 0.3 * (route[leg + 1]["lon"] - route[leg]["lon"])
+                                  for route, leg in zip(routes, legs)])
+            update = _timed(lambda: engine.update(uav_ids, latitude, longitude), args.repeat)
+            
+            points = [np.radians([[wp["lat"], wp["lon"]] for wp in route]) for route in routes]
+            scan = _timed(lambda: _full_scan(points, np.radians(latitude), np.radians(longitude)), 1)
+            expected = _full_scan(points, np.radians(latitude), np.radians(longitude))
+            assert np.allclose(engine._along, expected, atol=1e-3)
+            
+            print(f"{n:>6} {waypoints:>10,} {compile_time * 1e3:>7.1f}ms {update * 1e3:>7.2f}ms "
+                  f"{update / 0.04:>6.1%} {scan * 1e3:>9.1f}ms {scan / update:>7.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Benchmark the batched sensor fusion EKF against per-agent filters.
+
+Times one SensorFusionFleetModel step (sensor simulation plus one batched
+IMU predict and one batched GPS/barometer/magnetometer update for every
+row) against stepping the same model one UAV at a time on its scalar
+path, which is what a filter per agent costs. The 30 Hz column is the share of a 33 ms tick the
+batched step takes.
+
+Usage:
+    python benchmarks/sensor_fusion.py --uavs 100 1000 5000
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+from loguru import logger
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.agents.fleet_engine import SensorFusionFleetModel
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--uavs", type=int, nargs="+", default=[100, 1000, 5000], help="Fleet sizes")
+    parser.add_argument("--repeat", type=int, default=30, help="Batched steps per fleet size")
+    parser.add_argument("--rate", type=float, default=30.0, help="Telemetry rate in Hz")
+    args = parser.parse_args()
+    
+    logger.remove()
+    model = SensorFusionFleetModel()
+    rng = np.random.default_rng(11)
+    dt = 1.0 / args.rate
+    
+    print(f"{'uavs':>6} {'batched':>9} {f'{args.rate:g} Hz':>7} {'per agent':>11} {'speedup':>8} {'converged':>10}")
+    for n in args.uavs:
+        state = np.zeros(n, dtype=model.dtype)
+        model.initialize(state, rng)
+        
+        started = time.perf_counter()
+        for _ in range(args.repeat):
+            model.step(state, dt, rng)
+        batched = (time.perf_counter() - started) / args.repeat
+        
+        # One filter per UAV: same model, one row at a time
+        sample = min(n, 200)
+        scalar_rng = random.Random(11)
+        rows = [model.initialize_one(scalar_rng) for _ in range(sample)]
+        started = time.perf_counter()
+        for row in rows:
+            model.step_one(row, dt, scalar_rng)
+        per_agent = (time.perf_counter() - started) / sample * n
+        
+        converged = np.mean([model.to_dict(row)["sensor_health"]["kalman_filter_converged"] for row in state])
+        print(f"{n:>6} {batched * 1e3:>7.2f}ms {batched * args.rate:>6.1%} {per_agent * 1e3:>9.1f}ms "
+              f"{per_agent / batched:>7.0f}x {converged:>9.0%}")
+
+
+if __name__ == "__main__":
+    main()
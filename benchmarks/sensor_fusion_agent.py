@@ -0,0 +1,66 @@
+"""Benchmark standalone SensorFusionAgent telemetry against the CPU budget.
+
+Times one telemetry sample of an agent outside any fleet group (sensor
+simulation, EKF predict/update and payload) on its scalar filter path and
+on a one-row NumPy state, which is what stepping the batched fleet model
+for a single UAV costs. The last column is how many agents at the
+telemetry rate fit on one core.
+
+Usage:
+    python benchmarks/sensor_fusion_agent.py --samples 3000 --rate 30
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+from loguru import logger
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.agents.fleet_engine import SensorFusionFleetModel
+from src.agents.sensor_fusion_agent import SensorFusionAgent
+
+
+async def _scalar(samples: int) -> float:
+    agent = SensorFusionAgent("UAV_00000")
+    started = time.perf_counter()
+    for _ in range(samples):
+        await agent.generate_telemetry()
+    return (time.perf_counter() - started) / samples
+
+
+def _one_row(samples: int, dt: float) -> float:
+    model = SensorFusionFleetModel()
+    rng = np.random.default_rng(11)
+    state = np.zeros(1, dtype=model.dtype)
+    model.initialize(state, rng)
+    started = time.perf_counter()
+    for _ in range(samples):
+        model.step(state, dt, rng)
+        model.to_dict(state[0])
+    return (time.perf_counter() - started) / samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--samples", type=int, default=3000, help="Samples per path")
+    parser.add_argument("--rate", type=float, default=30.0, help="Telemetry rate in Hz")
+    args = parser.parse_args()
+    
+    logger.remove()
+    results = [
+        ("scalar filter", asyncio.run(_scalar(args.samples))),
+        ("one-row arrays", _one_row(args.samples, 1.0 / args.rate))
+    ]
+    
+    print(f"{'path':<15} {'per sample':>11} {'UAVs per core':>14}")
+    for name, elapsed in results:
+        print(f"{name:<15} {elapsed * 1e6:>9.0f}us {1.0 / (elapsed * args.rate):>14.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Benchmark fleet throughput with the fleet sharded across worker processes.
+
+Runs the same fleet with an increasing number of shards, with the
+simulation sped up far enough that the shards are CPU-bound, and reports
+how many scored telemetry samples reach the coordinator per wall-clock
+second. On a host with enough idle cores throughput grows roughly
+linearly with the shard count until it reaches the simulated rate.
+
+Usage:
+    python benchmarks/sharding.py --uavs 200 --speed 50 --shards 1 2 4
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Dict
+
+from loguru import logger
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.agents.sharding import ShardedFleet
+from src.utils.config import config
+
+
+SUBSYSTEMS = ["Power", "Propulsion", "Navigation", "Communication"]
+
+
+async def _run(shards: int, uavs: int, duration: float) -> Dict[str, float]:
+    fleet = ShardedFleet(shards=shards)
+    received = 0
+    
+    async def count(telemetry_data) -> None:
+        nonlocal received
+        received += 1
+    
+    fleet.register_telemetry_callback(count)
+    await fleet.start()
+    await fleet.add_uavs([f"UAV_{i:04d}" for i in range(uavs)], SUBSYSTEMS)
+    
+    # Skip the warm-up, then count a fixed window
+    await asyncio.sleep(1.0)
+    before, started = received, time.perf_counter()
+    await asyncio.sleep(duration)
+    elapsed = time.perf_counter() - started
+    delivered = received - before
+    
+    await fleet.refresh_status()
+    scheduler = fleet.get_scheduler_statistics()
+    await fleet.stop()
+    
+    return {
+        "throughput": delivered / elapsed,
+        "late": scheduler.get("late_dispatches", 0) / max(scheduler.get("agents_dispatched", 0), 1)
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--uavs", type=int, default=200, help="Number of simulated UAVs")
+    parser.add_argument("--speed", type=float, default=50.0, help="Simulation speed multiplier")
+    parser.add_argument("--duration", type=float, default=5.0, help="Measured wall-clock seconds per run")
+    parser.add_argument("--shards", type=int, nargs="+", default=[1, 2, 4], help="Shard counts to compare")
+    args = parser.parse_args()
+    
+    logger.remove()
+    config.set("system.simulation_speed", args.speed)
+    config.set("monitoring.log_level", "ERROR")
+    
+    rate = sum(config.get_subsystem(name).get("telemetry_rate", 10.0) for name in SUBSYSTEMS)
+    print(f"{args.uavs} UAVs x {len(SUBSYSTEMS)} subsystems at {args.speed:g}x, "
+          f"{os.cpu_count()} CPU(s), simulated rate {args.uavs * rate * args.speed:,.0f} samples/s")
+    print(f"{'shards':>6} {'samples/s':>12} {'speedup':>8} {'late':>7}")
+    
+    baseline = None
+    for shards in args.shards:
+        result = asyncio.run(_run(shards, args.uavs, args.duration))
+        baseline = baseline or result["throughput"]
+        print(f"{shards:>6} {result['throughput']:>12,.0f} {result['throughput'] / baseline:>7.2f}x "
+              f"{result['late']:>6.1%}")
+
+
+if __name__ == "__main__":
+    main()
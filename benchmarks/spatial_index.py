@@ -0,0 +1,79 @@
+"""Benchmark the fleet spatial index against all-pairs proximity checks.
+
+Scatters UAVs the way NavigationAgent does (0.2 degrees around Los
+Angeles, 100-500 m altitude) and compares, per fleet size, an all-pairs
+NumPy nearest-neighbor search with one spatial index rebuild (which
+resolves every UAV's nearest neighbor), then times the per-UAV
+nearest() lookups made by collision avoidance and radius queries.
+
+Usage:
+    python benchmarks/spatial_index.py --uavs 250 1000 4000 --radius 500
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+from loguru import logger
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.agents.spatial_index import FleetSpatialIndex
+
+
+def _all_pairs(xyz: np.ndarray) -> np.ndarray:
+    """Nearest neighbor of every point by computing every distance."""
+    squared = (xyz ** 2).sum(axis=1)
+    distances = squared[:, None] + squared[None, :] - 2 * xyz @ xyz.T
+    np.fill_diagonal(distances, np.inf)
+    return np.argmin(distances, axis=1)
+
+
+def _timed(function, repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter() - started) / repeat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--uavs", type=int, nargs="+", default=[250, 1000, 4000], help="Fleet sizes")
+    parser.add_argument("--radius", type=float, default=500.0, help="Cell size / search radius in meters")
+    parser.add_argument("--repeat", type=int, default=20, help="Repetitions per measurement")
+    args = parser.parse_args()
+    
+    logger.remove()
+    rng = np.random.default_rng(5)
+    print(f"{'uavs':>6} {'all-pairs':>11} {'index build':>12} {'nearest()':>10} {'within()':>10} {'pairs/uav':>10}")
+    for n in args.uavs:
+        uav_ids = [f"UAV_{i:05d}" for i in range(n)]
+        latitude = 34.0522 + rng.uniform(-0.1, 0.1, n)
+        longitude = -118.2437 + rng.uniform(-0.1, 0.1, n)
+        altitude = rng.uniform(100, 500, n)
+        heading = rng.uniform(0, 360, n)
+        
+        index = FleetSpatialIndex(cell_size=args.radius)
+        build = _timed(lambda: index.update(uav_ids, latitude, longitude, altitude, heading), args.repeat)
+        brute = _timed(lambda: _all_pairs(index._xyz), max(1, args.repeat // 4))
+        
+        # The index only resolves neighbors within the radius
+        nearest = _all_pairs(index._xyz)
+        for row in range(n):
+            found = index.nearest(uav_ids[row])
+            if found["uav_id"] is not None:
+                assert found["uav_id"] == uav_ids[nearest[row]]
+        
+        lookup = _timed(lambda: [index.nearest(uav_id) for uav_id in uav_ids], 1) / n
+        queries = uav_ids[:200]
+        within = _timed(lambda: [index.within(uav_id, args.radius) for uav_id in queries], 1) / len(queries)
+        pairs = index.stats["pairs_checked"] / index.stats["updates"] / n
+        
+        print(f"{n:>6} {brute * 1e3:>9.2f}ms {build * 1e3:>10.2f}ms {lookup * 1e6:>8.2f}us "
+              f"{within * 1e6:>8.1f}us {pairs:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Microbenchmark constructing and dispatching telemetry samples.
+
+Compares the validated Pydantic TelemetryData model against the slotted
+TelemetryRecord used on the hot path: first constructing samples around a
+realistic Power payload, then constructing them and sending them from an
+agent through the telemetry manager and bus to a no-op consumer.
+
+Usage:
+    python benchmarks/telemetry_record.py --samples 100000
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+from typing import Dict
+
+from loguru import logger
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.agents.power_agent import PowerAgent
+from src.agents.telemetry_manager import TelemetryManager
+from src.utils.models import TelemetryData, TelemetryRecord
+
+
+RECORD_TYPES = {"TelemetryData": TelemetryData, "TelemetryRecord": TelemetryRecord}
+
+
+async def _run(samples: int) -> Dict[str, Dict[str, float]]:
+    manager = TelemetryManager(use_scheduler=False, use_bus=True)
+    
+    async def consume(telemetry) -> None:
+        pass
+    
+    manager.register_telemetry_callback(consume, name="noop", queue_size=samples)
+    await manager.add_uav("UAV_0001", ["Power"])
+    agent: PowerAgent = manager.uavs["UAV_0001"]["Power"]
+    payload = (await agent.generate_telemetry()).data
+    await manager.bus.start()
+    
+    results: Dict[str, Dict[str, float]] = {}
+    for name, record_type in RECORD_TYPES.items():
+        started = time.perf_counter()
+        for _ in range(samples):
+            record_type(subsystem="Power", uav_id="UAV_0001", data=payload, status=agent.status)
+        construct = time.perf_counter() - started
+        
+        started = time.perf_counter()
+        for _ in range(samples):
+            await agent._send_telemetry(
+                record_type(subsystem="Power", uav_id="UAV_0001", data=payload, status=agent.status)
+            )
+        dispatch = time.perf_counter() - started
+        
+        # Let the consumer drain before the next run
+        await manager.bus.stop()
+        await manager.bus.start()
+        
+        results[name] = {"construct_us": construct / samples * 1e6, "dispatch_us": dispatch / samples * 1e6}
+    
+    await manager.bus.stop()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--samples", type=int, default=100000, help="Samples per measurement")
+    args = parser.parse_args()
+    
+    logger.remove()
+    results = asyncio.run(_run(args.samples))
+    
+    print(f"{args.samples} samples, Power payload")
+    print(f"{'type':<16} {'construct':>12} {'construct+dispatch':>20}")
+    for name, timings in results.items():
+        print(f"{name:<16} {timings['construct_us']:>10.2f}us {timings['dispatch_us']:>18.2f}us")
+    
+    baseline, fast = results["TelemetryData"], results["TelemetryRecord"]
+    print(f"speedup          {baseline['construct_us'] / fast['construct_us']:>11.1f}x "
+          f"{baseline['dispatch_us'] / fast['dispatch_us']:>19.1f}x")
+
+
+if __name__ == "__main__":
+    main()
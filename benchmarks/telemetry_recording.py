@@ -0,0 +1,85 @@
+"""Benchmark recording telemetry to columnar chunks and replaying it.
+
+Records simulated telemetry from every subsystem, then reports the
+recording throughput and size on disk (against the same samples as JSON
+lines), how fast replay rebuilds full records, and how fast a single
+numeric field is read straight from the memory-mapped columns.
+
+Usage:
+    python benchmarks/telemetry_recording.py --samples 50000
+"""
+
+import argparse
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from loguru import logger
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.agents.agent_factory import AgentFactory
+from src.monitoring.telemetry_recorder import TelemetryRecorder, TelemetryReplay
+
+
+async def _samples(count: int):
+    agents = [AgentFactory.create_agent("UAV_001", name) for name in AgentFactory.AGENT_CLASSES]
+    return [await agents[i % len(agents)].generate_telemetry() for i in range(count)]
+
+
+def _size(directory: Path) -> int:
+    return sum(path.stat().st_size for path in directory.rglob("*") if path.is_file())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--samples", type=int, default=50000, help="Telemetry samples to record")
+    parser.add_argument("--chunk-rows", type=int, default=4096, help="Records per chunk")
+    args = parser.parse_args()
+    
+    logger.remove()
+    samples = asyncio.run(_samples(args.samples))
+    
+    with tempfile.TemporaryDirectory() as directory:
+        root = Path(directory)
+        
+        started = time.perf_counter()
+        with open(root / "telemetry.jsonl", "w") as handle:
+            for record in samples:
+                handle.write(record.model_dump_json() + "\n")
+        json_time = time.perf_counter() - started
+        json_size = (root / "telemetry.jsonl").stat().st_size
+        
+        started = time.perf_counter()
+        recorder = TelemetryRecorder(root / "recording", chunk_rows=args.chunk_rows)
+        for record in samples:
+            recorder.append(record)
+        append_time = time.perf_counter() - started
+        recorder.close()
+        record_time = time.perf_counter() - started
+        record_size = _size(root / "recording")
+        
+        replay = TelemetryReplay(root / "recording")
+        started = time.perf_counter()
+        replayed = sum(1 for _ in replay.records())
+        replay_time = time.perf_counter() - started
+        
+        started = time.perf_counter()
+        voltage = replay.columns("Power", ["battery.voltage"])["battery.voltage"]
+        column_time = time.perf_counter() - started
+    
+    print(f"{args.samples} samples, {len(replay.chunks)} chunks of up to {args.chunk_rows} rows")
+    print(f"{'operation':<28} {'time':>9} {'samples/s':>12} {'size':>10}")
+    print(f"{'json lines write':<28} {json_time:>8.2f}s {args.samples / json_time:>12,.0f} "
+          f"{json_size / 2**20:>8.1f}MB")
+    print(f"{'recorder append (caller)':<28} {append_time:>8.2f}s {args.samples / append_time:>12,.0f}")
+    print(f"{'recorder write (total)':<28} {record_time:>8.2f}s {args.samples / record_time:>12,.0f} "
+          f"{record_size / 2**20:>8.1f}MB")
+    print(f"{'replay full records':<28} {replay_time:>8.2f}s {replayed / replay_time:>12,.0f}")
+    print(f"{'read one column (Power)':<28} {column_time * 1e3:>7.1f}ms {len(voltage) / column_time:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
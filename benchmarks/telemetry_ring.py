@@ -0,0 +1,90 @@
+"""Benchmark handing telemetry to another process: pipe vs. shared-memory ring.
+
+Moves the same simulated telemetry samples from a writer to a reader
+once by pickling them through a multiprocessing pipe and once through the
+shared-memory telemetry ring, and reports the writer-side cost per sample
+and the reader-side cost per sample.
+
+Usage:
+    python benchmarks/telemetry_ring.py --samples 20000
+"""
+
+import argparse
+import asyncio
+import pickle
+import sys
+import time
+from multiprocessing import Pipe
+from pathlib import Path
+
+from loguru import logger
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.agents.power_agent import PowerAgent
+from src.agents.navigation_agent import NavigationAgent
+from src.monitoring.telemetry_ring import TelemetryRing
+
+
+async def _samples(count: int):
+    agents = [PowerAgent("UAV_001"), NavigationAgent("UAV_001")]
+    return [await agents[i % len(agents)].generate_telemetry() for i in range(count)]
+
+
+def _pipe(samples, batch: int):
+    sender, receiver = Pipe()
+    write = read = 0.0
+    received = 0
+    for start in range(0, len(samples), batch):
+        started = time.perf_counter()
+        sender.send(samples[start:start + batch])
+        write += time.perf_counter() - started
+        
+        started = time.perf_counter()
+        received += len(receiver.recv())
+        read += time.perf_counter() - started
+    assert received == len(samples)
+    return write, read, len(pickle.dumps(samples[:batch])) / batch
+
+
+def _ring(samples, batch: int):
+    ring = TelemetryRing.create(capacity=len(samples))
+    reader = TelemetryRing.attach(ring.name)
+    write = read = 0.0
+    cursor = received = 0
+    try:
+        for start in range(0, len(samples), batch):
+            started = time.perf_counter()
+            ring.write_many(samples[start:start + batch])
+            write += time.perf_counter() - started
+            
+            started = time.perf_counter()
+            records, cursor = reader.read(cursor)
+            received += len(records)
+            read += time.perf_counter() - started
+        assert received == len(samples)
+        return write, read, ring.records.dtype.itemsize
+    finally:
+        reader.close()
+        ring.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--samples", type=int, default=20000, help="Telemetry samples to move")
+    parser.add_argument("--batch", type=int, default=100, help="Samples per send/read")
+    args = parser.parse_args()
+    
+    logger.remove()
+    samples = asyncio.run(_samples(args.samples))
+    
+    print(f"{args.samples} samples in batches of {args.batch}")
+    print(f"{'transport':<10} {'write/sample':>13} {'read/sample':>12} {'bytes/sample':>13}")
+    for name, transport in (("pipe", _pipe), ("ring", _ring)):
+        write, read, size = transport(samples, args.batch)
+        print(f"{name:<10} {write / args.samples * 1e6:>11.2f}us {read / args.samples * 1e6:>10.2f}us "
+              f"{size:>13.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,19 +4,24 @@ import asyncio
 import signal
 import sys
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from loguru import logger
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 from src.agents.telemetry_manager import TelemetryManager
+from src.agents.sharding import ShardedFleet
 from src.anomaly.anomaly_detector import AnomalyDetector
 from src.fault_injection.fault_manager import FaultManager
 from src.monitoring.logger import uav_logger
 from src.monitoring.metrics_collector import MetricsCollector
+from src.monitoring.telemetry_recorder import TelemetryRecorder, TelemetryReplay
+from src.monitoring.telemetry_ring import TelemetryRing
+from src.storage.query_engine import TelemetryQueryEngine
 from src.utils.config import config
-from src.utils.models import TelemetryData, Alert
+from src.utils.clock import get_clock, run_simulation
+from src.utils.models import TelemetryRecord, Alert
 
 
 class UAVSimulator:
@@ -24,10 +29,39 @@ class UAVSimulator:
     
     def __init__(self):
         """Initialize the UAV simulator."""
-        self.telemetry_manager = TelemetryManager()
-        self.anomaly_detector = AnomalyDetector()
-        self.fault_manager = FaultManager()
-        self.metrics_collector = MetricsCollector()
+        # One simulation clock shared by every component
+        self.clock = get_clock()
+        self.duration = config.get("system.clock.duration")
+        
+        # Sharded runs partition the fleet across worker processes, each with
+        # its own telemetry manager and anomaly detector
+        self.anomaly_detector: Optional[AnomalyDetector] = None
+        if config.get("system.sharding.enabled", False):
+            self.telemetry_manager = ShardedFleet()
+        else:
+            self.telemetry_manager = TelemetryManager(clock=self.clock)
+            self.anomaly_detector = AnomalyDetector(clock=self.clock)
+        self.fault_manager = FaultManager(clock=self.clock)
+        self.metrics_collector = MetricsCollector(clock=self.clock)
+        
+        # Out-of-process dashboards and reports read telemetry from shared memory
+        self.telemetry_ring: Optional[TelemetryRing] = None
+        if config.get("dashboard.shared_memory.enabled", False):
+            self.telemetry_ring = TelemetryRing.create(config.get("dashboard.shared_memory.name", "uav_telemetry"))
+        
+        # Scored telemetry can be recorded to disk, and a recording replayed
+        # through the telemetry manager in place of simulated UAVs
+        self.recorder: Optional[TelemetryRecorder] = None
+        self.query_engine: Optional[TelemetryQueryEngine] = None
+        if config.get("monitoring.recording.enabled", False):
+            self.recorder = TelemetryRecorder()
+            self.query_engine = TelemetryQueryEngine(recorder=self.recorder)
+        self.replay: Optional[TelemetryReplay] = None
+        replay_from = config.get("monitoring.recording.replay")
+        if replay_from:
+            if self.anomaly_detector is None:
+                raise ValueError("Telemetry replay is not supported with sharding enabled")
+            self.replay = TelemetryReplay(replay_from, clock=self.clock)
         
         self.is_running = False
         self._shutdown_event = asyncio.Event()
@@ -40,11 +74,14 @@ class UAVSimulator:
     def _register_callbacks(self) -> None:
         """Register callbacks between components."""
         # Telemetry callbacks
-        self.telemetry_manager.register_telemetry_callback(self._handle_telemetry)
+        self.telemetry_manager.register_telemetry_callback(self._handle_telemetry, name="simulator")
         self.telemetry_manager.register_alert_callback(self._handle_alert)
         
         # Anomaly detection callbacks
-        self.anomaly_detector.register_anomaly_callback(self._handle_anomaly_alert)
+        if self.anomaly_detector is not None:
+            self.anomaly_detector.register_anomaly_callback(self._handle_anomaly_alert)
+        else:
+            self.telemetry_manager.register_anomaly_callback(self._handle_anomaly_alert)
         
         # Fault injection callbacks
         self.fault_manager.register_fault_callback(self._handle_fault_alert)
@@ -53,7 +90,7 @@ class UAVSimulator:
         self.metrics_collector.register_metrics_callback(self._handle_metrics)
         self.metrics_collector.register_alert_callback(self._handle_performance_alert)
     
-    async def _handle_telemetry(self, telemetry_data: TelemetryData) -> None:
+    async def _handle_telemetry(self, telemetry_data: TelemetryRecord) -> None:
         """Handle incoming telemetry data.
         
         Args:
@@ -66,11 +103,39 @@ class UAVSimulator:
             telemetry_data.data
         )
         
-        # Process for anomaly detection
-        anomaly_result = await self.anomaly_detector.process_telemetry(telemetry_data)
+        # Shards deliver telemetry already scored
+        if self.anomaly_detector is None:
+            self._publish_telemetry(telemetry_data)
+            return
         
-        # Update telemetry data with anomaly score
-        telemetry_data.anomaly_score = anomaly_result.anomaly_score
+        # Queue for batched anomaly detection without stalling the producer;
+        # the anomaly score is filled in once the batch has been scored
+        future = self.anomaly_detector.submit_telemetry(telemetry_data)
+        future.add_done_callback(lambda done: self._apply_anomaly_result(telemetry_data, done))
+    
+    def _apply_anomaly_result(self, telemetry_data: TelemetryRecord, future: asyncio.Future) -> None:
+        """Copy a finished anomaly detection result onto its telemetry data.
+        
+        Args:
+            telemetry_data: Telemetry data that was scored
+            future: Completed detection future
+        """
+        if not future.cancelled() and future.exception() is None:
+            # Update telemetry data with anomaly score
+            telemetry_data.anomaly_score = future.result().anomaly_score
+        
+        self._publish_telemetry(telemetry_data)
+    
+    def _publish_telemetry(self, telemetry_data: TelemetryRecord) -> None:
+        """Write scored telemetry to the shared-memory ring and the recording, if enabled.
+        
+        Args:
+            telemetry_data: Scored telemetry data
+        """
+        if self.telemetry_ring is not None:
+            self.telemetry_ring.write(telemetry_data)
+        if self.recorder is not None:
+            self.recorder.append(telemetry_data)
     
     async def _handle_alert(self, alert: Alert) -> None:
         """Handle alerts from UAV agents.
@@ -149,12 +214,19 @@ class UAVSimulator:
             await self.fault_manager.start()
             await self.metrics_collector.start()
             
-            # Add UAVs
-            await self._add_uavs()
+            # Add UAVs, or feed them from a recording
+            if self.replay is not None:
+                asyncio.create_task(self._replay())
+            else:
+                await self._add_uavs()
             
             self.is_running = True
             logger.info("UAV Simulator started successfully")
             
+            # Stop on its own after the configured simulated duration
+            if self.duration:
+                asyncio.create_task(self._stop_after(self.duration))
+            
             # Wait for shutdown signal
             await self._shutdown_event.wait()
             
@@ -162,6 +234,23 @@ class UAVSimulator:
             logger.error(f"Error starting UAV Simulator: {e}")
             raise
     
+    async def _stop_after(self, duration: float) -> None:
+        """Trigger shutdown after a simulated duration.
+        
+        Args:
+            duration: Simulated seconds to run for
+        """
+        await self.clock.sleep(duration)
+        logger.info(f"Simulated duration of {duration}s reached, initiating shutdown...")
+        self._shutdown_event.set()
+    
+    async def _replay(self) -> None:
+        """Replay the configured recording, then trigger shutdown."""
+        speed = config.get("monitoring.recording.replay_speed", 1.0)
+        await self.replay.play(self.telemetry_manager.publish_telemetry, speed=speed)
+        logger.info("Telemetry replay finished, initiating shutdown...")
+        self._shutdown_event.set()
+    
     async def stop(self) -> None:
         """Stop the UAV simulator."""
         if not self.is_running:
@@ -175,9 +264,17 @@ class UAVSimulator:
             await self.telemetry_manager.stop()
             await self.fault_manager.stop()
             await self.metrics_collector.stop()
+            if self.anomaly_detector is not None:
+                await self.anomaly_detector.stop()
+            if self.telemetry_ring is not None:
+                self.telemetry_ring.close()
+                self.telemetry_ring = None
+            if self.recorder is not None:
+                self.recorder.close()
             
             self.is_running = False
             logger.info("UAV Simulator stopped successfully")
+            uav_logger.flush()
             
         except Exception as e:
             logger.error(f"Error stopping UAV Simulator: {e}")
@@ -186,11 +283,7 @@ class UAVSimulator:
     async def _add_uavs(self) -> None:
         """Add UAVs to the simulation."""
         uav_count = config.get("uav.count", 5)
-        
-        for i in range(1, uav_count + 1):
-            uav_id = f"UAV_{i:03d}"
-            await self.telemetry_manager.add_uav(uav_id)
-            logger.info(f"Added {uav_id} to simulation")
+        await self.telemetry_manager.add_uavs([f"UAV_{i:03d}" for i in range(1, uav_count + 1)])
     
     async def inject_fault(self, uav_id: str, subsystem: str, fault_type: str, 
                           parameters: Dict[str, Any] = None) -> bool:
@@ -226,16 +319,35 @@ class UAVSimulator:
         Returns:
             Dictionary containing simulator status
         """
-        return {
+        if self.anomaly_detector is not None:
+            anomaly_stats = self.anomaly_detector.get_statistics()
+        else:
+            anomaly_stats = self.telemetry_manager.get_anomaly_statistics()
+        
+        status = {
             "is_running": self.is_running,
             "uav_count": self.telemetry_manager.get_uav_count(),
             "agent_count": self.telemetry_manager.get_agent_count(),
+            "scheduler_stats": self.telemetry_manager.get_scheduler_statistics(),
+            "fleet_engine_stats": self.telemetry_manager.get_fleet_engine_statistics(),
+            "spatial_index_stats": self.telemetry_manager.get_spatial_index_statistics(),
+            "geofence_stats": self.telemetry_manager.get_geofence_statistics(),
+            "route_engine_stats": self.telemetry_manager.get_route_engine_statistics(),
+            "physics_stats": self.telemetry_manager.get_physics_statistics(),
+            "telemetry_bus_stats": self.telemetry_manager.get_bus_statistics(),
             "active_faults": len(self.fault_manager.get_active_faults()),
-            "anomaly_stats": self.anomaly_detector.get_statistics(),
+            "anomaly_stats": anomaly_stats,
             "fault_stats": self.fault_manager.get_statistics(),
             "metrics_stats": self.metrics_collector.get_statistics(),
             "log_stats": uav_logger.get_log_statistics()
         }
+        if isinstance(self.telemetry_manager, ShardedFleet):
+            status["sharding_stats"] = self.telemetry_manager.get_statistics()
+        if self.recorder is not None:
+            status["recording_stats"] = self.recorder.get_statistics()
+        if self.replay is not None:
+            status["replay_stats"] = self.replay.get_statistics()
+        return status
     
     def get_uav_status(self, uav_id: str) -> Dict[str, Any]:
         """Get status of a specific UAV.
@@ -285,5 +397,5 @@ async def main():
 
 
 if __name__ == "__main__":
-    # Run the simulator
-    asyncio.run(main())
+    # Run the simulator (on virtual time if system.clock.mode is "virtual")
+    run_simulation(main())
@@ -114,12 +114,5 @@ class AgentFactory:
         Returns:
             Telemetry rate in Hz
         """
-        # Get subsystem configuration
-        subsystems = config.get("uav.subsystems", [])
-        
-        for subsystem in subsystems:
-            if subsystem.get("name") == subsystem_name:
-                return subsystem.get("telemetry_rate", 10.0)
-        
         # Default telemetry rate if not found in config
-        return 10.0
+        return config.get_subsystem(subsystem_name).get("telemetry_rate", 10.0)
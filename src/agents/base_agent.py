@@ -1,14 +1,21 @@
 """Base agent class for UAV subsystems."""
 
 import asyncio
-import random
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Dict, Any, Optional, Callable, List
+from typing import Dict, Any, Optional, Callable, List, TYPE_CHECKING
 from loguru import logger
 
-from ..utils.models import TelemetryData, SystemStatus, SeverityLevel, Alert
+from ..utils.models import TelemetryRecord, SystemStatus, SeverityLevel, Alert
 from ..utils.config import config
+from ..utils.clock import SimulationClock, get_clock, create_rng
+from ..utils.snapshot import freeze, thaw
+from .history import TelemetryHistory
+
+if TYPE_CHECKING:
+    from .scheduler import TelemetryScheduler
+    from .fleet_engine import FleetGroup
+    from .physics import FlightPhysics
 
 
 class BaseAgent(ABC):
@@ -28,33 +35,56 @@ class BaseAgent(ABC):
         self.status = SystemStatus.NOMINAL
         self.is_running = False
         self._task: Optional[asyncio.Task] = None
+        self._scheduler: Optional["TelemetryScheduler"] = None
+        self._fleet: Optional["FleetGroup"] = None
+        self.physics: Optional["FlightPhysics"] = None
         self._callbacks: Dict[str, Callable] = {}
         self._fault_active = False
         self._fault_params: Dict[str, Any] = {}
-        self._telemetry_history: List[TelemetryData] = []
+        self._telemetry_history = TelemetryHistory(_history_depth(subsystem_name))
+        self._last_payload: Optional[Dict[str, Any]] = None
+        
+        # Simulated time and a per-agent random stream (seeded via system.seed)
+        self.clock: SimulationClock = get_clock()
+        self.rng = create_rng(uav_id, subsystem_name)
         
-        logger.info(f"Initialized {subsystem_name} agent for UAV {uav_id}")
+        logger.debug(f"Initialized {subsystem_name} agent for UAV {uav_id}")
     
-    async def start(self) -> None:
-        """Start the agent telemetry generation."""
+    async def start(self, scheduler: Optional["TelemetryScheduler"] = None) -> None:
+        """Start the agent telemetry generation.
+        
+        Args:
+            scheduler: Shared tick scheduler to drive this agent. When omitted
+                the agent runs its own telemetry loop task.
+        """
         if self.is_running:
             logger.warning(f"Agent {self.subsystem_name} is already running")
             return
         
         self.is_running = True
-        self._task = asyncio.create_task(self._telemetry_loop())
-        logger.info(f"Started {self.subsystem_name} agent for UAV {self.uav_id}")
+        if self._fleet is not None:
+            pass  # Telemetry is generated by the fleet group
+        elif scheduler is not None:
+            self._scheduler = scheduler
+            scheduler.register(self)
+        else:
+            self._task = asyncio.create_task(self._telemetry_loop())
+        logger.debug(f"Started {self.subsystem_name} agent for UAV {self.uav_id}")
     
     async def stop(self) -> None:
         """Stop the agent telemetry generation."""
         self.is_running = False
+        if self._scheduler is not None:
+            self._scheduler.unregister(self)
+            self._scheduler = None
         if self._task:
             self._task.cancel()
             try:
                 await self._task
             except asyncio.CancelledError:
                 pass
-        logger.info(f"Stopped {self.subsystem_name} agent for UAV {self.uav_id}")
+            self._task = None
+        logger.debug(f"Stopped {self.subsystem_name} agent for UAV {self.uav_id}")
     
     async def _telemetry_loop(self) -> None:
         """Main telemetry generation loop."""
@@ -62,34 +92,75 @@ class BaseAgent(ABC):
         
         while self.is_running:
             try:
-                # Generate telemetry data
-                telemetry_data = await self.generate_telemetry()
-                
-                # Apply fault injection if active
-                if self._fault_active:
-                    telemetry_data = await self._apply_fault(telemetry_data)
-                
-                # Send telemetry data
-                await self._send_telemetry(telemetry_data)
+                await self.tick()
                 
                 # Wait for next iteration
-                await asyncio.sleep(interval)
+                await self.clock.sleep(interval)
                 
             except Exception as e:
                 logger.error(f"Error in telemetry loop for {self.subsystem_name}: {e}")
-                await asyncio.sleep(interval)
+                await self.clock.sleep(interval)
+    
+    async def tick(self) -> None:
+        """Generate, fault and send a single telemetry sample."""
+        # Generate telemetry data
+        telemetry_data = await self.generate_telemetry()
+        await self.publish(telemetry_data)
+    
+    async def publish(self, telemetry_data: TelemetryRecord) -> None:
+        """Apply any active fault and send a telemetry sample.
+        
+        Args:
+            telemetry_data: Freshly generated telemetry data
+        """
+        # Stamp with simulated time
+        telemetry_data.timestamp = self.clock.now()
+        
+        # Payloads reference the agent's live state dicts; publish an immutable
+        # snapshot instead, sharing whatever is unchanged since the last one
+        telemetry_data.data = freeze(telemetry_data.data, self._last_payload)
+        self._last_payload = telemetry_data.data
+        
+        # Apply fault injection if active
+        if self._fault_active:
+            telemetry_data = await self._apply_fault(telemetry_data)
+        
+        # Send telemetry data
+        await self._send_telemetry(telemetry_data)
+    
+    def attach_fleet(self, group: Optional["FleetGroup"]) -> None:
+        """Hand telemetry generation over to a vectorized fleet group.
+        
+        Args:
+            group: Fleet group holding this UAV's subsystem state, or None to
+                go back to per-agent generation
+        """
+        self._fleet = group
+    
+    def attach_physics(self, physics: Optional["FlightPhysics"]) -> None:
+        """Read coupled airframe, motor and battery state from flight physics.
+        
+        Args:
+            physics: Flight physics holding a row for this UAV, or None to go
+                back to the agent's own simulated values
+        """
+        self.physics = physics
+    
+    def _physics_row(self) -> Optional[Any]:
+        """This UAV's live flight physics row, if it has one."""
+        return self.physics.row(self.uav_id) if self.physics is not None else None
     
     @abstractmethod
-    async def generate_telemetry(self) -> TelemetryData:
+    async def generate_telemetry(self) -> TelemetryRecord:
         """Generate telemetry data for the subsystem.
         
         Returns:
-            TelemetryData object containing subsystem-specific data
+            TelemetryRecord object containing subsystem-specific data
         """
         pass
     
     @abstractmethod
-    async def apply_fault(self, telemetry_data: TelemetryData, fault_params: Dict[str, Any]) -> TelemetryData:
+    async def apply_fault(self, telemetry_data: TelemetryRecord, fault_params: Dict[str, Any]) -> TelemetryRecord:
         """Apply fault injection to telemetry data.
         
         Args:
@@ -101,25 +172,33 @@ class BaseAgent(ABC):
         """
         pass
     
-    async def _apply_fault(self, telemetry_data: TelemetryData) -> TelemetryData:
-        """Internal method to apply active fault."""
+    async def _apply_fault(self, telemetry_data: TelemetryRecord) -> TelemetryRecord:
+        """Internal method to apply active fault.
+        
+        The fault edits a copy-on-write view of the snapshot, so only the
+        subtrees it touches are copied and the snapshot (and the agent state
+        and history sharing it) stays intact.
+        """
+        snapshot = telemetry_data.data
         try:
-            return await self.apply_fault(telemetry_data, self._fault_params)
+            telemetry_data.data = thaw(snapshot)
+            telemetry_data = await self.apply_fault(telemetry_data, self._fault_params)
+            telemetry_data.data = freeze(telemetry_data.data)
+            return telemetry_data
         except Exception as e:
             logger.error(f"Error applying fault to {self.subsystem_name}: {e}")
+            telemetry_data.data = snapshot
             return telemetry_data
     
-    async def _send_telemetry(self, telemetry_data: TelemetryData) -> None:
+    async def _send_telemetry(self, telemetry_data: TelemetryRecord) -> None:
         """Send telemetry data to registered callbacks."""
-        # Store in history
+        # Store in history (oldest record is overwritten once full)
         self._telemetry_history.append(telemetry_data)
         
-        # Keep only recent data (last 100 points)
-        if len(self._telemetry_history) > 100:
-            self._telemetry_history = self._telemetry_history[-100:]
-        
-        # Send to callbacks
+        # Send to callbacks; the alert callback only receives alerts
         for callback_name, callback in self._callbacks.items():
+            if callback_name == "alert":
+                continue
             try:
                 await callback(telemetry_data)
             except Exception as e:
@@ -187,6 +266,7 @@ class BaseAgent(ABC):
     
     async def _send_alert(self, alert: Alert) -> None:
         """Send alert to registered callbacks."""
+        alert.timestamp = self.clock.now()
         if "alert" in self._callbacks:
             try:
                 await self._callbacks["alert"](alert)
@@ -209,7 +289,7 @@ class BaseAgent(ABC):
             "fault_params": self._fault_params
         }
     
-    async def get_recent_telemetry(self, count: int = 10) -> List[TelemetryData]:
+    async def get_recent_telemetry(self, count: int = 10) -> List[TelemetryRecord]:
         """Get recent telemetry data from this agent.
         
         Args:
@@ -218,4 +298,39 @@ class BaseAgent(ABC):
         Returns:
             List of recent telemetry data
         """
-        return self._telemetry_history[-count:] if self._telemetry_history else []
+        if not self._telemetry_history and self._fleet is not None:
+            # Nothing published yet; materialize the current fleet row on demand
+            return [self._fleet.materialize(self.uav_id, self.status)]
+        
+        return list(self._telemetry_history.latest(count))
+    
+    @property
+    def telemetry_history(self) -> TelemetryHistory:
+        """Ring of recently published telemetry, for zero-copy reads."""
+        return self._telemetry_history
+    
+    async def get_telemetry_between(self, start: Optional[datetime] = None,
+                                    end: Optional[datetime] = None) -> List[TelemetryRecord]:
+        """Get telemetry published within a simulated time range.
+        
+        Args:
+            start: Earliest timestamp, inclusive (None for no lower bound)
+            end: Latest timestamp, exclusive (None for no upper bound)
+            
+        Returns:
+            List of telemetry data, oldest first
+        """
+        return list(self._telemetry_history.between(start, end))
+
+
+def _history_depth(subsystem_name: str) -> int:
+    """Get the configured telemetry history depth for a subsystem.
+    
+    Args:
+        subsystem_name: Name of the subsystem
+        
+    Returns:
+        Number of records kept per agent
+    """
+    depth = config.get_subsystem(subsystem_name).get("history_depth")
+    return depth if depth is not None else config.get("system.telemetry_history.depth", 100)
@@ -1,11 +1,10 @@
 """Communication subsystem agent."""
 
-import random
 from datetime import datetime
 from typing import Dict, Any
 
 from .base_agent import BaseAgent
-from ..utils.models import TelemetryData, SystemStatus
+from ..utils.models import TelemetryRecord, SystemStatus
 
 
 class CommunicationAgent(BaseAgent):
@@ -61,7 +60,7 @@ class CommunicationAgent(BaseAgent):
             "errors": 2
         }
     
-    async def generate_telemetry(self) -> TelemetryData:
+    async def generate_telemetry(self) -> TelemetryRecord:
         """Generate communication telemetry data."""
         self._update_radio_data()
         self._update_satellite_data()
@@ -80,14 +79,14 @@ class CommunicationAgent(BaseAgent):
             }
         }
         
-        return TelemetryData(
+        return TelemetryRecord(
             subsystem=self.subsystem_name,
             uav_id=self.uav_id,
             data=data,
             status=self.status
         )
     
-    async def apply_fault(self, telemetry_data: TelemetryData, fault_params: Dict[str, Any]) -> TelemetryData:
+    async def apply_fault(self, telemetry_data: TelemetryRecord, fault_params: Dict[str, Any]) -> TelemetryRecord:
         """Apply communication fault."""
         fault_type = fault_params.get("type", "signal_loss")
         
@@ -125,61 +124,61 @@ class CommunicationAgent(BaseAgent):
     
     def _update_radio_data(self) -> None:
         """Update radio communication data."""
-        self.radio_data["rssi"] += random.uniform(-2, 2)
+        self.radio_data["rssi"] += self.rng.uniform(-2, 2)
         self.radio_data["rssi"] = max(-100, min(-20, self.radio_data["rssi"]))
         
-        self.radio_data["snr"] += random.uniform(-1, 1)
+        self.radio_data["snr"] += self.rng.uniform(-1, 1)
         self.radio_data["snr"] = max(0, min(40, self.radio_data["snr"]))
         
-        self.radio_data["packet_loss"] += random.uniform(-0.0001, 0.0001)
+        self.radio_data["packet_loss"] += self.rng.uniform(-0.0001, 0.0001)
         self.radio_data["packet_loss"] = max(0, min(0.1, self.radio_data["packet_loss"]))
         
-        self.radio_data["latency"] += random.uniform(-1, 1)
+        self.radio_data["latency"] += self.rng.uniform(-1, 1)
         self.radio_data["latency"] = max(1, min(100, self.radio_data["latency"]))
         
         # Simulate occasional frequency changes
-        if random.random() < 0.01:  # 1% chance
-            self.radio_data["frequency"] += random.uniform(-0.1, 0.1)
+        if self.rng.random() < 0.01:  # 1% chance
+            self.radio_data["frequency"] += self.rng.uniform(-0.1, 0.1)
             self.radio_data["frequency"] = max(2.0, min(6.0, self.radio_data["frequency"]))
     
     def _update_satellite_data(self) -> None:
         """Update satellite communication data."""
-        self.satellite_data["signal_strength"] += random.uniform(-2, 2)
+        self.satellite_data["signal_strength"] += self.rng.uniform(-2, 2)
         self.satellite_data["signal_strength"] = max(0, min(100, self.satellite_data["signal_strength"]))
         
-        self.satellite_data["elevation"] += random.uniform(-1, 1)
+        self.satellite_data["elevation"] += self.rng.uniform(-1, 1)
         self.satellite_data["elevation"] = max(0, min(90, self.satellite_data["elevation"]))
         
-        self.satellite_data["azimuth"] += random.uniform(-2, 2)
+        self.satellite_data["azimuth"] += self.rng.uniform(-2, 2)
         self.satellite_data["azimuth"] = self.satellite_data["azimuth"] % 360
         
-        self.satellite_data["latency"] += random.uniform(-5, 5)
+        self.satellite_data["latency"] += self.rng.uniform(-5, 5)
         self.satellite_data["latency"] = max(200, min(300, self.satellite_data["latency"]))
     
     def _update_ground_station_data(self) -> None:
         """Update ground station communication data."""
-        self.ground_station_data["distance"] += random.uniform(-0.1, 0.1)
+        self.ground_station_data["distance"] += self.rng.uniform(-0.1, 0.1)
         self.ground_station_data["distance"] = max(0.1, min(50, self.ground_station_data["distance"]))
         
-        self.ground_station_data["rssi"] += random.uniform(-2, 2)
+        self.ground_station_data["rssi"] += self.rng.uniform(-2, 2)
         self.ground_station_data["rssi"] = max(-100, min(-20, self.ground_station_data["rssi"]))
         
-        self.ground_station_data["latency"] += random.uniform(-0.5, 0.5)
+        self.ground_station_data["latency"] += self.rng.uniform(-0.5, 0.5)
         self.ground_station_data["latency"] = max(1, min(50, self.ground_station_data["latency"]))
     
     def _update_network_status(self) -> None:
         """Update network status."""
-        self.network_status["used_bandwidth"] += random.uniform(-0.1, 0.1)
+        self.network_status["used_bandwidth"] += self.rng.uniform(-0.1, 0.1)
         self.network_status["used_bandwidth"] = max(0, min(
             self.network_status["total_bandwidth"], 
             self.network_status["used_bandwidth"]
         ))
         
-        self.network_status["packets_sent"] += random.randint(0, 5)
-        self.network_status["packets_received"] += random.randint(0, 5)
+        self.network_status["packets_sent"] += self.rng.randint(0, 5)
+        self.network_status["packets_received"] += self.rng.randint(0, 5)
         
         # Simulate occasional errors
-        if random.random() < 0.001:  # 0.1% chance
+        if self.rng.random() < 0.001:  # 0.1% chance
             self.network_status["errors"] += 1
     
     def _is_communication_healthy(self) -> bool:
@@ -1,11 +1,10 @@
 """Data storage subsystem agent."""
 
-import random
 from datetime import datetime
 from typing import Dict, Any
 
 from .base_agent import BaseAgent
-from ..utils.models import TelemetryData, SystemStatus
+from ..utils.models import TelemetryRecord, SystemStatus
 
 
 class DataStorageAgent(BaseAgent):
@@ -57,9 +56,9 @@ class DataStorageAgent(BaseAgent):
             "encryption_algorithm": "AES-256",
             "backup_enabled": True,
             "backup_frequency": 3600,  # seconds
-            "last_backup": datetime.now(),
+            "last_backup": self.clock.now(),
             "data_integrity_check": True,
-            "last_integrity_check": datetime.now()
+            "last_integrity_check": self.clock.now()
         }
         
         # Data transmission
@@ -100,7 +99,7 @@ class DataStorageAgent(BaseAgent):
             }
         }
     
-    async def generate_telemetry(self) -> TelemetryData:
+    async def generate_telemetry(self) -> TelemetryRecord:
         """Generate data storage telemetry data."""
         self._update_storage_devices()
         self._update_data_management()
@@ -122,14 +121,14 @@ class DataStorageAgent(BaseAgent):
             }
         }
         
-        return TelemetryData(
+        return TelemetryRecord(
             subsystem=self.subsystem_name,
             uav_id=self.uav_id,
             data=data,
             status=self.status
         )
     
-    async def apply_fault(self, telemetry_data: TelemetryData, fault_params: Dict[str, Any]) -> TelemetryData:
+    async def apply_fault(self, telemetry_data: TelemetryRecord, fault_params: Dict[str, Any]) -> TelemetryRecord:
         """Apply data storage fault."""
         fault_type = fault_params.get("type", "storage_failure")
         
@@ -182,23 +181,23 @@ class DataStorageAgent(BaseAgent):
         """Update storage device data."""
         for device_name, device in self.storage_devices.items():
             # Simulate data usage changes
-            device["used"] += random.uniform(-0.1, 0.5)
+            device["used"] += self.rng.uniform(-0.1, 0.5)
             device["used"] = max(0, min(device["capacity"], device["used"]))
             device["available"] = device["capacity"] - device["used"]
             
             # Simulate temperature changes
-            device["temperature"] += random.uniform(-1, 1)
+            device["temperature"] += self.rng.uniform(-1, 1)
             device["temperature"] = max(20, min(70, device["temperature"]))
             
             # Simulate health changes
-            device["health"] += random.uniform(-0.1, 0.1)
+            device["health"] += self.rng.uniform(-0.1, 0.1)
             device["health"] = max(0, min(100, device["health"]))
             
             # Simulate speed variations
-            device["read_speed"] += random.uniform(-10, 10)
+            device["read_speed"] += self.rng.uniform(-10, 10)
             device["read_speed"] = max(0, min(600, device["read_speed"]))
             
-            device["write_speed"] += random.uniform(-10, 10)
+            device["write_speed"] += self.rng.uniform(-10, 10)
             device["write_speed"] = max(0, min(550, device["write_speed"]))
             
             # Update status based on health
@@ -211,7 +210,7 @@ class DataStorageAgent(BaseAgent):
             
             # Simulate external storage connection changes
             if device_name == "external_storage":
-                if random.random() < 0.001:  # 0.1% chance
+                if self.rng.random() < 0.001:  # 0.1% chance
                     device["connected"] = not device["connected"]
     
     def _update_data_management(self) -> None:
@@ -221,44 +220,44 @@ class DataStorageAgent(BaseAgent):
         self.data_management["total_data_stored"] = total_used
         
         # Simulate compression ratio changes
-        self.data_management["data_compression_ratio"] += random.uniform(-0.01, 0.01)
+        self.data_management["data_compression_ratio"] += self.rng.uniform(-0.01, 0.01)
         self.data_management["data_compression_ratio"] = max(0.1, min(0.8, 
             self.data_management["data_compression_ratio"]))
         
         # Simulate backup frequency changes
-        self.data_management["backup_frequency"] += random.uniform(-60, 60)
+        self.data_management["backup_frequency"] += self.rng.uniform(-60, 60)
         self.data_management["backup_frequency"] = max(1800, min(7200, 
             self.data_management["backup_frequency"]))
         
         # Simulate occasional backup completion
-        if random.random() < 0.01:  # 1% chance
-            self.data_management["last_backup"] = datetime.now()
+        if self.rng.random() < 0.01:  # 1% chance
+            self.data_management["last_backup"] = self.clock.now()
         
         # Simulate occasional integrity check completion
-        if random.random() < 0.005:  # 0.5% chance
-            self.data_management["last_integrity_check"] = datetime.now()
+        if self.rng.random() < 0.005:  # 0.5% chance
+            self.data_management["last_integrity_check"] = self.clock.now()
     
     def _update_data_transmission(self) -> None:
         """Update data transmission data."""
         # Simulate transmission queue changes
-        self.data_transmission["transmission_queue_size"] += random.uniform(-2, 5)
+        self.data_transmission["transmission_queue_size"] += self.rng.uniform(-2, 5)
         self.data_transmission["transmission_queue_size"] = max(0, min(200, 
             self.data_transmission["transmission_queue_size"]))
         
         # Simulate transmission rate changes
-        self.data_transmission["transmission_rate"] += random.uniform(-1, 1)
+        self.data_transmission["transmission_rate"] += self.rng.uniform(-1, 1)
         self.data_transmission["transmission_rate"] = max(0, min(50, 
             self.data_transmission["transmission_rate"]))
         
         # Simulate transmission success/failure
-        if random.random() < 0.01:  # 1% chance
-            if random.random() < 0.9:  # 90% success rate
+        if self.rng.random() < 0.01:  # 1% chance
+            if self.rng.random() < 0.9:  # 90% success rate
                 self.data_transmission["successful_transmissions"] += 1
             else:
                 self.data_transmission["failed_transmissions"] += 1
         
         # Simulate retry attempts
-        if random.random() < 0.001:  # 0.1% chance
+        if self.rng.random() < 0.001:  # 0.1% chance
             self.data_transmission["retry_attempts"] += 1
             self.data_transmission["retry_attempts"] = min(5, 
                 self.data_transmission["retry_attempts"])
@@ -276,50 +275,50 @@ class DataStorageAgent(BaseAgent):
             ) / len(healthy_devices)
         
         # Simulate IO operations per second
-        self.storage_performance["io_operations_per_second"] += random.uniform(-50, 50)
+        self.storage_performance["io_operations_per_second"] += self.rng.uniform(-50, 50)
         self.storage_performance["io_operations_per_second"] = max(500, min(3000, 
             self.storage_performance["io_operations_per_second"]))
         
         # Simulate queue depth
-        self.storage_performance["queue_depth"] += random.uniform(-1, 1)
+        self.storage_performance["queue_depth"] += self.rng.uniform(-1, 1)
         self.storage_performance["queue_depth"] = max(1, min(16, 
             self.storage_performance["queue_depth"]))
         
         # Simulate latency
-        self.storage_performance["latency"] += random.uniform(-0.1, 0.1)
+        self.storage_performance["latency"] += self.rng.uniform(-0.1, 0.1)
         self.storage_performance["latency"] = max(0.1, min(10, 
             self.storage_performance["latency"]))
         
         # Simulate throughput
-        self.storage_performance["throughput"] += random.uniform(-2, 2)
+        self.storage_performance["throughput"] += self.rng.uniform(-2, 2)
         self.storage_performance["throughput"] = max(5, min(100, 
             self.storage_performance["throughput"]))
         
         # Simulate error rate
-        self.storage_performance["error_rate"] += random.uniform(-0.0001, 0.0001)
+        self.storage_performance["error_rate"] += self.rng.uniform(-0.0001, 0.0001)
         self.storage_performance["error_rate"] = max(0, min(0.1, 
             self.storage_performance["error_rate"]))
         
         # Simulate wear leveling
-        self.storage_performance["wear_leveling"] += random.uniform(-0.5, 0.5)
+        self.storage_performance["wear_leveling"] += self.rng.uniform(-0.5, 0.5)
         self.storage_performance["wear_leveling"] = max(0, min(100, 
             self.storage_performance["wear_leveling"]))
     
     def _update_data_retention(self) -> None:
         """Update data retention data."""
         # Simulate archived data size changes
-        self.data_retention["archived_data_size"] += random.uniform(-1, 2)
+        self.data_retention["archived_data_size"] += self.rng.uniform(-1, 2)
         self.data_retention["archived_data_size"] = max(0, min(500, 
             self.data_retention["archived_data_size"]))
         
         # Simulate deleted data size changes
-        self.data_retention["deleted_data_size"] += random.uniform(-0.5, 1)
+        self.data_retention["deleted_data_size"] += self.rng.uniform(-0.5, 1)
         self.data_retention["deleted_data_size"] = max(0, min(100, 
             self.data_retention["deleted_data_size"]))
         
         # Simulate data age distribution changes
         for age_group in self.data_retention["data_age_distribution"]:
-            self.data_retention["data_age_distribution"][age_group] += random.uniform(-1, 1)
+            self.data_retention["data_age_distribution"][age_group] += self.rng.uniform(-1, 1)
             self.data_retention["data_age_distribution"][age_group] = max(0, min(100, 
                 self.data_retention["data_age_distribution"][age_group]))
         
@@ -0,0 +1,346 @@
+"""Batched extended Kalman filter for IMU/GPS/barometer/magnetometer fusion.
+
+The stacked functions run many filters at once on NumPy arrays. The
+``*_one`` functions run the same filter for a single UAV on plain lists,
+where NumPy's per-call overhead would cost more than the arithmetic.
+"""
+
+import math
+from typing import Dict, List, Optional, Sequence
+import numpy as np
+
+
+# State vector: east/north/up position (m), east/north/up velocity (m/s),
+# heading (rad, clockwise from north) and gyroscope z bias (rad/s)
+STATE_SIZE = 8
+POSITION = slice(0, 3)
+VELOCITY = slice(3, 6)
+YAW = 6
+GYRO_BIAS = 7
+
+GRAVITY = 9.81
+
+# Default noise densities
+DEFAULT_NOISE = {
+    "accel": 0.2,  # m/s^2 per sqrt(Hz)
+    "gyro": 0.005,  # rad/s per sqrt(Hz)
+    "gyro_bias": 1e-4,  # rad/s^2 per sqrt(Hz)
+    "baro": 1.0,  # m
+    "mag": 0.5  # uT
+}
+
+_GPS_H = np.zeros((3, STATE_SIZE))
+_GPS_H[:, POSITION] = np.eye(3)
+_BARO_H = np.zeros((1, STATE_SIZE))
+_BARO_H[0, 2] = 1.0
+
+_TAU = 2 * math.pi
+
+
+def initial_covariance(n: int, position: float = 5.0, velocity: float = 1.0, yaw: float = 0.2,
+                       gyro_bias: float = 0.01) -> np.ndarray:
+    """Diagonal starting covariance for n filters.
+    
+    Args:
+        n: Number of filters
+        position: Position standard deviation in meters
+        velocity: Velocity standard deviation in m/s
+        yaw: Heading standard deviation in radians
+        gyro_bias: Gyroscope bias standard deviation in rad/s
+        
+    Returns:
+        Covariance stack of shape (n, STATE_SIZE, STATE_SIZE)
+    """
+    diagonal = np.array([position] * 3 + [velocity] * 3 + [yaw, gyro_bias]) ** 2
+    return np.repeat(np.diag(diagonal)[None], n, axis=0)
+
+
+def predict(x: np.ndarray, P: np.ndarray, accel: np.ndarray, gyro_z: np.ndarray, dt: float,
+            noise: Optional[Dict[str, float]] = None) -> None:
+    """Propagate every filter through one IMU sample in place.
+    
+    Args:
+        x: State stack (n, STATE_SIZE)
+        P: Covariance stack (n, STATE_SIZE, STATE_SIZE)
+        accel: Specific force in the forward/right/down body frame (n, 3)
+        gyro_z: Yaw rate about the down axis in rad/s (n,)
+        dt: Time step in seconds
+        noise: Noise densities overriding DEFAULT_NOISE
+    """
+    noise = {**DEFAULT_NOISE, **(noise or {})}
+    n = len(x)
+    sin, cos = np.sin(x[:, YAW]), np.cos(x[:, YAW])
+    forward, right, down = accel[:, 0], accel[:, 1], accel[:, 2]
+    
+    # Body specific force to east/north/up acceleration
+    acceleration = np.column_stack([forward * sin + right * cos,
+                                    forward * cos - right * sin,
+                                    -(down + GRAVITY)])
+    x[:, POSITION] += x[:, VELOCITY] * dt + 0.5 * acceleration * dt * dt
+    x[:, VELOCITY] += acceleration * dt
+    x[:, YAW] = (x[:, YAW] + (gyro_z - x[:, GYRO_BIAS]) * dt) % (2 * np.pi)
+    
+    # Jacobian of the transition
+    F = np.broadcast_to(np.eye(STATE_SIZE), (n, STATE_SIZE, STATE_SIZE)).copy()
+    F[:, 0, 3] = F[:, 1, 4] = F[:, 2, 5] = dt
+    d_east = (forward * cos - right * sin) * dt
+    d_north = (-forward * sin - right * cos) * dt
+    F[:, 3, YAW] = d_east
+    F[:, 4, YAW] = d_north
+    F[:, 0, YAW] = 0.5 * d_east * dt
+    F[:, 1, YAW] = 0.5 * d_north * dt
+    F[:, YAW, GYRO_BIAS] = -dt
+    
+    q = np.zeros(STATE_SIZE)
+    q[POSITION] = noise["accel"] ** 2 * dt ** 3 / 3
+    q[VELOCITY] = noise["accel"] ** 2 * dt
+    q[YAW] = noise["gyro"] ** 2 * dt
+    q[GYRO_BIAS] = noise["gyro_bias"] ** 2 * dt
+    P[:] = F @ P @ F.transpose(0, 2, 1)
+    P[:, np.arange(STATE_SIZE), np.arange(STATE_SIZE)] += q
+
+
+def update(x: np.ndarray, P: np.ndarray, rows: np.ndarray, residual: np.ndarray, H: np.ndarray,
+           R: np.ndarray) -> np.ndarray:
+    """Apply one measurement to a subset of the filters in place.
+    
+    Args:
+        x: State stack (n, STATE_SIZE)
+        P: Covariance stack (n, STATE_SIZE, STATE_SIZE)
+        rows: Filters that received the measurement (m,)
+        residual: Measurement minus predicted measurement (m, k)
+        H: Measurement Jacobians, (k, STATE_SIZE) shared or (m, k, STATE_SIZE)
+        R: Measurement noise covariances (m, k, k)
+        
+    Returns:
+        Normalized innovation squared of each updated filter (m,)
+    """
+    if not len(rows):
+        return np.empty(0)
+    
+    covariance = P[rows]
+    PHt = covariance @ np.swapaxes(H, -1, -2)
+    S = H @ PHt + R
+    
+    # K = P H^T S^-1, solved rather than inverted; S is symmetric
+    K = np.swapaxes(np.linalg.solve(S, np.swapaxes(PHt, 1, 2)), 1, 2)
+    x[rows] += (K @ residual[:, :, None])[:, :, 0]
+    x[rows, YAW] %= 2 * np.pi
+    
+    updated = covariance - K @ np.swapaxes(PHt, 1, 2)
+    P[rows] = 0.5 * (updated + np.swapaxes(updated, 1, 2))
+    return np.einsum("mi,mi->m", residual, np.linalg.solve(S, residual[:, :, None])[:, :, 0])
+
+
+def update_gps(x: np.ndarray, P: np.ndarray, rows: np.ndarray, position: np.ndarray,
+               horizontal: np.ndarray, vertical: np.ndarray) -> np.ndarray:
+    """Fuse GPS positions.
+    
+    Args:
+        x: State stack
+        P: Covariance stack
+        rows: Filters with a GPS fix this step (m,)
+        position: East/north/up GPS positions in meters (m, 3)
+        horizontal: Horizontal standard deviations in meters (m,)
+        vertical: Vertical standard deviations in meters (m,)
+        
+    Returns:
+        Normalized innovation squared of each updated filter
+    """
+    R = np.zeros((len(rows), 3, 3))
+    R[:, 0, 0] = R[:, 1, 1] = horizontal ** 2
+    R[:, 2, 2] = vertical ** 2
+    return update(x, P, rows, position - x[rows, POSITION], _GPS_H, R)
+
+
+def update_baro(x: np.ndarray, P: np.ndarray, rows: np.ndarray, altitude: np.ndarray,
+                sigma: float = DEFAULT_NOISE["baro"]) -> np.ndarray:
+    """Fuse barometric altitudes.
+    
+    Args:
+        x: State stack
+        P: Covariance stack
+        rows: Filters with a barometer sample (m,)
+        altitude: Barometric altitudes in meters (m,)
+        sigma: Barometer standard deviation in meters
+        
+    Returns:
+        Normalized innovation squared of each updated filter
+    """
+    R = np.full((len(rows), 1, 1), sigma ** 2)
+    return update(x, P, rows, (altitude - x[rows, 2])[:, None], _BARO_H, R)
+
+
+def update_mag(x: np.ndarray, P: np.ndarray, rows: np.ndarray, field: np.ndarray, horizontal: float,
+               sigma: float = DEFAULT_NOISE["mag"]) -> np.ndarray:
+    """Fuse magnetometer readings as a heading observation (level flight).
+    
+    The body-frame horizontal field is ``horizontal * (cos yaw, -sin yaw)``,
+    linearized about the current heading estimate.
+    
+    Args:
+        x: State stack
+        P: Covariance stack
+        rows: Filters with a magnetometer sample (m,)
+        field: Forward/right body-frame field in microtesla (m, 2)
+        horizontal: Local horizontal field strength in microtesla
+        sigma: Magnetometer standard deviation in microtesla
+        
+    Returns:
+        Normalized innovation squared of each updated filter
+    """
+    yaw = x[rows, YAW]
+    predicted = horizontal * np.column_stack([np.cos(yaw), -np.sin(yaw)])
+    H = np.zeros((len(rows), 2, STATE_SIZE))
+    H[:, 0, YAW] = -horizontal * np.sin(yaw)
+    H[:, 1, YAW] = -horizontal * np.cos(yaw)
+    R = np.broadcast_to(np.eye(2) * sigma ** 2, (len(rows), 2, 2))
+    return update(x, P, rows, field - predicted, H, R)
+
+
+def predict_one(x: List[float], P: List[List[float]], accel: Sequence[float], gyro_z: float, dt: float,
+                noise: Optional[Dict[str, float]] = None) -> None:
+    """Propagate a single filter through one IMU sample in place.
+    
+    Same model as predict; the transition Jacobian is the identity plus a
+    few entries, so F P F^T is applied as row and then column operations,
+    ordered so every operation reads rows and columns not yet changed.
+    
+    Args:
+        x: State (STATE_SIZE floats)
+        P: Covariance as STATE_SIZE rows of STATE_SIZE floats
+        accel: Specific force in the forward/right/down body frame
+        gyro_z: Yaw rate about the down axis in rad/s
+        dt: Time step in seconds
+        noise: Noise densities overriding DEFAULT_NOISE
+    """
+    noise = {**DEFAULT_NOISE, **noise} if noise else DEFAULT_NOISE
+    sin, cos = math.sin(x[YAW]), math.cos(x[YAW])
+    forward, right, down = accel
+    
+    acceleration = (forward * sin + right * cos, forward * cos - right * sin, -(down + GRAVITY))
+    for axis, value in enumerate(acceleration):
+        x[axis] += x[axis + 3] * dt + 0.5 * value * dt * dt
+        x[axis + 3] += value * dt
+    x[YAW] = (x[YAW] + (gyro_z - x[GYRO_BIAS]) * dt) % _TAU
+    
+    # Off-identity entries of the transition Jacobian
+    d_east = (forward * cos - right * sin) * dt
+    d_north = (-forward * sin - right * cos) * dt
+    half_east, half_north = 0.5 * d_east * dt, 0.5 * d_north * dt
+    east, north, up, v_east, v_north, v_up, yaw, bias = P
+    P[0] = [a + dt * b + half_east * c for a, b, c in zip(east, v_east, yaw)]
+    P[1] = [a + dt * b + half_north * c for a, b, c in zip(north, v_north, yaw)]
+    P[2] = [a + dt * b for a, b in zip(up, v_up)]
+    P[3] = [a + d_east * c for a, c in zip(v_east, yaw)]
+    P[4] = [a + d_north * c for a, c in zip(v_north, yaw)]
+    P[YAW] = [a - dt * c for a, c in zip(yaw, bias)]
+    for row in P:
+        row[0] += dt * row[3] + half_east * row[YAW]
+        row[1] += dt * row[4] + half_north * row[YAW]
+        row[2] += dt * row[5]
+        row[3] += d_east * row[YAW]
+        row[4] += d_north * row[YAW]
+        row[YAW] -= dt * row[GYRO_BIAS]
+    
+    accel_noise = noise["accel"] ** 2
+    for axis in range(3):
+        P[axis][axis] += accel_noise * dt ** 3 / 3
+        P[axis + 3][axis + 3] += accel_noise * dt
+    P[YAW][YAW] += noise["gyro"] ** 2 * dt
+    P[GYRO_BIAS][GYRO_BIAS] += noise["gyro_bias"] ** 2 * dt
+
+
+def update_one(x: List[float], P: List[List[float]], index: int, residual: float, variance: float) -> float:
+    """Apply one direct measurement of ``x[index]`` to a single filter in place.
+    
+    The heading is not wrapped; callers wrap it after their updates.
+    
+    Args:
+        x: State
+        P: Covariance rows
+        index: Observed state element
+        residual: Measurement minus x[index]
+        variance: Measurement noise variance
+        
+    Returns:
+        Normalized innovation squared
+    """
+    PHt = [row[index] for row in P]
+    S = PHt[index] + variance
+    for i, row in enumerate(P):
+        gain = PHt[i] / S
+        x[i] += gain * residual
+        P[i] = [value - gain * other for value, other in zip(row, PHt)]
+    return residual * residual / S
+
+
+def update_gps_one(x: List[float], P: List[List[float]], position: Sequence[float], horizontal: float,
+                   vertical: float) -> float:
+    """Fuse one GPS position into a single filter, one axis at a time.
+    
+    With independent axis errors, sequential scalar updates give the same
+    state, covariance and total NIS as update_gps.
+    
+    Args:
+        x: State
+        P: Covariance rows
+        position: East/north/up GPS position in meters
+        horizontal: Horizontal standard deviation in meters
+        vertical: Vertical standard deviation in meters
+        
+    Returns:
+        Normalized innovation squared
+    """
+    nis = 0.0
+    for axis, sigma in enumerate((horizontal, horizontal, vertical)):
+        nis += update_one(x, P, axis, position[axis] - x[axis], sigma * sigma)
+    x[YAW] %= _TAU
+    return nis
+
+
+def update_baro_one(x: List[float], P: List[List[float]], altitude: float,
+                    sigma: float = DEFAULT_NOISE["baro"]) -> float:
+    """Fuse one barometric altitude into a single filter.
+    
+    Args:
+        x: State
+        P: Covariance rows
+        altitude: Barometric altitude in meters
+        sigma: Barometer standard deviation in meters
+        
+    Returns:
+        Normalized innovation squared
+    """
+    nis = update_one(x, P, 2, altitude - x[2], sigma * sigma)
+    x[YAW] %= _TAU
+    return nis
+
+
+def update_mag_one(x: List[float], P: List[List[float]], field: Sequence[float], horizontal: float,
+                   sigma: float = DEFAULT_NOISE["mag"]) -> float:
+    """Fuse one magnetometer reading into a single filter, as update_mag does.
+    
+    Both field components observe only the heading, with equal noise, so
+    they are folded into one scalar heading measurement; the residual
+    across the predicted field direction carries no heading information
+    and only adds to the NIS.
+    
+    Args:
+        x: State
+        P: Covariance rows
+        field: Forward/right body-frame field in microtesla
+        horizontal: Local horizontal field strength in microtesla
+        sigma: Magnetometer standard deviation in microtesla
+        
+    Returns:
+        Normalized innovation squared
+    """
+    sin, cos = math.sin(x[YAW]), math.cos(x[YAW])
+    forward, right = field[0] - horizontal * cos, field[1] + horizontal * sin
+    along = -(forward * sin + right * cos)  # Residual along the Jacobian, per unit field
+    across = forward * cos - right * sin
+    variance = sigma * sigma
+    nis = update_one(x, P, YAW, along / horizontal, variance / (horizontal * horizontal))
+    x[YAW] %= _TAU
+    return nis + across * across / variance
@@ -1,11 +1,10 @@
 """Environmental subsystem agent."""
 
-import random
 from datetime import datetime
 from typing import Dict, Any
 
 from .base_agent import BaseAgent
-from ..utils.models import TelemetryData, SystemStatus
+from ..utils.models import TelemetryRecord, SystemStatus
 
 
 class EnvironmentalAgent(BaseAgent):
@@ -54,7 +53,7 @@ class EnvironmentalAgent(BaseAgent):
             "smog_level": 0.2  # 0-1 scale
         }
     
-    async def generate_telemetry(self) -> TelemetryData:
+    async def generate_telemetry(self) -> TelemetryRecord:
         """Generate environmental telemetry data."""
         self._update_weather_data()
         self._update_air_quality_data()
@@ -74,14 +73,14 @@ class EnvironmentalAgent(BaseAgent):
             }
         }
         
-        return TelemetryData(
+        return TelemetryRecord(
             subsystem=self.subsystem_name,
             uav_id=self.uav_id,
             data=data,
             status=self.status
         )
     
-    async def apply_fault(self, telemetry_data: TelemetryData, fault_params: Dict[str, Any]) -> TelemetryData:
+    async def apply_fault(self, telemetry_data: TelemetryRecord, fault_params: Dict[str, Any]) -> TelemetryRecord:
         """Apply environmental fault."""
         fault_type = fault_params.get("type", "sensor_failure")
         
@@ -127,56 +126,56 @@ class EnvironmentalAgent(BaseAgent):
     def _update_weather_data(self) -> None:
         """Update weather telemetry data."""
         # Simulate temperature changes
-        self.weather_data["temperature"] += random.uniform(-1, 1)
+        self.weather_data["temperature"] += self.rng.uniform(-1, 1)
         self.weather_data["temperature"] = max(-40, min(50, self.weather_data["temperature"]))
         
         # Simulate humidity changes
-        self.weather_data["humidity"] += random.uniform(-2, 2)
+        self.weather_data["humidity"] += self.rng.uniform(-2, 2)
         self.weather_data["humidity"] = max(0, min(100, self.weather_data["humidity"]))
         
         # Simulate pressure changes
-        self.weather_data["pressure"] += random.uniform(-2, 2)
+        self.weather_data["pressure"] += self.rng.uniform(-2, 2)
         self.weather_data["pressure"] = max(950, min(1050, self.weather_data["pressure"]))
         
         # Simulate wind changes
-        self.weather_data["wind_speed"] += random.uniform(-1, 1)
+        self.weather_data["wind_speed"] += self.rng.uniform(-1, 1)
         self.weather_data["wind_speed"] = max(0, min(30, self.weather_data["wind_speed"]))
         
-        self.weather_data["wind_direction"] += random.uniform(-5, 5)
+        self.weather_data["wind_direction"] += self.rng.uniform(-5, 5)
         self.weather_data["wind_direction"] = self.weather_data["wind_direction"] % 360
         
         # Simulate visibility changes
-        self.weather_data["visibility"] += random.uniform(-0.5, 0.5)
+        self.weather_data["visibility"] += self.rng.uniform(-0.5, 0.5)
         self.weather_data["visibility"] = max(0.1, min(50, self.weather_data["visibility"]))
         
         # Simulate precipitation
-        self.weather_data["precipitation"] += random.uniform(-0.5, 0.5)
+        self.weather_data["precipitation"] += self.rng.uniform(-0.5, 0.5)
         self.weather_data["precipitation"] = max(0, min(100, self.weather_data["precipitation"]))
         
         # Simulate cloud cover
-        self.weather_data["cloud_cover"] += random.uniform(-2, 2)
+        self.weather_data["cloud_cover"] += self.rng.uniform(-2, 2)
         self.weather_data["cloud_cover"] = max(0, min(100, self.weather_data["cloud_cover"]))
     
     def _update_air_quality_data(self) -> None:
         """Update air quality telemetry data."""
         # Simulate PM2.5 changes
-        self.air_quality_data["pm2_5"] += random.uniform(-2, 2)
+        self.air_quality_data["pm2_5"] += self.rng.uniform(-2, 2)
         self.air_quality_data["pm2_5"] = max(0, min(200, self.air_quality_data["pm2_5"]))
         
         # Simulate PM10 changes
-        self.air_quality_data["pm10"] += random.uniform(-3, 3)
+        self.air_quality_data["pm10"] += self.rng.uniform(-3, 3)
         self.air_quality_data["pm10"] = max(0, min(300, self.air_quality_data["pm10"]))
         
         # Simulate CO2 changes
-        self.air_quality_data["co2"] += random.uniform(-5, 5)
+        self.air_quality_data["co2"] += self.rng.uniform(-5, 5)
         self.air_quality_data["co2"] = max(300, min(1000, self.air_quality_data["co2"]))
         
         # Simulate NO2 changes
-        self.air_quality_data["no2"] += random.uniform(-1, 1)
+        self.air_quality_data["no2"] += self.rng.uniform(-1, 1)
         self.air_quality_data["no2"] = max(0, min(100, self.air_quality_data["no2"]))
         
         # Simulate O3 changes
-        self.air_quality_data["o3"] += random.uniform(-2, 2)
+        self.air_quality_data["o3"] += self.rng.uniform(-2, 2)
         self.air_quality_data["o3"] = max(0, min(200, self.air_quality_data["o3"]))
         
         # Update air quality index based on PM2.5
@@ -196,26 +195,26 @@ class EnvironmentalAgent(BaseAgent):
     def _update_radiation_data(self) -> None:
         """Update radiation telemetry data."""
         # Simulate UV index changes
-        self.radiation_data["uv_index"] += random.uniform(-0.5, 0.5)
+        self.radiation_data["uv_index"] += self.rng.uniform(-0.5, 0.5)
         self.radiation_data["uv_index"] = max(0, min(15, self.radiation_data["uv_index"]))
         
         # Simulate solar radiation changes
-        self.radiation_data["solar_radiation"] += random.uniform(-20, 20)
+        self.radiation_data["solar_radiation"] += self.rng.uniform(-20, 20)
         self.radiation_data["solar_radiation"] = max(0, min(1000, self.radiation_data["solar_radiation"]))
         
         # Simulate cosmic radiation changes
-        self.radiation_data["cosmic_radiation"] += random.uniform(-0.01, 0.01)
+        self.radiation_data["cosmic_radiation"] += self.rng.uniform(-0.01, 0.01)
         self.radiation_data["cosmic_radiation"] = max(0, min(1, self.radiation_data["cosmic_radiation"]))
         
         # Simulate terrestrial radiation changes
-        self.radiation_data["terrestrial_radiation"] += random.uniform(-0.005, 0.005)
+        self.radiation_data["terrestrial_radiation"] += self.rng.uniform(-0.005, 0.005)
         self.radiation_data["terrestrial_radiation"] = max(0, min(0.5, self.radiation_data["terrestrial_radiation"]))
     
     def _update_hazard_data(self) -> None:
         """Update environmental hazard data."""
         # Simulate turbulence detection
         if self.weather_data["wind_speed"] > 15:
-            self.hazard_data["turbulence_detected"] = random.random() < 0.3
+            self.hazard_data["turbulence_detected"] = self.rng.random() < 0.3
             self.hazard_data["turbulence_severity"] = min(1.0, self.weather_data["wind_speed"] / 30)
         else:
             self.hazard_data["turbulence_detected"] = False
@@ -235,7 +234,7 @@ class EnvironmentalAgent(BaseAgent):
         
         # Simulate dust storm
         if self.weather_data["wind_speed"] > 20 and self.air_quality_data["pm10"] > 100:
-            self.hazard_data["dust_storm"] = random.random() < 0.1
+            self.hazard_data["dust_storm"] = self.rng.random() < 0.1
         else:
             self.hazard_data["dust_storm"] = False
         
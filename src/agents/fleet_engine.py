@@ -0,0 +1,1268 @@
+"""Vectorized fleet-state engine for subsystem telemetry generation."""
+
+import asyncio
+import math
+import random
+from abc import ABC, abstractmethod
+from typing import Dict, Any, Optional, List, Callable, Type, TYPE_CHECKING
+import numpy as np
+from loguru import logger
+
+from . import ekf
+from ..utils.models import TelemetryRecord, SystemStatus
+from ..utils.config import config
+from ..utils.clock import SimulationClock, get_clock
+
+if TYPE_CHECKING:
+    from .base_agent import BaseAgent
+    from .physics import FlightPhysics
+    from .scheduler import TelemetryScheduler
+
+
+def _walk(state: np.ndarray, field: str, spread: float, low: float, high: float,
+          rng: np.random.Generator) -> None:
+    """Apply a bounded uniform random walk to a field for the whole fleet."""
+    column = state[field]
+    column += rng.uniform(-spread, spread, column.shape)
+    np.clip(column, low, high, out=column)
+
+
+def _walk_one(row: Dict[str, Any], field: str, spread: float, low: float, high: float,
+              rng: random.Random) -> None:
+    """Apply a bounded uniform random walk to a field of a single row."""
+    row[field] = min(high, max(low, row[field] + rng.uniform(-spread, spread)))
+
+
+class FleetModel(ABC):
+    """Vectorized state model for one subsystem across all UAVs.
+    
+    State lives in a structured NumPy array with one row per UAV. A step
+    updates every row at once; telemetry dictionaries are only built when
+    a single row is materialized.
+    """
+    
+    subsystem_name: str = ""
+    dtype: np.dtype = np.dtype([])
+    
+    @abstractmethod
+    def initialize(self, state: np.ndarray, rng: np.random.Generator) -> None:
+        """Fill freshly allocated rows with initial values.
+        
+        Args:
+            state: Structured array view of the new rows
+            rng: Random generator
+        """
+        pass
+    
+    @abstractmethod
+    def step(self, state: np.ndarray, dt: float, rng: np.random.Generator) -> None:
+        """Advance every row by one telemetry period in place.
+        
+        Args:
+            state: Structured array view of all live rows
+            dt: Telemetry period in seconds
+            rng: Random generator
+        """
+        pass
+    
+    @abstractmethod
+    def to_dict(self, row: np.void) -> Dict[str, Any]:
+        """Build the subsystem telemetry payload for one row.
+        
+        Args:
+            row: Structured array row
+            
+        Returns:
+            Telemetry data dictionary matching the per-agent layout
+        """
+        pass
+    
+    def couple(self, state: np.ndarray, dt: float, physics: "FlightPhysics", rows: np.ndarray) -> None:
+        """Overwrite the physically coupled fields from the flight physics.
+        
+        Called after every step when the engine has flight physics; models
+        without coupled fields keep their own state.
+        
+        Args:
+            state: Structured array view of all live rows
+            dt: Telemetry period in seconds
+            physics: Flight physics stepping the fleet's airframes
+            rows: Physics row of each state row, -1 where a UAV has none
+        """
+        pass
+
+
+class PowerFleetModel(FleetModel):
+    """Vectorized equivalent of PowerAgent."""
+    
+    subsystem_name = "Power"
+    dtype = np.dtype([
+        ("voltage", "f8"), ("current", "f8"), ("capacity", "f8"),
+        ("remaining_capacity", "f8"), ("temperature", "f8"), ("charge_cycles", "i4"),
+        ("health", "f8"), ("state_of_charge", "f8"), ("time_to_empty", "f8"),
+        ("time_to_full", "f8"),
+        ("propulsion", "f8"), ("avionics", "f8"), ("communication", "f8"),
+        ("payload", "f8"), ("sensors", "f8"), ("total_power", "f8"),
+        ("charging", "?"), ("discharging", "?"), ("power_save_mode", "?"),
+        ("voltage_regulation", "i1"), ("current_limit", "f8"),
+        ("overcurrent_protection", "?"), ("thermal_protection", "?"),
+        ("solar_available", "?"), ("solar_voltage", "f8"), ("solar_current", "f8"),
+        ("solar_power", "f8"), ("solar_efficiency", "f8"), ("solar_temperature", "f8"),
+        ("irradiance", "f8")
+    ])
+    
+    VOLTAGE_REGULATION = ("normal", "low", "high")
+    
+    def initialize(self, state: np.ndarray, rng: np.random.Generator) -> None:
+        """Fill new rows with the PowerAgent defaults."""
+        defaults = {
+            "voltage": 12.6, "current": 8.5, "capacity": 5000, "remaining_capacity": 4500,
+            "temperature": 25.0, "charge_cycles": 45, "health": 95.0, "state_of_charge": 90.0,
+            "time_to_empty": 45.0, "time_to_full": 0.0,
+            "propulsion": 60.0, "avionics": 15.0, "communication": 10.0, "payload": 10.0,
+            "sensors": 5.0, "total_power": 100.0,
+            "charging": False, "discharging": True, "power_save_mode": False,
+            "voltage_regulation": 0, "current_limit": 15.0,
+            "overcurrent_protection": False, "thermal_protection": False,
+            "solar_available": True, "solar_voltage": 18.0, "solar_current": 2.0,
+            "solar_power": 36.0, "solar_efficiency": 0.22, "solar_temperature": 35.0,
+            "irradiance": 800.0
+        }
+        for field, value in defaults.items():
+            state[field] = value
+    
+    def step(self, state: np.ndarray, dt: float, rng: np.random.Generator) -> None:
+        """Advance battery, distribution, management and solar state."""
+        n = len(state)
+        
+        # Battery discharge driven by the previous total power draw
+        current = state["total_power"] / state["voltage"] + rng.uniform(-0.5, 0.5, n)
+        state["current"] = np.clip(current, 0, 20)
+        
+        voltage = 10.5 + state["state_of_charge"] / 100.0 * 2.1 + rng.uniform(-0.1, 0.1, n)
+        state["voltage"] = np.clip(voltage, 10.0, 12.8)
+        
+        remaining = state["remaining_capacity"] - state["current"] * dt
+        state["remaining_capacity"] = np.clip(remaining, 0, state["capacity"])
+        state["state_of_charge"] = state["remaining_capacity"] / state["capacity"] * 100
+        
+        _walk(state, "temperature", 0.5, 15, 60, rng)
+        
+        with np.errstate(divide="ignore", invalid="ignore"):
+            state["time_to_empty"] = np.where(
+                state["current"] > 0,
+                state["remaining_capacity"] / state["current"] * 60,
+                np.inf
+            )
+        
+        # Power distribution
+        _walk(state, "propulsion", 2, 0, 80, rng)
+        _walk(state, "avionics", 0.5, 5, 25, rng)
+        _walk(state, "communication", 0.5, 5, 20, rng)
+        _walk(state, "payload", 1, 0, 20, rng)
+        _walk(state, "sensors", 0.2, 2, 10, rng)
+        state["total_power"] = (
+            state["propulsion"] + state["avionics"] + state["communication"] +
+            state["payload"] + state["sensors"]
+        )
+        
+        # Power management
+        charging = (state["voltage"] > 12.4) & (state["state_of_charge"] < 95)
+        state["charging"] = charging
+        state["discharging"] = ~charging
+        state["power_save_mode"] = state["state_of_charge"] < 30
+        state["voltage_regulation"] = np.select(
+            [state["voltage"] < 11.0, state["voltage"] > 12.5], [1, 2], default=0
+        )
+        
+        # Solar panels (rows with failed panels keep their last values)
+        solar = state[state["solar_available"]]
+        if len(solar):
+            m = len(solar)
+            _walk(solar, "irradiance", 50, 0, 1000, rng)
+            power = solar["irradiance"] * 0.05 * solar["solar_efficiency"] + rng.uniform(-2, 2, m)
+            solar["solar_power"] = np.clip(power, 0, 50)
+            solar["solar_voltage"] = 18.0 + rng.uniform(-1, 1, m)
+            solar["solar_current"] = solar["solar_power"] / solar["solar_voltage"]
+            _walk(solar, "solar_temperature", 1, 20, 60, rng)
+            state[state["solar_available"]] = solar
+    
+    def couple(self, state: np.ndarray, dt: float, physics: "FlightPhysics", rows: np.ndarray) -> None:
+        """Take battery state and propulsion draw from the physics; hand back the other loads."""
+        coupled = rows >= 0
+        source = physics.state[rows[coupled]]
+        loads = (state["avionics"] + state["communication"] + state["payload"] + state["sensors"])[coupled]
+        solar = np.where(state["solar_available"], state["solar_power"], 0.0)[coupled]
+        physics.state["load_power"][rows[coupled]] = loads - solar
+        
+        state["propulsion"][coupled] = source["propulsion_power"]
+        state["total_power"][coupled] = source["propulsion_power"] + loads
+        for field in ("voltage", "current", "capacity", "remaining_capacity", "state_of_charge"):
+            state[field][coupled] = source[field]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            state["time_to_empty"][coupled] = np.where(
+                source["current"] > 0, source["remaining_capacity"] / source["current"] * 60 / 1000, np.inf
+            )
+    
+    def to_dict(self, row: np.void) -> Dict[str, Any]:
+        """Build a PowerAgent-compatible payload."""
+        total_power = float(row["total_power"])
+        solar_power = float(row["solar_power"])
+        
+        return {
+            "battery": {
+                "voltage": float(row["voltage"]),
+                "current": float(row["current"]),
+                "capacity": float(row["capacity"]),
+                "remaining_capacity": float(row["remaining_capacity"]),
+                "temperature": float(row["temperature"]),
+                "charge_cycles": int(row["charge_cycles"]),
+                "health": float(row["health"]),
+                "state_of_charge": float(row["state_of_charge"]),
+                "time_to_empty": float(row["time_to_empty"]),
+                "time_to_full": float(row["time_to_full"])
+            },
+            "power_distribution": {
+                "total_power": total_power,
+                "propulsion": float(row["propulsion"]),
+                "avionics": float(row["avionics"]),
+                "communication": float(row["communication"]),
+                "payload": float(row["payload"]),
+                "sensors": float(row["sensors"])
+            },
+            "power_management": {
+                "charging": bool(row["charging"]),
+                "discharging": bool(row["discharging"]),
+                "power_save_mode": bool(row["power_save_mode"]),
+                "voltage_regulation": self.VOLTAGE_REGULATION[int(row["voltage_regulation"])],
+                "current_limit": float(row["current_limit"]),
+                "overcurrent_protection": bool(row["overcurrent_protection"]),
+                "thermal_protection": bool(row["thermal_protection"])
+            },
+            "solar": {
+                "available": bool(row["solar_available"]),
+                "voltage": float(row["solar_voltage"]),
+                "current": float(row["solar_current"]),
+                "power": solar_power,
+                "efficiency": float(row["solar_efficiency"]),
+                "temperature": float(row["solar_temperature"]),
+                "irradiance": float(row["irradiance"])
+            },
+            "status": {
+                "power_healthy": bool(
+                    row["voltage"] > 11.0 and row["state_of_charge"] > 20 and
+                    row["temperature"] < 50 and not row["overcurrent_protection"] and
+                    not row["thermal_protection"]
+                ),
+                "battery_critical": bool(row["state_of_charge"] < 20),
+                "charging_active": bool(row["charging"]),
+                "power_efficiency": min(1.0, solar_power / total_power) if total_power > 0 else 0.0
+            }
+        }
+
+
+class PropulsionFleetModel(FleetModel):
+    """Vectorized equivalent of PropulsionAgent (four motors per UAV)."""
+    
+    subsystem_name = "Propulsion"
+    MOTORS = 4
+    dtype = np.dtype([
+        ("rpm", "f8", (4,)), ("thrust", "f8", (4,)), ("motor_temperature", "f8", (4,)),
+        ("motor_voltage", "f8", (4,)), ("motor_current", "f8", (4,)),
+        ("esc_temperature", "f8", (4,)), ("esc_voltage", "f8", (4,)),
+        ("esc_current", "f8", (4,)), ("esc_status", "i1", (4,)),
+        ("prop_efficiency", "f8", (4,)), ("damage_level", "f8", (4,)), ("balance", "f8", (4,)),
+        ("total_thrust", "f8"), ("power_consumption", "f8"), ("efficiency", "f8")
+    ])
+    
+    ESC_STATUS = ("normal", "warning", "error")
+    
+    def initialize(self, state: np.ndarray, rng: np.random.Generator) -> None:
+        """Fill new rows with the PropulsionAgent defaults."""
+        defaults = {
+            "rpm": 3000, "thrust": 25.0, "motor_temperature": 45.0, "motor_voltage": 12.0,
+            "motor_current": 8.5, "esc_temperature": 40.0, "esc_voltage": 12.0,
+            "esc_current": 8.5, "esc_status": 0, "prop_efficiency": 0.85,
+            "damage_level": 0.0, "balance": 1.0, "total_thrust": 100.0,
+            "power_consumption": 400.0, "efficiency": 0.75
+        }
+        for field, value in defaults.items():
+            state[field] = value
+    
+    def step(self, state: np.ndarray, dt: float, rng: np.random.Generator) -> None:
+        """Advance motor, ESC and propeller state."""
+        _walk(state, "rpm", 50, 0, 6000, rng)
+        _walk(state, "thrust", 1, 0, 50, rng)
+        _walk(state, "motor_temperature", 2, 20, 100, rng)
+        _walk(state, "motor_voltage", 0.1, 10, 14, rng)
+        _walk(state, "motor_current", 0.2, 0, 15, rng)
+        
+        _walk(state, "esc_temperature", 1, 20, 80, rng)
+        _walk(state, "esc_voltage", 0.1, 10, 14, rng)
+        _walk(state, "esc_current", 0.2, 0, 15, rng)
+        
+        # Occasional ESC status changes (0.1% chance per ESC)
+        changed = rng.random(state["esc_status"].shape) < 0.001
+        if changed.any():
+            status = state["esc_status"]
+            status[changed] = rng.integers(0, len(self.ESC_STATUS), int(changed.sum()))
+            state["esc_status"] = status
+        
+        _walk(state, "prop_efficiency", 0.01, 0.5, 1.0, rng)
+        _walk(state, "damage_level", 0.001, 0, 1.0, rng)
+        _walk(state, "balance", 0.01, 0.5, 1.0, rng)
+        
+        state["total_thrust"] = state["thrust"].sum(axis=1)
+        state["power_consumption"] = (state["motor_voltage"] * state["motor_current"]).sum(axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            state["efficiency"] = np.where(
+                state["power_consumption"] > 0,
+                np.minimum(1.0, state["total_thrust"] / (state["power_consumption"] / 10)),
+                0.0
+            )
+    
+    def couple(self, state: np.ndarray, dt: float, physics: "FlightPhysics", rows: np.ndarray) -> None:
+        """Take motor speed, thrust and electrical draw from the physics."""
+        coupled = rows >= 0
+        source = physics.state[rows[coupled]]
+        voltage = source["voltage"][:, None]
+        current = source["motor_power"] / voltage
+        for field, value in (("rpm", source["rpm"]), ("thrust", source["thrust"]),
+                             ("motor_voltage", voltage), ("motor_current", current),
+                             ("esc_voltage", voltage), ("esc_current", current)):
+            state[field][coupled] = value
+        
+        # Windings heat toward a temperature set by the power they carry
+        temperature = state["motor_temperature"][coupled]
+        heating = (30 + 0.15 * source["motor_power"] - temperature) * min(1.0, dt / 30)
+        state["motor_temperature"][coupled] = temperature + heating
+        
+        state["total_thrust"][coupled] = source["thrust"].sum(axis=1)
+        state["power_consumption"][coupled] = source["motor_power"].sum(axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            state["efficiency"] = np.where(
+                state["power_consumption"] > 0,
+                np.minimum(1.0, state["total_thrust"] / (state["power_consumption"] / 10)),
+                0.0
+            )
+    
+    def to_dict(self, row: np.void) -> Dict[str, Any]:
+        """Build a PropulsionAgent-compatible payload."""
+        motors = {}
+        esc = {}
+        propellers = {}
+        for i in range(self.MOTORS):
+            motors[f"motor_{i + 1}"] = {
+                "rpm": float(row["rpm"][i]),
+                "thrust": float(row["thrust"][i]),
+                "temperature": float(row["motor_temperature"][i]),
+                "voltage": float(row["motor_voltage"][i]),
+                "current": float(row["motor_current"][i])
+            }
+            esc[f"esc_{i + 1}"] = {
+                "temperature": float(row["esc_temperature"][i]),
+                "voltage": float(row["esc_voltage"][i]),
+                "current": float(row["esc_current"][i]),
+                "status": self.ESC_STATUS[int(row["esc_status"][i])]
+            }
+            propellers[f"prop_{i + 1}"] = {
+                "efficiency": float(row["prop_efficiency"][i]),
+                "damage_level": float(row["damage_level"][i]),
+                "balance": float(row["balance"][i])
+            }
+        
+        total_thrust = float(row["total_thrust"])
+        
+        return {
+            "motors": motors,
+            "esc": esc,
+            "propellers": propellers,
+            "overall": {
+                "total_thrust": total_thrust,
+                "power_consumption": float(row["power_consumption"]),
+                "efficiency": float(row["efficiency"]),
+                "thrust_to_weight_ratio": total_thrust / 10.0  # Assuming 10kg UAV
+            },
+            "status": {
+                "all_motors_operational": bool((row["motor_temperature"] < 80).all()),
+                "all_esc_operational": bool((row["esc_status"] == 0).all()),
+                "propeller_balance_ok": bool((row["balance"] > 0.8).all())
+            }
+        }
+
+
+class NavigationFleetModel(FleetModel):
+    """Vectorized equivalent of NavigationAgent."""
+    
+    subsystem_name = "Navigation"
+    dtype = np.dtype([
+        ("latitude", "f8"), ("longitude", "f8"), ("altitude", "f8"), ("heading", "f8"),
+        ("speed", "f8"), ("gps_accuracy", "f8"), ("roll", "f8"), ("pitch", "f8"),
+        ("yaw_rate", "f8"), ("accel", "f8", (3,)), ("gyro", "f8", (3,))
+    ])
+    
+    def initialize(self, state: np.ndarray, rng: np.random.Generator) -> None:
+        """Scatter new rows around the Los Angeles area like NavigationAgent."""
+        n = len(state)
+        state["latitude"] = 34.0522 + rng.uniform(-0.1, 0.1, n)
+        state["longitude"] = -118.2437 + rng.uniform(-0.1, 0.1, n)
+        state["altitude"] = rng.uniform(100, 500, n)
+        state["heading"] = rng.uniform(0, 360, n)
+        state["speed"] = rng.uniform(10, 30, n)
+        state["gps_accuracy"] = rng.uniform(1, 5, n)
+        state["roll"] = rng.uniform(-5, 5, n)
+        state["pitch"] = rng.uniform(-5, 5, n)
+        state["yaw_rate"] = rng.uniform(-10, 10, n)
+        state["accel"] = rng.uniform(-2, 2, (n, 3))
+        state["gyro"] = rng.uniform(-50, 50, (n, 3))
+    
+    def step(self, state: np.ndarray, dt: float, rng: np.random.Generator) -> None:
+        """Advance position, attitude and sensor state."""
+        n = len(state)
+        
+        # Dead-reckon position from speed and heading
+        distance = state["speed"] * dt
+        heading = np.radians(state["heading"])
+        state["latitude"] += distance * np.cos(heading) / 111000
+        state["longitude"] += distance * np.sin(heading) / (111000 * np.cos(np.radians(state["latitude"])))
+        state["latitude"] += rng.uniform(-0.0001, 0.0001, n)
+        state["longitude"] += rng.uniform(-0.0001, 0.0001, n)
+        state["altitude"] += rng.uniform(-0.5, 0.5, n)
+        
+        # Attitude
+        _walk(state, "roll", 0.5, -30, 30, rng)
+        _walk(state, "pitch", 0.5, -30, 30, rng)
+        state["heading"] = (state["heading"] + rng.uniform(-1, 1, n)) % 360
+        
+        # Sensor noise
+        state["accel"] += rng.uniform(-0.1, 0.1, (n, 3))
+        state["gyro"] += rng.uniform(-2, 2, (n, 3))
+        _walk(state, "speed", 0.5, 0, 50, rng)
+    
+    def couple(self, state: np.ndarray, dt: float, physics: "FlightPhysics", rows: np.ndarray) -> None:
+        """Take position, attitude and inertial readings from the physics."""
+        coupled = rows >= 0
+        source = physics.state[rows[coupled]]
+        for field, value in (("latitude", "latitude"), ("longitude", "longitude"), ("altitude", "altitude"),
+                             ("heading", "heading"), ("speed", "speed"), ("roll", "roll"),
+                             ("pitch", "pitch"), ("yaw_rate", "turn_rate"), ("accel", "acceleration")):
+            state[field][coupled] = source[value]
+        state["gyro"][coupled] = np.column_stack([source["roll_rate"], source["pitch_rate"], source["turn_rate"]])
+    
+    def to_dict(self, row: np.void) -> Dict[str, Any]:
+        """Build a NavigationAgent-compatible payload."""
+        accel = row["accel"]
+        gyro = row["gyro"]
+        
+        return {
+            "position": {
+                "latitude": float(row["latitude"]),
+                "longitude": float(row["longitude"]),
+                "altitude": float(row["altitude"])
+            },
+            "attitude": {
+                "heading": float(row["heading"]),
+                "roll": float(row["roll"]),
+                "pitch": float(row["pitch"]),
+                "yaw_rate": float(row["yaw_rate"])
+            },
+            "velocity": {
+                "speed": float(row["speed"]),
+                "direction": float(row["heading"])
+            },
+            "sensors": {
+                "gps_accuracy": float(row["gps_accuracy"]),
+                "accelerometer": {"x": float(accel[0]), "y": float(accel[1]), "z": float(accel[2])},
+                "gyroscope": {"x": float(gyro[0]), "y": float(gyro[1]), "z": float(gyro[2])}
+            },
+            "status": {
+                "gps_lock": bool(row["gps_accuracy"] < 3.0),
+                "imu_calibrated": True,
+                "compass_valid": True
+            }
+        }
+
+
+class SensorFusionFleetModel(FleetModel):
+    """Sensor simulation and batched EKF for SensorFusionAgent.
+    
+    Each row carries a simulated true trajectory, the IMU, GPS, barometer
+    and magnetometer readings derived from it, and an extended Kalman
+    filter fusing those readings. A step is one batched IMU predict for
+    every row plus one batched update per aiding sensor for the rows whose
+    sensor is healthy, so the filter runs for the whole fleet at once.
+    Convergence and confidence are read from the filter covariance; a row
+    cut off from its aiding sensors drifts and its covariance grows.
+    
+    A UAV outside any fleet group runs the same model on a dictionary
+    row through initialize_one/step_one, which use the scalar filter
+    functions instead of one-row arrays.
+    """
+    
+    subsystem_name = "Sensor_Fusion"
+    dtype = np.dtype([
+        ("origin", "f8", (2,)), ("true_position", "f8", (3,)), ("true_velocity", "f8", (3,)),
+        ("true_yaw", "f8"), ("yaw_rate", "f8"), ("speed", "f8"), ("climb_rate", "f8"),
+        ("gyro_bias", "f8"), ("baro_bias", "f8"),
+        ("accel", "f8", (3,)), ("gyro", "f8", (3,)), ("mag", "f8", (3,)),
+        ("imu_temperature", "f8"), ("calibration", "i1"),
+        ("latitude", "f8"), ("longitude", "f8"), ("gps_altitude", "f8"), ("gps_accuracy", "f8"),
+        ("satellites", "i4"), ("hdop", "f8"), ("vdop", "f8"), ("gps_speed", "f8"),
+        ("gps_heading", "f8"), ("gps_age", "f8"),
+        ("pressure", "f8"), ("baro_altitude", "f8"), ("baro_temperature", "f8"),
+        ("calibration_offset", "f8"),
+        ("healthy", "?", (4,)), ("x", "f8", (ekf.STATE_SIZE,)),
+        ("P", "f8", (ekf.STATE_SIZE, ekf.STATE_SIZE)), ("nis", "f8"), ("faults", "i4")
+    ])
+    
+    CALIBRATION = ("calibrated", "calibrating", "failed")
+    IMU, GPS, BAROMETER, MAGNETOMETER = range(4)
+    
+    # Fault bits cutting sensors out of the filter; a fusion algorithm
+    # fault stops every aiding update, and a diverging filter also fails
+    # its innovation checks while its covariance blows up
+    FAULT_BITS = {
+        "imu_failure": 1,
+        "gps_failure": 2,
+        "barometer_failure": 4,
+        "magnetometer_failure": 8,
+        "fusion_algorithm_failure": 16,
+        "kalman_filter_divergence": 32
+    }
+    DIVERGENCE_NOISE = {"accel": 2.0, "gyro": 0.05}  # Process noise added while diverging
+    
+    GPS_INTERVAL = 0.2  # s between GPS fixes
+    NOMINAL_ACCURACY = 2.5  # m
+    GPS_RECOVERY = 10.0  # s for the GPS accuracy to settle back to nominal
+    FIELD_HORIZONTAL = 24.0  # uT, Los Angeles area
+    FIELD_DOWN = 39.0  # uT
+    POSITION_SCALE = 5.0  # m of horizontal uncertainty at which confidence is 0.5
+    MAX_POSITION_STD = 10.0  # m; beyond this the filter has diverged
+    MAX_HEADING_STD = 15.0  # degrees
+    
+    def initialize(self, state: np.ndarray, rng: np.random.Generator) -> None:
+        """Place new rows around the Los Angeles area with converged filters."""
+        n = len(state)
+        state["origin"] = np.column_stack([34.0522 + rng.uniform(-0.1, 0.1, n),
+                                           -118.2437 + rng.uniform(-0.1, 0.1, n)])
+        state["true_position"] = np.column_stack([np.zeros(n), np.zeros(n), rng.uniform(100, 300, n)])
+        state["true_yaw"] = rng.uniform(0, 2 * np.pi, n)
+        state["speed"] = rng.uniform(10, 20, n)
+        state["true_velocity"] = np.column_stack([state["speed"] * np.sin(state["true_yaw"]),
+                                                  state["speed"] * np.cos(state["true_yaw"]), np.zeros(n)])
+        state["accel"] = [0.0, 0.0, -ekf.GRAVITY]
+        state["imu_temperature"] = 25.0
+        state["satellites"] = 8
+        state["gps_accuracy"] = 2.5
+        state["hdop"] = 1.2
+        state["vdop"] = 1.5
+        state["pressure"] = 1013.25
+        state["baro_temperature"] = 20.0
+        state["healthy"] = True
+        
+        # Filters start near the truth with a GPS-grade covariance
+        initial = ekf.initial_covariance(n)
+        state["P"] = initial
+        state["x"][:, ekf.POSITION] = state["true_position"] + rng.normal(0, 2.0, (n, 3))
+        state["x"][:, ekf.VELOCITY] = state["true_velocity"] + rng.normal(0, 0.5, (n, 3))
+        state["x"][:, ekf.YAW] = (state["true_yaw"] + rng.normal(0, 0.05, n)) % (2 * np.pi)
+        state["nis"] = 3.0
+    
+    def step(self, state: np.ndarray, dt: float, rng: np.random.Generator) -> None:
+        """Advance the trajectories, sample every sensor and run the filters."""
+        n = len(state)
+        faults = state["faults"]
+        
+        # True trajectory: wandering turns, speed and climb within 50-400 m
+        _walk(state, "yaw_rate", 0.01, -0.2, 0.2, rng)
+        _walk(state, "speed", 0.2, 0, 30, rng)
+        _walk(state, "climb_rate", 0.1, -2, 2, rng)
+        altitude = state["true_position"][:, 2]
+        climb = state["climb_rate"]
+        state["climb_rate"] = np.where((altitude < 50) & (climb < 0), -climb,
+                                       np.where((altitude > 400) & (climb > 0), -climb, climb))
+        state["true_yaw"] = (state["true_yaw"] + state["yaw_rate"] * dt) % (2 * np.pi)
+        yaw = state["true_yaw"]
+        sin, cos = np.sin(yaw), np.cos(yaw)
+        previous = state["true_velocity"].copy()
+        velocity = np.column_stack([state["speed"] * sin, state["speed"] * cos, state["climb_rate"]])
+        acceleration = (velocity - previous) / dt
+        state["true_velocity"] = velocity
+        state["true_position"] += 0.5 * (previous + velocity) * dt
+        
+        # IMU: forward/right/down specific force and body rates
+        accel = np.column_stack([acceleration[:, 0] * sin + acceleration[:, 1] * cos,
+                                 acceleration[:, 0] * cos - acceleration[:, 1] * sin,
+                                 -acceleration[:, 2] - ekf.GRAVITY]) + rng.normal(0, 0.05, (n, 3))
+        state["gyro_bias"] = np.clip(state["gyro_bias"] + rng.normal(0, 1e-4, n), -0.02, 0.02)
+        gyro = np.column_stack([rng.normal(0, 0.005, n), rng.normal(0, 0.005, n),
+                                state["yaw_rate"] + state["gyro_bias"] + rng.normal(0, 0.002, n)])
+        imu_fault = (faults & self.FAULT_BITS["imu_failure"]) != 0
+        accel[imu_fault] = 0.0
+        gyro[imu_fault] = 0.0
+        state["accel"] = accel
+        state["gyro"] = gyro
+        _walk(state, "imu_temperature", 0.5, 15, 60, rng)
+        recalibrate = rng.random(n) < 0.001  # 0.1% chance
+        state["calibration"][recalibrate] = rng.integers(0, 3, int(recalibrate.sum()))
+        
+        # Magnetometer: local field seen from the body frame
+        field = np.column_stack([self.FIELD_HORIZONTAL * cos, -self.FIELD_HORIZONTAL * sin,
+                                 np.full(n, self.FIELD_DOWN)])
+        state["mag"] = field + rng.normal(0, 0.5, (n, 3))
+        
+        # GPS solution: each of 20 satellites is in view about half the
+        # time, and the accuracy wanders around its nominal value
+        drift = 0.05 * (10 - state["satellites"])
+        draw = rng.random(n)
+        change = (draw < dt * (0.5 + drift)).astype(np.int32) - (draw > 1 - dt * (0.5 - drift))
+        state["satellites"] = np.clip(state["satellites"] + change, 0, 20)
+        _walk(state, "gps_accuracy", 0.2, 1.0, 10.0, rng)
+        state["gps_accuracy"] += (self.NOMINAL_ACCURACY - state["gps_accuracy"]) * dt / self.GPS_RECOVERY
+        _walk(state, "hdop", 0.1, 0.5, 5.0, rng)
+        _walk(state, "vdop", 0.1, 0.5, 5.0, rng)
+        origin = state["origin"]
+        position = state["true_position"]
+        accuracy = state["gps_accuracy"]
+        state["latitude"] = origin[:, 0] + (position[:, 1] + rng.normal(0, 1, n) * accuracy) / 111000
+        state["longitude"] = origin[:, 1] + (position[:, 0] + rng.normal(0, 1, n) * accuracy) / (
+            111000 * np.cos(np.radians(origin[:, 0])))
+        state["gps_altitude"] = position[:, 2] + rng.normal(0, 1, n) * accuracy * 1.5
+        state["gps_speed"] = np.maximum(0, state["speed"] + rng.normal(0, 0.1, n))
+        state["gps_heading"] = (np.degrees(yaw) + rng.normal(0, 1, n)) % 360
+        
+        # Barometer: drifting bias on the true altitude
+        state["baro_bias"] = np.clip(state["baro_bias"] + rng.normal(0, 0.01, n), -3, 3)
+        baro_altitude = position[:, 2] + state["baro_bias"] + rng.normal(0, 0.3, n)
+        state["pressure"] = 1013.25 * np.clip(1 - baro_altitude / 44330, 0.5, 1.1) ** (1 / 0.1903)
+        state["baro_altitude"] = 44330 * (1 - (state["pressure"] / 1013.25) ** 0.1903)
+        _walk(state, "baro_temperature", 0.5, 15, 40, rng)
+        _walk(state, "calibration_offset", 0.1, -5, 5, rng)
+        
+        healthy = state["healthy"]
+        healthy[:, self.IMU] = (state["calibration"] == 0) & (state["imu_temperature"] < 50)
+        healthy[:, self.GPS] = (state["satellites"] >= 4) & (accuracy < 5.0)
+        healthy[:, self.BAROMETER] = ((950 < state["pressure"]) & (state["pressure"] < 1050)
+                                     & (np.abs(state["calibration_offset"]) < 2.0))
+        strength = np.linalg.norm(state["mag"], axis=1)
+        healthy[:, self.MAGNETOMETER] = (20 < strength) & (strength < 60)
+        
+        # One batched predict, then each aiding sensor for the rows that have it
+        x, P = state["x"], state["P"]
+        ekf.predict(x, P, accel, gyro[:, 2], dt)
+        diverging = (faults & self.FAULT_BITS["kalman_filter_divergence"]) != 0
+        if diverging.any():
+            inflation = np.zeros(ekf.STATE_SIZE)
+            inflation[ekf.VELOCITY] = self.DIVERGENCE_NOISE["accel"] ** 2 * dt
+            inflation[ekf.YAW] = self.DIVERGENCE_NOISE["gyro"] ** 2 * dt
+            P[diverging] += np.diag(inflation)
+        aiding = (faults & (self.FAULT_BITS["fusion_algorithm_failure"]
+                            | self.FAULT_BITS["kalman_filter_divergence"])) == 0
+        
+        state["gps_age"] += dt
+        due = state["gps_age"] >= self.GPS_INTERVAL - 1e-9
+        state["gps_age"][due] = 0.0
+        rows = np.flatnonzero(due & healthy[:, self.GPS] & aiding
+                              & ((faults & self.FAULT_BITS["gps_failure"]) == 0))
+        if len(rows):
+            gps = np.column_stack([
+                (state["longitude"][rows] - origin[rows, 1]) * 111000 * np.cos(np.radians(origin[rows, 0])),
+                (state["latitude"][rows] - origin[rows, 0]) * 111000,
+                state["gps_altitude"][rows]
+            ])
+            nis = ekf.update_gps(x, P, rows, gps, accuracy[rows], accuracy[rows] * 1.5)
+            state["nis"][rows] = 0.9 * state["nis"][rows] + 0.1 * nis
+        
+        rows = np.flatnonzero(healthy[:, self.BAROMETER] & aiding
+                              & ((faults & self.FAULT_BITS["barometer_failure"]) == 0))
+        ekf.update_baro(x, P, rows, state["baro_altitude"][rows])
+        
+        rows = np.flatnonzero(healthy[:, self.MAGNETOMETER] & aiding
+                              & ((faults & self.FAULT_BITS["magnetometer_failure"]) == 0))
+        ekf.update_mag(x, P, rows, state["mag"][rows, :2], self.FIELD_HORIZONTAL)
+    
+    def initialize_one(self, rng: random.Random) -> Dict[str, Any]:
+        """Create a single row, as initialize does for an array of rows.
+        
+        Args:
+            rng: Random source of the UAV
+            
+        Returns:
+            Row with the fields of dtype as floats, ints and lists
+        """
+        yaw = rng.uniform(0, 2 * math.pi)
+        speed = rng.uniform(10, 20)
+        true_position = [0.0, 0.0, rng.uniform(100, 300)]
+        true_velocity = [speed * math.sin(yaw), speed * math.cos(yaw), 0.0]
+        row: Dict[str, Any] = {name: 0.0 for name in self.dtype.names}
+        row.update({
+            "origin": [34.0522 + rng.uniform(-0.1, 0.1), -118.2437 + rng.uniform(-0.1, 0.1)],
+            "true_position": true_position, "true_velocity": true_velocity, "true_yaw": yaw,
+            "speed": speed, "accel": [0.0, 0.0, -ekf.GRAVITY], "gyro": [0.0, 0.0, 0.0],
+            "mag": [0.0, 0.0, 0.0], "imu_temperature": 25.0, "calibration": 0,
+            "satellites": 8, "gps_accuracy": 2.5, "hdop": 1.2, "vdop": 1.5,
+            "pressure": 1013.25, "baro_temperature": 20.0, "healthy": [True] * 4,
+            "P": ekf.initial_covariance(1)[0].tolist(), "nis": 3.0, "faults": 0
+        })
+        
+        row["x"] = ([value + rng.gauss(0, 2.0) for value in true_position]
+                    + [value + rng.gauss(0, 0.5) for value in true_velocity]
+                    + [(yaw + rng.gauss(0, 0.05)) % (2 * math.pi), 0.0])
+        return row
+    
+    def step_one(self, row: Dict[str, Any], dt: float, rng: random.Random) -> None:
+        """Advance a single row created by initialize_one, as step does for an array."""
+        faults = row["faults"]
+        
+        # True trajectory
+        _walk_one(row, "yaw_rate", 0.01, -0.2, 0.2, rng)
+        _walk_one(row, "speed", 0.2, 0, 30, rng)
+        _walk_one(row, "climb_rate", 0.1, -2, 2, rng)
+        position = row["true_position"]
+        if (position[2] < 50 and row["climb_rate"] < 0) or (position[2] > 400 and row["climb_rate"] > 0):
+            row["climb_rate"] = -row["climb_rate"]
+        yaw = row["true_yaw"] = (row["true_yaw"] + row["yaw_rate"] * dt) % (2 * math.pi)
+        sin, cos = math.sin(yaw), math.cos(yaw)
+        previous = row["true_velocity"]
+        velocity = [row["speed"] * sin, row["speed"] * cos, row["climb_rate"]]
+        acceleration = [(new - old) / dt for new, old in zip(velocity, previous)]
+        row["true_velocity"] = velocity
+        for axis in range(3):
+            position[axis] += 0.5 * (previous[axis] + velocity[axis]) * dt
+        
+        # IMU
+        accel = [acceleration[0] * sin + acceleration[1] * cos + rng.gauss(0, 0.05),
+                 acceleration[0] * cos - acceleration[1] * sin + rng.gauss(0, 0.05),
+                 -acceleration[2] - ekf.GRAVITY + rng.gauss(0, 0.05)]
+        row["gyro_bias"] = min(0.02, max(-0.02, row["gyro_bias"] + rng.gauss(0, 1e-4)))
+        gyro = [rng.gauss(0, 0.005), rng.gauss(0, 0.005),
+                row["yaw_rate"] + row["gyro_bias"] + rng.gauss(0, 0.002)]
+        if faults & self.FAULT_BITS["imu_failure"]:
+            accel = [0.0, 0.0, 0.0]
+            gyro = [0.0, 0.0, 0.0]
+        row["accel"] = accel
+        row["gyro"] = gyro
+        _walk_one(row, "imu_temperature", 0.5, 15, 60, rng)
+        if rng.random() < 0.001:  # 0.1% chance
+            row["calibration"] = rng.randrange(3)
+        
+        # Magnetometer
+        row["mag"] = [self.FIELD_HORIZONTAL * cos + rng.gauss(0, 0.5),
+                      -self.FIELD_HORIZONTAL * sin + rng.gauss(0, 0.5),
+                      self.FIELD_DOWN + rng.gauss(0, 0.5)]
+        
+        # GPS solution
+        drift = 0.05 * (10 - row["satellites"])
+        draw = rng.random()
+        if draw < dt * (0.5 + drift):
+            row["satellites"] = min(20, row["satellites"] + 1)
+        elif draw > 1 - dt * (0.5 - drift):
+            row["satellites"] = max(0, row["satellites"] - 1)
+        _walk_one(row, "gps_accuracy", 0.2, 1.0, 10.0, rng)
+        row["gps_accuracy"] += (self.NOMINAL_ACCURACY - row["gps_accuracy"]) * dt / self.GPS_RECOVERY
+        _walk_one(row, "hdop", 0.1, 0.5, 5.0, rng)
+        _walk_one(row, "vdop", 0.1, 0.5, 5.0, rng)
+        origin = row["origin"]
+        accuracy = row["gps_accuracy"]
+        meters_per_degree = 111000 * math.cos(math.radians(origin[0]))
+        row["latitude"] = origin[0] + (position[1] + rng.gauss(0, 1) * accuracy) / 111000
+        row["longitude"] = origin[1] + (position[0] + rng.gauss(0, 1) * accuracy) / meters_per_degree
+        row["gps_altitude"] = position[2] + rng.gauss(0, 1) * accuracy * 1.5
+        row["gps_speed"] = max(0.0, row["speed"] + rng.gauss(0, 0.1))
+        row["gps_heading"] = (math.degrees(yaw) + rng.gauss(0, 1)) % 360
+        
+        # Barometer
+        row["baro_bias"] = min(3.0, max(-3.0, row["baro_bias"] + rng.gauss(0, 0.01)))
+        baro_altitude = position[2] + row["baro_bias"] + rng.gauss(0, 0.3)
+        row["pressure"] = 1013.25 * min(1.1, max(0.5, 1 - baro_altitude / 44330)) ** (1 / 0.1903)
+        row["baro_altitude"] = 44330 * (1 - (row["pressure"] / 1013.25) ** 0.1903)
+        _walk_one(row, "baro_temperature", 0.5, 15, 40, rng)
+        _walk_one(row, "calibration_offset", 0.1, -5, 5, rng)
+        
+        strength = math.sqrt(sum(value * value for value in row["mag"]))
+        healthy = row["healthy"] = [
+            row["calibration"] == 0 and row["imu_temperature"] < 50,
+            row["satellites"] >= 4 and accuracy < 5.0,
+            950 < row["pressure"] < 1050 and abs(row["calibration_offset"]) < 2.0,
+            20 < strength < 60
+        ]
+        
+        # Predict, then each aiding sensor that is available
+        x, P = row["x"], row["P"]
+        ekf.predict_one(x, P, accel, gyro[2], dt)
+        if faults & self.FAULT_BITS["kalman_filter_divergence"]:
+            for axis in range(3, 6):
+                P[axis][axis] += self.DIVERGENCE_NOISE["accel"] ** 2 * dt
+            P[ekf.YAW][ekf.YAW] += self.DIVERGENCE_NOISE["gyro"] ** 2 * dt
+        aiding = not faults & (self.FAULT_BITS["fusion_algorithm_failure"]
+                               | self.FAULT_BITS["kalman_filter_divergence"])
+        
+        row["gps_age"] += dt
+        if row["gps_age"] >= self.GPS_INTERVAL - 1e-9:
+            row["gps_age"] = 0.0
+            if healthy[self.GPS] and aiding and not faults & self.FAULT_BITS["gps_failure"]:
+                gps = ((row["longitude"] - origin[1]) * meters_per_degree,
+                       (row["latitude"] - origin[0]) * 111000,
+                       row["gps_altitude"])
+                nis = ekf.update_gps_one(x, P, gps, accuracy, accuracy * 1.5)
+                row["nis"] = 0.9 * row["nis"] + 0.1 * nis
+        
+        if healthy[self.BAROMETER] and aiding and not faults & self.FAULT_BITS["barometer_failure"]:
+            ekf.update_baro_one(x, P, row["baro_altitude"])
+        if healthy[self.MAGNETOMETER] and aiding and not faults & self.FAULT_BITS["magnetometer_failure"]:
+            ekf.update_mag_one(x, P, row["mag"][:2], self.FIELD_HORIZONTAL)
+    
+    def to_dict(self, row: np.void) -> Dict[str, Any]:
+        """Build a SensorFusionAgent payload from an array or dictionary row."""
+        accel, gyro, mag = row["accel"], row["gyro"], row["mag"]
+        x, P = row["x"], row["P"]
+        imu_ok, gps_ok, baro_ok, mag_ok = (bool(value) for value in row["healthy"])
+        satellites = int(row["satellites"])
+        
+        position_std = math.sqrt(P[0][0] + P[1][1])
+        heading_std = math.degrees(math.sqrt(P[ekf.YAW][ekf.YAW]))
+        confidence = 1.0 / (1.0 + (position_std / self.POSITION_SCALE) ** 2)
+        fusion_active = imu_ok and (gps_ok or baro_ok)
+        converged = position_std < self.MAX_POSITION_STD and heading_std < self.MAX_HEADING_STD
+        latitude = float(row["origin"][0] + x[1] / 111000)
+        longitude = float(row["origin"][1] + x[0] / (111000 * math.cos(math.radians(row["origin"][0]))))
+        roll = math.degrees(math.atan2(-accel[1], -accel[2])) if accel[2] else 0.0
+        pitch = math.degrees(math.atan2(accel[0], math.hypot(accel[1], accel[2])))
+        
+        if gps_ok and imu_ok:
+            fusion_mode = "gps_imu_baro"
+        elif imu_ok and baro_ok:
+            fusion_mode = "imu_baro"
+        elif imu_ok:
+            fusion_mode = "imu_only"
+        else:
+            fusion_mode = "failed"
+        
+        healthy_count = imu_ok + gps_ok + baro_ok + mag_ok
+        redundancy = ("critical", "critical", "limited", "good", "full")[healthy_count]
+        
+        return {
+            "imu": {
+                "accelerometer": {"x": float(accel[0]), "y": float(accel[1]), "z": float(accel[2])},
+                "gyroscope": {"x": float(gyro[0]), "y": float(gyro[1]), "z": float(gyro[2])},
+                "magnetometer": {"x": float(mag[0]), "y": float(mag[1]), "z": float(mag[2])},
+                "temperature": float(row["imu_temperature"]),
+                "calibration_status": self.CALIBRATION[row["calibration"]]
+            },
+            "gps": {
+                "latitude": float(row["latitude"]),
+                "longitude": float(row["longitude"]),
+                "altitude": float(row["gps_altitude"]),
+                "accuracy": float(row["gps_accuracy"]),
+                "satellites": satellites,
+                "fix_type": "3D" if satellites >= 4 else "2D" if satellites >= 3 else "none",
+                "hdop": float(row["hdop"]),
+                "vdop": float(row["vdop"]),
+                "speed": float(row["gps_speed"]),
+                "heading": float(row["gps_heading"])
+            },
+            "barometer": {
+                "pressure": float(row["pressure"]),
+                "altitude": float(row["baro_altitude"]),
+                "temperature": float(row["baro_temperature"]),
+                "calibration_offset": float(row["calibration_offset"])
+            },
+            "fusion_output": {
+                # x/y follow the longitude/latitude * 111 km convention
+                "position": {"x": longitude * 111000, "y": latitude * 111000, "z": float(x[2])},
+                "velocity": {"x": float(x[4]), "y": float(x[3]), "z": float(x[5])},
+                "attitude": {"roll": roll, "pitch": pitch, "yaw": math.degrees(x[ekf.YAW])},
+                "angular_velocity": {"x": float(gyro[0]), "y": float(gyro[1]), "z": float(gyro[2])},
+                "linear_acceleration": {"x": float(accel[0]), "y": float(accel[1]), "z": float(accel[2])},
+                "confidence": confidence,
+                "fusion_mode": fusion_mode,
+                "uncertainty": {
+                    "position": float(position_std),
+                    "altitude": float(math.sqrt(P[2][2])),
+                    "heading": heading_std,
+                    "gps_innovation": float(row["nis"])
+                }
+            },
+            "sensor_health": {
+                "imu_healthy": imu_ok,
+                "gps_healthy": gps_ok,
+                "barometer_healthy": baro_ok,
+                "magnetometer_healthy": mag_ok,
+                "fusion_algorithm_active": fusion_active,
+                "kalman_filter_converged": converged
+            },
+            "status": {
+                "fusion_healthy": fusion_active and converged and confidence > 0.7,
+                "position_accuracy": "high" if position_std < 2.0 else "medium" if position_std < 5.0 else "low",
+                "attitude_accuracy": "high" if mag_ok and imu_ok else "medium" if imu_ok else "low",
+                "sensor_redundancy": redundancy
+            }
+        }
+
+
+class FleetGroup:
+    """All UAV rows of one subsystem, stepped together at a shared rate.
+    
+    A group exposes the same ``telemetry_rate``/``tick()`` surface as an
+    agent so it can be driven by the TelemetryScheduler in place of the
+    individual agents it represents.
+    """
+    
+    def __init__(self, model: FleetModel, telemetry_rate: float, rng: np.random.Generator,
+                 should_emit: Optional[Callable[[], bool]] = None, initial_capacity: int = 64,
+                 clock: Optional[SimulationClock] = None, physics: Optional["FlightPhysics"] = None):
+        """Initialize fleet group.
+        
+        Args:
+            model: Vectorized subsystem model
+            telemetry_rate: Step rate in Hz
+            rng: Random generator for this subsystem
+            should_emit: Predicate telling whether any consumer wants telemetry
+            initial_capacity: Initial number of preallocated rows
+            clock: Simulation clock used to stamp telemetry
+            physics: Flight physics the model's coupled fields are read from
+        """
+        self.model = model
+        self.uav_id = "fleet"
+        self.subsystem_name = model.subsystem_name
+        self.telemetry_rate = telemetry_rate
+        self.should_emit = should_emit
+        self.clock = clock if clock is not None else get_clock()
+        self.physics = physics
+        self.is_running = False
+        
+        self._rng = rng
+        self._state = np.zeros(initial_capacity, dtype=model.dtype)
+        self._size = 0
+        self._index: Dict[str, int] = {}
+        self._uav_ids: List[str] = []
+        self._agents: Dict[str, "BaseAgent"] = {}
+        self._scheduler: Optional["TelemetryScheduler"] = None
+        self._task: Optional[asyncio.Task] = None
+        
+        self.steps = 0
+        self.materialized = 0
+    
+    @property
+    def state(self) -> np.ndarray:
+        """Structured array view of all live rows."""
+        return self._state[:self._size]
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    @property
+    def uav_ids(self) -> List[str]:
+        """UAV identifiers in row order."""
+        return list(self._uav_ids)
+    
+    def add(self, agent: "BaseAgent") -> None:
+        """Allocate a row for an agent's UAV.
+        
+        Args:
+            agent: Agent whose telemetry this group will generate
+        """
+        uav_id = agent.uav_id
+        if uav_id in self._index:
+            self._agents[uav_id] = agent
+            return
+        
+        if self._size == len(self._state):
+            grown = np.zeros(max(1, len(self._state) * 2), dtype=self.model.dtype)
+            grown[:self._size] = self._state[:self._size]
+            self._state = grown
+        
+        row = self._size
+        self.model.initialize(self._state[row:row + 1], self._rng)
+        self._index[uav_id] = row
+        self._uav_ids.append(uav_id)
+        self._agents[uav_id] = agent
+        self._size += 1
+    
+    def remove(self, uav_id: str) -> None:
+        """Release a UAV's row by moving the last row into its slot.
+        
+        Args:
+            uav_id: UAV to remove
+        """
+        row = self._index.pop(uav_id, None)
+        if row is None:
+            return
+        
+        self._agents.pop(uav_id, None)
+        last = self._size - 1
+        if row != last:
+            moved = self._uav_ids[last]
+            self._state[row] = self._state[last]
+            self._uav_ids[row] = moved
+            self._index[moved] = row
+        
+        self._uav_ids.pop()
+        self._size -= 1
+    
+    def contains(self, uav_id: str) -> bool:
+        """Check whether a UAV has a row in this group."""
+        return uav_id in self._index
+    
+    def row(self, uav_id: str) -> np.void:
+        """Get a UAV's live row; writes to its fields update the group state."""
+        return self._state[self._index[uav_id]]
+    
+    def materialize(self, uav_id: str, status: SystemStatus = SystemStatus.NOMINAL) -> TelemetryRecord:
+        """Build a TelemetryRecord object from a UAV's current row.
+        
+        Args:
+            uav_id: UAV identifier
+            status: Agent status to stamp on the telemetry
+            
+        Returns:
+            TelemetryRecord in the same layout the per-agent path produces
+        """
+        self.materialized += 1
+        row = self._state[self._index[uav_id]]
+        
+        return TelemetryRecord(
+            timestamp=self.clock.now(),
+            subsystem=self.subsystem_name,
+            uav_id=uav_id,
+            data=self.model.to_dict(row),
+            status=status
+        )
+    
+    def step(self) -> None:
+        """Advance every row by one telemetry period."""
+        if self._size:
+            dt = 1.0 / self.telemetry_rate
+            self.model.step(self.state, dt, self._rng)
+            if self.physics is not None:
+                self.model.couple(self.state, dt, self.physics, self.physics.rows(self._uav_ids))
+        self.steps += 1
+    
+    async def tick(self) -> None:
+        """Step the whole fleet and publish telemetry for running agents."""
+        self.step()
+        
+        if self.should_emit is not None and not self.should_emit():
+            return
+        
+        for uav_id, agent in list(self._agents.items()):
+            if agent.is_running:
+                await agent.publish(self.materialize(uav_id, agent.status))
+    
+    async def start(self, scheduler: Optional["TelemetryScheduler"] = None) -> None:
+        """Start stepping the group.
+        
+        Args:
+            scheduler: Shared tick scheduler; a private loop is used if omitted
+        """
+        if self.is_running:
+            return
+        
+        self.is_running = True
+        if scheduler is not None:
+            self._scheduler = scheduler
+            scheduler.register(self)
+        else:
+            self._task = asyncio.create_task(self._run_loop())
+    
+    async def stop(self) -> None:
+        """Stop stepping the group."""
+        self.is_running = False
+        if self._scheduler is not None:
+            self._scheduler.unregister(self)
+            self._scheduler = None
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+    
+    async def _run_loop(self) -> None:
+        """Private stepping loop used when no scheduler is shared."""
+        interval = 1.0 / self.telemetry_rate
+        
+        while self.is_running:
+            try:
+                await self.tick()
+            except Exception as e:
+                logger.error(f"Error stepping fleet group {self.subsystem_name}: {e}")
+            await self.clock.sleep(interval)
+
+
+class FleetStateEngine:
+    """Holds per-subsystem fleet state in structured arrays.
+    
+    Agents of supported subsystems are attached to the engine instead of
+    generating their own telemetry. Each subsystem is then stepped once per
+    period for the whole fleet with batched random draws, and a
+    TelemetryRecord object is only built for an agent when it is published
+    to consumers or explicitly requested.
+    """
+    
+    # Registry of available vectorized models
+    MODELS: Dict[str, Type[FleetModel]] = {
+        "Power": PowerFleetModel,
+        "Propulsion": PropulsionFleetModel,
+        "Navigation": NavigationFleetModel,
+        "Sensor_Fusion": SensorFusionFleetModel
+    }
+    
+    def __init__(self, seed: Optional[int] = None, should_emit: Optional[Callable[[], bool]] = None,
+                 clock: Optional[SimulationClock] = None):
+        """Initialize fleet-state engine.
+        
+        Args:
+            seed: Random seed for the batched generators (defaults to
+                system.fleet_engine.seed, then system.seed)
+            should_emit: Predicate telling whether any consumer wants telemetry;
+                when it returns False groups only advance their state
+            clock: Simulation clock (defaults to the shared clock)
+        """
+        if seed is None:
+            seed = config.get("system.fleet_engine.seed")
+        if seed is None:
+            seed = config.get("system.seed")
+        
+        self.seed = seed
+        self.should_emit = should_emit
+        self.clock = clock if clock is not None else get_clock()
+        self.initial_capacity = config.get("system.fleet_engine.initial_capacity", 64)
+        self.groups: Dict[str, FleetGroup] = {}
+        self.physics: Optional["FlightPhysics"] = None
+        self.is_running = False
+        self._scheduler: Optional["TelemetryScheduler"] = None
+        
+        logger.info("FleetStateEngine initialized")
+    
+    @classmethod
+    def register_model(cls, subsystem_name: str, model_class: Type[FleetModel]) -> None:
+        """Register a vectorized model for a subsystem.
+        
+        Args:
+            subsystem_name: Name of the subsystem
+            model_class: Model class to register
+        """
+        if not issubclass(model_class, FleetModel):
+            raise ValueError("Model class must inherit from FleetModel")
+        
+        cls.MODELS[subsystem_name] = model_class
+    
+    def supports(self, subsystem_name: str) -> bool:
+        """Check whether a subsystem has a vectorized model.
+        
+        Args:
+            subsystem_name: Name of the subsystem
+            
+        Returns:
+            True if the subsystem can be driven by the engine
+        """
+        return subsystem_name in self.MODELS
+    
+    async def attach(self, agent: "BaseAgent") -> None:
+        """Move an agent's state generation into the engine.
+        
+        Args:
+            agent: Agent of a supported subsystem
+        """
+        name = agent.subsystem_name
+        if not self.supports(name):
+            raise ValueError(f"No fleet model for subsystem: {name}")
+        
+        group = self.groups.get(name)
+        if group is None:
+            group = FleetGroup(
+                self.MODELS[name](), agent.telemetry_rate, self._create_rng(name),
+                should_emit=self.should_emit, initial_capacity=self.initial_capacity,
+                clock=self.clock, physics=self.physics
+            )
+            self.groups[name] = group
+            if self.is_running:
+                await group.start(self._scheduler)
+        
+        group.add(agent)
+        agent.attach_fleet(group)
+    
+    def attach_physics(self, physics: Optional["FlightPhysics"]) -> None:
+        """Couple every subsystem group to the fleet's flight physics.
+        
+        Args:
+            physics: Flight physics stepping the fleet's airframes, or None to
+                uncouple
+        """
+        self.physics = physics
+        for group in self.groups.values():
+            group.physics = physics
+    
+    def _create_rng(self, subsystem_name: str) -> np.random.Generator:
+        """Create the batched generator for one subsystem group."""
+        if self.seed is None:
+            return np.random.default_rng()
+        
+        # Independent per-subsystem streams, so group creation order does not matter
+        key = [ord(c) for c in subsystem_name]
+        return np.random.default_rng([int(self.seed), *key])
+    
+    def detach(self, agent: "BaseAgent") -> None:
+        """Release an agent's row.
+        
+        Args:
+            agent: Previously attached agent
+        """
+        group = self.groups.get(agent.subsystem_name)
+        if group is not None:
+            group.remove(agent.uav_id)
+        agent.attach_fleet(None)
+    
+    def get_state(self, subsystem_name: str) -> Optional[np.ndarray]:
+        """Get the live structured state array of a subsystem.
+        
+        Args:
+            subsystem_name: Name of the subsystem
+            
+        Returns:
+            Structured array view (one row per UAV) or None
+        """
+        group = self.groups.get(subsystem_name)
+        return group.state if group is not None else None
+    
+    async def start(self, scheduler: Optional["TelemetryScheduler"] = None) -> None:
+        """Start stepping all subsystem groups.
+        
+        Args:
+            scheduler: Shared tick scheduler
+        """
+        self.is_running = True
+        self._scheduler = scheduler
+        for group in self.groups.values():
+            await group.start(scheduler)
+        logger.info(f"FleetStateEngine started with {len(self.groups)} subsystem groups")
+    
+    async def stop(self) -> None:
+        """Stop stepping all subsystem groups."""
+        self.is_running = False
+        for group in self.groups.values():
+            await group.stop()
+        self._scheduler = None
+        logger.info("FleetStateEngine stopped")
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get engine statistics.
+        
+        Returns:
+            Dictionary containing per-subsystem row and step counts
+        """
+        return {
+            "is_running": self.is_running,
+            "subsystems": {
+                name: {
+                    "uavs": len(group),
+                    "capacity": len(group._state),
+                    "telemetry_rate": group.telemetry_rate,
+                    "steps": group.steps,
+                    "materialized": group.materialized
+                }
+                for name, group in self.groups.items()
+            }
+        }
@@ -1,12 +1,14 @@
 """Flight control subsystem agent."""
 
-import random
 import math
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Optional, TYPE_CHECKING
 
 from .base_agent import BaseAgent
-from ..utils.models import TelemetryData, SystemStatus
+from ..utils.models import TelemetryRecord, SystemStatus
+
+if TYPE_CHECKING:
+    from .route_engine import RouteEngine
 
 
 class FlightControlAgent(BaseAgent):
@@ -58,8 +60,9 @@ class FlightControlAgent(BaseAgent):
             "stability_augmentation": True,
             "fly_by_wire_active": True
         }
+        self.route_engine: Optional["RouteEngine"] = None
     
-    async def generate_telemetry(self) -> TelemetryData:
+    async def generate_telemetry(self) -> TelemetryRecord:
         """Generate flight control telemetry data."""
         self._update_control_surfaces()
         self._update_autopilot_data()
@@ -79,14 +82,14 @@ class FlightControlAgent(BaseAgent):
             }
         }
         
-        return TelemetryData(
+        return TelemetryRecord(
             subsystem=self.subsystem_name,
             uav_id=self.uav_id,
             data=data,
             status=self.status
         )
     
-    async def apply_fault(self, telemetry_data: TelemetryData, fault_params: Dict[str, Any]) -> TelemetryData:
+    async def apply_fault(self, telemetry_data: TelemetryRecord, fault_params: Dict[str, Any]) -> TelemetryRecord:
         """Apply flight control fault."""
         fault_type = fault_params.get("type", "servo_failure")
         
@@ -100,7 +103,7 @@ class FlightControlAgent(BaseAgent):
             # Simulate control surface jam
             surface = fault_params.get("surface", "aileron_left")
             if surface in telemetry_data.data["control_surfaces"]:
-                telemetry_data.data["control_surfaces"][surface] = random.uniform(-10, 10)
+                telemetry_data.data["control_surfaces"][surface] = self.rng.uniform(-10, 10)
                 
         elif fault_type == "autopilot_failure":
             # Simulate autopilot failure
@@ -121,124 +124,168 @@ class FlightControlAgent(BaseAgent):
             
         elif fault_type == "trim_failure":
             # Simulate trim system failure
-            telemetry_data.data["control_status"]["trim_position"] = random.uniform(-5, 5)
+            telemetry_data.data["control_status"]["trim_position"] = self.rng.uniform(-5, 5)
         
         telemetry_data.status = SystemStatus.ERROR
         return telemetry_data
     
     def _update_control_surfaces(self) -> None:
         """Update control surface positions."""
-        # Simulate control surface movements
-        self.control_surfaces["aileron_left"] += random.uniform(-2, 2)
+        row = self._physics_row()
+        if row is not None:
+            # Surfaces the physics autopilot is flying with
+            for name, deflection in zip(self.physics.SURFACES, row["surfaces"]):
+                self.control_surfaces[name] = float(deflection)
+        else:
+            self._simulate_control_surfaces()
+        
+        # Simulate flap and spoiler changes
+        if self.rng.random() < 0.01:  # 1% chance
+            self.control_surfaces["flaps"] = self.rng.uniform(0, 30)
+        
+        if self.rng.random() < 0.005:  # 0.5% chance
+            self.control_surfaces["spoilers"] = self.rng.uniform(0, 20)
+    
+    def _simulate_control_surfaces(self) -> None:
+        """Drift the primary control surfaces when no physics is attached."""
+        self.control_surfaces["aileron_left"] += self.rng.uniform(-2, 2)
         self.control_surfaces["aileron_left"] = max(-30, min(30, self.control_surfaces["aileron_left"]))
         
-        self.control_surfaces["aileron_right"] += random.uniform(-2, 2)
+        self.control_surfaces["aileron_right"] += self.rng.uniform(-2, 2)
         self.control_surfaces["aileron_right"] = max(-30, min(30, self.control_surfaces["aileron_right"]))
         
-        self.control_surfaces["elevator"] += random.uniform(-1, 1)
+        self.control_surfaces["elevator"] += self.rng.uniform(-1, 1)
         self.control_surfaces["elevator"] = max(-20, min(20, self.control_surfaces["elevator"]))
         
-        self.control_surfaces["rudder"] += random.uniform(-1, 1)
+        self.control_surfaces["rudder"] += self.rng.uniform(-1, 1)
         self.control_surfaces["rudder"] = max(-20, min(20, self.control_surfaces["rudder"]))
+    
+    def attach_route_engine(self, route_engine: Optional["RouteEngine"]) -> None:
+        """Take waypoint guidance from a route engine tracking the fleet.
         
-        # Simulate flap and spoiler changes
-        if random.random() < 0.01:  # 1% chance
-            self.control_surfaces["flaps"] = random.uniform(0, 30)
-        
-        if random.random() < 0.005:  # 0.5% chance
-            self.control_surfaces["spoilers"] = random.uniform(0, 20)
+        Args:
+            route_engine: Route engine holding this UAV's mission route, or
+                None to go back to simulated guidance
+        """
+        self.route_engine = route_engine
     
     def _update_autopilot_data(self) -> None:
         """Update autopilot data."""
         # Simulate autopilot mode changes
-        if random.random() < 0.005:  # 0.5% chance
+        if self.rng.random() < 0.005:  # 0.5% chance
             modes = ["manual", "auto", "guided", "rtl"]
-            self.autopilot_data["mode"] = random.choice(modes)
-        
-        # Update waypoint data
-        self.autopilot_data["distance_to_target"] += random.uniform(-10, 10)
-        self.autopilot_data["distance_to_target"] = max(0, min(10000, 
-            self.autopilot_data["distance_to_target"]))
+            self.autopilot_data["mode"] = self.rng.choice(modes)
         
-        self.autopilot_data["bearing_to_target"] += random.uniform(-2, 2)
-        self.autopilot_data["bearing_to_target"] = self.autopilot_data["bearing_to_target"] % 360
-        
-        self.autopilot_data["cross_track_error"] += random.uniform(-1, 1)
-        self.autopilot_data["cross_track_error"] = max(-50, min(50, 
-            self.autopilot_data["cross_track_error"]))
+        # Guidance along the mission route when it is tracked
+        progress = self.route_engine.progress(self.uav_id) if self.route_engine is not None else None
+        if progress is not None:
+            self.autopilot_data["waypoint_active"] = progress["next_waypoint"] + 1
+            self.autopilot_data["total_waypoints"] = progress["total_waypoints"]
+            self.autopilot_data["distance_to_target"] = progress["distance_to_target"]
+            self.autopilot_data["bearing_to_target"] = progress["bearing_to_target"]
+            self.autopilot_data["cross_track_error"] = progress["cross_track_error"]
+            if self.physics is not None:
+                self.physics.command(self.uav_id, heading=progress["bearing_to_target"])
+        else:
+            self._simulate_guidance()
         
         # Update hold modes based on autopilot mode
         if self.autopilot_data["mode"] in ["auto", "guided"]:
-            self.autopilot_data["altitude_hold"] = random.random() < 0.8
-            self.autopilot_data["heading_hold"] = random.random() < 0.8
-            self.autopilot_data["speed_hold"] = random.random() < 0.8
+            self.autopilot_data["altitude_hold"] = self.rng.random() < 0.8
+            self.autopilot_data["heading_hold"] = self.rng.random() < 0.8
+            self.autopilot_data["speed_hold"] = self.rng.random() < 0.8
         else:
             self.autopilot_data["altitude_hold"] = False
             self.autopilot_data["heading_hold"] = False
             self.autopilot_data["speed_hold"] = False
     
+    def _simulate_guidance(self) -> None:
+        """Drift waypoint guidance when no route is tracked."""
+        self.autopilot_data["distance_to_target"] += self.rng.uniform(-10, 10)
+        self.autopilot_data["distance_to_target"] = max(0, min(10000, 
+            self.autopilot_data["distance_to_target"]))
+        
+        self.autopilot_data["bearing_to_target"] += self.rng.uniform(-2, 2)
+        self.autopilot_data["bearing_to_target"] = self.autopilot_data["bearing_to_target"] % 360
+        
+        self.autopilot_data["cross_track_error"] += self.rng.uniform(-1, 1)
+        self.autopilot_data["cross_track_error"] = max(-50, min(50, 
+            self.autopilot_data["cross_track_error"]))
+    
     def _update_flight_dynamics(self) -> None:
         """Update flight dynamics data."""
+        row = self._physics_row()
+        if row is not None:
+            self.flight_dynamics["vertical_speed"] = float(row["vertical_speed"])
+            self.flight_dynamics["turn_rate"] = float(row["turn_rate"])
+            self.flight_dynamics["bank_angle"] = float(row["roll"])
+            self.flight_dynamics["pitch_angle"] = float(row["pitch"])
+            self.flight_dynamics["load_factor"] = float(row["load_factor"])
+        else:
+            self._simulate_flight_dynamics()
+        
+        # Update warnings based on flight dynamics
+        self.flight_dynamics["stall_warning"] = (
+            self.flight_dynamics["pitch_angle"] > 20 or 
+            self.flight_dynamics["load_factor"] < 0.8
+        )
+        
+        self.flight_dynamics["overspeed_warning"] = (
+            self.flight_dynamics["load_factor"] > 2.5 or 
+            abs(self.flight_dynamics["turn_rate"]) > 25
+        )
+    
+    def _simulate_flight_dynamics(self) -> None:
+        """Drift the flight dynamics when no physics is attached."""
         # Simulate vertical speed changes
-        self.flight_dynamics["vertical_speed"] += random.uniform(-1, 1)
+        self.flight_dynamics["vertical_speed"] += self.rng.uniform(-1, 1)
         self.flight_dynamics["vertical_speed"] = max(-20, min(20, 
             self.flight_dynamics["vertical_speed"]))
         
         # Simulate turn rate changes
-        self.flight_dynamics["turn_rate"] += random.uniform(-2, 2)
+        self.flight_dynamics["turn_rate"] += self.rng.uniform(-2, 2)
         self.flight_dynamics["turn_rate"] = max(-30, min(30, self.flight_dynamics["turn_rate"]))
         
         # Simulate bank angle changes
-        self.flight_dynamics["bank_angle"] += random.uniform(-1, 1)
+        self.flight_dynamics["bank_angle"] += self.rng.uniform(-1, 1)
         self.flight_dynamics["bank_angle"] = max(-60, min(60, self.flight_dynamics["bank_angle"]))
         
         # Simulate pitch angle changes
-        self.flight_dynamics["pitch_angle"] += random.uniform(-0.5, 0.5)
+        self.flight_dynamics["pitch_angle"] += self.rng.uniform(-0.5, 0.5)
         self.flight_dynamics["pitch_angle"] = max(-30, min(30, self.flight_dynamics["pitch_angle"]))
         
         # Simulate load factor changes
-        self.flight_dynamics["load_factor"] += random.uniform(-0.1, 0.1)
+        self.flight_dynamics["load_factor"] += self.rng.uniform(-0.1, 0.1)
         self.flight_dynamics["load_factor"] = max(0.5, min(3.0, self.flight_dynamics["load_factor"]))
-        
-        # Update warnings based on flight dynamics
-        self.flight_dynamics["stall_warning"] = (
-            self.flight_dynamics["pitch_angle"] > 20 or 
-            self.flight_dynamics["load_factor"] < 0.8
-        )
-        
-        self.flight_dynamics["overspeed_warning"] = (
-            self.flight_dynamics["load_factor"] > 2.5 or 
-            abs(self.flight_dynamics["turn_rate"]) > 25
-        )
     
     def _update_control_status(self) -> None:
         """Update control system status."""
         # Simulate servo health changes
         for i in range(len(self.control_status["servo_health"])):
-            self.control_status["servo_health"][i] += random.uniform(-0.5, 0.5)
+            self.control_status["servo_health"][i] += self.rng.uniform(-0.5, 0.5)
             self.control_status["servo_health"][i] = max(0, min(100, 
                 self.control_status["servo_health"][i]))
         
         # Simulate control authority changes
-        self.control_status["control_authority"] += random.uniform(-1, 1)
+        self.control_status["control_authority"] += self.rng.uniform(-1, 1)
         self.control_status["control_authority"] = max(0, min(100, 
             self.control_status["control_authority"]))
         
         # Simulate trim position changes
-        self.control_status["trim_position"] += random.uniform(-0.1, 0.1)
+        self.control_status["trim_position"] += self.rng.uniform(-0.1, 0.1)
         self.control_status["trim_position"] = max(-5, min(5, 
             self.control_status["trim_position"]))
         
         # Simulate control sensitivity changes
-        self.control_status["control_sensitivity"] += random.uniform(-0.05, 0.05)
+        self.control_status["control_sensitivity"] += self.rng.uniform(-0.05, 0.05)
         self.control_status["control_sensitivity"] = max(0.5, min(2.0, 
             self.control_status["control_sensitivity"]))
         
         # Simulate occasional system status changes
-        if random.random() < 0.001:  # 0.1% chance
+        if self.rng.random() < 0.001:  # 0.1% chance
             self.control_status["stability_augmentation"] = not self.control_status["stability_augmentation"]
         
-        if random.random() < 0.001:  # 0.1% chance
+        if self.rng.random() < 0.001:  # 0.1% chance
             self.control_status["fly_by_wire_active"] = not self.control_status["fly_by_wire_active"]
     
     def _is_flight_control_healthy(self) -> bool:
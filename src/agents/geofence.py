@@ -0,0 +1,506 @@
+"""Grid-indexed geofence / no-fly-zone engine."""
+
+import asyncio
+import json
+import math
+import time
+from pathlib import Path
+from typing import Dict, Any, Optional, List, Sequence, Tuple, TYPE_CHECKING
+import numpy as np
+from loguru import logger
+
+from .spatial_index import METERS_PER_DEGREE, PositionSource
+from ..utils.config import config
+from ..utils.clock import SimulationClock, get_clock
+
+if TYPE_CHECKING:
+    from .scheduler import TelemetryScheduler
+
+
+# Grid cell keys pack (column, row) as column * 2**32 + row
+_COLUMN = np.int64(1 << 32)
+
+CIRCLE, POLYGON = 0, 1
+
+
+class GeofenceEngine:
+    """No-fly zones compiled into a uniform grid for vectorized checks.
+    
+    Zones are circles or simple polygons (outer ring only) in latitude and
+    longitude. Compiling projects them onto a local east/north plane in
+    meters and registers every zone in each grid cell within ``cell_size``
+    of its bounding box, so a position only meets the zones listed for its
+    own cell, never the whole zone set. ``evaluate`` answers containment
+    and signed distance to the nearest zone boundary (negative inside) for
+    all positions at once; boundaries further than ``cell_size`` away are
+    reported as infinitely far.
+    
+    Like the fleet spatial index, the engine exposes ``telemetry_rate`` and
+    ``tick()`` so the TelemetryScheduler can re-check the fleet every period.
+    """
+    
+    def __init__(self, source: Optional[PositionSource] = None, cell_size: Optional[float] = None,
+                 rate: Optional[float] = None, clock: Optional[SimulationClock] = None):
+        """Initialize geofence engine.
+        
+        Args:
+            source: Callable returning the current fleet positions, read on
+                every tick
+            cell_size: Grid cell size and distance horizon in meters
+                (defaults to configuration)
+            rate: Fleet check rate in Hz (defaults to configuration)
+            clock: Simulation clock used by the private check loop
+        """
+        self.source = source
+        self.cell_size = float(cell_size if cell_size is not None
+                               else config.get("system.geofence.cell_size", 1000.0))
+        self.telemetry_rate = rate if rate is not None else config.get("system.geofence.rate", 5.0)
+        self.clock = clock if clock is not None else get_clock()
+        self.uav_id = "fleet"
+        self.subsystem_name = "Geofence"
+        self.is_running = False
+        self._scheduler: Optional["TelemetryScheduler"] = None
+        self._task: Optional[asyncio.Task] = None
+        
+        # Zone definitions, compiled lazily
+        self.zone_ids: List[str] = []
+        self._zone_rows: Dict[str, int] = {}
+        self._circles: List[Tuple[float, float, float]] = []
+        self._polygons: List[np.ndarray] = []
+        self._kinds: List[Tuple[int, int]] = []
+        self._compiled = False
+        
+        # Last fleet check
+        self._uav_rows: Dict[str, int] = {}
+        self._result: Dict[str, np.ndarray] = {}
+        
+        self.stats = {
+            "zones": 0,
+            "grid_cells": 0,
+            "compiles": 0,
+            "checks": 0,
+            "pairs_checked": 0,
+            "violations": 0,
+            "last_check_ms": 0.0
+        }
+    
+    def __len__(self) -> int:
+        return len(self.zone_ids)
+    
+    def __contains__(self, zone_id: str) -> bool:
+        return zone_id in self._zone_rows
+    
+    def _register(self, zone_id: Optional[str], kind: int, index: int) -> str:
+        """Record a new zone and mark the grid stale."""
+        zone_id = zone_id if zone_id is not None else f"zone_{len(self.zone_ids)}"
+        self._zone_rows[zone_id] = len(self.zone_ids)
+        self.zone_ids.append(zone_id)
+        self._kinds.append((kind, index))
+        self._compiled = False
+        return zone_id
+    
+    def add_circle(self, latitude: float, longitude: float, radius: float,
+                   zone_id: Optional[str] = None) -> str:
+        """Add a circular zone.
+        
+        Args:
+            latitude: Center latitude in degrees
+            longitude: Center longitude in degrees
+            radius: Radius in meters
+            zone_id: Zone identifier (generated if omitted); adding an
+                existing identifier again is a no-op
+                
+        Returns:
+            Zone identifier
+        """
+        if zone_id in self._zone_rows:
+            return zone_id
+        self._circles.append((float(latitude), float(longitude), float(radius)))
+        return self._register(zone_id, CIRCLE, len(self._circles) - 1)
+    
+    def add_polygon(self, vertices: Sequence[Sequence[float]], zone_id: Optional[str] = None) -> str:
+        """Add a polygonal zone.
+        
+        Args:
+            vertices: (latitude, longitude) pairs of the outer ring; a
+                closing vertex equal to the first is optional
+            zone_id: Zone identifier (generated if omitted); adding an
+                existing identifier again is a no-op
+                
+        Returns:
+            Zone identifier
+        """
+        if zone_id in self._zone_rows:
+            return zone_id
+        ring = np.asarray(vertices, dtype=float)
+        if len(ring) > 1 and np.array_equal(ring[0], ring[-1]):
+            ring = ring[:-1]
+        if len(ring) < 3:
+            raise ValueError("A polygon zone needs at least three vertices")
+        self._polygons.append(ring)
+        return self._register(zone_id, POLYGON, len(self._polygons) - 1)
+    
+    def add_no_fly_zones(self, zones: Sequence[Dict[str, Any]]) -> List[str]:
+        """Add circular zones in the MissionPlanningAgent constraint format.
+        
+        Args:
+            zones: Dictionaries with lat, lon and radius (meters)
+            
+        Returns:
+            Zone identifiers, shared by missions declaring the same zone
+        """
+        return [
+            self.add_circle(zone["lat"], zone["lon"], zone["radius"],
+                            zone.get("id") or f"nfz_{zone['lat']:.6f}_{zone['lon']:.6f}_{zone['radius']:g}")
+            for zone in zones
+        ]
+    
+    def load_geojson(self, path: str) -> int:
+        """Add the zones of a GeoJSON FeatureCollection.
+        
+        Polygon and MultiPolygon features contribute their outer rings;
+        Point features need a ``radius`` property in meters. The ``id``
+        property (or feature id) becomes the zone identifier.
+        
+        Args:
+            path: GeoJSON file
+            
+        Returns:
+            Number of zones added
+        """
+        with open(path) as handle:
+            collection = json.load(handle)
+        
+        added = 0
+        for number, feature in enumerate(collection.get("features", [])):
+            geometry = feature.get("geometry") or {}
+            properties = feature.get("properties") or {}
+            zone_id = str(properties.get("id", feature.get("id", f"{Path(path).stem}_{number}")))
+            kind = geometry.get("type")
+            
+            if kind == "Point" and "radius" in properties:
+                longitude, latitude = geometry["coordinates"][:2]
+                self.add_circle(latitude, longitude, properties["radius"], zone_id)
+                added += 1
+            elif kind in ("Polygon", "MultiPolygon"):
+                polygons = [geometry["coordinates"]] if kind == "Polygon" else geometry["coordinates"]
+                for part, rings in enumerate(polygons):
+                    # GeoJSON positions are (longitude, latitude)
+                    ring = [(latitude, longitude) for longitude, latitude, *_ in rings[0]]
+                    self.add_polygon(ring, zone_id if len(polygons) == 1 else f"{zone_id}#{part}")
+                    added += 1
+            else:
+                logger.warning(f"Skipping unsupported geofence feature {zone_id} ({kind})")
+        
+        logger.info(f"Loaded {added} geofence zones from {path}")
+        return added
+    
+    def compile(self) -> None:
+        """Project the zones and build the grid."""
+        started = time.perf_counter()
+        zones = len(self.zone_ids)
+        circles = np.array(self._circles, dtype=float).reshape(-1, 3)
+        vertex_counts = np.array([len(ring) for ring in self._polygons], dtype=np.intp)
+        vertices = np.concatenate(self._polygons) if self._polygons else np.empty((0, 2))
+        
+        # Projection origin: middle of every zone anchor point
+        anchors = np.concatenate([circles[:, :2], vertices])
+        self._origin = tuple(anchors.mean(axis=0)) if len(anchors) else (0.0, 0.0)
+        self._circle_xy = np.column_stack(self._project(circles[:, 0], circles[:, 1]))
+        self._circle_radius = circles[:, 2]
+        self._vertex_xy = np.column_stack(self._project(vertices[:, 0], vertices[:, 1]))
+        self._vertex_start = np.concatenate([[0], np.cumsum(vertex_counts)])
+        
+        # Every ring edge as start/end points, polygons contiguous
+        following = np.arange(len(vertices)) + 1
+        following[self._vertex_start[1:] - 1] = self._vertex_start[:-1]
+        self._edge_start = self._vertex_xy
+        self._edge_end = self._vertex_xy[following]
+        
+        kinds = np.array(self._kinds, dtype=np.intp).reshape(-1, 2)
+        self._zone_kind = kinds[:, 0]
+        self._zone_index = kinds[:, 1]
+        
+        # Zone bounding boxes
+        low = np.empty((zones, 2))
+        high = np.empty((zones, 2))
+        is_circle = self._zone_kind == CIRCLE
+        circle_index = self._zone_index[is_circle]
+        radius = self._circle_radius[circle_index][:, None]
+        low[is_circle] = self._circle_xy[circle_index] - radius
+        high[is_circle] = self._circle_xy[circle_index] + radius
+        if len(vertices):
+            polygon_zones = np.flatnonzero(~is_circle)
+            order = self._zone_index[polygon_zones]
+            starts = self._vertex_start[:-1]
+            low[polygon_zones] = np.minimum.reduceat(self._vertex_xy, starts)[order]
+            high[polygon_zones] = np.maximum.reduceat(self._vertex_xy, starts)[order]
+        
+        self._zone_low = low
+        self._zone_high = high
+        
+        # Register each zone in every cell within cell_size of its bounding
+        # box, so a cell lists every boundary its positions can see
+        first = np.floor(low / self.cell_size).astype(np.int64) - 1
+        last = np.floor(high / self.cell_size).astype(np.int64) + 1
+        span = last - first + 1
+        cells = span[:, 0] * span[:, 1]
+        zone = np.repeat(np.arange(zones), cells)
+        offset = np.arange(int(cells.sum())) - np.repeat(np.cumsum(cells) - cells, cells)
+        column = first[zone, 0] + offset // span[zone, 1]
+        row = first[zone, 1] + offset % span[zone, 1]
+        keys = column * _COLUMN + row
+        
+        order = np.argsort(keys, kind="stable")
+        keys = keys[order]
+        self._cell_zones = zone[order]
+        self._cell_keys, self._cell_start = np.unique(keys, return_index=True)
+        self._cell_end = np.r_[self._cell_start[1:], len(keys)]
+        
+        self._compiled = True
+        self.stats["zones"] = zones
+        self.stats["grid_cells"] = len(self._cell_keys)
+        self.stats["compiles"] += 1
+        logger.debug(f"Compiled {zones} geofence zones into {len(self._cell_keys)} cells "
+                     f"in {(time.perf_counter() - started) * 1e3:.1f}ms")
+    
+    def _project(self, latitude: np.ndarray, longitude: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Project coordinates onto the east/north plane of the zone origin."""
+        lat0, lon0 = self._origin
+        east = (np.asarray(longitude, dtype=float) - lon0) * (METERS_PER_DEGREE * math.cos(math.radians(lat0)))
+        north = (np.asarray(latitude, dtype=float) - lat0) * METERS_PER_DEGREE
+        return east, north
+    
+    def _pairs(self, x: np.ndarray, y: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Pair each point with the zones registered in its cell.
+        
+        Pairs whose zone bounding box is further than cell_size away are
+        dropped before any exact geometry is evaluated.
+        
+        Returns:
+            (point, zone) arrays, grouped by point in ascending order
+        """
+        column = np.floor(x / self.cell_size).astype(np.int64)
+        row = np.floor(y / self.cell_size).astype(np.int64)
+        keys = column * _COLUMN + row
+        
+        slot = np.minimum(np.searchsorted(self._cell_keys, keys), len(self._cell_keys) - 1)
+        hit = np.flatnonzero(self._cell_keys[slot] == keys)
+        slot = slot[hit]
+        
+        counts = self._cell_end[slot] - self._cell_start[slot]
+        within = np.arange(int(counts.sum())) - np.repeat(np.cumsum(counts) - counts, counts)
+        zone = self._cell_zones[np.repeat(self._cell_start[slot], counts) + within]
+        point = np.repeat(hit, counts)
+        
+        gap_x = np.maximum(np.maximum(self._zone_low[zone, 0] - x[point], x[point] - self._zone_high[zone, 0]), 0)
+        gap_y = np.maximum(np.maximum(self._zone_low[zone, 1] - y[point], y[point] - self._zone_high[zone, 1]), 0)
+        near = gap_x * gap_x + gap_y * gap_y <= self.cell_size ** 2
+        return point[near], zone[near]
+    
+    def _signed_distance(self, x: np.ndarray, y: np.ndarray, point: np.ndarray,
+                         zone: np.ndarray) -> np.ndarray:
+        """Signed distance from each paired point to its zone boundary."""
+        distance = np.empty(len(point))
+        kind = self._zone_kind[zone]
+        index = self._zone_index[zone]
+        
+        circle = kind == CIRCLE
+        center = self._circle_xy[index[circle]]
+        distance[circle] = (np.hypot(x[point[circle]] - center[:, 0], y[point[circle]] - center[:, 1])
+                            - self._circle_radius[index[circle]])
+        
+        polygon = np.flatnonzero(~circle)
+        if len(polygon):
+            distance[polygon] = self._polygon_distance(x[point[polygon]], y[point[polygon]], index[polygon])
+        return distance
+    
+    def _polygon_distance(self, x: np.ndarray, y: np.ndarray, polygon: np.ndarray) -> np.ndarray:
+        """Signed distance from points to polygons, one polygon per point."""
+        counts = self._vertex_start[polygon + 1] - self._vertex_start[polygon]
+        pair_start = np.cumsum(counts) - counts
+        edge = np.repeat(self._vertex_start[polygon], counts) + (
+            np.arange(int(counts.sum())) - np.repeat(pair_start, counts)
+        )
+        px = np.repeat(x, counts)
+        py = np.repeat(y, counts)
+        ax, ay = self._edge_start[edge, 0], self._edge_start[edge, 1]
+        bx, by = self._edge_end[edge, 0], self._edge_end[edge, 1]
+        
+        # Distance to each edge segment
+        dx, dy = bx - ax, by - ay
+        length = dx * dx + dy * dy
+        t = np.clip(((px - ax) * dx + (py - ay) * dy) / np.where(length > 0, length, 1.0), 0.0, 1.0)
+        segment = np.hypot(px - (ax + t * dx), py - (ay + t * dy))
+        
+        # Even-odd rule: count edges crossed by a ray towards +x
+        straddles = (ay > py) != (by > py)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            crossing = straddles & (px < ax + (py - ay) * dx / np.where(straddles, dy, 1.0))
+        
+        inside = np.add.reduceat(crossing.astype(np.intp), pair_start) % 2 == 1
+        nearest = np.minimum.reduceat(segment, pair_start)
+        return np.where(inside, -nearest, nearest)
+    
+    def evaluate(self, latitude: Sequence[float], longitude: Sequence[float]) -> Dict[str, np.ndarray]:
+        """Check positions against every zone.
+        
+        Args:
+            latitude: Latitudes in degrees
+            longitude: Longitudes in degrees
+            
+        Returns:
+            Dictionary of per-position arrays: ``inside`` (in any zone),
+            ``zone`` (row in zone_ids of the zone with the nearest boundary,
+            or the deepest containing one; -1 if none within cell_size) and
+            ``distance`` (signed distance in meters to that boundary,
+            negative inside, infinite beyond cell_size)
+        """
+        n = len(latitude)
+        result = {
+            "inside": np.zeros(n, dtype=bool),
+            "zone": np.full(n, -1, dtype=np.intp),
+            "distance": np.full(n, np.inf)
+        }
+        if not n or not self.zone_ids:
+            return result
+        if not self._compiled:
+            self.compile()
+        
+        x, y = self._project(latitude, longitude)
+        point, zone = self._pairs(x, y)
+        self.stats["pairs_checked"] += len(point)
+        if not len(point):
+            return result
+        distance = self._signed_distance(x, y, point, zone)
+        
+        # Keep each point's smallest signed distance; the first pair equal
+        # to the group minimum names the zone
+        starts = np.flatnonzero(np.r_[True, point[1:] != point[:-1]])
+        sizes = np.diff(np.r_[starts, len(point)])
+        nearest = np.minimum.reduceat(distance, starts)
+        hits = np.flatnonzero(distance == np.repeat(nearest, sizes))
+        first = hits[np.searchsorted(hits, starts)]
+        point, zone, distance = point[starts], zone[first], nearest
+        reachable = distance <= self.cell_size
+        
+        result["zone"][point[reachable]] = zone[reachable]
+        result["distance"][point[reachable]] = distance[reachable]
+        result["inside"][point] = distance < 0
+        return result
+    
+    def contains(self, latitude: float, longitude: float) -> Optional[str]:
+        """Get the zone containing a single position.
+        
+        Args:
+            latitude: Latitude in degrees
+            longitude: Longitude in degrees
+            
+        Returns:
+            Identifier of the deepest containing zone, or None
+        """
+        result = self.evaluate([latitude], [longitude])
+        return self.zone_ids[result["zone"][0]] if result["inside"][0] else None
+    
+    def check_fleet(self, uav_ids: Sequence[str], latitude: Sequence[float],
+                    longitude: Sequence[float]) -> int:
+        """Check every UAV position and keep the results for status().
+        
+        Args:
+            uav_ids: UAV identifiers, one per position
+            latitude: Latitudes in degrees
+            longitude: Longitudes in degrees
+            
+        Returns:
+            Number of UAVs inside a zone
+        """
+        started = time.perf_counter()
+        self._result = self.evaluate(latitude, longitude)
+        self._uav_rows = dict(zip(uav_ids, range(len(uav_ids))))
+        violations = int(self._result["inside"].sum())
+        
+        self.stats["checks"] += 1
+        self.stats["violations"] = violations
+        self.stats["last_check_ms"] = (time.perf_counter() - started) * 1e3
+        return violations
+    
+    def status(self, uav_id: str) -> Optional[Dict[str, Any]]:
+        """Get a UAV's geofence state as of the last fleet check.
+        
+        Args:
+            uav_id: UAV identifier
+            
+        Returns:
+            Dictionary with inside, zone_id (None when no zone boundary is
+            within cell_size) and distance, or None if the UAV was not checked
+        """
+        row = self._uav_rows.get(uav_id)
+        if row is None:
+            return None
+        
+        zone = self._result["zone"][row]
+        return {
+            "inside": bool(self._result["inside"][row]),
+            "zone_id": self.zone_ids[zone] if zone >= 0 else None,
+            "distance": float(self._result["distance"][row])
+        }
+    
+    async def tick(self) -> None:
+        """Check the fleet positions from the position source."""
+        if self.source is not None:
+            uav_ids, latitude, longitude, _altitude, _heading = self.source()
+            self.check_fleet(uav_ids, latitude, longitude)
+    
+    async def start(self, scheduler: Optional["TelemetryScheduler"] = None) -> None:
+        """Start checking the fleet.
+        
+        Args:
+            scheduler: Shared tick scheduler; a private loop is used if omitted
+        """
+        if self.is_running:
+            return
+        
+        self.is_running = True
+        if scheduler is not None:
+            self._scheduler = scheduler
+            scheduler.register(self)
+        else:
+            self._task = asyncio.create_task(self._run_loop())
+    
+    async def stop(self) -> None:
+        """Stop checking the fleet."""
+        self.is_running = False
+        if self._scheduler is not None:
+            self._scheduler.unregister(self)
+            self._scheduler = None
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+    
+    async def _run_loop(self) -> None:
+        """Private check loop used when no scheduler is shared."""
+        interval = 1.0 / self.telemetry_rate
+        
+        while self.is_running:
+            try:
+                await self.tick()
+            except Exception as e:
+                logger.error(f"Error checking geofences: {e}")
+            await self.clock.sleep(interval)
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get geofence statistics.
+        
+        Returns:
+            Dictionary containing geofence statistics
+        """
+        return {
+            **self.stats,
+            "cell_size": self.cell_size,
+            "rate": self.telemetry_rate,
+            "is_running": self.is_running
+        }
@@ -0,0 +1,139 @@
+"""Fixed-capacity telemetry history ring for agents."""
+
+from datetime import datetime
+from typing import Iterator, List, Optional
+
+from ..utils.models import TelemetryRecord
+
+
+class TelemetryHistory:
+    """Ring buffer of an agent's most recent telemetry records.
+    
+    Slots are preallocated, so appending overwrites the oldest record in
+    place instead of re-slicing a list. Reads are generators over the ring,
+    so iterating the latest N records copies nothing. Records are appended
+    in timestamp order, which lets time-range queries binary search.
+    """
+    
+    def __init__(self, capacity: int):
+        """Initialize telemetry history.
+        
+        Args:
+            capacity: Maximum number of records kept
+        """
+        if capacity <= 0:
+            raise ValueError("History capacity must be positive")
+        
+        self._slots: List[Optional[TelemetryRecord]] = [None] * capacity
+        self._next = 0
+        self._count = 0
+    
+    def __len__(self) -> int:
+        return self._count
+    
+    def __bool__(self) -> bool:
+        return self._count > 0
+    
+    @property
+    def capacity(self) -> int:
+        """Maximum number of records kept."""
+        return len(self._slots)
+    
+    def append(self, record: TelemetryRecord) -> None:
+        """Append a record, overwriting the oldest one when full.
+        
+        Args:
+            record: Telemetry record, no older than the latest one
+        """
+        self._slots[self._next] = record
+        self._next += 1
+        if self._next == len(self._slots):
+            self._next = 0
+        if self._count < len(self._slots):
+            self._count += 1
+    
+    def _slot(self, position: int) -> int:
+        """Map a position (0 = oldest kept record) to its slot."""
+        return (self._next - self._count + position) % len(self._slots)
+    
+    def __getitem__(self, index: int) -> TelemetryRecord:
+        """Get a record by position; negative indices count from the newest."""
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("History index out of range")
+        return self._slots[self._slot(index)]
+    
+    def _iterate(self, start: int, stop: int) -> Iterator[TelemetryRecord]:
+        """Yield records from position start up to (excluding) stop."""
+        slots = self._slots
+        capacity = len(slots)
+        slot = self._slot(start)
+        for _ in range(stop - start):
+            yield slots[slot]
+            slot += 1
+            if slot == capacity:
+                slot = 0
+    
+    def __iter__(self) -> Iterator[TelemetryRecord]:
+        """Iterate from the oldest to the newest record."""
+        return self._iterate(0, self._count)
+    
+    def latest(self, count: int) -> Iterator[TelemetryRecord]:
+        """Iterate over the most recent records, oldest first.
+        
+        Args:
+            count: Maximum number of records
+            
+        Returns:
+            Iterator over at most count records
+        """
+        count = max(0, min(count, self._count))
+        return self._iterate(self._count - count, self._count)
+    
+    def _bisect(self, when: datetime) -> int:
+        """Position of the first record stamped at or after when."""
+        low, high = 0, self._count
+        slots = self._slots
+        while low < high:
+            middle = (low + high) // 2
+            if slots[self._slot(middle)].timestamp < when:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+    
+    def between(self, start: Optional[datetime] = None,
+                end: Optional[datetime] = None) -> Iterator[TelemetryRecord]:
+        """Iterate over the records stamped within a time range, oldest first.
+        
+        Args:
+            start: Earliest timestamp, inclusive (None for no lower bound)
+            end: Latest timestamp, exclusive (None for no upper bound)
+            
+        Returns:
+            Iterator over the matching records
+        """
+        first = self._bisect(start) if start is not None else 0
+        last = self._bisect(end) if end is not None else self._count
+        return self._iterate(first, max(first, last))
+    
+    def resize(self, capacity: int) -> None:
+        """Change the capacity, keeping the most recent records.
+        
+        Args:
+            capacity: New maximum number of records
+        """
+        if capacity <= 0:
+            raise ValueError("History capacity must be positive")
+        
+        kept = list(self.latest(capacity))
+        self._slots = kept + [None] * (capacity - len(kept))
+        self._count = len(kept)
+        self._next = self._count % capacity
+    
+    def clear(self) -> None:
+        """Drop every record."""
+        self._slots = [None] * len(self._slots)
+        self._next = 0
+        self._count = 0
@@ -1,11 +1,14 @@
 """Mission planning subsystem agent."""
 
-import random
 from datetime import datetime, timedelta
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, TYPE_CHECKING
 
 from .base_agent import BaseAgent
-from ..utils.models import TelemetryData, SystemStatus
+from ..utils.models import TelemetryRecord, SystemStatus
+
+if TYPE_CHECKING:
+    from .geofence import GeofenceEngine
+    from .route_engine import RouteEngine
 
 
 class MissionPlanningAgent(BaseAgent):
@@ -21,7 +24,7 @@ class MissionPlanningAgent(BaseAgent):
             "mission_type": "surveillance",
             "status": "active",  # planned, active, paused, completed, failed
             "priority": "medium",  # low, medium, high, critical
-            "start_time": datetime.now(),
+            "start_time": self.clock.now(),
             "estimated_duration": 120,  # minutes
             "current_phase": "execution"
         }
@@ -87,8 +90,35 @@ class MissionPlanningAgent(BaseAgent):
             "replanning_events": 0,
             "abort_events": 0
         }
+        self.geofence: Optional["GeofenceEngine"] = None
+        self._in_no_fly_zone = False
+        self.route_engine: Optional["RouteEngine"] = None
+    
+    def attach_geofence(self, geofence: Optional["GeofenceEngine"]) -> None:
+        """Count constraint violations from a geofence engine's fleet checks.
+        
+        Args:
+            geofence: Geofence engine holding this mission's no-fly zones, or
+                None to go back to simulated violations
+        """
+        self.geofence = geofence
+        self._in_no_fly_zone = False
+    
+    def attach_route_engine(self, route_engine: Optional["RouteEngine"]) -> None:
+        """Register this mission's waypoints and take progress from the engine.
+        
+        Args:
+            route_engine: Route engine tracking the fleet, or None to go back
+                to simulated progress
+        """
+        if self.route_engine is not None:
+            self.route_engine.remove_route(self.uav_id)
+        self.route_engine = route_engine
+        if route_engine is not None:
+            route_engine.set_route(self.uav_id, self.waypoint_data["waypoints"],
+                                   current_leg=self.waypoint_data["current_waypoint"] - 2)
     
-    async def generate_telemetry(self) -> TelemetryData:
+    async def generate_telemetry(self) -> TelemetryRecord:
         """Generate mission planning telemetry data."""
         self._update_mission_data()
         self._update_waypoint_data()
@@ -109,14 +139,14 @@ class MissionPlanningAgent(BaseAgent):
             }
         }
         
-        return TelemetryData(
+        return TelemetryRecord(
             subsystem=self.subsystem_name,
             uav_id=self.uav_id,
             data=data,
             status=self.status
         )
     
-    async def apply_fault(self, telemetry_data: TelemetryData, fault_params: Dict[str, Any]) -> TelemetryData:
+    async def apply_fault(self, telemetry_data: TelemetryRecord, fault_params: Dict[str, Any]) -> TelemetryRecord:
         """Apply mission planning fault."""
         fault_type = fault_params.get("type", "waypoint_corruption")
         
@@ -125,9 +155,9 @@ class MissionPlanningAgent(BaseAgent):
             wp_id = fault_params.get("waypoint_id", 3)
             for wp in telemetry_data.data["waypoints"]["waypoints"]:
                 if wp["id"] == wp_id:
-                    wp["lat"] += random.uniform(-0.01, 0.01)
-                    wp["lon"] += random.uniform(-0.01, 0.01)
-                    wp["alt"] += random.uniform(-50, 50)
+                    wp["lat"] += self.rng.uniform(-0.01, 0.01)
+                    wp["lon"] += self.rng.uniform(-0.01, 0.01)
+                    wp["alt"] += self.rng.uniform(-50, 50)
                     break
                     
         elif fault_type == "mission_abort":
@@ -165,9 +195,9 @@ class MissionPlanningAgent(BaseAgent):
     def _update_mission_data(self) -> None:
         """Update mission data."""
         # Simulate mission status changes
-        if random.random() < 0.001:  # 0.1% chance
+        if self.rng.random() < 0.001:  # 0.1% chance
             statuses = ["active", "paused", "completed"]
-            self.mission_data["status"] = random.choice(statuses)
+            self.mission_data["status"] = self.rng.choice(statuses)
         
         # Update current phase based on progress
         completion = self.mission_progress["completion_percentage"]
@@ -187,20 +217,29 @@ class MissionPlanningAgent(BaseAgent):
     
     def _update_waypoint_data(self) -> None:
         """Update waypoint data."""
+        # A tracked route is fixed: waypoints behind the UAV are completed
+        if self.route_engine is not None:
+            progress = self.route_engine.progress(self.uav_id)
+            if progress is not None:
+                for index, wp in enumerate(self.waypoint_data["waypoints"]):
+                    wp["completed"] = index < progress["next_waypoint"]
+                self.waypoint_data["current_waypoint"] = progress["next_waypoint"] + 1
+            return
+        
         # Simulate waypoint completion
         current_wp = self.waypoint_data["current_waypoint"]
         if current_wp < len(self.waypoint_data["waypoints"]):
             wp = self.waypoint_data["waypoints"][current_wp - 1]
-            if not wp["completed"] and random.random() < 0.01:  # 1% chance per cycle
+            if not wp["completed"] and self.rng.random() < 0.01:  # 1% chance per cycle
                 wp["completed"] = True
                 self.waypoint_data["current_waypoint"] += 1
         
         # Update waypoint accuracy
         for wp in self.waypoint_data["waypoints"]:
             if not wp["completed"]:
-                wp["lat"] += random.uniform(-0.0001, 0.0001)
-                wp["lon"] += random.uniform(-0.0001, 0.0001)
-                wp["alt"] += random.uniform(-1, 1)
+                wp["lat"] += self.rng.uniform(-0.0001, 0.0001)
+                wp["lon"] += self.rng.uniform(-0.0001, 0.0001)
+                wp["alt"] += self.rng.uniform(-1, 1)
                 wp["alt"] = max(0, min(500, wp["alt"]))
     
     def _update_mission_progress(self) -> None:
@@ -211,13 +250,17 @@ class MissionPlanningAgent(BaseAgent):
             completed_waypoints / self.waypoint_data["total_waypoints"]
         ) * 100
         
-        # Update distance traveled
-        self.mission_progress["distance_traveled"] += random.uniform(0.01, 0.05)
-        
-        # Update distance remaining
-        total_distance = 20.0  # km
-        self.mission_progress["distance_remaining"] = max(0, 
-            total_distance - self.mission_progress["distance_traveled"])
+        # Distances along the tracked route, or simulated without one
+        progress = self.route_engine.progress(self.uav_id) if self.route_engine is not None else None
+        if progress is not None:
+            self.mission_progress["distance_traveled"] = progress["along_track"] / 1000
+            self.mission_progress["distance_remaining"] = progress["distance_remaining"] / 1000
+        elif self.route_engine is None:
+            self.mission_progress["distance_traveled"] += self.rng.uniform(0.01, 0.05)
+            
+            total_distance = 20.0  # km
+            self.mission_progress["distance_remaining"] = max(0, 
+                total_distance - self.mission_progress["distance_traveled"])
         
         # Update time elapsed
         self.mission_progress["time_elapsed"] += 1.0 / self.telemetry_rate / 60  # minutes
@@ -239,31 +282,38 @@ class MissionPlanningAgent(BaseAgent):
     def _update_mission_performance(self) -> None:
         """Update mission performance metrics."""
         # Update waypoint accuracy
-        self.mission_performance["waypoint_accuracy"] += random.uniform(-0.1, 0.1)
+        self.mission_performance["waypoint_accuracy"] += self.rng.uniform(-0.1, 0.1)
         self.mission_performance["waypoint_accuracy"] = max(0.5, min(10, 
             self.mission_performance["waypoint_accuracy"]))
         
         # Update altitude accuracy
-        self.mission_performance["altitude_accuracy"] += random.uniform(-0.05, 0.05)
+        self.mission_performance["altitude_accuracy"] += self.rng.uniform(-0.05, 0.05)
         self.mission_performance["altitude_accuracy"] = max(0.1, min(5, 
             self.mission_performance["altitude_accuracy"]))
         
         # Update speed accuracy
-        self.mission_performance["speed_accuracy"] += random.uniform(-0.05, 0.05)
+        self.mission_performance["speed_accuracy"] += self.rng.uniform(-0.05, 0.05)
         self.mission_performance["speed_accuracy"] = max(0.1, min(3, 
             self.mission_performance["speed_accuracy"]))
         
         # Update mission efficiency
-        self.mission_performance["mission_efficiency"] += random.uniform(-0.01, 0.01)
+        self.mission_performance["mission_efficiency"] += self.rng.uniform(-0.01, 0.01)
         self.mission_performance["mission_efficiency"] = max(0.5, min(1.0, 
             self.mission_performance["mission_efficiency"]))
         
-        # Simulate occasional constraint violations
-        if random.random() < 0.001:  # 0.1% chance
+        # Each entry into a no-fly zone is one violation; without a geofence
+        # simulate occasional ones
+        if self.geofence is not None:
+            status = self.geofence.status(self.uav_id)
+            inside = status is not None and status["inside"]
+            if inside and not self._in_no_fly_zone:
+                self.mission_performance["constraint_violations"] += 1
+            self._in_no_fly_zone = inside
+        elif self.rng.random() < 0.001:  # 0.1% chance
             self.mission_performance["constraint_violations"] += 1
         
         # Simulate occasional replanning events
-        if random.random() < 0.0005:  # 0.05% chance
+        if self.rng.random() < 0.0005:  # 0.05% chance
             self.mission_performance["replanning_events"] += 1
     
     def _is_mission_healthy(self) -> bool:
@@ -1,12 +1,11 @@
 """Navigation subsystem agent."""
 
-import random
 import math
 from datetime import datetime
 from typing import Dict, Any
 
 from .base_agent import BaseAgent
-from ..utils.models import TelemetryData, SystemStatus
+from ..utils.models import TelemetryRecord, SystemStatus
 
 
 class NavigationAgent(BaseAgent):
@@ -16,29 +15,29 @@ class NavigationAgent(BaseAgent):
         super().__init__(uav_id, "Navigation", telemetry_rate)
         
         # Navigation state
-        self.latitude = 34.0522 + random.uniform(-0.1, 0.1)  # Los Angeles area
-        self.longitude = -118.2437 + random.uniform(-0.1, 0.1)
-        self.altitude = random.uniform(100, 500)  # meters
-        self.heading = random.uniform(0, 360)  # degrees
-        self.speed = random.uniform(10, 30)  # m/s
-        self.gps_accuracy = random.uniform(1, 5)  # meters
+        self.latitude = 34.0522 + self.rng.uniform(-0.1, 0.1)  # Los Angeles area
+        self.longitude = -118.2437 + self.rng.uniform(-0.1, 0.1)
+        self.altitude = self.rng.uniform(100, 500)  # meters
+        self.heading = self.rng.uniform(0, 360)  # degrees
+        self.speed = self.rng.uniform(10, 30)  # m/s
+        self.gps_accuracy = self.rng.uniform(1, 5)  # meters
         
         # IMU data
-        self.roll = random.uniform(-5, 5)  # degrees
-        self.pitch = random.uniform(-5, 5)  # degrees
-        self.yaw_rate = random.uniform(-10, 10)  # degrees/s
+        self.roll = self.rng.uniform(-5, 5)  # degrees
+        self.pitch = self.rng.uniform(-5, 5)  # degrees
+        self.yaw_rate = self.rng.uniform(-10, 10)  # degrees/s
         
         # Accelerometer data
-        self.accel_x = random.uniform(-2, 2)  # m/s²
-        self.accel_y = random.uniform(-2, 2)  # m/s²
-        self.accel_z = random.uniform(-2, 2)  # m/s²
+        self.accel_x = self.rng.uniform(-2, 2)  # m/s²
+        self.accel_y = self.rng.uniform(-2, 2)  # m/s²
+        self.accel_z = self.rng.uniform(-2, 2)  # m/s²
         
         # Gyroscope data
-        self.gyro_x = random.uniform(-50, 50)  # degrees/s
-        self.gyro_y = random.uniform(-50, 50)  # degrees/s
-        self.gyro_z = random.uniform(-50, 50)  # degrees/s
+        self.gyro_x = self.rng.uniform(-50, 50)  # degrees/s
+        self.gyro_y = self.rng.uniform(-50, 50)  # degrees/s
+        self.gyro_z = self.rng.uniform(-50, 50)  # degrees/s
     
-    async def generate_telemetry(self) -> TelemetryData:
+    async def generate_telemetry(self) -> TelemetryRecord:
         """Generate navigation telemetry data."""
         # Simulate movement
         self._update_position()
@@ -81,22 +80,22 @@ class NavigationAgent(BaseAgent):
             }
         }
         
-        return TelemetryData(
+        return TelemetryRecord(
             subsystem=self.subsystem_name,
             uav_id=self.uav_id,
             data=data,
             status=self.status
         )
     
-    async def apply_fault(self, telemetry_data: TelemetryData, fault_params: Dict[str, Any]) -> TelemetryData:
+    async def apply_fault(self, telemetry_data: TelemetryRecord, fault_params: Dict[str, Any]) -> TelemetryRecord:
         """Apply navigation fault."""
         fault_type = fault_params.get("type", "drift")
         
         if fault_type == "drift":
             # Simulate GPS drift
             drift_factor = fault_params.get("drift_factor", 0.1)
-            telemetry_data.data["position"]["latitude"] += random.uniform(-drift_factor, drift_factor)
-            telemetry_data.data["position"]["longitude"] += random.uniform(-drift_factor, drift_factor)
+            telemetry_data.data["position"]["latitude"] += self.rng.uniform(-drift_factor, drift_factor)
+            telemetry_data.data["position"]["longitude"] += self.rng.uniform(-drift_factor, drift_factor)
             telemetry_data.data["sensors"]["gps_accuracy"] *= 2
             telemetry_data.data["status"]["gps_lock"] = False
             
@@ -109,7 +108,7 @@ class NavigationAgent(BaseAgent):
         elif fault_type == "compass_error":
             # Simulate compass error
             error_angle = fault_params.get("error_angle", 45)
-            telemetry_data.data["attitude"]["heading"] += random.uniform(-error_angle, error_angle)
+            telemetry_data.data["attitude"]["heading"] += self.rng.uniform(-error_angle, error_angle)
             telemetry_data.data["status"]["compass_valid"] = False
         
         telemetry_data.status = SystemStatus.ERROR
@@ -117,6 +116,14 @@ class NavigationAgent(BaseAgent):
     
     def _update_position(self) -> None:
         """Update UAV position based on current velocity."""
+        row = self._physics_row()
+        if row is not None:
+            self.latitude = float(row["latitude"])
+            self.longitude = float(row["longitude"])
+            self.altitude = float(row["altitude"])
+            self.speed = float(row["speed"])
+            return
+        
         # Simple position update simulation
         dt = 1.0 / self.telemetry_rate
         distance = self.speed * dt
@@ -129,16 +136,24 @@ class NavigationAgent(BaseAgent):
         self.longitude += lon_change
         
         # Add some random variation
-        self.latitude += random.uniform(-0.0001, 0.0001)
-        self.longitude += random.uniform(-0.0001, 0.0001)
-        self.altitude += random.uniform(-0.5, 0.5)
+        self.latitude += self.rng.uniform(-0.0001, 0.0001)
+        self.longitude += self.rng.uniform(-0.0001, 0.0001)
+        self.altitude += self.rng.uniform(-0.5, 0.5)
     
     def _update_attitude(self) -> None:
         """Update UAV attitude."""
+        row = self._physics_row()
+        if row is not None:
+            self.heading = float(row["heading"])
+            self.roll = float(row["roll"])
+            self.pitch = float(row["pitch"])
+            self.yaw_rate = float(row["turn_rate"])
+            return
+        
         # Simulate attitude changes
-        self.roll += random.uniform(-0.5, 0.5)
-        self.pitch += random.uniform(-0.5, 0.5)
-        self.heading += random.uniform(-1, 1)
+        self.roll += self.rng.uniform(-0.5, 0.5)
+        self.pitch += self.rng.uniform(-0.5, 0.5)
+        self.heading += self.rng.uniform(-1, 1)
         
         # Keep values in valid ranges
         self.roll = max(-30, min(30, self.roll))
@@ -147,15 +162,24 @@ class NavigationAgent(BaseAgent):
     
     def _update_sensors(self) -> None:
         """Update sensor readings."""
+        row = self._physics_row()
+        if row is not None:
+            # Forward, lateral and vertical acceleration; body rates in degrees/s
+            self.accel_x, self.accel_y, self.accel_z = (float(value) for value in row["acceleration"])
+            self.gyro_x = float(row["roll_rate"])
+            self.gyro_y = float(row["pitch_rate"])
+            self.gyro_z = float(row["turn_rate"])
+            return
+        
         # Simulate sensor noise
-        self.accel_x += random.uniform(-0.1, 0.1)
-        self.accel_y += random.uniform(-0.1, 0.1)
-        self.accel_z += random.uniform(-0.1, 0.1)
+        self.accel_x += self.rng.uniform(-0.1, 0.1)
+        self.accel_y += self.rng.uniform(-0.1, 0.1)
+        self.accel_z += self.rng.uniform(-0.1, 0.1)
         
-        self.gyro_x += random.uniform(-2, 2)
-        self.gyro_y += random.uniform(-2, 2)
-        self.gyro_z += random.uniform(-2, 2)
+        self.gyro_x += self.rng.uniform(-2, 2)
+        self.gyro_y += self.rng.uniform(-2, 2)
+        self.gyro_z += self.rng.uniform(-2, 2)
         
         # Add some realistic variation to speed
-        self.speed += random.uniform(-0.5, 0.5)
+        self.speed += self.rng.uniform(-0.5, 0.5)
         self.speed = max(0, min(50, self.speed))
@@ -1,11 +1,10 @@
 """Payload subsystem agent."""
 
-import random
 from datetime import datetime
 from typing import Dict, Any
 
 from .base_agent import BaseAgent
-from ..utils.models import TelemetryData, SystemStatus
+from ..utils.models import TelemetryRecord, SystemStatus
 
 
 class PayloadAgent(BaseAgent):
@@ -60,7 +59,7 @@ class PayloadAgent(BaseAgent):
             "failed_transmissions": 0
         }
     
-    async def generate_telemetry(self) -> TelemetryData:
+    async def generate_telemetry(self) -> TelemetryRecord:
         """Generate payload telemetry data."""
         self._update_camera_data()
         self._update_sensor_data()
@@ -80,14 +79,14 @@ class PayloadAgent(BaseAgent):
             }
         }
         
-        return TelemetryData(
+        return TelemetryRecord(
             subsystem=self.subsystem_name,
             uav_id=self.uav_id,
             data=data,
             status=self.status
         )
     
-    async def apply_fault(self, telemetry_data: TelemetryData, fault_params: Dict[str, Any]) -> TelemetryData:
+    async def apply_fault(self, telemetry_data: TelemetryRecord, fault_params: Dict[str, Any]) -> TelemetryRecord:
         """Apply payload fault."""
         fault_type = fault_params.get("type", "camera_failure")
         
@@ -133,43 +132,43 @@ class PayloadAgent(BaseAgent):
     def _update_camera_data(self) -> None:
         """Update camera telemetry data."""
         # Simulate gimbal movement
-        self.camera_data["gimbal_pitch"] += random.uniform(-1, 1)
+        self.camera_data["gimbal_pitch"] += self.rng.uniform(-1, 1)
         self.camera_data["gimbal_pitch"] = max(-90, min(90, self.camera_data["gimbal_pitch"]))
         
-        self.camera_data["gimbal_roll"] += random.uniform(-0.5, 0.5)
+        self.camera_data["gimbal_roll"] += self.rng.uniform(-0.5, 0.5)
         self.camera_data["gimbal_roll"] = max(-45, min(45, self.camera_data["gimbal_roll"]))
         
-        self.camera_data["gimbal_yaw"] += random.uniform(-2, 2)
+        self.camera_data["gimbal_yaw"] += self.rng.uniform(-2, 2)
         self.camera_data["gimbal_yaw"] = self.camera_data["gimbal_yaw"] % 360
         
         # Simulate camera settings changes
-        self.camera_data["focus_distance"] += random.uniform(-0.5, 0.5)
+        self.camera_data["focus_distance"] += self.rng.uniform(-0.5, 0.5)
         self.camera_data["focus_distance"] = max(1, min(100, self.camera_data["focus_distance"]))
         
         # Simulate storage usage increase when recording
         if self.camera_data["recording"]:
-            self.camera_data["storage_used"] += random.uniform(0.01, 0.05)
+            self.camera_data["storage_used"] += self.rng.uniform(0.01, 0.05)
             self.camera_data["storage_used"] = min(
                 self.camera_data["storage_total"], 
                 self.camera_data["storage_used"]
             )
         
         # Simulate temperature changes
-        self.camera_data["temperature"] += random.uniform(-1, 1)
+        self.camera_data["temperature"] += self.rng.uniform(-1, 1)
         self.camera_data["temperature"] = max(20, min(60, self.camera_data["temperature"]))
         
         # Simulate occasional recording start/stop
-        if random.random() < 0.01:  # 1% chance
+        if self.rng.random() < 0.01:  # 1% chance
             self.camera_data["recording"] = not self.camera_data["recording"]
     
     def _update_sensor_data(self) -> None:
         """Update sensor telemetry data."""
         # Simulate LiDAR variations
         if self.sensor_data["lidar_active"]:
-            self.sensor_data["lidar_range"] += random.uniform(-2, 2)
+            self.sensor_data["lidar_range"] += self.rng.uniform(-2, 2)
             self.sensor_data["lidar_range"] = max(10, min(200, self.sensor_data["lidar_range"]))
             
-            self.sensor_data["lidar_points_per_second"] += random.randint(-1000, 1000)
+            self.sensor_data["lidar_points_per_second"] += self.rng.randint(-1000, 1000)
             self.sensor_data["lidar_points_per_second"] = max(50000, min(200000, 
                 self.sensor_data["lidar_points_per_second"]))
         
@@ -177,53 +176,53 @@ class PayloadAgent(BaseAgent):
         if self.sensor_data["thermal_active"]:
             temp_min, temp_max = self.sensor_data["thermal_temperature_range"]
             self.sensor_data["thermal_temperature_range"] = [
-                temp_min + random.uniform(-2, 2),
-                temp_max + random.uniform(-2, 2)
+                temp_min + self.rng.uniform(-2, 2),
+                temp_max + self.rng.uniform(-2, 2)
             ]
         
         # Simulate data collection rate changes
-        self.sensor_data["data_collection_rate"] += random.uniform(-0.1, 0.1)
+        self.sensor_data["data_collection_rate"] += self.rng.uniform(-0.1, 0.1)
         self.sensor_data["data_collection_rate"] = max(0.1, min(10, 
             self.sensor_data["data_collection_rate"]))
     
     def _update_delivery_data(self) -> None:
         """Update delivery mechanism data."""
         # Simulate cargo weight changes
-        self.delivery_data["cargo_weight"] += random.uniform(-0.1, 0.1)
+        self.delivery_data["cargo_weight"] += self.rng.uniform(-0.1, 0.1)
         self.delivery_data["cargo_weight"] = max(0, min(5, self.delivery_data["cargo_weight"]))
         
         # Simulate cargo volume changes
-        self.delivery_data["cargo_volume"] += random.uniform(-0.05, 0.05)
+        self.delivery_data["cargo_volume"] += self.rng.uniform(-0.05, 0.05)
         self.delivery_data["cargo_volume"] = max(0, min(10, self.delivery_data["cargo_volume"]))
         
         # Simulate delivery accuracy variations
-        self.delivery_data["delivery_accuracy"] += random.uniform(-0.1, 0.1)
+        self.delivery_data["delivery_accuracy"] += self.rng.uniform(-0.1, 0.1)
         self.delivery_data["delivery_accuracy"] = max(0.1, min(5, 
             self.delivery_data["delivery_accuracy"]))
         
         # Simulate payload bay status changes
-        if random.random() < 0.005:  # 0.5% chance
-            self.delivery_data["payload_bay_status"] = random.choice(["closed", "open", "stuck"])
+        if self.rng.random() < 0.005:  # 0.5% chance
+            self.delivery_data["payload_bay_status"] = self.rng.choice(["closed", "open", "stuck"])
     
     def _update_data_transmission(self) -> None:
         """Update data transmission data."""
         # Simulate data rate variations
-        self.data_transmission["data_rate"] += random.uniform(-0.5, 0.5)
+        self.data_transmission["data_rate"] += self.rng.uniform(-0.5, 0.5)
         self.data_transmission["data_rate"] = max(1, min(20, 
             self.data_transmission["data_rate"]))
         
         # Simulate compression ratio changes
-        self.data_transmission["compression_ratio"] += random.uniform(-0.05, 0.05)
+        self.data_transmission["compression_ratio"] += self.rng.uniform(-0.05, 0.05)
         self.data_transmission["compression_ratio"] = max(0.1, min(0.8, 
             self.data_transmission["compression_ratio"]))
         
         # Simulate transmission queue changes
-        self.data_transmission["transmission_queue"] += random.uniform(-5, 5)
+        self.data_transmission["transmission_queue"] += self.rng.uniform(-5, 5)
         self.data_transmission["transmission_queue"] = max(0, min(1000, 
             self.data_transmission["transmission_queue"]))
         
         # Simulate occasional transmission failures
-        if random.random() < 0.001:  # 0.1% chance
+        if self.rng.random() < 0.001:  # 0.1% chance
             self.data_transmission["failed_transmissions"] += 1
     
     def _is_payload_operational(self) -> bool:
@@ -0,0 +1,431 @@
+"""Coupled per-UAV flight physics for the whole fleet."""
+
+import asyncio
+import time
+from typing import Dict, Any, Optional, List, Sequence, TYPE_CHECKING
+import numpy as np
+from loguru import logger
+
+from ..utils.config import config
+from ..utils.clock import SimulationClock, get_clock
+
+if TYPE_CHECKING:
+    from .scheduler import TelemetryScheduler
+
+
+GRAVITY = 9.81
+METERS_PER_DEGREE = 111000.0
+
+
+class FlightPhysics:
+    """Array-backed flight dynamics shared by a UAV's subsystem agents.
+    
+    Every UAV is one row of a structured array holding its airframe,
+    motor, control-surface and battery state, and one step advances all
+    rows together. Within a step the subsystems are coupled: a simple
+    autopilot sets the control surfaces and motor throttle from the
+    heading/altitude/speed targets, roll and pitch follow the ailerons and
+    elevator, motor thrust against drag and gravity drives airspeed and
+    climb, and motor plus avionics power draw drains the battery, whose
+    voltage in turn sets the current drawn.
+    
+    Navigation, Propulsion, Power and Flight_Control agents read their
+    telemetry from a UAV's row instead of random-walking their own values.
+    Like the route engine, the physics core exposes ``telemetry_rate`` and
+    ``tick()`` so the TelemetryScheduler steps it once per period.
+    """
+    
+    dtype = np.dtype([
+        ("latitude", "f8"), ("longitude", "f8"), ("altitude", "f8"), ("heading", "f8"),
+        ("speed", "f8"), ("vertical_speed", "f8"), ("roll", "f8"), ("pitch", "f8"),
+        ("roll_rate", "f8"), ("pitch_rate", "f8"), ("turn_rate", "f8"), ("load_factor", "f8"),
+        ("acceleration", "f8", (3,)),
+        ("target_heading", "f8"), ("target_altitude", "f8"), ("target_speed", "f8"),
+        ("surfaces", "f8", (4,)), ("throttle", "f8"),
+        ("rpm", "f8", (4,)), ("thrust", "f8", (4,)), ("motor_power", "f8", (4,)),
+        ("motor_health", "f8", (4,)),
+        ("voltage", "f8"), ("current", "f8"), ("capacity", "f8"), ("remaining_capacity", "f8"),
+        ("state_of_charge", "f8"), ("propulsion_power", "f8"), ("load_power", "f8"),
+        ("total_power", "f8")
+    ])
+    
+    # Subsystems whose telemetry is read from the physics
+    SUBSYSTEMS = ("Navigation", "Propulsion", "Power", "Flight_Control")
+    
+    # Order of the surfaces column
+    SURFACES = ("aileron_left", "aileron_right", "elevator", "rudder")
+    
+    # Airframe: 10 kg with four motors; 25 N per motor at 3000 rpm
+    MASS = 10.0  # kg
+    DRAG = 0.15  # N per (m/s)^2
+    STALL_SPEED = 8.0  # m/s; below it the wing stops holding altitude
+    MAX_RPM = 6000.0
+    THRUST_COEFFICIENT = 25.0 / 3000.0 ** 2  # N per rpm^2
+    POWER_COEFFICIENT = 100.0 / 3000.0 ** 3  # W per rpm^3
+    MOTOR_TIME_CONSTANT = 0.1  # s
+    
+    # Control surface authority and attitude response
+    ROLL_PER_AILERON = 2.0  # degrees of bank per degree of differential aileron
+    PITCH_PER_ELEVATOR = 1.0  # degrees of pitch per degree of elevator
+    YAW_RATE_PER_RUDDER = 0.1  # degrees/s per degree of rudder
+    ATTITUDE_TIME_CONSTANT = 0.5  # s
+    MAX_AILERON = 15.0  # degrees
+    MAX_ELEVATOR = 20.0  # degrees
+    MAX_RUDDER = 20.0  # degrees
+    
+    # Autopilot gains
+    HEADING_GAIN = 1.5  # degrees of bank per degree of heading error
+    MAX_BANK = 30.0  # degrees
+    ALTITUDE_GAIN = 0.3  # degrees of pitch per meter of altitude error
+    CLIMB_DAMPING = 0.5  # degrees of pitch per m/s of vertical speed
+    MAX_PITCH = 15.0  # degrees
+    SPEED_GAIN = 0.05  # throttle per m/s of speed error
+    
+    # Battery: 3S pack, 5000 mAh
+    INTERNAL_RESISTANCE = 0.02  # ohm
+    
+    def __init__(self, rate: Optional[float] = None, seed: Optional[int] = None,
+                 initial_capacity: int = 64, clock: Optional[SimulationClock] = None):
+        """Initialize flight physics.
+        
+        Args:
+            rate: Step rate in Hz (defaults to configuration)
+            seed: Random seed for new rows and target changes (defaults to
+                system.seed)
+            initial_capacity: Initial number of preallocated rows
+            clock: Simulation clock used by the private step loop
+        """
+        if seed is None:
+            seed = config.get("system.seed")
+        
+        self.telemetry_rate = rate if rate is not None else config.get("system.physics.rate", 50.0)
+        self.clock = clock if clock is not None else get_clock()
+        self.uav_id = "fleet"
+        self.subsystem_name = "Physics"
+        self.is_running = False
+        self._scheduler: Optional["TelemetryScheduler"] = None
+        self._task: Optional[asyncio.Task] = None
+        
+        self._rng = np.random.default_rng(seed)
+        self._state = np.zeros(max(1, initial_capacity), dtype=self.dtype)
+        self._size = 0
+        self._index: Dict[str, int] = {}
+        self._uav_ids: List[str] = []
+        
+        self.stats = {
+            "uavs": 0,
+            "steps": 0,
+            "last_step_ms": 0.0
+        }
+    
+    @property
+    def state(self) -> np.ndarray:
+        """Structured array view of all live rows."""
+        return self._state[:self._size]
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def __contains__(self, uav_id: str) -> bool:
+        return uav_id in self._index
+    
+    @property
+    def uav_ids(self) -> List[str]:
+        """UAV identifiers in row order."""
+        return list(self._uav_ids)
+    
+    def add(self, uav_id: str, latitude: Optional[float] = None, longitude: Optional[float] = None,
+            altitude: Optional[float] = None, heading: Optional[float] = None,
+            speed: Optional[float] = None) -> None:
+        """Allocate a UAV's row, trimmed for level flight.
+        
+        Args:
+            uav_id: UAV identifier
+            latitude: Initial latitude in degrees (random around Los Angeles
+                if omitted)
+            longitude: Initial longitude in degrees
+            altitude: Initial altitude in meters
+            heading: Initial heading in degrees
+            speed: Initial airspeed in m/s
+        """
+        if uav_id in self._index:
+            return
+        
+        if self._size == len(self._state):
+            grown = np.zeros(len(self._state) * 2, dtype=self.dtype)
+            grown[:self._size] = self._state[:self._size]
+            self._state = grown
+        
+        rng = self._rng
+        row = self._state[self._size]
+        row["latitude"] = latitude if latitude is not None else 34.0522 + rng.uniform(-0.1, 0.1)
+        row["longitude"] = longitude if longitude is not None else -118.2437 + rng.uniform(-0.1, 0.1)
+        row["altitude"] = altitude if altitude is not None else rng.uniform(100, 500)
+        row["heading"] = heading if heading is not None else rng.uniform(0, 360)
+        row["speed"] = speed if speed is not None else rng.uniform(10, 30)
+        row["load_factor"] = 1.0
+        row["target_heading"] = row["heading"]
+        row["target_altitude"] = row["altitude"]
+        row["target_speed"] = np.clip(row["speed"], 10, 25)
+        row["motor_health"] = 1.0
+        
+        # Motors already turning at the thrust that balances drag
+        thrust = self.DRAG * row["speed"] ** 2 / 4
+        row["rpm"] = np.sqrt(thrust / self.THRUST_COEFFICIENT)
+        row["thrust"] = thrust
+        row["throttle"] = row["rpm"][0] / self.MAX_RPM
+        row["motor_power"] = self.POWER_COEFFICIENT * row["rpm"] ** 3
+        
+        row["capacity"] = 5000.0
+        row["remaining_capacity"] = 4500.0
+        row["state_of_charge"] = 90.0
+        row["load_power"] = 40.0
+        row["propulsion_power"] = row["motor_power"].sum()
+        row["total_power"] = row["propulsion_power"] + row["load_power"]
+        row["voltage"] = 10.5 + 0.9 * 2.1
+        row["current"] = row["total_power"] / row["voltage"]
+        
+        self._index[uav_id] = self._size
+        self._uav_ids.append(uav_id)
+        self._size += 1
+        self.stats["uavs"] = self._size
+    
+    def remove(self, uav_id: str) -> None:
+        """Release a UAV's row by moving the last row into its slot.
+        
+        Args:
+            uav_id: UAV to remove
+        """
+        row = self._index.pop(uav_id, None)
+        if row is None:
+            return
+        
+        last = self._size - 1
+        if row != last:
+            moved = self._uav_ids[last]
+            self._state[row] = self._state[last]
+            self._uav_ids[row] = moved
+            self._index[moved] = row
+        
+        self._uav_ids.pop()
+        self._size -= 1
+        self.stats["uavs"] = self._size
+    
+    def row(self, uav_id: str) -> Optional[np.void]:
+        """Get a UAV's live row; writes to its fields update the physics state."""
+        index = self._index.get(uav_id)
+        return self._state[index] if index is not None else None
+    
+    def rows(self, uav_ids: Sequence[str]) -> np.ndarray:
+        """Row numbers of several UAVs, -1 for UAVs without a row."""
+        return np.fromiter((self._index.get(uav_id, -1) for uav_id in uav_ids), np.intp, len(uav_ids))
+    
+    def command(self, uav_id: str, heading: Optional[float] = None, altitude: Optional[float] = None,
+                speed: Optional[float] = None) -> None:
+        """Set the autopilot targets of a UAV.
+        
+        Args:
+            uav_id: UAV identifier
+            heading: Target heading in degrees
+            altitude: Target altitude in meters
+            speed: Target airspeed in m/s
+        """
+        row = self.row(uav_id)
+        if row is None:
+            return
+        if heading is not None:
+            row["target_heading"] = heading % 360
+        if altitude is not None:
+            row["target_altitude"] = altitude
+        if speed is not None:
+            row["target_speed"] = speed
+    
+    def set_motor_health(self, uav_id: str, health: Sequence[float]) -> None:
+        """Scale the thrust each motor produces (0 stops a motor).
+        
+        Args:
+            uav_id: UAV identifier
+            health: Thrust factor of each of the four motors
+        """
+        row = self.row(uav_id)
+        if row is not None:
+            row["motor_health"] = np.clip(health, 0.0, 1.0)
+    
+    def step(self, dt: float) -> None:
+        """Advance every UAV by dt seconds.
+        
+        Args:
+            dt: Time step in seconds
+        """
+        started = time.perf_counter()
+        state = self.state
+        n = len(state)
+        if n:
+            self._wander_targets(state, dt)
+            self._autopilot(state)
+            self._motors(state, dt)
+            self._airframe(state, dt)
+            self._battery(state, dt)
+        
+        self.stats["steps"] += 1
+        self.stats["last_step_ms"] = (time.perf_counter() - started) * 1e3
+    
+    def _wander_targets(self, state: np.ndarray, dt: float) -> None:
+        """Occasionally pick a new heading or altitude, about once a minute."""
+        n = len(state)
+        turn = self._rng.random(n) < dt / 60
+        state["target_heading"][turn] = (state["heading"][turn] + self._rng.uniform(-90, 90, int(turn.sum()))) % 360
+        climb = self._rng.random(n) < dt / 120
+        state["target_altitude"][climb] = self._rng.uniform(100, 500, int(climb.sum()))
+    
+    def _autopilot(self, state: np.ndarray) -> None:
+        """Set control surfaces and throttle from the target errors."""
+        surfaces = state["surfaces"]
+        
+        # Heading error to bank angle to differential aileron; rudder coordinates the turn
+        heading_error = (state["target_heading"] - state["heading"] + 180) % 360 - 180
+        bank = np.clip(self.HEADING_GAIN * heading_error, -self.MAX_BANK, self.MAX_BANK)
+        aileron = np.clip(bank / self.ROLL_PER_AILERON, -self.MAX_AILERON, self.MAX_AILERON)
+        surfaces[:, 0] = -aileron
+        surfaces[:, 1] = aileron
+        surfaces[:, 3] = np.clip(0.2 * state["roll"], -self.MAX_RUDDER, self.MAX_RUDDER)
+        
+        # Altitude error to pitch to elevator
+        pitch = np.clip(self.ALTITUDE_GAIN * (state["target_altitude"] - state["altitude"])
+                        - self.CLIMB_DAMPING * state["vertical_speed"], -self.MAX_PITCH, self.MAX_PITCH)
+        surfaces[:, 2] = np.clip(pitch / self.PITCH_PER_ELEVATOR, -self.MAX_ELEVATOR, self.MAX_ELEVATOR)
+        state["surfaces"] = surfaces
+        
+        # Throttle: thrust that balances drag and climb at the target speed, plus a speed correction
+        required = (self.DRAG * state["target_speed"] ** 2
+                    + self.MASS * GRAVITY * np.sin(np.radians(state["pitch"])))
+        feedforward = np.sqrt(np.maximum(required, 0) / 4 / self.THRUST_COEFFICIENT) / self.MAX_RPM
+        throttle = feedforward + self.SPEED_GAIN * (state["target_speed"] - state["speed"])
+        state["throttle"] = np.where(state["remaining_capacity"] > 0, np.clip(throttle, 0, 1), 0)
+    
+    def _motors(self, state: np.ndarray, dt: float) -> None:
+        """Spin the motors toward the throttle and derive thrust and power."""
+        health = state["motor_health"]
+        target = state["throttle"][:, None] * self.MAX_RPM * (health > 0)
+        rpm = state["rpm"]
+        rpm += (target - rpm) * min(1.0, dt / self.MOTOR_TIME_CONSTANT)
+        state["rpm"] = rpm
+        state["thrust"] = self.THRUST_COEFFICIENT * rpm ** 2 * health
+        state["motor_power"] = self.POWER_COEFFICIENT * rpm ** 3
+    
+    def _airframe(self, state: np.ndarray, dt: float) -> None:
+        """Move attitude toward the surfaces and integrate speed and position."""
+        lag = min(1.0, dt / self.ATTITUDE_TIME_CONSTANT)
+        surfaces = state["surfaces"]
+        previous_roll, previous_pitch = state["roll"].copy(), state["pitch"].copy()
+        aileron = (surfaces[:, 1] - surfaces[:, 0]) / 2
+        state["roll"] += (self.ROLL_PER_AILERON * aileron - state["roll"]) * lag
+        state["pitch"] += (self.PITCH_PER_ELEVATOR * surfaces[:, 2] - state["pitch"]) * lag
+        state["roll_rate"] = (state["roll"] - previous_roll) / dt
+        state["pitch_rate"] = (state["pitch"] - previous_pitch) / dt
+        
+        roll, pitch = np.radians(state["roll"]), np.radians(state["pitch"])
+        speed = state["speed"]
+        
+        # Thrust against drag and the along-path component of gravity
+        forward = (state["thrust"].sum(axis=1) - self.DRAG * speed ** 2
+                   - self.MASS * GRAVITY * np.sin(pitch)) / self.MASS
+        speed = np.maximum(0.0, speed + forward * dt)
+        state["speed"] = speed
+        
+        # Coordinated turn from bank, plus the rudder's yaw
+        turn_rate = (np.degrees(GRAVITY * np.tan(roll) / np.maximum(speed, 5.0))
+                     + self.YAW_RATE_PER_RUDDER * surfaces[:, 3])
+        state["turn_rate"] = turn_rate
+        state["load_factor"] = 1.0 / np.cos(roll)
+        state["heading"] = (state["heading"] + turn_rate * dt) % 360
+        
+        # Climb along the flight path; the wing stops holding altitude below stall speed
+        previous_climb = state["vertical_speed"].copy()
+        climb = speed * np.sin(pitch) - np.maximum(0.0, self.STALL_SPEED - speed)
+        climb = np.where(state["altitude"] <= 0, np.maximum(climb, 0.0), climb)
+        state["vertical_speed"] = climb
+        state["altitude"] = np.maximum(0.0, state["altitude"] + climb * dt)
+        
+        acceleration = state["acceleration"]
+        acceleration[:, 0] = forward
+        acceleration[:, 1] = speed * np.radians(turn_rate)
+        acceleration[:, 2] = (climb - previous_climb) / dt
+        state["acceleration"] = acceleration
+        
+        distance = speed * np.cos(pitch) * dt
+        heading = np.radians(state["heading"])
+        state["latitude"] += distance * np.cos(heading) / METERS_PER_DEGREE
+        state["longitude"] += distance * np.sin(heading) / (METERS_PER_DEGREE * np.cos(np.radians(state["latitude"])))
+    
+    def _battery(self, state: np.ndarray, dt: float) -> None:
+        """Drain the battery by the motor and avionics power draw."""
+        state["propulsion_power"] = state["motor_power"].sum(axis=1)
+        state["total_power"] = state["propulsion_power"] + state["load_power"]
+        
+        voltage = (10.5 + state["state_of_charge"] / 100.0 * 2.1
+                   - self.INTERNAL_RESISTANCE * state["current"])
+        state["voltage"] = np.clip(voltage, 10.0, 12.8)
+        state["current"] = state["total_power"] / state["voltage"]
+        
+        # 1 mAh = 3.6 As
+        remaining = state["remaining_capacity"] - state["current"] * dt / 3.6
+        state["remaining_capacity"] = np.clip(remaining, 0, state["capacity"])
+        state["state_of_charge"] = state["remaining_capacity"] / state["capacity"] * 100
+    
+    async def tick(self) -> None:
+        """Step the fleet by one period."""
+        self.step(1.0 / self.telemetry_rate)
+    
+    async def start(self, scheduler: Optional["TelemetryScheduler"] = None) -> None:
+        """Start stepping the physics.
+        
+        Args:
+            scheduler: Shared tick scheduler; a private loop is used if omitted
+        """
+        if self.is_running:
+            return
+        
+        self.is_running = True
+        if scheduler is not None:
+            self._scheduler = scheduler
+            scheduler.register(self)
+        else:
+            self._task = asyncio.create_task(self._run_loop())
+    
+    async def stop(self) -> None:
+        """Stop stepping the physics."""
+        self.is_running = False
+        if self._scheduler is not None:
+            self._scheduler.unregister(self)
+            self._scheduler = None
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+    
+    async def _run_loop(self) -> None:
+        """Private step loop used when no scheduler is shared."""
+        interval = 1.0 / self.telemetry_rate
+        
+        while self.is_running:
+            try:
+                await self.tick()
+            except Exception as e:
+                logger.error(f"Error stepping flight physics: {e}")
+            await self.clock.sleep(interval)
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get flight physics statistics.
+        
+        Returns:
+            Dictionary containing flight physics statistics
+        """
+        return {
+            **self.stats,
+            "rate": self.telemetry_rate,
+            "is_running": self.is_running
+        }
@@ -1,11 +1,10 @@
 """Power subsystem agent."""
 
-import random
 from datetime import datetime
 from typing import Dict, Any
 
 from .base_agent import BaseAgent
-from ..utils.models import TelemetryData, SystemStatus
+from ..utils.models import TelemetryRecord, SystemStatus
 
 
 class PowerAgent(BaseAgent):
@@ -60,12 +59,18 @@ class PowerAgent(BaseAgent):
             "irradiance": 800.0  # W/m²
         }
     
-    async def generate_telemetry(self) -> TelemetryData:
+    async def generate_telemetry(self) -> TelemetryRecord:
         """Generate power telemetry data."""
-        self._update_battery_data()
-        self._update_power_distribution()
+        row = self._physics_row()
+        if row is not None:
+            self._update_power_distribution()
+            self._update_solar_data()
+            self._read_physics(row)
+        else:
+            self._update_battery_data()
+            self._update_power_distribution()
+            self._update_solar_data()
         self._update_power_management()
-        self._update_solar_data()
         
         data = {
             "battery": self.battery_data,
@@ -80,14 +85,14 @@ class PowerAgent(BaseAgent):
             }
         }
         
-        return TelemetryData(
+        return TelemetryRecord(
             subsystem=self.subsystem_name,
             uav_id=self.uav_id,
             data=data,
             status=self.status
         )
     
-    async def apply_fault(self, telemetry_data: TelemetryData, fault_params: Dict[str, Any]) -> TelemetryData:
+    async def apply_fault(self, telemetry_data: TelemetryRecord, fault_params: Dict[str, Any]) -> TelemetryRecord:
         """Apply power fault."""
         fault_type = fault_params.get("type", "voltage_drop")
         
@@ -132,12 +137,12 @@ class PowerAgent(BaseAgent):
         """Update battery telemetry data."""
         # Simulate battery discharge
         discharge_rate = self.power_distribution["total_power"] / self.battery_data["voltage"]
-        self.battery_data["current"] = discharge_rate + random.uniform(-0.5, 0.5)
+        self.battery_data["current"] = discharge_rate + self.rng.uniform(-0.5, 0.5)
         self.battery_data["current"] = max(0, min(20, self.battery_data["current"]))
         
         # Update voltage based on current and SOC
         soc_factor = self.battery_data["state_of_charge"] / 100.0
-        self.battery_data["voltage"] = 10.5 + (soc_factor * 2.1) + random.uniform(-0.1, 0.1)
+        self.battery_data["voltage"] = 10.5 + (soc_factor * 2.1) + self.rng.uniform(-0.1, 0.1)
         self.battery_data["voltage"] = max(10.0, min(12.8, self.battery_data["voltage"]))
         
         # Update remaining capacity
@@ -154,7 +159,7 @@ class PowerAgent(BaseAgent):
         ) * 100
         
         # Update temperature
-        self.battery_data["temperature"] += random.uniform(-0.5, 0.5)
+        self.battery_data["temperature"] += self.rng.uniform(-0.5, 0.5)
         self.battery_data["temperature"] = max(15, min(60, self.battery_data["temperature"]))
         
         # Update time to empty
@@ -165,22 +170,53 @@ class PowerAgent(BaseAgent):
         else:
             self.battery_data["time_to_empty"] = float('inf')
     
+    def _read_physics(self, row: Any) -> None:
+        """Take the battery state and propulsion draw from the flight physics.
+        
+        The other loads, net of solar power, are handed back as the load the
+        physics drains the battery by alongside the motors.
+        """
+        loads = sum(
+            self.power_distribution[name] for name in ("avionics", "communication", "payload", "sensors")
+        )
+        solar = self.solar_data["power"] if self.solar_data["available"] else 0.0
+        row["load_power"] = loads - solar
+        
+        self.power_distribution["propulsion"] = float(row["propulsion_power"])
+        self.power_distribution["total_power"] = self.power_distribution["propulsion"] + loads
+        
+        self.battery_data["voltage"] = float(row["voltage"])
+        self.battery_data["current"] = float(row["current"])
+        self.battery_data["capacity"] = float(row["capacity"])
+        self.battery_data["remaining_capacity"] = float(row["remaining_capacity"])
+        self.battery_data["state_of_charge"] = float(row["state_of_charge"])
+        
+        self.battery_data["temperature"] += self.rng.uniform(-0.5, 0.5)
+        self.battery_data["temperature"] = max(15, min(60, self.battery_data["temperature"]))
+        
+        if self.battery_data["current"] > 0:
+            self.battery_data["time_to_empty"] = (
+                self.battery_data["remaining_capacity"] / 1000
+            ) / self.battery_data["current"] * 60  # minutes
+        else:
+            self.battery_data["time_to_empty"] = float('inf')
+    
     def _update_power_distribution(self) -> None:
         """Update power distribution data."""
         # Simulate power consumption variations
-        self.power_distribution["propulsion"] += random.uniform(-2, 2)
+        self.power_distribution["propulsion"] += self.rng.uniform(-2, 2)
         self.power_distribution["propulsion"] = max(0, min(80, self.power_distribution["propulsion"]))
         
-        self.power_distribution["avionics"] += random.uniform(-0.5, 0.5)
+        self.power_distribution["avionics"] += self.rng.uniform(-0.5, 0.5)
         self.power_distribution["avionics"] = max(5, min(25, self.power_distribution["avionics"]))
         
-        self.power_distribution["communication"] += random.uniform(-0.5, 0.5)
+        self.power_distribution["communication"] += self.rng.uniform(-0.5, 0.5)
         self.power_distribution["communication"] = max(5, min(20, self.power_distribution["communication"]))
         
-        self.power_distribution["payload"] += random.uniform(-1, 1)
+        self.power_distribution["payload"] += self.rng.uniform(-1, 1)
         self.power_distribution["payload"] = max(0, min(20, self.power_distribution["payload"]))
         
-        self.power_distribution["sensors"] += random.uniform(-0.2, 0.2)
+        self.power_distribution["sensors"] += self.rng.uniform(-0.2, 0.2)
         self.power_distribution["sensors"] = max(2, min(10, self.power_distribution["sensors"]))
         
         # Update total power
@@ -222,21 +258,21 @@ class PowerAgent(BaseAgent):
             return
         
         # Simulate solar panel variations
-        self.solar_data["irradiance"] += random.uniform(-50, 50)
+        self.solar_data["irradiance"] += self.rng.uniform(-50, 50)
         self.solar_data["irradiance"] = max(0, min(1000, self.solar_data["irradiance"]))
         
         # Update power based on irradiance
         self.solar_data["power"] = (
             self.solar_data["irradiance"] * 0.05 * self.solar_data["efficiency"]
-        ) + random.uniform(-2, 2)
+        ) + self.rng.uniform(-2, 2)
         self.solar_data["power"] = max(0, min(50, self.solar_data["power"]))
         
         # Update voltage and current
-        self.solar_data["voltage"] = 18.0 + random.uniform(-1, 1)
+        self.solar_data["voltage"] = 18.0 + self.rng.uniform(-1, 1)
         self.solar_data["current"] = self.solar_data["power"] / self.solar_data["voltage"]
         
         # Update temperature
-        self.solar_data["temperature"] += random.uniform(-1, 1)
+        self.solar_data["temperature"] += self.rng.uniform(-1, 1)
         self.solar_data["temperature"] = max(20, min(60, self.solar_data["temperature"]))
     
     def _is_power_healthy(self) -> bool:
@@ -1,11 +1,10 @@
 """Propulsion subsystem agent."""
 
-import random
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, List
 
 from .base_agent import BaseAgent
-from ..utils.models import TelemetryData, SystemStatus
+from ..utils.models import TelemetryRecord, SystemStatus
 
 
 class PropulsionAgent(BaseAgent):
@@ -43,7 +42,7 @@ class PropulsionAgent(BaseAgent):
         self.power_consumption = 400.0  # Watts
         self.efficiency = 0.75
     
-    async def generate_telemetry(self) -> TelemetryData:
+    async def generate_telemetry(self) -> TelemetryRecord:
         """Generate propulsion telemetry data."""
         self._update_motor_data()
         self._update_esc_data()
@@ -67,14 +66,14 @@ class PropulsionAgent(BaseAgent):
             }
         }
         
-        return TelemetryData(
+        return TelemetryRecord(
             subsystem=self.subsystem_name,
             uav_id=self.uav_id,
             data=data,
             status=self.status
         )
     
-    async def apply_fault(self, telemetry_data: TelemetryData, fault_params: Dict[str, Any]) -> TelemetryData:
+    async def apply_fault(self, telemetry_data: TelemetryRecord, fault_params: Dict[str, Any]) -> TelemetryRecord:
         """Apply propulsion fault."""
         fault_type = fault_params.get("type", "motor_failure")
         
@@ -115,51 +114,102 @@ class PropulsionAgent(BaseAgent):
         telemetry_data.status = SystemStatus.ERROR
         return telemetry_data
     
+    async def inject_fault(self, fault_params: Dict[str, Any]) -> None:
+        """Inject a fault, taking the lost thrust out of the flight physics."""
+        if self.physics is not None:
+            self.physics.set_motor_health(self.uav_id, self._motor_health(fault_params))
+        await super().inject_fault(fault_params)
+    
+    async def clear_fault(self) -> None:
+        """Clear active fault and restore full thrust."""
+        if self.physics is not None:
+            self.physics.set_motor_health(self.uav_id, [1.0] * len(self.motors))
+        await super().clear_fault()
+    
+    def _motor_health(self, fault_params: Dict[str, Any]) -> List[float]:
+        """Thrust factor of each motor under a fault."""
+        health = [1.0] * len(self.motors)
+        fault_type = fault_params.get("type", "motor_failure")
+        
+        if fault_type == "motor_failure":
+            motor_id = fault_params.get("motor_id", "motor_1")
+            if motor_id in self.motors:
+                health[list(self.motors).index(motor_id)] = 0.0
+        elif fault_type == "propeller_damage":
+            prop_id = fault_params.get("prop_id", "prop_1")
+            if prop_id in self.propellers:
+                health[list(self.propellers).index(prop_id)] = 1 - fault_params.get("damage_level", 0.5)
+        elif fault_type == "thrust_reduction":
+            health = [1 - fault_params.get("reduction_factor", 0.3)] * len(self.motors)
+        
+        return health
+    
     def _update_motor_data(self) -> None:
         """Update motor telemetry data."""
+        row = self._physics_row()
+        if row is not None:
+            dt = 1.0 / self.telemetry_rate
+            voltage = float(row["voltage"])
+            for i, motor in enumerate(self.motors.values()):
+                power = float(row["motor_power"][i])
+                motor["rpm"] = float(row["rpm"][i])
+                motor["thrust"] = float(row["thrust"][i])
+                motor["voltage"] = voltage
+                motor["current"] = power / voltage
+                
+                # Windings heat toward a temperature set by the power they carry
+                motor["temperature"] += (30 + 0.15 * power - motor["temperature"]) * min(1.0, dt / 30)
+            return
+        
         for motor_id, motor in self.motors.items():
             # Simulate normal operation variations
-            motor["rpm"] += random.uniform(-50, 50)
+            motor["rpm"] += self.rng.uniform(-50, 50)
             motor["rpm"] = max(0, min(6000, motor["rpm"]))
             
-            motor["thrust"] += random.uniform(-1, 1)
+            motor["thrust"] += self.rng.uniform(-1, 1)
             motor["thrust"] = max(0, min(50, motor["thrust"]))
             
-            motor["temperature"] += random.uniform(-2, 2)
+            motor["temperature"] += self.rng.uniform(-2, 2)
             motor["temperature"] = max(20, min(100, motor["temperature"]))
             
-            motor["voltage"] += random.uniform(-0.1, 0.1)
+            motor["voltage"] += self.rng.uniform(-0.1, 0.1)
             motor["voltage"] = max(10, min(14, motor["voltage"]))
             
-            motor["current"] += random.uniform(-0.2, 0.2)
+            motor["current"] += self.rng.uniform(-0.2, 0.2)
             motor["current"] = max(0, min(15, motor["current"]))
     
     def _update_esc_data(self) -> None:
         """Update ESC telemetry data."""
-        for esc_id, esc in self.esc_data.items():
-            esc["temperature"] += random.uniform(-1, 1)
+        coupled = self._physics_row() is not None
+        for esc, motor in zip(self.esc_data.values(), self.motors.values()):
+            esc["temperature"] += self.rng.uniform(-1, 1)
             esc["temperature"] = max(20, min(80, esc["temperature"]))
             
-            esc["voltage"] += random.uniform(-0.1, 0.1)
-            esc["voltage"] = max(10, min(14, esc["voltage"]))
-            
-            esc["current"] += random.uniform(-0.2, 0.2)
-            esc["current"] = max(0, min(15, esc["current"]))
+            if coupled:
+                # Each ESC carries its motor's supply
+                esc["voltage"] = motor["voltage"]
+                esc["current"] = motor["current"]
+            else:
+                esc["voltage"] += self.rng.uniform(-0.1, 0.1)
+                esc["voltage"] = max(10, min(14, esc["voltage"]))
+                
+                esc["current"] += self.rng.uniform(-0.2, 0.2)
+                esc["current"] = max(0, min(15, esc["current"]))
             
             # Simulate occasional ESC status changes
-            if random.random() < 0.001:  # 0.1% chance
-                esc["status"] = random.choice(["normal", "warning", "error"])
+            if self.rng.random() < 0.001:  # 0.1% chance
+                esc["status"] = self.rng.choice(["normal", "warning", "error"])
     
     def _update_propeller_data(self) -> None:
         """Update propeller telemetry data."""
         for prop_id, prop in self.propellers.items():
-            prop["efficiency"] += random.uniform(-0.01, 0.01)
+            prop["efficiency"] += self.rng.uniform(-0.01, 0.01)
             prop["efficiency"] = max(0.5, min(1.0, prop["efficiency"]))
             
-            prop["damage_level"] += random.uniform(-0.001, 0.001)
+            prop["damage_level"] += self.rng.uniform(-0.001, 0.001)
             prop["damage_level"] = max(0, min(1.0, prop["damage_level"]))
             
-            prop["balance"] += random.uniform(-0.01, 0.01)
+            prop["balance"] += self.rng.uniform(-0.01, 0.01)
             prop["balance"] = max(0.5, min(1.0, prop["balance"]))
     
     def _update_overall_metrics(self) -> None:
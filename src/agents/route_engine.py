@@ -0,0 +1,365 @@
+"""Vectorized waypoint route progress for the whole fleet."""
+
+import asyncio
+import time
+from typing import Dict, Any, Optional, List, Sequence, Tuple, TYPE_CHECKING
+import numpy as np
+from loguru import logger
+
+from .spatial_index import PositionSource
+from ..utils.config import config
+from ..utils.clock import SimulationClock, get_clock
+
+if TYPE_CHECKING:
+    from .scheduler import TelemetryScheduler
+
+
+# Mean Earth radius used by every great-circle computation
+EARTH_RADIUS = 6371000.0
+
+
+def _angular_distance(lat1: np.ndarray, lon1: np.ndarray, lat2: np.ndarray, lon2: np.ndarray) -> np.ndarray:
+    """Haversine central angle between points given in radians."""
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    return 2 * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+def _bearing(lat1: np.ndarray, lon1: np.ndarray, lat2: np.ndarray, lon2: np.ndarray) -> np.ndarray:
+    """Initial great-circle bearing in radians between points given in radians."""
+    dlon = lon2 - lon1
+    return np.arctan2(np.sin(dlon) * np.cos(lat2),
+                      np.cos(lat1) * np.sin(lat2) - np.sin(lat1) * np.cos(lat2) * np.cos(dlon))
+
+
+def haversine(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great-circle distance in meters between two points in degrees."""
+    return float(_angular_distance(*np.radians([lat1, lon1, lat2, lon2]))) * EARTH_RADIUS
+
+
+class RouteEngine:
+    """Waypoint routes with precomputed leg geometry, tracked fleet-wide.
+    
+    Each route's leg lengths (haversine), leg bearings and cumulative
+    along-track distances are computed once when it is set. Every update
+    then locates all tracked UAVs at once: each UAV is projected onto a
+    short window of legs starting at the leg it was last on (routes are
+    flown forward), giving along-track distance and signed cross-track
+    error (positive right of track). The waypoint reached at that
+    along-track distance is a binary search over the cumulative distances
+    of every route, so per-update cost does not grow with route length.
+    
+    Like the geofence engine, the route engine exposes ``telemetry_rate``
+    and ``tick()`` so the TelemetryScheduler can refresh it every period.
+    """
+    
+    def __init__(self, source: Optional[PositionSource] = None, window: Optional[int] = None,
+                 rate: Optional[float] = None, clock: Optional[SimulationClock] = None):
+        """Initialize route engine.
+        
+        Args:
+            source: Callable returning the current fleet positions, read on
+                every tick
+            window: Legs searched ahead of each UAV's current leg (defaults
+                to configuration)
+            rate: Update rate in Hz (defaults to configuration)
+            clock: Simulation clock used by the private update loop
+        """
+        self.source = source
+        self.window = max(1, int(window if window is not None else config.get("system.route_engine.window", 4)))
+        self.telemetry_rate = rate if rate is not None else config.get("system.route_engine.rate", 25.0)
+        self.clock = clock if clock is not None else get_clock()
+        self.uav_id = "fleet"
+        self.subsystem_name = "Route_Engine"
+        self.is_running = False
+        self._scheduler: Optional["TelemetryScheduler"] = None
+        self._task: Optional[asyncio.Task] = None
+        
+        # Route definitions, concatenated lazily
+        self._routes: Dict[str, Tuple[np.ndarray, int]] = {}
+        self._compiled = False
+        self._route_ids: List[str] = []
+        self._route_rows: Dict[str, int] = {}
+        self._leg = np.empty(0, dtype=np.intp)
+        
+        # Last update, one entry per route
+        self._tracked = np.empty(0, dtype=bool)
+        self._along = np.empty(0)
+        self._cross = np.empty(0)
+        self._next = np.empty(0, dtype=np.intp)
+        self._target_distance = np.empty(0)
+        self._target_bearing = np.empty(0)
+        
+        self.stats = {
+            "routes": 0,
+            "waypoints": 0,
+            "updates": 0,
+            "tracked": 0,
+            "legs_checked": 0,
+            "last_update_ms": 0.0
+        }
+    
+    def __len__(self) -> int:
+        return len(self._routes)
+    
+    def __contains__(self, uav_id: str) -> bool:
+        return uav_id in self._routes
+    
+    def set_route(self, uav_id: str, waypoints: Sequence[Dict[str, Any]], current_leg: int = 0) -> None:
+        """Set or replace a UAV's route.
+        
+        Args:
+            uav_id: UAV identifier
+            waypoints: Waypoint dictionaries with lat and lon in degrees, in
+                flight order
+            current_leg: Leg the UAV is flying (leg i joins waypoints i and
+                i + 1); tracking only moves forward from here
+        """
+        if len(waypoints) < 2:
+            raise ValueError("A route needs at least two waypoints")
+        
+        points = np.radians([[waypoint["lat"], waypoint["lon"]] for waypoint in waypoints])
+        self._routes[uav_id] = (points, min(max(0, current_leg), len(points) - 2))
+        self._route_rows.pop(uav_id, None)
+        self._compiled = False
+    
+    def remove_route(self, uav_id: str) -> None:
+        """Stop tracking a UAV's route.
+        
+        Args:
+            uav_id: UAV identifier
+        """
+        if self._routes.pop(uav_id, None) is not None:
+            self._compiled = False
+    
+    def compile(self) -> None:
+        """Concatenate every route and precompute its leg geometry."""
+        # Carry the tracked leg and last update of routes that were not replaced
+        previous = {uav_id: row for uav_id, row in self._route_rows.items() if uav_id in self._routes}
+        legs = {uav_id: int(self._leg[row]) for uav_id, row in previous.items()}
+        carried = (self._tracked, self._along, self._cross, self._next, self._target_distance,
+                   self._target_bearing)
+        
+        self._route_ids = list(self._routes)
+        self._route_rows = {uav_id: row for row, uav_id in enumerate(self._route_ids)}
+        routes = [self._routes[uav_id][0] for uav_id in self._route_ids]
+        counts = np.array([len(points) for points in routes], dtype=np.intp)
+        self._route_start = np.cumsum(counts) - counts
+        self._route_waypoints = counts
+        self._leg = np.array([legs.get(uav_id, self._routes[uav_id][1]) for uav_id in self._route_ids],
+                             dtype=np.intp)
+        
+        points = np.concatenate(routes) if routes else np.empty((0, 2))
+        self._lat, self._lon = points[:, 0], points[:, 1]
+        
+        # Leg i starts at waypoint i; each route's last waypoint starts none
+        following = np.minimum(np.arange(len(points)) + 1, max(len(points) - 1, 0))
+        self._leg_length = _angular_distance(self._lat, self._lon, self._lat[following],
+                                             self._lon[following]) * EARTH_RADIUS
+        self._leg_bearing = _bearing(self._lat, self._lon, self._lat[following], self._lon[following])
+        last = self._route_start + counts - 1
+        self._leg_length[last] = 0.0
+        
+        # Along-track distance of each waypoint from its route's start
+        before = np.concatenate([[0.0], np.cumsum(self._leg_length)[:-1]]) if len(points) else np.empty(0)
+        self._cumulative = before - np.repeat(before[self._route_start], counts)
+        self._total = self._cumulative[last]
+        
+        # Routes stacked end to end: one sorted array answers every route
+        self._route_base = np.cumsum(self._total) - self._total
+        self._stacked = self._cumulative + np.repeat(self._route_base, counts)
+        
+        n = len(self._route_ids)
+        self._tracked = np.zeros(n, dtype=bool)
+        self._along = np.zeros(n)
+        self._cross = np.zeros(n)
+        self._next = self._leg + 1
+        self._target_distance = np.full(n, np.nan)
+        self._target_bearing = np.zeros(n)
+        
+        old = np.fromiter(previous.values(), np.intp, len(previous))
+        new = np.fromiter((self._route_rows[uav_id] for uav_id in previous), np.intp, len(previous))
+        for target, source in zip((self._tracked, self._along, self._cross, self._next, self._target_distance,
+                                   self._target_bearing), carried):
+            target[new] = source[old]
+        
+        self._compiled = True
+        self.stats["routes"] = n
+        self.stats["waypoints"] = len(points)
+    
+    def update(self, uav_ids: Sequence[str], latitude: Sequence[float], longitude: Sequence[float]) -> None:
+        """Locate every UAV with a route on it.
+        
+        Args:
+            uav_ids: UAV identifiers, one per position
+            latitude: Latitudes in degrees
+            longitude: Longitudes in degrees
+        """
+        started = time.perf_counter()
+        if not self._compiled:
+            self.compile()
+        
+        positions = dict(zip(uav_ids, range(len(uav_ids))))
+        rows = np.fromiter((positions.get(uav_id, -1) for uav_id in self._route_ids), np.intp,
+                           len(self._route_ids))
+        self._tracked = rows >= 0
+        routes = np.flatnonzero(self._tracked)
+        lat = np.radians(np.asarray(latitude, dtype=float)[rows[routes]])[:, None]
+        lon = np.radians(np.asarray(longitude, dtype=float)[rows[routes]])[:, None]
+        
+        # Candidate legs: the current one and the next few, within the route
+        last_leg = self._route_waypoints[routes] - 2
+        candidate = self._leg[routes][:, None] + np.arange(self.window)
+        beyond = candidate > last_leg[:, None]
+        candidate = np.minimum(candidate, last_leg[:, None])
+        start = self._route_start[routes][:, None] + candidate
+        self.stats["legs_checked"] += candidate.size
+        
+        # Spherical along-track / cross-track against each candidate leg
+        distance = _angular_distance(self._lat[start], self._lon[start], lat, lon)
+        angle = _bearing(self._lat[start], self._lon[start], lat, lon) - self._leg_bearing[start]
+        cross = np.arcsin(np.clip(np.sin(distance) * np.sin(angle), -1.0, 1.0)) * EARTH_RADIUS
+        along = np.arctan2(np.sin(distance) * np.cos(angle), np.cos(distance)) * EARTH_RADIUS
+        length = self._leg_length[start]
+        to_end = _angular_distance(self._lat[start + 1], self._lon[start + 1], lat, lon) * EARTH_RADIUS
+        gap = np.where(along < 0, distance * EARTH_RADIUS, np.where(along > length, to_end, np.abs(cross)))
+        gap[beyond] = np.inf
+        
+        # Closest leg wins; ties go to the earlier leg
+        best = np.argmin(gap, axis=1)
+        pick = np.arange(len(routes))
+        leg_start = start[pick, best]
+        self._leg[routes] = candidate[pick, best]
+        self._along[routes] = self._cumulative[leg_start] + np.clip(along[pick, best], 0.0, length[pick, best])
+        self._cross[routes] = cross[pick, best]
+        
+        # Waypoint ahead of the along-track position, by binary search
+        reached = np.searchsorted(self._stacked, self._along[routes] + self._route_base[routes], "right")
+        final = self._route_start[routes] + self._route_waypoints[routes] - 1
+        target = np.minimum(reached, final)
+        self._next[routes] = target - self._route_start[routes]
+        
+        lat, lon = lat[:, 0], lon[:, 0]
+        self._target_distance[routes] = _angular_distance(lat, lon, self._lat[target],
+                                                          self._lon[target]) * EARTH_RADIUS
+        self._target_bearing[routes] = np.degrees(_bearing(lat, lon, self._lat[target], self._lon[target])) % 360
+        
+        self.stats["updates"] += 1
+        self.stats["tracked"] = len(routes)
+        self.stats["last_update_ms"] = (time.perf_counter() - started) * 1e3
+    
+    def waypoint_at(self, uav_id: str, distance: float) -> Optional[int]:
+        """Get the waypoint a route reaches next at an along-track distance.
+        
+        Args:
+            uav_id: UAV identifier
+            distance: Along-track distance from the route start in meters
+            
+        Returns:
+            Waypoint index, or None if the UAV has no route
+        """
+        if uav_id not in self._routes:
+            return None
+        if not self._compiled:
+            self.compile()
+        
+        row = self._route_rows[uav_id]
+        start = self._route_start[row]
+        count = self._route_waypoints[row]
+        index = np.searchsorted(self._cumulative[start:start + count], distance, "right")
+        return int(min(index, count - 1))
+    
+    def progress(self, uav_id: str) -> Optional[Dict[str, Any]]:
+        """Get a UAV's route progress as of the last update.
+        
+        Args:
+            uav_id: UAV identifier
+            
+        Returns:
+            Dictionary with leg, next_waypoint (index), total_waypoints, and
+            in meters along_track, distance_remaining, total_distance,
+            distance_to_target and cross_track_error (positive right of
+            track), plus bearing_to_target in degrees; None if the UAV has
+            no route or no position was available
+        """
+        if uav_id not in self._routes:
+            return None
+        if not self._compiled:
+            self.compile()
+        
+        row = self._route_rows[uav_id]
+        if not self._tracked[row]:
+            return None
+        
+        total = float(self._total[row])
+        along = float(self._along[row])
+        return {
+            "leg": int(self._leg[row]),
+            "next_waypoint": int(self._next[row]),
+            "total_waypoints": int(self._route_waypoints[row]),
+            "along_track": along,
+            "distance_remaining": max(0.0, total - along),
+            "total_distance": total,
+            "distance_to_target": float(self._target_distance[row]),
+            "bearing_to_target": float(self._target_bearing[row]),
+            "cross_track_error": float(self._cross[row])
+        }
+    
+    async def tick(self) -> None:
+        """Locate the fleet positions from the position source on their routes."""
+        if self.source is not None and self._routes:
+            uav_ids, latitude, longitude, _altitude, _heading = self.source()
+            self.update(uav_ids, latitude, longitude)
+    
+    async def start(self, scheduler: Optional["TelemetryScheduler"] = None) -> None:
+        """Start tracking routes.
+        
+        Args:
+            scheduler: Shared tick scheduler; a private loop is used if omitted
+        """
+        if self.is_running:
+            return
+        
+        self.is_running = True
+        if scheduler is not None:
+            self._scheduler = scheduler
+            scheduler.register(self)
+        else:
+            self._task = asyncio.create_task(self._run_loop())
+    
+    async def stop(self) -> None:
+        """Stop tracking routes."""
+        self.is_running = False
+        if self._scheduler is not None:
+            self._scheduler.unregister(self)
+            self._scheduler = None
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+    
+    async def _run_loop(self) -> None:
+        """Private update loop used when no scheduler is shared."""
+        interval = 1.0 / self.telemetry_rate
+        
+        while self.is_running:
+            try:
+                await self.tick()
+            except Exception as e:
+                logger.error(f"Error updating route progress: {e}")
+            await self.clock.sleep(interval)
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get route engine statistics.
+        
+        Returns:
+            Dictionary containing route engine statistics
+        """
+        return {
+            **self.stats,
+            "window": self.window,
+            "rate": self.telemetry_rate,
+            "is_running": self.is_running
+        }
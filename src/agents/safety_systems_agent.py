@@ -1,11 +1,14 @@
 """Safety systems subsystem agent."""
 
-import random
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Optional, TYPE_CHECKING
 
 from .base_agent import BaseAgent
-from ..utils.models import TelemetryData, SystemStatus
+from ..utils.models import TelemetryRecord, SystemStatus, Alert, SeverityLevel
+
+if TYPE_CHECKING:
+    from .geofence import GeofenceEngine
+    from .spatial_index import FleetSpatialIndex
 
 
 class SafetySystemsAgent(BaseAgent):
@@ -35,6 +38,8 @@ class SafetySystemsAgent(BaseAgent):
             "detection_range": 200.0,  # meters
             "last_detection_time": None
         }
+        self.spatial_index: Optional["FleetSpatialIndex"] = None
+        self.geofence: Optional["GeofenceEngine"] = None
         
         # System health monitoring
         self.system_health = {
@@ -45,7 +50,7 @@ class SafetySystemsAgent(BaseAgent):
             "navigation_backup_active": True,
             "propulsion_backup_active": True,
             "health_check_interval": 10,  # seconds
-            "last_health_check": datetime.now()
+            "last_health_check": self.clock.now()
         }
         
         # Safety limits and thresholds
@@ -73,9 +78,11 @@ class SafetySystemsAgent(BaseAgent):
             "manual_interventions": 0
         }
     
-    async def generate_telemetry(self) -> TelemetryData:
+    async def generate_telemetry(self) -> TelemetryRecord:
         """Generate safety systems telemetry data."""
         self._update_emergency_systems()
+        if self.geofence is not None:
+            await self._check_geofence()
         self._update_collision_avoidance()
         self._update_system_health()
         self._update_safety_events()
@@ -94,14 +101,14 @@ class SafetySystemsAgent(BaseAgent):
             }
         }
         
-        return TelemetryData(
+        return TelemetryRecord(
             subsystem=self.subsystem_name,
             uav_id=self.uav_id,
             data=data,
             status=self.status
         )
     
-    async def apply_fault(self, telemetry_data: TelemetryData, fault_params: Dict[str, Any]) -> TelemetryData:
+    async def apply_fault(self, telemetry_data: TelemetryRecord, fault_params: Dict[str, Any]) -> TelemetryRecord:
         """Apply safety systems fault."""
         fault_type = fault_params.get("type", "parachute_failure")
         
@@ -154,63 +161,123 @@ class SafetySystemsAgent(BaseAgent):
     def _update_emergency_systems(self) -> None:
         """Update emergency systems status."""
         # Simulate parachute status changes
-        if random.random() < 0.001:  # 0.1% chance
+        if self.rng.random() < 0.001:  # 0.1% chance
             if self.emergency_systems["parachute_status"] == "ready":
                 self.emergency_systems["parachute_deployed"] = True
                 self.emergency_systems["parachute_status"] = "deployed"
         
         # Simulate emergency landing activation
-        if random.random() < 0.0005:  # 0.05% chance
+        if self.rng.random() < 0.0005:  # 0.05% chance
             self.emergency_systems["emergency_landing_active"] = True
         
         # Simulate RTL activation
-        if random.random() < 0.001:  # 0.1% chance
+        if self.rng.random() < 0.001:  # 0.1% chance
             self.emergency_systems["rtl_active"] = True
         
-        # Simulate geofence violations
-        if random.random() < 0.0001:  # 0.01% chance
+        # Simulate geofence violations (checked for real with a geofence engine)
+        if self.geofence is None and self.rng.random() < 0.0001:  # 0.01% chance
             self.emergency_systems["geofence_violation"] = True
         
         # Simulate emergency stop
-        if random.random() < 0.0001:  # 0.01% chance
+        if self.rng.random() < 0.0001:  # 0.01% chance
             self.emergency_systems["emergency_stop"] = True
     
+    def attach_spatial_index(self, index: Optional["FleetSpatialIndex"]) -> None:
+        """Detect other UAVs of the fleet through a shared spatial index.
+        
+        Args:
+            index: Fleet spatial index, or None to go back to simulated
+                obstacle detection
+        """
+        self.spatial_index = index
+    
+    def attach_geofence(self, geofence: Optional["GeofenceEngine"]) -> None:
+        """Report geofence violations from a geofence engine's fleet checks.
+        
+        Args:
+            geofence: Geofence engine, or None to go back to simulated
+                violations
+        """
+        self.geofence = geofence
+    
+    async def _check_geofence(self) -> None:
+        """Track no-fly zone containment and alert when the UAV enters a zone."""
+        # A geofence failure fault leaves the geofence unable to enforce
+        if self._fault_active and self._fault_params.get("type") == "geofence_failure":
+            return
+        
+        status = self.geofence.status(self.uav_id)
+        inside = status is not None and status["inside"]
+        entered = inside and not self.emergency_systems["geofence_violation"]
+        self.emergency_systems["geofence_violation"] = inside
+        
+        if entered:
+            await self._send_alert(Alert(
+                uav_id=self.uav_id,
+                subsystem=self.subsystem_name,
+                severity=SeverityLevel.HIGH,
+                message=f"Geofence violation: entered no-fly zone {status['zone_id']}",
+                data={"fault_type": "geofence_failure", "zone_id": status["zone_id"],
+                      "depth": -status["distance"]}
+            ))
+    
     def _update_collision_avoidance(self) -> None:
         """Update collision avoidance data."""
-        # Simulate obstacle detection
-        if random.random() < 0.01:  # 1% chance
+        if self.spatial_index is not None:
+            self._detect_fleet_obstacles()
+        elif self.rng.random() < 0.01:  # Simulate obstacle detection (1% chance)
             self.collision_avoidance["obstacle_detected"] = True
-            self.collision_avoidance["obstacle_distance"] = random.uniform(10, 200)
-            self.collision_avoidance["obstacle_direction"] = random.uniform(0, 360)
-            self.collision_avoidance["last_detection_time"] = datetime.now()
-        else:
-            self.collision_avoidance["obstacle_detected"] = False
-        
-        # Update avoidance maneuver based on obstacle detection
-        if self.collision_avoidance["obstacle_detected"]:
+            self.collision_avoidance["obstacle_distance"] = self.rng.uniform(10, 200)
+            self.collision_avoidance["obstacle_direction"] = self.rng.uniform(0, 360)
+            self.collision_avoidance["last_detection_time"] = self.clock.now()
             maneuvers = ["climb", "descend", "turn_left", "turn_right"]
-            self.collision_avoidance["avoidance_maneuver"] = random.choice(maneuvers)
+            self.collision_avoidance["avoidance_maneuver"] = self.rng.choice(maneuvers)
         else:
+            self.collision_avoidance["obstacle_detected"] = False
             self.collision_avoidance["avoidance_maneuver"] = "none"
         
         # Simulate safety margin changes
-        self.collision_avoidance["safety_margin"] += random.uniform(-2, 2)
+        self.collision_avoidance["safety_margin"] += self.rng.uniform(-2, 2)
         self.collision_avoidance["safety_margin"] = max(10, min(100, 
             self.collision_avoidance["safety_margin"]))
         
         # Simulate detection range changes
-        self.collision_avoidance["detection_range"] += random.uniform(-5, 5)
+        self.collision_avoidance["detection_range"] += self.rng.uniform(-5, 5)
         self.collision_avoidance["detection_range"] = max(50, min(500, 
             self.collision_avoidance["detection_range"]))
     
+    def _detect_fleet_obstacles(self) -> None:
+        """Treat the nearest other UAV within detection range as the obstacle."""
+        nearest = self.spatial_index.nearest(self.uav_id)
+        if nearest is None or nearest["distance"] > self.collision_avoidance["detection_range"]:
+            self.collision_avoidance["obstacle_detected"] = False
+            self.collision_avoidance["avoidance_maneuver"] = "none"
+            return
+        
+        self.collision_avoidance["obstacle_detected"] = True
+        self.collision_avoidance["obstacle_distance"] = nearest["distance"]
+        self.collision_avoidance["obstacle_direction"] = nearest["bearing"]
+        self.collision_avoidance["last_detection_time"] = self.clock.now()
+        
+        # Separate vertically from traffic mostly above or below, otherwise
+        # turn away from the side the other UAV is on
+        horizontal = max(nearest["distance"] ** 2 - nearest["vertical_offset"] ** 2, 0.0) ** 0.5
+        if abs(nearest["vertical_offset"]) >= horizontal:
+            maneuver = "descend" if nearest["vertical_offset"] > 0 else "climb"
+        elif (nearest["bearing"] - nearest["heading"]) % 360 < 180:
+            maneuver = "turn_left"
+        else:
+            maneuver = "turn_right"
+        self.collision_avoidance["avoidance_maneuver"] = maneuver
+    
     def _update_system_health(self) -> None:
         """Update system health monitoring."""
         # Simulate critical systems status
-        if random.random() < 0.001:  # 0.1% chance
+        if self.rng.random() < 0.001:  # 0.1% chance
             self.system_health["critical_systems_ok"] = not self.system_health["critical_systems_ok"]
         
         # Simulate redundant systems status
-        if random.random() < 0.0005:  # 0.05% chance
+        if self.rng.random() < 0.0005:  # 0.05% chance
             self.system_health["redundant_systems_active"] = not self.system_health["redundant_systems_active"]
         
         # Simulate backup system status changes
@@ -222,42 +289,42 @@ class SafetySystemsAgent(BaseAgent):
         ]
         
         for system in backup_systems:
-            if random.random() < 0.0001:  # 0.01% chance
+            if self.rng.random() < 0.0001:  # 0.01% chance
                 self.system_health[system] = not self.system_health[system]
         
         # Update health check interval
-        self.system_health["health_check_interval"] += random.uniform(-1, 1)
+        self.system_health["health_check_interval"] += self.rng.uniform(-1, 1)
         self.system_health["health_check_interval"] = max(5, min(30, 
             self.system_health["health_check_interval"]))
         
         # Update last health check time
-        if random.random() < 0.1:  # 10% chance
-            self.system_health["last_health_check"] = datetime.now()
+        if self.rng.random() < 0.1:  # 10% chance
+            self.system_health["last_health_check"] = self.clock.now()
     
     def _update_safety_events(self) -> None:
         """Update safety events and alerts."""
         # Simulate alert generation
-        if random.random() < 0.001:  # 0.1% chance
+        if self.rng.random() < 0.001:  # 0.1% chance
             self.safety_events["total_alerts"] += 1
             
             # Determine alert severity
-            if random.random() < 0.1:  # 10% chance of critical alert
+            if self.rng.random() < 0.1:  # 10% chance of critical alert
                 self.safety_events["critical_alerts"] += 1
             else:
                 self.safety_events["warning_alerts"] += 1
             
-            self.safety_events["last_alert_time"] = datetime.now()
+            self.safety_events["last_alert_time"] = self.clock.now()
         
         # Simulate auto responses
-        if random.random() < 0.0005:  # 0.05% chance
+        if self.rng.random() < 0.0005:  # 0.05% chance
             self.safety_events["auto_responses"] += 1
         
         # Simulate manual interventions
-        if random.random() < 0.0001:  # 0.01% chance
+        if self.rng.random() < 0.0001:  # 0.01% chance
             self.safety_events["manual_interventions"] += 1
         
         # Update alert cooldown
-        self.safety_events["alert_cooldown"] += random.uniform(-0.5, 0.5)
+        self.safety_events["alert_cooldown"] += self.rng.uniform(-0.5, 0.5)
         self.safety_events["alert_cooldown"] = max(1, min(10, 
             self.safety_events["alert_cooldown"]))
     
@@ -0,0 +1,261 @@
+"""Shared tick scheduler driving all UAV subsystem agents from one loop."""
+
+import asyncio
+import heapq
+import itertools
+from typing import Dict, Any, Optional, List, Tuple, TYPE_CHECKING
+from loguru import logger
+
+from ..utils.config import config
+from ..utils.clock import SimulationClock, get_clock
+
+if TYPE_CHECKING:
+    from .base_agent import BaseAgent
+
+
+class TelemetryScheduler:
+    """Heap-based scheduler that ticks every registered agent at its own rate.
+    
+    Agents are keyed by their next due time. Due times are advanced by a fixed
+    interval from the previous due time (not from when the tick actually ran),
+    so rates hold without cumulative drift. Agents sharing a rate are phase
+    aligned to the scheduler epoch, which makes them come due together and be
+    dispatched as one batch.
+    """
+    
+    def __init__(self, batch_window: Optional[float] = None, clock: Optional[SimulationClock] = None):
+        """Initialize tick scheduler.
+        
+        Args:
+            batch_window: Agents due within this many simulated seconds of the
+                earliest due agent are dispatched in the same tick
+            clock: Simulation clock (defaults to the shared clock)
+        """
+        if batch_window is None:
+            batch_window = config.get("system.scheduler.batch_window_ms", 1.0) / 1000.0
+        
+        self.batch_window = batch_window
+        self.clock = clock if clock is not None else get_clock()
+        self.yield_every = config.get("system.scheduler.yield_every", 256)
+        self.is_running = False
+        
+        # Heap of (due_time, sequence, agent); stale entries are skipped lazily
+        self._heap: List[Tuple[float, int, "BaseAgent"]] = []
+        self._entries: Dict[int, int] = {}
+        self._counter = itertools.count()
+        self._epoch: Optional[float] = None
+        self._task: Optional[asyncio.Task] = None
+        self._waiter: Optional[asyncio.Future] = None
+        self._wakeup_time: Optional[float] = None
+        
+        # Statistics
+        self.stats = {
+            "ticks": 0,
+            "agents_dispatched": 0,
+            "max_batch_size": 0,
+            "late_dispatches": 0,
+            "missed_deadlines": 0,
+            "tick_errors": 0,
+            "total_lateness": 0.0,
+            "max_lateness": 0.0
+        }
+        
+        logger.debug("TelemetryScheduler initialized")
+    
+    def _now(self) -> float:
+        """Get the current simulated time in seconds."""
+        return self.clock.time()
+    
+    async def start(self) -> None:
+        """Start the scheduler loop."""
+        if self.is_running:
+            logger.warning("TelemetryScheduler is already running")
+            return
+        
+        self.is_running = True
+        if self._epoch is None:
+            self._epoch = self._now()
+        self._task = asyncio.create_task(self._run_loop())
+        logger.info("TelemetryScheduler started")
+    
+    async def stop(self) -> None:
+        """Stop the scheduler loop."""
+        self.is_running = False
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        logger.info("TelemetryScheduler stopped")
+    
+    def register(self, agent: "BaseAgent") -> None:
+        """Register an agent to be ticked at its telemetry rate.
+        
+        Args:
+            agent: Agent to schedule
+        """
+        now = self._now()
+        if self._epoch is None:
+            self._epoch = now
+        
+        # Align the first tick to the rate grid so equal-rate agents batch
+        interval = 1.0 / agent.telemetry_rate
+        periods = -(-(now - self._epoch) // interval)
+        due = self._epoch + periods * interval
+        
+        self._push(agent, due)
+        self._wake(due)
+    
+    def unregister(self, agent: "BaseAgent") -> None:
+        """Remove an agent from the schedule.
+        
+        Args:
+            agent: Agent to remove
+        """
+        self._entries.pop(id(agent), None)
+    
+    def is_registered(self, agent: "BaseAgent") -> bool:
+        """Check whether an agent is currently scheduled.
+        
+        Args:
+            agent: Agent to check
+            
+        Returns:
+            True if the agent is scheduled
+        """
+        return id(agent) in self._entries
+    
+    def _push(self, agent: "BaseAgent", due: float) -> None:
+        """Push an agent onto the heap, superseding any previous entry."""
+        sequence = next(self._counter)
+        self._entries[id(agent)] = sequence
+        heapq.heappush(self._heap, (due, sequence, agent))
+    
+    def _wake(self, due: float) -> None:
+        """Wake the loop early if a new entry is due before its next wakeup."""
+        if self._waiter is None or self._waiter.done():
+            return
+        if self._wakeup_time is None or due < self._wakeup_time:
+            self._waiter.set_result(None)
+    
+    def _pop_due(self, now: float) -> List[Tuple[float, "BaseAgent"]]:
+        """Pop every live entry due by now plus the batch window."""
+        batch = []
+        limit = now + self.batch_window
+        heap = self._heap
+        
+        while heap and heap[0][0] <= limit:
+            due, sequence, agent = heapq.heappop(heap)
+            if self._entries.get(id(agent)) != sequence:
+                continue  # Unregistered or rescheduled
+            batch.append((due, agent))
+        
+        return batch
+    
+    async def _sleep_until(self, when: Optional[float]) -> None:
+        """Sleep until the given time or until woken by a new registration."""
+        loop = asyncio.get_running_loop()
+        self._waiter = loop.create_future()
+        self._wakeup_time = when
+        handle = None
+        
+        if when is not None:
+            handle = loop.call_at(self.clock.loop_time(when), self._release_waiter, self._waiter)
+        
+        try:
+            await self._waiter
+        finally:
+            if handle:
+                handle.cancel()
+            self._waiter = None
+            self._wakeup_time = None
+    
+    @staticmethod
+    def _release_waiter(waiter: asyncio.Future) -> None:
+        """Resolve a sleeping waiter if it is still pending."""
+        if not waiter.done():
+            waiter.set_result(None)
+    
+    async def _run_loop(self) -> None:
+        """Main scheduling loop."""
+        while self.is_running:
+            # Drop stale entries from the top of the heap
+            while self._heap and self._entries.get(id(self._heap[0][2])) != self._heap[0][1]:
+                heapq.heappop(self._heap)
+            
+            now = self._now()
+            if not self._heap:
+                await self._sleep_until(None)
+                continue
+            
+            if self._heap[0][0] > now + self.batch_window:
+                await self._sleep_until(self._heap[0][0])
+                continue
+            
+            batch = self._pop_due(now)
+            if batch:
+                await self._dispatch(batch, now)
+            
+            # Let the rest of the event loop run between batches
+            await asyncio.sleep(0)
+    
+    async def _dispatch(self, batch: List[Tuple[float, "BaseAgent"]], now: float) -> None:
+        """Tick a batch of due agents and reschedule them.
+        
+        Args:
+            batch: List of (due_time, agent) pairs
+            now: Time the batch was collected
+        """
+        self.stats["ticks"] += 1
+        self.stats["agents_dispatched"] += len(batch)
+        self.stats["max_batch_size"] = max(self.stats["max_batch_size"], len(batch))
+        
+        for index, (due, agent) in enumerate(batch):
+            # Large batches yield periodically so consumers are not starved
+            if index and index % self.yield_every == 0:
+                await asyncio.sleep(0)
+            
+            interval = 1.0 / agent.telemetry_rate
+            lateness = max(0.0, now - due)
+            self.stats["total_lateness"] += lateness
+            if lateness > self.stats["max_lateness"]:
+                self.stats["max_lateness"] = lateness
+            
+            # Skip whole periods we could not serve instead of bursting
+            next_due = due + interval
+            if next_due <= now:
+                missed = int((now - due) // interval)
+                self.stats["late_dispatches"] += 1
+                self.stats["missed_deadlines"] += missed
+                next_due = due + (missed + 1) * interval
+            
+            self._push(agent, next_due)
+            
+            try:
+                await agent.tick()
+            except Exception as e:
+                self.stats["tick_errors"] += 1
+                logger.error(f"Error ticking {agent.subsystem_name} for UAV {agent.uav_id}: {e}")
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get scheduler statistics.
+        
+        Returns:
+            Dictionary containing scheduler statistics
+        """
+        stats = self.stats.copy()
+        total_lateness = stats.pop("total_lateness")
+        stats["scheduled_agents"] = len(self._entries)
+        stats["is_running"] = self.is_running
+        stats["batch_window_ms"] = self.batch_window * 1000.0
+        stats["average_lateness_ms"] = (
+            total_lateness / stats["agents_dispatched"] * 1000.0 if stats["agents_dispatched"] else 0.0
+        )
+        stats["max_lateness_ms"] = stats.pop("max_lateness") * 1000.0
+        stats["average_batch_size"] = (
+            stats["agents_dispatched"] / stats["ticks"] if stats["ticks"] else 0.0
+        )
+        
+        return stats
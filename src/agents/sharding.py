@@ -0,0 +1,680 @@
+"""Multi-process fleet sharding."""
+
+import asyncio
+import itertools
+import multiprocessing
+import os
+import sys
+import time
+import zlib
+from multiprocessing.connection import Connection
+from multiprocessing.process import BaseProcess
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from loguru import logger
+
+from .telemetry_manager import TelemetryManager
+from ..anomaly.anomaly_detector import AnomalyDetector
+from ..utils.config import config
+from ..utils.models import Alert, TelemetryRecord
+
+
+def shard_for(uav_id: str, shards: int) -> int:
+    """Get the index of the shard that owns a UAV.
+    
+    Unlike hash(), the result is the same in every process and every run.
+    
+    Args:
+        uav_id: Unique identifier for the UAV
+        shards: Number of shards
+        
+    Returns:
+        Shard index
+    """
+    return zlib.crc32(uav_id.encode()) % shards
+
+
+class ShardWorker:
+    """One shard of the fleet, running inside a worker process.
+    
+    The shard owns a TelemetryManager and an AnomalyDetector for its UAVs.
+    Telemetry is scored locally and shipped to the coordinator in batches,
+    together with alerts and a periodic status snapshot, so the coordinator
+    never touches individual samples on the hot path. Commands from the
+    coordinator arrive on the same pipe.
+    """
+    
+    def __init__(self, index: int, connection: Connection):
+        """Initialize shard worker.
+        
+        Args:
+            index: Shard index
+            connection: Pipe to the coordinator
+        """
+        self.index = index
+        self.connection = connection
+        self.manager = TelemetryManager()
+        self.detector = AnomalyDetector(clock=self.manager.clock)
+        
+        self.flush_interval = config.get("system.sharding.flush_interval", 0.05)
+        self.status_interval = config.get("system.sharding.status_interval", 1.0)
+        self.forward_telemetry = config.get("system.sharding.forward_telemetry", True)
+        
+        self._telemetry: List[TelemetryRecord] = []
+        self._alerts: List[Alert] = []
+        self._anomalies: List[Alert] = []
+        self._stopping = asyncio.Event()
+        self._command_tasks: set = set()
+        
+        self.stats = {
+            "telemetry_forwarded": 0,
+            "alerts_forwarded": 0,
+            "batches_sent": 0,
+            "commands_handled": 0
+        }
+        
+        self.manager.register_telemetry_callback(self._handle_telemetry, name="coordinator")
+        self.manager.register_alert_callback(self._handle_alert)
+        self.detector.register_anomaly_callback(self._handle_anomaly)
+    
+    async def _handle_telemetry(self, telemetry_data: TelemetryRecord) -> None:
+        """Score a sample and queue it for the coordinator once scored."""
+        future = self.detector.submit_telemetry(telemetry_data)
+        if self.forward_telemetry:
+            future.add_done_callback(lambda done: self._queue_scored(telemetry_data, done))
+    
+    def _queue_scored(self, telemetry_data: TelemetryRecord, future: asyncio.Future) -> None:
+        if not future.cancelled() and future.exception() is None:
+            telemetry_data.anomaly_score = future.result().anomaly_score
+        self._telemetry.append(telemetry_data)
+    
+    async def _handle_alert(self, alert: Alert) -> None:
+        self._alerts.append(alert)
+    
+    async def _handle_anomaly(self, alert: Alert) -> None:
+        self._anomalies.append(alert)
+    
+    async def run(self) -> None:
+        """Serve the coordinator until it asks the shard to stop or goes away."""
+        loop = asyncio.get_running_loop()
+        loop.add_reader(self.connection.fileno(), self._read_commands)
+        await self.manager.start()
+        await self.detector.start()
+        
+        # The first status snapshot tells the coordinator the shard is ready
+        self._send("status", self._status())
+        last_status = time.monotonic()
+        
+        try:
+            while not self._stopping.is_set():
+                try:
+                    await asyncio.wait_for(self._stopping.wait(), self.flush_interval)
+                except asyncio.TimeoutError:
+                    pass
+                self._flush()
+                
+                if time.monotonic() - last_status >= self.status_interval:
+                    self._send("status", self._status())
+                    last_status = time.monotonic()
+        finally:
+            loop.remove_reader(self.connection.fileno())
+            await self.manager.stop()
+            await self.detector.stop()
+            self._flush()
+            self._send("stopped", self._status())
+    
+    def _read_commands(self) -> None:
+        """Pick up every command waiting on the pipe."""
+        try:
+            while self.connection.poll():
+                request_id, command, args = self.connection.recv()
+                if command == "stop":
+                    self._stopping.set()
+                    continue
+                task = asyncio.create_task(self._execute(request_id, command, args))
+                self._command_tasks.add(task)
+                task.add_done_callback(self._command_tasks.discard)
+        except (EOFError, OSError):
+            # The coordinator is gone; shut down instead of running orphaned
+            asyncio.get_running_loop().remove_reader(self.connection.fileno())
+            self._stopping.set()
+    
+    async def _execute(self, request_id: int, command: str, args: Tuple) -> None:
+        """Run one coordinator command and send back its result."""
+        handlers: Dict[str, Callable] = {
+            "add_uavs": self.manager.add_uavs,
+            "remove_uavs": self.manager.remove_uavs,
+            "inject_fault": self.manager.inject_fault,
+            "clear_fault": self.manager.clear_fault,
+            "get_telemetry": self.manager.get_telemetry,
+            "status": self._command_status
+        }
+        self.stats["commands_handled"] += 1
+        try:
+            handler = handlers.get(command)
+            if handler is None:
+                raise ValueError(f"Unknown shard command: {command}")
+            result = await handler(*args)
+        except Exception as e:
+            logger.error(f"Shard {self.index} failed to run {command}: {e}")
+            self._send("reply", (request_id, False, str(e)))
+            return
+        
+        # Fleet changes are visible to the coordinator before the reply lands
+        if command in ("add_uavs", "remove_uavs"):
+            self._send("status", self._status())
+        self._send("reply", (request_id, True, result))
+    
+    async def _command_status(self) -> Dict[str, Any]:
+        return self._status()
+    
+    def _flush(self) -> None:
+        """Ship the telemetry and alerts gathered since the last flush."""
+        if not (self._telemetry or self._alerts or self._anomalies):
+            return
+        
+        batch = (self._telemetry, self._alerts, self._anomalies)
+        self._telemetry, self._alerts, self._anomalies = [], [], []
+        self.stats["telemetry_forwarded"] += len(batch[0])
+        self.stats["alerts_forwarded"] += len(batch[1]) + len(batch[2])
+        self.stats["batches_sent"] += 1
+        self._send("events", batch)
+    
+    def _send(self, kind: str, payload: Any) -> None:
+        try:
+            self.connection.send((kind, payload))
+        except (BrokenPipeError, OSError):
+            self._stopping.set()
+    
+    def _status(self) -> Dict[str, Any]:
+        """Snapshot of the shard's state for the coordinator."""
+        return {
+            "shard": self.index,
+            "pid": os.getpid(),
+            "uavs": self.manager.get_all_uav_status(),
+            "agent_count": self.manager.get_agent_count(),
+            "scheduler_stats": self.manager.get_scheduler_statistics(),
+            "fleet_engine_stats": self.manager.get_fleet_engine_statistics(),
+            "spatial_index_stats": self.manager.get_spatial_index_statistics(),
+            "geofence_stats": self.manager.get_geofence_statistics(),
+            "route_engine_stats": self.manager.get_route_engine_statistics(),
+            "physics_stats": self.manager.get_physics_statistics(),
+            "telemetry_bus_stats": self.manager.get_bus_statistics(),
+            "anomaly_stats": self.detector.get_statistics(),
+            "stats": self.stats.copy()
+        }
+
+
+def _run_shard(index: int, connection: Connection, settings: Dict[str, Any]) -> None:
+    """Worker process entry point.
+    
+    Args:
+        index: Shard index
+        connection: Pipe to the coordinator
+        settings: Coordinator configuration, including runtime changes
+    """
+    config.load_dict(settings)
+    
+    # Shards already occupy the cores, so retrain in threads instead of
+    # giving every shard a process pool of its own
+    config.set("anomaly_detection.retraining.executor", config.get("system.sharding.retrain_executor", "thread"))
+    
+    logger.remove()
+    logger.add(
+        sys.stderr,
+        level=config.get("monitoring.log_level", "INFO"),
+        format=f"{{time:YYYY-MM-DD HH:mm:ss}} | {{level: <8}} | shard {index} | "
+               "{name}:{function}:{line} | {message}"
+    )
+    
+    async def serve() -> None:
+        await ShardWorker(index, connection).run()
+    
+    asyncio.run(serve())
+
+
+class ShardedFleet:
+    """Coordinator for a fleet partitioned across worker processes.
+    
+    Each UAV is owned by one shard (see shard_for), and every shard runs
+    its own TelemetryManager and AnomalyDetector in its own process, so the
+    simulation uses one core per shard. The coordinator offers the parts of
+    the TelemetryManager interface the simulator relies on: fleet changes,
+    faults and telemetry lookups are forwarded to the owning shard, and
+    status queries are answered from the shards' latest status snapshots.
+    """
+    
+    def __init__(self, shards: Optional[int] = None, start_method: Optional[str] = None):
+        """Initialize sharded fleet.
+        
+        Args:
+            shards: Number of worker processes (defaults to configuration,
+                then to the number of CPU cores)
+            start_method: multiprocessing start method (defaults to configuration)
+        """
+        if config.get("system.clock.mode", "wall") == "virtual":
+            raise ValueError("Sharding needs the wall clock; virtual time cannot be shared between processes")
+        
+        self.shards = shards or config.get("system.sharding.shards") or os.cpu_count() or 1
+        self.start_method = start_method or config.get("system.sharding.start_method", "spawn")
+        self.start_timeout = config.get("system.sharding.start_timeout", 60.0)
+        self.event_queue_size = max(1, config.get("system.sharding.event_queue_size", 256))
+        
+        self.telemetry_callbacks: List[Callable] = []
+        self.alert_callbacks: List[Callable] = []
+        self.anomaly_callbacks: List[Callable] = []
+        self.is_running = False
+        
+        self._processes: List[BaseProcess] = []
+        self._connections: List[Connection] = []
+        self._status: List[Dict[str, Any]] = [{} for _ in range(self.shards)]
+        self._ready: List[asyncio.Future] = []
+        self._stopped: List[asyncio.Future] = []
+        self._pending: Dict[int, Tuple[int, asyncio.Future]] = {}
+        self._request_ids = itertools.count()
+        self._events: Optional[asyncio.Queue] = None
+        self._dispatcher: Optional[asyncio.Task] = None
+        
+        self.stats = {
+            "telemetry_received": 0,
+            "alerts_received": 0,
+            "anomalies_received": 0,
+            "batches_received": 0,
+            "batches_dropped": 0,
+            "shards_lost": 0
+        }
+        
+        logger.info(f"ShardedFleet initialized with {self.shards} shard(s)")
+    
+    async def start(self) -> None:
+        """Start the worker processes and wait until every shard is ready."""
+        if self.is_running:
+            logger.warning("ShardedFleet is already running")
+            return
+        
+        loop = asyncio.get_running_loop()
+        context = multiprocessing.get_context(self.start_method)
+        settings = config.to_dict()
+        self._events = asyncio.Queue(maxsize=self.event_queue_size)
+        self._dispatcher = asyncio.create_task(self._dispatch_events())
+        
+        for index in range(self.shards):
+            connection, child_connection = context.Pipe()
+            process = context.Process(
+                target=_run_shard,
+                args=(index, child_connection, settings),
+                name=f"uav-shard-{index}"
+            )
+            process.start()
+            child_connection.close()
+            
+            self._processes.append(process)
+            self._connections.append(connection)
+            self._ready.append(loop.create_future())
+            self._stopped.append(loop.create_future())
+            loop.add_reader(connection.fileno(), self._receive, index)
+        
+        try:
+            await asyncio.wait_for(asyncio.gather(*self._ready), self.start_timeout)
+        except Exception:
+            await self._shutdown()
+            raise
+        
+        self.is_running = True
+        logger.info(f"ShardedFleet started {self.shards} shard(s)")
+    
+    async def stop(self) -> None:
+        """Stop every shard, delivering the telemetry it already produced."""
+        if not self.is_running:
+            logger.warning("ShardedFleet is not running")
+            return
+        
+        self.is_running = False
+        await self._shutdown()
+        logger.info("ShardedFleet stopped")
+    
+    async def _shutdown(self) -> None:
+        """Ask the shards to stop, then reap the processes and pipes."""
+        loop = asyncio.get_running_loop()
+        for index, connection in enumerate(self._connections):
+            if not self._stopped[index].done():
+                try:
+                    connection.send((None, "stop", ()))
+                except (BrokenPipeError, OSError):
+                    self._shard_lost(index)
+        
+        try:
+            await asyncio.wait_for(asyncio.gather(*self._stopped), self.start_timeout)
+        except asyncio.TimeoutError:
+            logger.error("Shards did not stop in time; terminating them")
+        
+        for index, process in enumerate(self._processes):
+            await asyncio.to_thread(process.join, 5.0)
+            if process.is_alive():
+                process.terminate()
+                await asyncio.to_thread(process.join)
+            loop.remove_reader(self._connections[index].fileno())
+            self._connections[index].close()
+        
+        # Every shard's last batch precedes its "stopped" message
+        if self._events is not None:
+            await self._events.join()
+        if self._dispatcher is not None:
+            self._dispatcher.cancel()
+            await asyncio.gather(self._dispatcher, return_exceptions=True)
+        
+        self._processes, self._connections = [], []
+        self._ready, self._stopped = [], []
+        self._dispatcher = None
+    
+    def _receive(self, index: int) -> None:
+        """Read every message a shard has sent so far."""
+        connection = self._connections[index]
+        try:
+            while connection.poll():
+                kind, payload = connection.recv()
+                self._handle_message(index, kind, payload)
+        except (EOFError, OSError):
+            self._shard_lost(index)
+    
+    def _handle_message(self, index: int, kind: str, payload: Any) -> None:
+        if kind == "events":
+            self.stats["batches_received"] += 1
+            if self._events.full():
+                # Callbacks are falling behind; drop the oldest batch
+                self._events.get_nowait()
+                self._events.task_done()
+                self.stats["batches_dropped"] += 1
+            self._events.put_nowait(payload)
+        elif kind == "reply":
+            request_id, ok, result = payload
+            _, future = self._pending.pop(request_id, (index, None))
+            if future is not None and not future.done():
+                if ok:
+                    future.set_result(result)
+                else:
+                    future.set_exception(RuntimeError(f"Shard {index}: {result}"))
+        elif kind == "status":
+            self._status[index] = payload
+            if not self._ready[index].done():
+                self._ready[index].set_result(None)
+        elif kind == "stopped":
+            self._status[index] = payload
+            if not self._stopped[index].done():
+                self._stopped[index].set_result(None)
+    
+    def _shard_lost(self, index: int) -> None:
+        """Handle a shard whose pipe closed, failing whatever waits on it."""
+        asyncio.get_running_loop().remove_reader(self._connections[index].fileno())
+        if not self._stopped[index].done():
+            self.stats["shards_lost"] += 1
+            logger.error(f"Shard {index} exited unexpectedly")
+            self._stopped[index].set_result(None)
+        if not self._ready[index].done():
+            self._ready[index].set_exception(RuntimeError(f"Shard {index} exited during startup"))
+        
+        for request_id, (shard, future) in list(self._pending.items()):
+            if shard == index:
+                del self._pending[request_id]
+                if not future.done():
+                    future.set_exception(RuntimeError(f"Shard {index} is gone"))
+    
+    async def _dispatch_events(self) -> None:
+        """Deliver shard batches to the registered callbacks, in arrival order."""
+        while True:
+            telemetry, alerts, anomalies = await self._events.get()
+            try:
+                self.stats["telemetry_received"] += len(telemetry)
+                self.stats["alerts_received"] += len(alerts)
+                self.stats["anomalies_received"] += len(anomalies)
+                for callbacks, items in ((self.telemetry_callbacks, telemetry),
+                                         (self.alert_callbacks, alerts),
+                                         (self.anomaly_callbacks, anomalies)):
+                    for item in items:
+                        for callback in callbacks:
+                            try:
+                                await callback(item)
+                            except Exception as e:
+                                logger.error(f"Error in shard event callback: {e}")
+            finally:
+                self._events.task_done()
+    
+    async def _request(self, index: int, command: str, *args: Any) -> Any:
+        """Send a command to a shard and wait for its result."""
+        if not self.is_running:
+            raise RuntimeError("ShardedFleet is not running")
+        
+        request_id = next(self._request_ids)
+        try:
+            self._connections[index].send((request_id, command, args))
+        except (BrokenPipeError, OSError) as e:
+            self._shard_lost(index)
+            raise RuntimeError(f"Shard {index} is gone") from e
+        
+        # Replies are read on this loop, so none can arrive before this
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = (index, future)
+        return await future
+    
+    def _partition(self, uav_ids: Iterable[str]) -> Dict[int, List[str]]:
+        """Group UAV IDs by owning shard, dropping duplicates."""
+        groups: Dict[int, List[str]] = {}
+        for uav_id in dict.fromkeys(uav_ids):
+            groups.setdefault(shard_for(uav_id, self.shards), []).append(uav_id)
+        return groups
+    
+    async def add_uav(self, uav_id: str, subsystems: Optional[List[str]] = None) -> None:
+        """Add a UAV with its agents to its shard.
+        
+        Args:
+            uav_id: Unique identifier for the UAV
+            subsystems: List of subsystem names to create (None for all)
+        """
+        await self.add_uavs([uav_id], subsystems)
+    
+    async def add_uavs(self, uav_ids: Iterable[str], subsystems: Optional[List[str]] = None) -> List[str]:
+        """Add several UAVs, every shard adding its own share concurrently.
+        
+        Args:
+            uav_ids: Unique identifiers of the UAVs
+            subsystems: List of subsystem names to create for each UAV (None for all)
+            
+        Returns:
+            Identifiers of the UAVs that were added
+        """
+        groups = self._partition(uav_ids)
+        results = await asyncio.gather(*(
+            self._request(index, "add_uavs", group, subsystems) for index, group in groups.items()
+        ))
+        added = [uav_id for result in results for uav_id in result]
+        logger.info(f"Added {len(added)} UAVs across {len(groups)} shard(s)")
+        return added
+    
+    async def remove_uav(self, uav_id: str) -> None:
+        """Remove a UAV and its agents from its shard.
+        
+        Args:
+            uav_id: Unique identifier for the UAV
+        """
+        await self.remove_uavs([uav_id])
+    
+    async def remove_uavs(self, uav_ids: Iterable[str]) -> List[str]:
+        """Remove several UAVs, every shard removing its own share concurrently.
+        
+        Args:
+            uav_ids: Unique identifiers of the UAVs
+            
+        Returns:
+            Identifiers of the UAVs that were removed
+        """
+        groups = self._partition(uav_ids)
+        results = await asyncio.gather(*(
+            self._request(index, "remove_uavs", group) for index, group in groups.items()
+        ))
+        return [uav_id for result in results for uav_id in result]
+    
+    async def inject_fault(self, uav_id: str, subsystem: str, fault_params: Dict[str, Any]) -> None:
+        """Inject a fault into a subsystem on the owning shard.
+        
+        Args:
+            uav_id: Unique identifier for the UAV
+            subsystem: Name of the subsystem
+            fault_params: Fault injection parameters
+        """
+        await self._request(shard_for(uav_id, self.shards), "inject_fault", uav_id, subsystem, fault_params)
+    
+    async def clear_fault(self, uav_id: str, subsystem: str) -> None:
+        """Clear a fault from a subsystem on the owning shard.
+        
+        Args:
+            uav_id: Unique identifier for the UAV
+            subsystem: Name of the subsystem
+        """
+        await self._request(shard_for(uav_id, self.shards), "clear_fault", uav_id, subsystem)
+    
+    async def get_telemetry(self, uav_id: str, subsystem: Optional[str] = None,
+                            start: Optional[Any] = None, end: Optional[Any] = None,
+                            count: int = 10) -> List[TelemetryRecord]:
+        """Get telemetry history from the owning shard.
+        
+        Args:
+            uav_id: Unique identifier for the UAV
+            subsystem: Subsystem name (None for all subsystems)
+            start: Earliest timestamp, inclusive
+            end: Latest timestamp, exclusive
+            count: Records per subsystem when no time range is given
+            
+        Returns:
+            Telemetry records
+        """
+        return await self._request(shard_for(uav_id, self.shards), "get_telemetry",
+                                   uav_id, subsystem, start, end, count)
+    
+    async def refresh_status(self) -> None:
+        """Fetch a fresh status snapshot from every shard."""
+        snapshots = await asyncio.gather(*(self._request(index, "status") for index in range(self.shards)))
+        self._status = list(snapshots)
+    
+    def register_telemetry_callback(self, callback: Callable, name: Optional[str] = None) -> None:
+        """Register a callback for scored telemetry from every shard.
+        
+        Args:
+            callback: Async callback function that receives TelemetryRecord
+            name: Consumer name (accepted for TelemetryManager compatibility)
+        """
+        self.telemetry_callbacks.append(callback)
+    
+    def register_alert_callback(self, callback: Callable) -> None:
+        """Register a callback for agent alerts from every shard.
+        
+        Args:
+            callback: Async callback function that receives Alert
+        """
+        self.alert_callbacks.append(callback)
+    
+    def register_anomaly_callback(self, callback: Callable) -> None:
+        """Register a callback for anomaly alerts from every shard.
+        
+        Args:
+            callback: Async callback function that receives Alert
+        """
+        self.anomaly_callbacks.append(callback)
+    
+    def get_uav_status(self, uav_id: str) -> Optional[Dict[str, Any]]:
+        """Get status of all agents for a UAV, as of its shard's last snapshot.
+        
+        Args:
+            uav_id: Unique identifier for the UAV
+            
+        Returns:
+            Dictionary containing agent statuses or None if UAV not found
+        """
+        return self._status[shard_for(uav_id, self.shards)].get("uavs", {}).get(uav_id)
+    
+    def get_all_uav_status(self) -> Dict[str, Dict[str, Any]]:
+        """Get status of all UAVs and their agents, as of the last snapshots.
+        
+        Returns:
+            Dictionary mapping UAV IDs to their agent statuses
+        """
+        status = {}
+        for snapshot in self._status:
+            status.update(snapshot.get("uavs", {}))
+        return status
+    
+    def get_uav_count(self) -> int:
+        """Get number of UAVs across all shards."""
+        return sum(len(snapshot.get("uavs", {})) for snapshot in self._status)
+    
+    def get_agent_count(self) -> int:
+        """Get number of agents across all shards."""
+        return sum(snapshot.get("agent_count", 0) for snapshot in self._status)
+    
+    def _combine(self, section: str) -> Dict[str, Any]:
+        """Combine one statistics section of every shard's latest snapshot.
+        
+        Integer counters are summed (max_* counters take the maximum); the
+        full per-shard sections are kept under "shards".
+        
+        Args:
+            section: Snapshot key of the statistics section
+            
+        Returns:
+            Combined statistics
+        """
+        sections = [snapshot.get(section) or {} for snapshot in self._status]
+        counters = {
+            name for stats in sections for name, value in stats.items()
+            if isinstance(value, int) and not isinstance(value, bool)
+        }
+        combined: Dict[str, Any] = {}
+        for name in sorted(counters):
+            values = [stats.get(name, 0) for stats in sections]
+            combined[name] = max(values) if name.startswith("max_") else sum(values)
+        combined["shards"] = sections
+        return combined
+    
+    def get_scheduler_statistics(self) -> Dict[str, Any]:
+        """Get tick scheduler statistics combined across shards."""
+        return self._combine("scheduler_stats")
+    
+    def get_fleet_engine_statistics(self) -> Dict[str, Any]:
+        """Get fleet-state engine statistics combined across shards."""
+        return self._combine("fleet_engine_stats")
+    
+    def get_spatial_index_statistics(self) -> Dict[str, Any]:
+        """Get spatial index statistics combined across shards."""
+        return self._combine("spatial_index_stats")
+    
+    def get_geofence_statistics(self) -> Dict[str, Any]:
+        """Get geofence statistics combined across shards."""
+        return self._combine("geofence_stats")
+    
+    def get_route_engine_statistics(self) -> Dict[str, Any]:
+        """Get route engine statistics combined across shards."""
+        return self._combine("route_engine_stats")
+    
+    def get_physics_statistics(self) -> Dict[str, Any]:
+        """Get flight physics statistics combined across shards."""
+        return self._combine("physics_stats")
+    
+    def get_bus_statistics(self) -> Dict[str, Any]:
+        """Get telemetry bus statistics combined across shards."""
+        return self._combine("telemetry_bus_stats")
+    
+    def get_anomaly_statistics(self) -> Dict[str, Any]:
+        """Get anomaly detection statistics combined across shards."""
+        return self._combine("anomaly_stats")
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get coordinator statistics.
+        
+        Returns:
+            Dictionary containing coordinator and per-shard statistics
+        """
+        stats = self.stats.copy()
+        stats["shards"] = self.shards
+        stats["is_running"] = self.is_running
+        stats["pending_batches"] = self._events.qsize() if self._events is not None else 0
+        stats["shard_stats"] = [snapshot.get("stats", {}) for snapshot in self._status]
+        stats["shard_pids"] = [snapshot.get("pid") for snapshot in self._status]
+        return stats
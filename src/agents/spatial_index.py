@@ -0,0 +1,316 @@
+"""Fleet-wide spatial index for inter-UAV proximity queries."""
+
+import asyncio
+import math
+import time
+from typing import Dict, Any, Optional, List, Callable, Sequence, Tuple, TYPE_CHECKING
+import numpy as np
+from loguru import logger
+
+from ..utils.config import config
+from ..utils.clock import SimulationClock, get_clock
+
+if TYPE_CHECKING:
+    from .scheduler import TelemetryScheduler
+
+
+# Same flat-earth conversion the navigation models dead-reckon with
+METERS_PER_DEGREE = 111000.0
+
+# Grid cell keys pack (column, row) as column * 2**32 + row
+_COLUMN = np.int64(1 << 32)
+
+# (uav_ids, latitude, longitude, altitude, heading) for every located UAV
+PositionSource = Callable[[], Tuple[Sequence[str], np.ndarray, np.ndarray, np.ndarray, np.ndarray]]
+
+
+class FleetSpatialIndex:
+    """Uniform grid over UAV positions, rebuilt from scratch every tick.
+    
+    Positions are projected onto a local east/north plane in meters and
+    bucketed into square cells of ``cell_size``. Keys are sorted so each
+    grid column is one contiguous run, and a neighborhood query is a
+    handful of binary searches instead of a scan of the fleet. Every
+    rebuild also resolves each UAV's nearest neighbor within
+    ``cell_size`` (3D distance) for the whole fleet at once, so the
+    per-UAV lookups made by collision avoidance are dictionary hits.
+    
+    The index exposes the same ``telemetry_rate``/``tick()`` surface as an
+    agent so the TelemetryScheduler can refresh it alongside telemetry.
+    """
+    
+    def __init__(self, source: Optional[PositionSource] = None, cell_size: Optional[float] = None,
+                 rate: Optional[float] = None, clock: Optional[SimulationClock] = None):
+        """Initialize spatial index.
+        
+        Args:
+            source: Callable returning the current fleet positions, read on
+                every tick
+            cell_size: Grid cell size and nearest-neighbor search radius in
+                meters (defaults to configuration)
+            rate: Rebuild rate in Hz (defaults to configuration)
+            clock: Simulation clock used by the private refresh loop
+        """
+        self.source = source
+        self.cell_size = float(cell_size if cell_size is not None
+                               else config.get("system.spatial_index.cell_size", 500.0))
+        self.telemetry_rate = rate if rate is not None else config.get("system.spatial_index.rate", 10.0)
+        self.clock = clock if clock is not None else get_clock()
+        self.uav_id = "fleet"
+        self.subsystem_name = "Spatial_Index"
+        self.is_running = False
+        self._scheduler: Optional["TelemetryScheduler"] = None
+        self._task: Optional[asyncio.Task] = None
+        
+        self._uav_ids: List[str] = []
+        self._rows: Dict[str, int] = {}
+        self._xyz = np.empty((0, 3))
+        self._heading = np.empty(0)
+        self._keys = np.empty(0, dtype=np.int64)
+        self._sorted_keys = np.empty(0, dtype=np.int64)
+        self._order = np.empty(0, dtype=np.intp)
+        self._origin = (0.0, 0.0)
+        self._neighbor = np.empty(0, dtype=np.intp)
+        self._distance = np.empty(0)
+        
+        self.stats = {
+            "updates": 0,
+            "uavs": 0,
+            "pairs_checked": 0,
+            "last_update_ms": 0.0,
+            "queries": 0
+        }
+    
+    def __len__(self) -> int:
+        return len(self._uav_ids)
+    
+    def _project(self, latitude: np.ndarray, longitude: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Project coordinates onto the east/north plane of the current origin."""
+        lat0, lon0 = self._origin
+        east = (longitude - lon0) * (METERS_PER_DEGREE * math.cos(math.radians(lat0)))
+        north = (latitude - lat0) * METERS_PER_DEGREE
+        return east, north
+    
+    def _cell_keys(self, east: np.ndarray, north: np.ndarray) -> np.ndarray:
+        """Grid cell key of each projected point."""
+        column = np.floor(east / self.cell_size).astype(np.int64)
+        row = np.floor(north / self.cell_size).astype(np.int64)
+        return column * _COLUMN + row
+    
+    def update(self, uav_ids: Sequence[str], latitude: Sequence[float], longitude: Sequence[float],
+               altitude: Sequence[float], heading: Optional[Sequence[float]] = None) -> None:
+        """Rebuild the index from fleet positions.
+        
+        Args:
+            uav_ids: UAV identifiers, one per position
+            latitude: Latitudes in degrees
+            longitude: Longitudes in degrees
+            altitude: Altitudes in meters
+            heading: Headings in degrees (zeros if omitted)
+        """
+        started = time.perf_counter()
+        latitude = np.asarray(latitude, dtype=float)
+        longitude = np.asarray(longitude, dtype=float)
+        n = len(latitude)
+        
+        self._uav_ids = list(uav_ids)
+        self._rows = dict(zip(self._uav_ids, range(n)))
+        self._heading = np.zeros(n) if heading is None else np.asarray(heading, dtype=float)
+        if n:
+            self._origin = (float(latitude.mean()), float(longitude.mean()))
+        east, north = self._project(latitude, longitude)
+        self._xyz = np.column_stack([east, north, np.asarray(altitude, dtype=float)])
+        self._keys = self._cell_keys(east, north)
+        self._order = np.argsort(self._keys, kind="stable")
+        self._sorted_keys = self._keys[self._order]
+        
+        self._neighbor = np.full(n, -1, dtype=np.intp)
+        self._distance = np.full(n, np.inf)
+        if n > 1:
+            self._resolve_nearest()
+        
+        self.stats["updates"] += 1
+        self.stats["uavs"] = n
+        self.stats["last_update_ms"] = (time.perf_counter() - started) * 1e3
+    
+    def _candidates(self, rows: np.ndarray, reach: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Pair each query row with every point in the cells around it.
+        
+        Args:
+            rows: Query rows
+            reach: Cells searched in each direction
+            
+        Returns:
+            (query row, candidate row) arrays, one entry per pair, grouped
+            by query row in the order of ``rows``
+        """
+        keys = self._keys[rows]
+        columns = range(-reach, reach + 1)
+        low = np.stack([np.searchsorted(self._sorted_keys, keys + column * _COLUMN - reach, "left")
+                        for column in columns], axis=1).ravel()
+        high = np.stack([np.searchsorted(self._sorted_keys, keys + column * _COLUMN + reach, "right")
+                         for column in columns], axis=1).ravel()
+        counts = high - low
+        
+        total = int(counts.sum())
+        query = np.repeat(np.repeat(rows, len(columns)), counts)
+        within_run = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+        candidate = self._order[np.repeat(low, counts) + within_run]
+        return query, candidate
+    
+    def _resolve_nearest(self) -> None:
+        """Find every UAV's nearest neighbor within one cell size."""
+        # Querying in key order keeps the binary searches cache friendly
+        rows = self._order
+        query, candidate = self._candidates(rows, 1)
+        self.stats["pairs_checked"] += len(query)
+        
+        offset = self._xyz[candidate] - self._xyz[query]
+        distance = np.einsum("ij,ij->i", offset, offset)
+        distance[(candidate == query) | (distance > self.cell_size ** 2)] = np.inf
+        
+        # Every row's group holds at least the row itself, so reduceat sees
+        # no empty groups; the first candidate equal to the minimum wins
+        sizes = np.bincount(query, minlength=len(rows))[rows]
+        starts = np.cumsum(sizes) - sizes
+        nearest = np.minimum.reduceat(distance, starts)
+        hits = np.flatnonzero(distance == np.repeat(nearest, sizes))
+        first = hits[np.searchsorted(hits, starts)]
+        
+        found = np.isfinite(nearest)
+        self._neighbor[rows[found]] = candidate[first[found]]
+        self._distance[rows] = np.sqrt(nearest)
+    
+    def _describe(self, row: int, other: int, distance: float) -> Dict[str, Any]:
+        """Relative position of another UAV as seen from a row."""
+        offset = self._xyz[other] - self._xyz[row]
+        return {
+            "uav_id": self._uav_ids[other],
+            "distance": float(distance),
+            "bearing": math.degrees(math.atan2(offset[0], offset[1])) % 360,
+            "vertical_offset": float(offset[2]),
+            "heading": float(self._heading[row])
+        }
+    
+    def nearest(self, uav_id: str) -> Optional[Dict[str, Any]]:
+        """Get a UAV's nearest neighbor as of the last rebuild.
+        
+        Args:
+            uav_id: UAV identifier
+            
+        Returns:
+            Dictionary with the neighbor's uav_id, 3D distance (m), bearing
+            from north (degrees) and vertical offset (m), plus the UAV's own
+            heading; uav_id is None and distance infinite when no UAV is
+            within cell_size. None if the UAV is not in the index.
+        """
+        self.stats["queries"] += 1
+        row = self._rows.get(uav_id)
+        if row is None:
+            return None
+        
+        other = self._neighbor[row]
+        if other < 0:
+            return {"uav_id": None, "distance": math.inf, "bearing": 0.0,
+                    "vertical_offset": 0.0, "heading": float(self._heading[row])}
+        return self._describe(row, other, self._distance[row])
+    
+    def within(self, uav_id: str, radius: float) -> List[Dict[str, Any]]:
+        """Get every UAV within a radius of another, closest first.
+        
+        Args:
+            uav_id: UAV identifier
+            radius: Search radius in meters (3D distance)
+            
+        Returns:
+            List of neighbor dictionaries as returned by nearest()
+        """
+        self.stats["queries"] += 1
+        row = self._rows.get(uav_id)
+        if row is None:
+            return []
+        
+        _, candidate = self._candidates(np.array([row]), max(1, math.ceil(radius / self.cell_size)))
+        distance = np.linalg.norm(self._xyz[candidate] - self._xyz[row], axis=1)
+        keep = (candidate != row) & (distance <= radius)
+        candidate, distance = candidate[keep], distance[keep]
+        order = np.argsort(distance, kind="stable")
+        return [self._describe(row, other, d) for other, d in zip(candidate[order], distance[order])]
+    
+    def pairs_within(self, radius: float) -> List[Tuple[str, str, float]]:
+        """Get every pair of UAVs closer than a radius.
+        
+        Args:
+            radius: Separation in meters (3D distance)
+            
+        Returns:
+            List of (uav_id, uav_id, distance) tuples, closest first
+        """
+        self.stats["queries"] += 1
+        query, candidate = self._candidates(np.arange(len(self._uav_ids)),
+                                            max(1, math.ceil(radius / self.cell_size)))
+        distance = np.linalg.norm(self._xyz[candidate] - self._xyz[query], axis=1)
+        keep = (query < candidate) & (distance <= radius)
+        query, candidate, distance = query[keep], candidate[keep], distance[keep]
+        order = np.argsort(distance, kind="stable")
+        return [(self._uav_ids[a], self._uav_ids[b], float(d))
+                for a, b, d in zip(query[order], candidate[order], distance[order])]
+    
+    async def tick(self) -> None:
+        """Rebuild the index from the position source."""
+        if self.source is not None:
+            self.update(*self.source())
+    
+    async def start(self, scheduler: Optional["TelemetryScheduler"] = None) -> None:
+        """Start refreshing the index.
+        
+        Args:
+            scheduler: Shared tick scheduler; a private loop is used if omitted
+        """
+        if self.is_running:
+            return
+        
+        self.is_running = True
+        if scheduler is not None:
+            self._scheduler = scheduler
+            scheduler.register(self)
+        else:
+            self._task = asyncio.create_task(self._run_loop())
+    
+    async def stop(self) -> None:
+        """Stop refreshing the index."""
+        self.is_running = False
+        if self._scheduler is not None:
+            self._scheduler.unregister(self)
+            self._scheduler = None
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+    
+    async def _run_loop(self) -> None:
+        """Private refresh loop used when no scheduler is shared."""
+        interval = 1.0 / self.telemetry_rate
+        
+        while self.is_running:
+            try:
+                await self.tick()
+            except Exception as e:
+                logger.error(f"Error updating spatial index: {e}")
+            await self.clock.sleep(interval)
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get index statistics.
+        
+        Returns:
+            Dictionary containing index statistics
+        """
+        return {
+            **self.stats,
+            "cell_size": self.cell_size,
+            "rate": self.telemetry_rate,
+            "is_running": self.is_running
+        }
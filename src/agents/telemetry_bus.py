@@ -0,0 +1,330 @@
+"""Bounded asynchronous telemetry bus between agents and consumers."""
+
+import asyncio
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+from loguru import logger
+
+from ..utils.config import config
+
+
+OVERFLOW_POLICIES = ("block", "drop_oldest", "sample")
+
+
+class Subscription:
+    """One consumer's bounded queue and the workers draining it.
+    
+    Items are queued with their enqueue time, so the age of the oldest queued
+    item tells how far behind the consumer is.
+    """
+    
+    def __init__(self, name: str, callback: Callable, queue_size: int, overflow: str,
+                 workers: int, sample_every: int):
+        """Initialize subscription.
+        
+        Args:
+            name: Consumer name, used in statistics and logs
+            callback: Async callback receiving each item
+            queue_size: Maximum number of queued items
+            overflow: What to do with a new item when the queue is full:
+                "block" waits for room, "drop_oldest" evicts the oldest item,
+                "sample" additionally thins the stream once the queue is half full
+            workers: Number of concurrent callback invocations
+            sample_every: Keep one in this many items while sampling
+        """
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy {overflow}, expected one of {OVERFLOW_POLICIES}")
+        if queue_size <= 0 or workers <= 0:
+            raise ValueError("Queue size and worker count must be positive")
+        
+        self.name = name
+        self.callback = callback
+        self.queue_size = queue_size
+        self.overflow = overflow
+        self.workers = workers
+        self.sample_every = max(1, sample_every)
+        
+        self._queue: Deque[Tuple[float, Any]] = deque()
+        self._items = asyncio.Condition()
+        self._tasks: List[asyncio.Task] = []
+        self._in_flight = 0
+        self._offered = 0
+        
+        self.stats = {
+            "published": 0,
+            "delivered": 0,
+            "dropped": 0,
+            "sampled_out": 0,
+            "errors": 0,
+            "blocked_publishes": 0,
+            "max_lag": 0,
+            "max_lag_seconds": 0.0
+        }
+    
+    @property
+    def lag(self) -> int:
+        """Number of items queued or being handled."""
+        return len(self._queue) + self._in_flight
+    
+    def lag_seconds(self) -> float:
+        """Age of the oldest queued item in seconds."""
+        if not self._queue:
+            return 0.0
+        return time.perf_counter() - self._queue[0][0]
+    
+    def start(self) -> None:
+        """Start the worker tasks."""
+        if self._tasks:
+            return
+        self._tasks = [
+            asyncio.create_task(self._worker(), name=f"telemetry-bus-{self.name}-{index}")
+            for index in range(self.workers)
+        ]
+    
+    async def stop(self, drain: bool = True, timeout: Optional[float] = None) -> None:
+        """Stop the worker tasks.
+        
+        Args:
+            drain: Deliver the queued items before stopping
+            timeout: Seconds to wait for the drain before cancelling the
+                workers and dropping what is left (None waits indefinitely)
+        """
+        if drain and self._tasks:
+            try:
+                await asyncio.wait_for(self._drained(), timeout)
+            except asyncio.TimeoutError:
+                logger.warning(f"Telemetry consumer {self.name} did not drain within {timeout}s; "
+                               f"dropping {self.lag} item(s)")
+                self.stats["dropped"] += self._in_flight
+        
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        
+        if self._queue:
+            self.stats["dropped"] += len(self._queue)
+            self._queue.clear()
+    
+    async def _drained(self) -> None:
+        """Wait until every queued item has been delivered."""
+        async with self._items:
+            await self._items.wait_for(lambda: not self._queue and not self._in_flight)
+    
+    async def put(self, item: Any) -> None:
+        """Queue an item according to the overflow policy.
+        
+        Only the "block" policy ever waits, and only while the queue is full.
+        
+        Args:
+            item: Item to deliver
+        """
+        self._offered += 1
+        queue = self._queue
+        
+        if self.overflow == "sample" and len(queue) >= self.queue_size // 2:
+            if self._offered % self.sample_every:
+                self.stats["sampled_out"] += 1
+                return
+        
+        async with self._items:
+            if len(queue) >= self.queue_size:
+                if self.overflow == "block":
+                    self.stats["blocked_publishes"] += 1
+                    await self._items.wait_for(lambda: len(queue) < self.queue_size)
+                else:
+                    queue.popleft()
+                    self.stats["dropped"] += 1
+            
+            queue.append((time.perf_counter(), item))
+            self.stats["published"] += 1
+            if self.lag > self.stats["max_lag"]:
+                self.stats["max_lag"] = self.lag
+            self._items.notify_all()
+    
+    async def _worker(self) -> None:
+        """Deliver queued items to the callback one at a time."""
+        queue = self._queue
+        while True:
+            async with self._items:
+                await self._items.wait_for(lambda: bool(queue))
+                enqueued, item = queue.popleft()
+                self._in_flight += 1
+                self._items.notify_all()  # Room for blocked publishers
+            
+            waited = time.perf_counter() - enqueued
+            if waited > self.stats["max_lag_seconds"]:
+                self.stats["max_lag_seconds"] = waited
+            
+            try:
+                await self.callback(item)
+                self.stats["delivered"] += 1
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.stats["errors"] += 1
+                logger.error(f"Error in telemetry consumer {self.name}: {e}")
+            finally:
+                async with self._items:
+                    self._in_flight -= 1
+                    self._items.notify_all()
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get subscription statistics.
+        
+        Returns:
+            Dictionary containing consumer statistics
+        """
+        stats = self.stats.copy()
+        stats["lag"] = self.lag
+        stats["lag_seconds"] = self.lag_seconds()
+        stats["queue_size"] = self.queue_size
+        stats["overflow"] = self.overflow
+        stats["workers"] = self.workers
+        return stats
+
+
+class TelemetryBus:
+    """Fan-out bus decoupling telemetry producers from consumers.
+    
+    Every consumer gets its own bounded queue drained by its own workers,
+    so a slow consumer only ever falls behind itself. Publishing costs one
+    queue append per consumer and does not wait for any callback.
+    """
+    
+    def __init__(self, queue_size: Optional[int] = None, overflow: Optional[str] = None,
+                 workers: Optional[int] = None, sample_every: Optional[int] = None,
+                 drain_timeout: Optional[float] = None):
+        """Initialize telemetry bus.
+        
+        Args:
+            queue_size: Default queue size per consumer
+            overflow: Default overflow policy ("block", "drop_oldest", "sample")
+            workers: Default number of workers per consumer
+            sample_every: Keep one in this many items while a "sample"
+                consumer is more than half full
+            drain_timeout: Seconds a draining stop waits for the consumers
+                before cancelling them
+        """
+        self.queue_size = queue_size if queue_size is not None else config.get("system.telemetry_bus.queue_size", 1024)
+        self.overflow = overflow if overflow is not None else config.get("system.telemetry_bus.overflow", "drop_oldest")
+        self.workers = workers if workers is not None else config.get("system.telemetry_bus.workers", 1)
+        self.sample_every = (
+            sample_every if sample_every is not None else config.get("system.telemetry_bus.sample_every", 4)
+        )
+        self.drain_timeout = (
+            drain_timeout if drain_timeout is not None else config.get("system.telemetry_bus.drain_timeout", 5.0)
+        )
+        self.subscriptions: Dict[str, Subscription] = {}
+        self.is_running = False
+        
+        logger.debug("TelemetryBus initialized")
+    
+    def subscribe(self, name: str, callback: Callable, queue_size: Optional[int] = None,
+                  overflow: Optional[str] = None, workers: Optional[int] = None) -> Subscription:
+        """Register a consumer.
+        
+        Args:
+            name: Unique consumer name
+            callback: Async callback receiving each item
+            queue_size: Queue size for this consumer (defaults to the bus default)
+            overflow: Overflow policy for this consumer (defaults to the bus default)
+            workers: Worker count for this consumer; more than one delivers
+                items concurrently and so out of order
+                
+        Returns:
+            The new subscription
+        """
+        if name in self.subscriptions:
+            raise ValueError(f"Consumer {name} is already subscribed")
+        
+        subscription = Subscription(
+            name,
+            callback,
+            queue_size=queue_size or self.queue_size,
+            overflow=overflow or self.overflow,
+            workers=workers or self.workers,
+            sample_every=self.sample_every
+        )
+        self.subscriptions[name] = subscription
+        if self.is_running:
+            subscription.start()
+        
+        logger.debug(f"Subscribed telemetry consumer {name} ({subscription.overflow}, "
+                     f"queue {subscription.queue_size}, {subscription.workers} worker(s))")
+        return subscription
+    
+    async def unsubscribe(self, name: str) -> None:
+        """Remove a consumer, dropping whatever it still has queued.
+        
+        Args:
+            name: Consumer name
+        """
+        subscription = self.subscriptions.pop(name, None)
+        if subscription is not None:
+            await subscription.stop(drain=False)
+    
+    async def publish(self, item: Any) -> None:
+        """Offer an item to every consumer.
+        
+        Args:
+            item: Item to deliver
+        """
+        for subscription in list(self.subscriptions.values()):
+            await subscription.put(item)
+    
+    async def start(self) -> None:
+        """Start delivering to consumers."""
+        if self.is_running:
+            return
+        
+        self.is_running = True
+        for subscription in self.subscriptions.values():
+            subscription.start()
+        logger.info(f"TelemetryBus started with {len(self.subscriptions)} consumer(s)")
+    
+    async def stop(self, drain: bool = True) -> None:
+        """Stop delivering to consumers.
+        
+        A consumer still draining after drain_timeout seconds is cancelled
+        and its remaining items are dropped, so one stuck consumer cannot
+        hang shutdown.
+        
+        Args:
+            drain: Deliver every queued item before stopping
+        """
+        if not self.is_running:
+            return
+        
+        self.is_running = False
+        await asyncio.gather(*(subscription.stop(drain, self.drain_timeout)
+                               for subscription in self.subscriptions.values()))
+        logger.info("TelemetryBus stopped")
+    
+    def lagging_consumers(self, min_lag: int = 1) -> List[str]:
+        """Get consumers with queued work, furthest behind first.
+        
+        Args:
+            min_lag: Minimum number of pending items to be reported
+            
+        Returns:
+            Consumer names ordered by lag
+        """
+        lagging = [sub for sub in self.subscriptions.values() if sub.lag >= min_lag]
+        return [sub.name for sub in sorted(lagging, key=lambda sub: sub.lag_seconds(), reverse=True)]
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get bus statistics.
+        
+        Returns:
+            Dictionary containing per-consumer statistics
+        """
+        consumers = {name: sub.get_statistics() for name, sub in self.subscriptions.items()}
+        return {
+            "is_running": self.is_running,
+            "consumers": consumers,
+            "total_dropped": sum(stats["dropped"] + stats["sampled_out"] for stats in consumers.values()),
+            "max_lag": max((stats["lag"] for stats in consumers.values()), default=0),
+            "lagging_consumers": self.lagging_consumers()
+        }
@@ -3,26 +3,110 @@
 import asyncio
 import json
 from datetime import datetime
-from typing import Dict, List, Any, Optional, Callable
+from typing import Dict, List, Any, Optional, Callable, Iterable, Awaitable, Tuple
+import numpy as np
 from loguru import logger
 
 from .agent_factory import AgentFactory
 from .base_agent import BaseAgent
-from ..utils.models import TelemetryData, Alert, UAVState
+from .scheduler import TelemetryScheduler
+from .fleet_engine import FleetStateEngine
+from .flight_control_agent import FlightControlAgent
+from .geofence import GeofenceEngine
+from .mission_planning_agent import MissionPlanningAgent
+from .physics import FlightPhysics
+from .route_engine import RouteEngine
+from .safety_systems_agent import SafetySystemsAgent
+from .spatial_index import FleetSpatialIndex
+from .telemetry_bus import TelemetryBus
+from ..utils.models import TelemetryRecord, Alert, UAVState
 from ..utils.config import config
+from ..utils.clock import SimulationClock, get_clock
 
 
 class TelemetryManager:
     """Manages multiple UAV agents and their telemetry data."""
     
-    def __init__(self):
-        """Initialize telemetry manager."""
+    def __init__(self, use_scheduler: Optional[bool] = None, use_fleet_engine: Optional[bool] = None,
+                 clock: Optional[SimulationClock] = None, use_bus: Optional[bool] = None,
+                 use_spatial_index: Optional[bool] = None, use_geofence: Optional[bool] = None,
+                 use_route_engine: Optional[bool] = None, use_physics: Optional[bool] = None):
+        """Initialize telemetry manager.
+        
+        Args:
+            use_scheduler: Drive all agents from one shared tick scheduler
+                instead of one task per agent (defaults to configuration)
+            use_fleet_engine: Generate telemetry for supported subsystems with
+                the vectorized fleet-state engine (defaults to configuration)
+            clock: Simulation clock injected into every agent (defaults to
+                the shared clock)
+            use_bus: Deliver telemetry to callbacks through per-consumer
+                bounded queues instead of awaiting each callback inline
+                (defaults to configuration)
+            use_spatial_index: Feed nearest-UAV distances from a fleet
+                spatial index into collision avoidance (defaults to
+                configuration)
+            use_geofence: Check every UAV position against the no-fly zones
+                of a grid-indexed geofence engine (defaults to configuration)
+            use_route_engine: Compute mission progress and autopilot guidance
+                from each UAV's position on its waypoint route (defaults to
+                configuration)
+            use_physics: Couple Navigation, Propulsion, Power and
+                Flight_Control telemetry through a per-UAV flight physics
+                core stepped for the whole fleet (defaults to configuration)
+        """
+        self.clock = clock if clock is not None else get_clock()
         self.uavs: Dict[str, Dict[str, BaseAgent]] = {}
         self.telemetry_callbacks: List[Callable] = []
         self.alert_callbacks: List[Callable] = []
         self.is_running = False
         self._tasks: List[asyncio.Task] = []
         
+        if use_scheduler is None:
+            use_scheduler = config.get("system.scheduler.enabled", True)
+        self.scheduler: Optional[TelemetryScheduler] = TelemetryScheduler(clock=self.clock) if use_scheduler else None
+        
+        if use_fleet_engine is None:
+            use_fleet_engine = config.get("system.fleet_engine.enabled", False)
+        self.fleet_engine: Optional[FleetStateEngine] = (
+            FleetStateEngine(should_emit=self._has_telemetry_consumers, clock=self.clock)
+            if use_fleet_engine else None
+        )
+        
+        if use_bus is None:
+            use_bus = config.get("system.telemetry_bus.enabled", True)
+        self.bus: Optional[TelemetryBus] = TelemetryBus() if use_bus else None
+        
+        if use_spatial_index is None:
+            use_spatial_index = config.get("system.spatial_index.enabled", True)
+        self.spatial_index: Optional[FleetSpatialIndex] = (
+            FleetSpatialIndex(source=self._fleet_positions, clock=self.clock) if use_spatial_index else None
+        )
+        
+        if use_geofence is None:
+            use_geofence = config.get("system.geofence.enabled", True)
+        self.geofence: Optional[GeofenceEngine] = None
+        if use_geofence:
+            self.geofence = GeofenceEngine(source=self._fleet_positions, clock=self.clock)
+            zones_file = config.get("system.geofence.zones_file")
+            if zones_file:
+                self.geofence.load_geojson(zones_file)
+        
+        if use_route_engine is None:
+            use_route_engine = config.get("system.route_engine.enabled", True)
+        self.route_engine: Optional[RouteEngine] = (
+            RouteEngine(source=self._fleet_positions, clock=self.clock) if use_route_engine else None
+        )
+        
+        if use_physics is None:
+            use_physics = config.get("system.physics.enabled", True)
+        self.physics: Optional[FlightPhysics] = FlightPhysics(clock=self.clock) if use_physics else None
+        if self.fleet_engine is not None:
+            self.fleet_engine.attach_physics(self.physics)
+        
+        # Agents started or stopped at once by bulk operations
+        self.startup_concurrency = max(1, config.get("system.startup_concurrency", 256))
+        
         logger.info("TelemetryManager initialized")
     
     async def add_uav(self, uav_id: str, subsystems: Optional[List[str]] = None) -> None:
@@ -32,11 +116,63 @@ class TelemetryManager:
             uav_id: Unique identifier for the UAV
             subsystems: List of subsystem names to create (None for all)
         """
-        if uav_id in self.uavs:
-            logger.warning(f"UAV {uav_id} already exists")
-            return
+        await self.add_uavs([uav_id], subsystems)
+    
+    async def add_uavs(self, uav_ids: Iterable[str], subsystems: Optional[List[str]] = None) -> List[str]:
+        """Add several UAVs with their agents to the telemetry system.
+        
+        Agents are constructed up front; when the system is running they
+        are then started concurrently, startup_concurrency at a time.
+        
+        Args:
+            uav_ids: Unique identifiers of the UAVs
+            subsystems: List of subsystem names to create for each UAV (None for all)
+            
+        Returns:
+            Identifiers of the UAVs that were added
+        """
+        added: Dict[str, Dict[str, BaseAgent]] = {}
+        for uav_id in uav_ids:
+            if uav_id in self.uavs or uav_id in added:
+                logger.warning(f"UAV {uav_id} already exists")
+                continue
+            
+            agents = self._create_agents(uav_id, subsystems)
+            
+            # Hand supported subsystems over to the vectorized engine
+            if self.fleet_engine is not None:
+                for agent_name, agent in agents.items():
+                    if self.fleet_engine.supports(agent_name):
+                        await self.fleet_engine.attach(agent)
+            
+            added[uav_id] = agents
+        
+        self.uavs.update(added)
+        
+        # Agents added while running join the live schedule immediately
+        if self.is_running:
+            await self._run_bounded(
+                agent.start(self.scheduler) for agents in added.values() for agent in agents.values()
+            )
+        
+        if added:
+            agent_count = sum(len(agents) for agents in added.values())
+            if len(added) == 1:
+                logger.info(f"Added UAV {next(iter(added))} with {agent_count} agents")
+            else:
+                logger.info(f"Added {len(added)} UAVs with {agent_count} agents")
+        return list(added)
+    
+    def _create_agents(self, uav_id: str, subsystems: Optional[List[str]]) -> Dict[str, BaseAgent]:
+        """Create a UAV's agents and wire them to the manager.
         
-        # Create agents for the UAV
+        Args:
+            uav_id: Unique identifier for the UAV
+            subsystems: List of subsystem names to create (None for all)
+            
+        Returns:
+            Dictionary mapping subsystem names to agents
+        """
         if subsystems is None:
             agents = AgentFactory.create_all_agents(uav_id)
         else:
@@ -49,12 +185,63 @@ class TelemetryManager:
                     logger.error(f"Failed to create agent {subsystem_name} for UAV {uav_id}: {e}")
         
         # Register callbacks for each agent
-        for agent_name, agent in agents.items():
+        for agent in agents.values():
+            agent.clock = self.clock
             agent.register_callback("telemetry", self._handle_telemetry)
             agent.register_callback("alert", self._handle_alert)
+            if isinstance(agent, SafetySystemsAgent):
+                if self.spatial_index is not None:
+                    agent.attach_spatial_index(self.spatial_index)
+                if self.geofence is not None:
+                    agent.attach_geofence(self.geofence)
+            if isinstance(agent, MissionPlanningAgent) and self.geofence is not None:
+                self.geofence.add_no_fly_zones(agent.mission_constraints["no_fly_zones"])
+                agent.attach_geofence(self.geofence)
+            if isinstance(agent, (MissionPlanningAgent, FlightControlAgent)) and self.route_engine is not None:
+                agent.attach_route_engine(self.route_engine)
+        
+        # One physics row per UAV, starting where its navigation agent placed it
+        coupled = [agent for agent in agents.values() if agent.subsystem_name in FlightPhysics.SUBSYSTEMS]
+        if coupled and self.physics is not None:
+            navigation = agents.get("Navigation")
+            if navigation is not None:
+                self.physics.add(uav_id, latitude=navigation.latitude, longitude=navigation.longitude,
+                                 altitude=navigation.altitude, heading=navigation.heading,
+                                 speed=navigation.speed)
+            else:
+                self.physics.add(uav_id)
+            for agent in coupled:
+                agent.attach_physics(self.physics)
+        
+        return agents
+    
+    def _fleet_positions(self) -> Tuple[List[str], np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Current position and heading of every UAV with a Navigation subsystem.
         
-        self.uavs[uav_id] = agents
-        logger.info(f"Added UAV {uav_id} with {len(agents)} agents")
+        Returns:
+            (uav_ids, latitude, longitude, altitude, heading), read from the
+            fleet engine's Navigation state and from per-agent navigation
+        """
+        group = self.fleet_engine.groups.get("Navigation") if self.fleet_engine is not None else None
+        agents = [
+            uav_agents["Navigation"] for uav_id, uav_agents in self.uavs.items()
+            if "Navigation" in uav_agents and (group is None or not group.contains(uav_id))
+        ]
+        uav_ids = [agent.uav_id for agent in agents]
+        columns = [
+            np.fromiter((getattr(agent, name) for agent in agents), float, len(agents))
+            for name in ("latitude", "longitude", "altitude", "heading")
+        ]
+        
+        if group is not None and len(group):
+            state = group.state
+            uav_ids = group.uav_ids + uav_ids
+            columns = [
+                np.concatenate([state[name], column])
+                for name, column in zip(("latitude", "longitude", "altitude", "heading"), columns)
+            ]
+        
+        return (uav_ids, *columns)
     
     async def remove_uav(self, uav_id: str) -> None:
         """Remove a UAV and its agents from the telemetry system.
@@ -62,17 +249,68 @@ class TelemetryManager:
         Args:
             uav_id: Unique identifier for the UAV
         """
-        if uav_id not in self.uavs:
-            logger.warning(f"UAV {uav_id} not found")
-            return
+        await self.remove_uavs([uav_id])
+    
+    async def remove_uavs(self, uav_ids: Iterable[str]) -> List[str]:
+        """Remove several UAVs and their agents from the telemetry system.
+        
+        Agents are stopped concurrently, startup_concurrency at a time.
+        
+        Args:
+            uav_ids: Unique identifiers of the UAVs
+            
+        Returns:
+            Identifiers of the UAVs that were removed
+        """
+        removed: Dict[str, Dict[str, BaseAgent]] = {}
+        for uav_id in uav_ids:
+            if uav_id not in self.uavs:
+                logger.warning(f"UAV {uav_id} not found")
+                continue
+            removed[uav_id] = self.uavs.pop(uav_id)
+        
+        # Stop all agents for these UAVs
+        agents = [agent for uav_agents in removed.values() for agent in uav_agents.values()]
+        await self._run_bounded(agent.stop() for agent in agents)
+        if self.fleet_engine is not None:
+            for agent in agents:
+                self.fleet_engine.detach(agent)
+        if self.route_engine is not None:
+            for uav_id in removed:
+                self.route_engine.remove_route(uav_id)
+        if self.physics is not None:
+            for uav_id in removed:
+                self.physics.remove(uav_id)
+        
+        if len(removed) == 1:
+            logger.info(f"Removed UAV {next(iter(removed))}")
+        elif removed:
+            logger.info(f"Removed {len(removed)} UAVs")
+        return list(removed)
+    
+    async def _run_bounded(self, coroutines: Iterable[Awaitable]) -> None:
+        """Await coroutines concurrently, at most startup_concurrency at a time.
         
-        # Stop all agents for this UAV
-        agents = self.uavs[uav_id]
-        for agent_name, agent in agents.items():
-            await agent.stop()
+        Args:
+            coroutines: Coroutines to run; every one is awaited even if
+                another one fails, and the first error is raised afterwards
+        """
+        # A fixed pool of workers drains the coroutines, so the cost is one
+        # task per worker rather than one task per agent
+        pending = list(coroutines)
+        remaining = iter(pending)
+        errors: List[Exception] = []
+        
+        async def worker() -> None:
+            for coroutine in remaining:
+                try:
+                    await coroutine
+                except Exception as e:
+                    errors.append(e)
         
-        del self.uavs[uav_id]
-        logger.info(f"Removed UAV {uav_id}")
+        await asyncio.gather(*(worker() for _ in range(min(self.startup_concurrency, len(pending)))))
+        if errors:
+            raise errors[0]
     
     async def start(self) -> None:
         """Start the telemetry system."""
@@ -82,11 +320,34 @@ class TelemetryManager:
         
         self.is_running = True
         
+        if self.bus is not None:
+            await self.bus.start()
+        
+        if self.scheduler is not None:
+            await self.scheduler.start()
+        
+        if self.physics is not None:
+            await self.physics.start(self.scheduler)
+        
+        if self.fleet_engine is not None:
+            await self.fleet_engine.start(self.scheduler)
+        
+        if self.spatial_index is not None:
+            await self.spatial_index.tick()
+            await self.spatial_index.start(self.scheduler)
+        
+        if self.geofence is not None:
+            await self.geofence.tick()
+            await self.geofence.start(self.scheduler)
+        
+        if self.route_engine is not None:
+            await self.route_engine.tick()
+            await self.route_engine.start(self.scheduler)
+        
         # Start all agents for all UAVs
-        for uav_id, agents in self.uavs.items():
-            for agent_name, agent in agents.items():
-                await agent.start()
-                logger.debug(f"Started {agent_name} agent for UAV {uav_id}")
+        await self._run_bounded(
+            agent.start(self.scheduler) for agents in self.uavs.values() for agent in agents.values()
+        )
         
         logger.info("TelemetryManager started")
     
@@ -99,10 +360,29 @@ class TelemetryManager:
         self.is_running = False
         
         # Stop all agents for all UAVs
-        for uav_id, agents in self.uavs.items():
-            for agent_name, agent in agents.items():
-                await agent.stop()
-                logger.debug(f"Stopped {agent_name} agent for UAV {uav_id}")
+        await self._run_bounded(agent.stop() for agents in self.uavs.values() for agent in agents.values())
+        
+        if self.fleet_engine is not None:
+            await self.fleet_engine.stop()
+        
+        if self.spatial_index is not None:
+            await self.spatial_index.stop()
+        
+        if self.geofence is not None:
+            await self.geofence.stop()
+        
+        if self.route_engine is not None:
+            await self.route_engine.stop()
+        
+        if self.physics is not None:
+            await self.physics.stop()
+        
+        if self.scheduler is not None:
+            await self.scheduler.stop()
+        
+        # Deliver what producers already published
+        if self.bus is not None:
+            await self.bus.stop()
         
         # Cancel all tasks
         for task in self._tasks:
@@ -150,13 +430,29 @@ class TelemetryManager:
         await agent.clear_fault()
         logger.info(f"Cleared fault in {subsystem} for UAV {uav_id}")
     
-    def register_telemetry_callback(self, callback: Callable) -> None:
+    def register_telemetry_callback(self, callback: Callable, name: Optional[str] = None,
+                                    queue_size: Optional[int] = None, overflow: Optional[str] = None,
+                                    workers: Optional[int] = None) -> None:
         """Register a callback for telemetry data.
         
+        With the telemetry bus enabled the callback becomes a bus consumer
+        with its own queue; the queue options are ignored otherwise.
+        
         Args:
-            callback: Async callback function that receives TelemetryData
+            callback: Async callback function that receives TelemetryRecord
+            name: Consumer name shown in bus statistics (defaults to the
+                callback's name)
+            queue_size: Maximum number of samples queued for this consumer
+            overflow: Policy when the queue is full ("block", "drop_oldest", "sample")
+            workers: Number of concurrent callback invocations
         """
         self.telemetry_callbacks.append(callback)
+        if self.bus is not None:
+            if name is None:
+                name = getattr(callback, "__qualname__", "consumer")
+                if name in self.bus.subscriptions:
+                    name = f"{name}_{len(self.telemetry_callbacks)}"
+            self.bus.subscribe(name, callback, queue_size=queue_size, overflow=overflow, workers=workers)
         logger.debug("Registered telemetry callback")
     
     def register_alert_callback(self, callback: Callable) -> None:
@@ -168,12 +464,32 @@ class TelemetryManager:
         self.alert_callbacks.append(callback)
         logger.debug("Registered alert callback")
     
-    async def _handle_telemetry(self, telemetry_data: TelemetryData) -> None:
+    async def publish_telemetry(self, telemetry_data: TelemetryRecord) -> None:
+        """Deliver telemetry produced outside the agents, e.g. a replay.
+        
+        The record reaches every registered consumer exactly as if one of
+        the manager's agents had emitted it.
+        
+        Args:
+            telemetry_data: Telemetry record
+        """
+        await self._handle_telemetry(telemetry_data)
+    
+    def _has_telemetry_consumers(self) -> bool:
+        """Check whether anyone is listening for telemetry."""
+        return bool(self.telemetry_callbacks)
+    
+    async def _handle_telemetry(self, telemetry_data: TelemetryRecord) -> None:
         """Handle incoming telemetry data.
         
         Args:
             telemetry_data: Telemetry data from an agent
         """
+        # Queue for every consumer; slow consumers only fall behind themselves
+        if self.bus is not None:
+            await self.bus.publish(telemetry_data)
+            return
+        
         # Send to registered callbacks
         for callback in self.telemetry_callbacks:
             try:
@@ -224,6 +540,85 @@ class TelemetryManager:
         
         return status
     
+    def get_scheduler_statistics(self) -> Dict[str, Any]:
+        """Get tick scheduler statistics.
+        
+        Returns:
+            Dictionary containing scheduler statistics (empty when agents run
+            their own loops)
+        """
+        if self.scheduler is None:
+            return {}
+        
+        return self.scheduler.get_statistics()
+    
+    def get_bus_statistics(self) -> Dict[str, Any]:
+        """Get telemetry bus statistics.
+        
+        Returns:
+            Dictionary containing per-consumer lag and drop counters (empty
+            when callbacks are awaited inline)
+        """
+        if self.bus is None:
+            return {}
+        
+        return self.bus.get_statistics()
+    
+    def get_fleet_engine_statistics(self) -> Dict[str, Any]:
+        """Get fleet-state engine statistics.
+        
+        Returns:
+            Dictionary containing engine statistics (empty when disabled)
+        """
+        if self.fleet_engine is None:
+            return {}
+        
+        return self.fleet_engine.get_statistics()
+    
+    def get_spatial_index_statistics(self) -> Dict[str, Any]:
+        """Get fleet spatial index statistics.
+        
+        Returns:
+            Dictionary containing index statistics (empty when disabled)
+        """
+        if self.spatial_index is None:
+            return {}
+        
+        return self.spatial_index.get_statistics()
+    
+    def get_geofence_statistics(self) -> Dict[str, Any]:
+        """Get geofence engine statistics.
+        
+        Returns:
+            Dictionary containing geofence statistics (empty when disabled)
+        """
+        if self.geofence is None:
+            return {}
+        
+        return self.geofence.get_statistics()
+    
+    def get_route_engine_statistics(self) -> Dict[str, Any]:
+        """Get route engine statistics.
+        
+        Returns:
+            Dictionary containing route engine statistics (empty when disabled)
+        """
+        if self.route_engine is None:
+            return {}
+        
+        return self.route_engine.get_statistics()
+    
+    def get_physics_statistics(self) -> Dict[str, Any]:
+        """Get flight physics statistics.
+        
+        Returns:
+            Dictionary containing flight physics statistics (empty when disabled)
+        """
+        if self.physics is None:
+            return {}
+        
+        return self.physics.get_statistics()
+    
     def get_uav_count(self) -> int:
         """Get the number of UAVs in the system.
         
@@ -311,12 +706,20 @@ class TelemetryManager:
         
         return states
     
-    async def get_telemetry(self, uav_id: str, subsystem: Optional[str] = None) -> List[TelemetryData]:
+    async def get_telemetry(self, uav_id: str, subsystem: Optional[str] = None,
+                            start: Optional[datetime] = None, end: Optional[datetime] = None,
+                            count: int = 10) -> List[TelemetryRecord]:
         """Get telemetry data for a UAV.
         
+        Without a time range the most recent points of each subsystem are
+        returned; with one, everything its history holds for that range.
+        
         Args:
             uav_id: UAV identifier
             subsystem: Optional subsystem filter
+            start: Earliest simulated timestamp, inclusive
+            end: Latest simulated timestamp, exclusive
+            count: Recent points per subsystem when no range is given
             
         Returns:
             List of telemetry data points
@@ -327,9 +730,11 @@ class TelemetryManager:
         telemetry_data = []
         for agent_name, agent in self.uavs[uav_id].items():
             if subsystem is None or agent_name == subsystem:
-                # Get recent telemetry from agent
-                if hasattr(agent, 'get_recent_telemetry'):
-                    data = await agent.get_recent_telemetry()
+                if start is not None or end is not None:
+                    telemetry_data.extend(agent.telemetry_history.between(start, end))
+                else:
+                    # Get recent telemetry from agent
+                    data = await agent.get_recent_telemetry(count)
                     telemetry_data.extend(data)
         
         return telemetry_data
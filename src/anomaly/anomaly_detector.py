@@ -1,42 +1,118 @@
 """Real-time anomaly detection engine for UAV telemetry data."""
 
 import asyncio
+import time
+import zlib
 import numpy as np
-from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional, Callable
 from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Deque, Dict, List, Any, Optional, Callable, Sequence, Tuple
 from sklearn.ensemble import IsolationForest
 from sklearn.svm import OneClassSVM
 from sklearn.neighbors import LocalOutlierFactor
 from sklearn.preprocessing import StandardScaler
 from loguru import logger
 
-from ..utils.models import TelemetryData, AnomalyDetectionResult, Alert, SeverityLevel
+from ..utils.models import TelemetryRecord, AnomalyDetectionResult, Alert, SeverityLevel
 from ..utils.config import config
+from ..utils.clock import SimulationClock, get_clock
+from .feature_plans import FeaturePlanCompiler
+from .ring_buffer import RingBuffer
+from .streaming import STREAMING_ALGORITHMS, StreamingDetector, WelfordZScore, EWMAChart, HalfSpaceTrees
+
+
+def _fit_window(model: Any, data_array: np.ndarray) -> Tuple[StandardScaler, Any]:
+    """Fit a scaler and model on a snapshot of one data window.
+    
+    Runs in a worker process, so it only touches its arguments.
+    
+    Args:
+        model: Unfitted model to train
+        data_array: Window samples, one row per sample
+        
+    Returns:
+        Tuple of (fitted scaler, fitted model)
+    """
+    scaler = StandardScaler()
+    model.fit(scaler.fit_transform(data_array))
+    
+    return scaler, model
+
+
+def _fit_fleet(model: Any, data_arrays: List[np.ndarray]) -> Tuple[List[StandardScaler], Any]:
+    """Fit one model on pooled data from several windows.
+    
+    Each window is standardized with its own scaler first, so differences
+    between UAVs (battery age, payload mass) do not dominate the pooled
+    distribution. Runs in a worker process, so it only touches its arguments.
+    
+    Args:
+        model: Unfitted model to train
+        data_arrays: Samples of each window, one row per sample
+        
+    Returns:
+        Tuple of (fitted scaler per window, fitted model)
+    """
+    scalers = [StandardScaler().fit(data_array) for data_array in data_arrays]
+    pooled = np.concatenate([scaler.transform(data_array) for scaler, data_array in zip(scalers, data_arrays)])
+    model.fit(pooled)
+    
+    return scalers, model
 
 
 class AnomalyDetector:
     """Real-time anomaly detection engine for UAV telemetry data."""
     
-    def __init__(self):
-        """Initialize anomaly detector."""
+    def __init__(self, clock: Optional[SimulationClock] = None):
+        """Initialize anomaly detector.
+        
+        Args:
+            clock: Simulation clock used for retraining intervals (defaults to
+                the shared clock)
+        """
+        self.clock = clock if clock is not None else get_clock()
         self.enabled = config.get("anomaly_detection.enabled", True)
         self.algorithm = config.get("anomaly_detection.algorithm", "isolation_forest")
         self.threshold = config.get("anomaly_detection.threshold", 0.8)
         self.window_size = config.get("anomaly_detection.window_size", 100)
         self.retrain_interval = config.get("anomaly_detection.retrain_interval", 300)
+        self.model_scope = config.get("anomaly_detection.model_scope", "window")
+        
+        # Micro-batching of incoming samples
+        self.batching_enabled = config.get("anomaly_detection.batching.enabled", True)
+        self.max_batch_delay = config.get("anomaly_detection.batching.max_delay_ms", 2.0) / 1000.0
+        self.max_batch_size = config.get("anomaly_detection.batching.max_batch_size", 1024)
+        self.max_pending = max(1, config.get("anomaly_detection.batching.max_pending", 16384))
+        self._pending: Deque[Tuple[TelemetryRecord, asyncio.Future]] = deque()
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._scorer: Optional[asyncio.Task] = None
+        
+        # Background retraining
+        self.retrain_executor = config.get("anomaly_detection.retraining.executor", "process")
+        self.retrain_workers = config.get("anomaly_detection.retraining.max_workers", 2)
+        self.min_train_samples = config.get("anomaly_detection.retraining.min_samples", 20)
+        self.stagger_retrains = config.get("anomaly_detection.retraining.stagger", True)
+        self._executor: Optional[Executor] = None
+        self._retrain_tasks: Dict[str, asyncio.Task] = {}
         
         # Feature configuration
         self.features = config.get("anomaly_detection.features", [
             "cpu_usage", "memory_usage", "temperature", "voltage", "current",
             "altitude", "speed", "battery_level"
         ])
+        self.feature_compiler = FeaturePlanCompiler(self.features)
         
         # Data storage
-        self.data_windows: Dict[str, deque] = {}
+        self.data_windows: Dict[str, RingBuffer] = {}
+        self.window_subsystems: Dict[str, str] = {}
+        self.model_keys: Dict[str, str] = {}
         self.models: Dict[str, Any] = {}
         self.scalers: Dict[str, StandardScaler] = {}
         self.last_retrain: Dict[str, datetime] = {}
+        self.next_retrain: Dict[str, datetime] = {}
+        self.trained_models: set = set()
+        self.trained_windows: set = set()
         
         # Callbacks
         self.anomaly_callbacks: List[Callable] = []
@@ -50,22 +126,46 @@ class AnomalyDetector:
             "anomalies_detected": 0,
             "false_positives": 0,
             "true_positives": 0,
-            "model_retrains": 0
+            "model_retrains": 0,
+            "failed_retrains": 0,
+            "retrain_time_total": 0.0,
+            "max_retrain_latency": 0.0,
+            "batches_processed": 0,
+            "batched_samples": 0,
+            "max_batch_size": 0,
+            "dropped_samples": 0
         }
         
         logger.info(f"AnomalyDetector initialized with {self.algorithm} algorithm")
     
-    async def process_telemetry(self, telemetry_data: TelemetryData) -> AnomalyDetectionResult:
+    async def process_telemetry(self, telemetry_data: TelemetryRecord) -> AnomalyDetectionResult:
         """Process telemetry data for anomaly detection.
         
+        With batching enabled the sample is queued and scored together with
+        every other sample that arrives within the batching delay.
+        
         Args:
             telemetry_data: Telemetry data to analyze
             
         Returns:
             AnomalyDetectionResult with detection results
         """
+        return await self.submit_telemetry(telemetry_data)
+    
+    def submit_telemetry(self, telemetry_data: TelemetryRecord) -> asyncio.Future:
+        """Queue telemetry data for anomaly detection without waiting.
+        
+        Args:
+            telemetry_data: Telemetry data to analyze
+            
+        Returns:
+            Future resolving to the AnomalyDetectionResult
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        
         if not self.enabled:
-            return AnomalyDetectionResult(
+            future.set_result(AnomalyDetectionResult(
                 uav_id=telemetry_data.uav_id,
                 subsystem=telemetry_data.subsystem,
                 anomaly_score=0.0,
@@ -73,190 +173,236 @@ class AnomalyDetector:
                 features={},
                 algorithm=self.algorithm,
                 confidence=1.0
-            )
+            ))
+            return future
+        
+        if len(self._pending) >= self.max_pending:
+            # Scoring has fallen behind; the oldest sample is skipped unscored
+            dropped, dropped_future = self._pending.popleft()
+            self.stats["dropped_samples"] += 1
+            if not dropped_future.done():
+                dropped_future.set_result(AnomalyDetectionResult(
+                    uav_id=dropped.uav_id,
+                    subsystem=dropped.subsystem,
+                    anomaly_score=0.0,
+                    is_anomaly=False,
+                    features={},
+                    algorithm=self.algorithm,
+                    confidence=0.0
+                ))
+        self._pending.append((telemetry_data, future))
+        
+        if not self.batching_enabled or len(self._pending) >= self.max_batch_size:
+            self._flush_pending()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.max_batch_delay, self._flush_pending)
+        
+        return future
+    
+    def _flush_pending(self) -> None:
+        """Start scoring the queued samples unless a scorer is already running.
         
-        # Extract features from telemetry data
-        features = self._extract_features(telemetry_data)
+        A running scorer picks up samples queued meanwhile as its next batch,
+        so while scoring falls behind the backlog stays in the bounded
+        pending queue.
+        """
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
         
-        if not features:
-            logger.warning(f"No features extracted from {telemetry_data.subsystem}")
-            return AnomalyDetectionResult(
-                uav_id=telemetry_data.uav_id,
-                subsystem=telemetry_data.subsystem,
-                anomaly_score=0.0,
-                is_anomaly=False,
-                features={},
-                algorithm=self.algorithm,
-                confidence=0.0
-            )
+        if self._pending and (self._scorer is None or self._scorer.done()):
+            self._scorer = asyncio.create_task(self._score_pending())
+    
+    async def _score_pending(self) -> None:
+        """Score queued samples in batches of up to max_batch_size until none are left."""
+        size = self.max_batch_size if self.batching_enabled else 1
+        while self._pending:
+            batch = [self._pending.popleft() for _ in range(min(size, len(self._pending)))]
+            await self._run_batch(batch)
+    
+    async def _run_batch(self, batch: List[Tuple[TelemetryRecord, asyncio.Future]]) -> None:
+        """Score a batch of queued samples and resolve their futures.
         
-        # Get or create data window for this subsystem
-        window_key = f"{telemetry_data.uav_id}_{telemetry_data.subsystem}"
-        if window_key not in self.data_windows:
-            self.data_windows[window_key] = deque(maxlen=self.window_size)
-            self.models[window_key] = self._create_model()
-            self.scalers[window_key] = StandardScaler()
-            self.last_retrain[window_key] = datetime.now()
+        Args:
+            batch: List of (telemetry_data, future) pairs
+        """
+        try:
+            results = await self._process_batch([telemetry_data for telemetry_data, _ in batch])
+        except Exception as e:
+            logger.error(f"Error processing anomaly detection batch: {e}")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
         
-        # Add features to data window
-        self.data_windows[window_key].append(features)
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+    
+    async def _process_batch(self, samples: List[TelemetryRecord]) -> List[AnomalyDetectionResult]:
+        """Run anomaly detection for a batch of samples.
         
-        # Check if we have enough data for prediction
-        if len(self.data_windows[window_key]) < 10:
-            return AnomalyDetectionResult(
-                uav_id=telemetry_data.uav_id,
-                subsystem=telemetry_data.subsystem,
-                anomaly_score=0.0,
-                is_anomaly=False,
-                features=features,
-                algorithm=self.algorithm,
-                confidence=0.5
-            )
+        Samples are grouped by window and each window is scored with a single
+        vectorized model call.
         
-        # Retrain model if needed
-        await self._retrain_model_if_needed(window_key)
-        
-        # Perform anomaly detection
-        anomaly_score, is_anomaly = await self._detect_anomaly(window_key, features)
-        
-        # Update statistics
-        self.stats["total_predictions"] += 1
-        if is_anomaly:
-            self.stats["anomalies_detected"] += 1
-        
-        # Create result
-        result = AnomalyDetectionResult(
-            uav_id=telemetry_data.uav_id,
-            subsystem=telemetry_data.subsystem,
-            anomaly_score=anomaly_score,
-            is_anomaly=is_anomaly,
-            features=features,
-            algorithm=self.algorithm,
-            confidence=self._calculate_confidence(window_key, anomaly_score)
-        )
+        Args:
+            samples: Telemetry samples in arrival order
+            
+        Returns:
+            Detection results in the same order as the samples
+        """
+        results: List[Optional[AnomalyDetectionResult]] = [None] * len(samples)
+        batch_features: List[Dict[str, float]] = []
+        batch_rows: List[Tuple[float, ...]] = []
+        groups: Dict[str, List[int]] = {}
+        
+        for index, telemetry_data in enumerate(samples):
+            # Extract features from telemetry data
+            plan = self.feature_compiler.get_plan(telemetry_data.subsystem, telemetry_data.data)
+            row = plan.extract(telemetry_data.data)
+            features = plan.to_dict(row)
+            batch_features.append(features)
+            batch_rows.append(row)
+            
+            if not features:
+                logger.warning(f"No features extracted from {telemetry_data.subsystem}")
+                results[index] = AnomalyDetectionResult(
+                    uav_id=telemetry_data.uav_id,
+                    subsystem=telemetry_data.subsystem,
+                    anomaly_score=0.0,
+                    is_anomaly=False,
+                    features={},
+                    algorithm=self.algorithm,
+                    confidence=0.0
+                )
+                continue
+            
+            # Get or create data window for this subsystem
+            window_key = f"{telemetry_data.uav_id}_{telemetry_data.subsystem}"
+            if window_key not in self.data_windows:
+                self.data_windows[window_key] = RingBuffer(self.window_size, plan.columns)
+                self.window_subsystems[window_key] = telemetry_data.subsystem
+                self.scalers[window_key] = StandardScaler()
+                
+                model_key = self._model_key(window_key)
+                self.model_keys[window_key] = model_key
+                if model_key not in self.models:
+                    self.models[model_key] = self._create_model()
+            
+            # Add features to data window
+            self.data_windows[window_key].append(row)
+            
+            # Check if we have enough data for prediction
+            if len(self.data_windows[window_key]) < 10:
+                results[index] = AnomalyDetectionResult(
+                    uav_id=telemetry_data.uav_id,
+                    subsystem=telemetry_data.subsystem,
+                    anomaly_score=0.0,
+                    is_anomaly=False,
+                    features=features,
+                    algorithm=self.algorithm,
+                    confidence=0.5
+                )
+                continue
+            
+            groups.setdefault(window_key, []).append(index)
         
-        # Send to callbacks if anomaly detected
-        if is_anomaly:
-            await self._handle_anomaly(result, telemetry_data)
+        for window_key, indices in groups.items():
+            # Retrain model in the background if needed
+            self._retrain_model_if_needed(window_key)
+            
+            if not self._is_ready(window_key):
+                # No model has been swapped in yet for this window
+                for index in indices:
+                    results[index] = AnomalyDetectionResult(
+                        uav_id=samples[index].uav_id,
+                        subsystem=samples[index].subsystem,
+                        anomaly_score=0.0,
+                        is_anomaly=False,
+                        features=batch_features[index],
+                        algorithm=self.algorithm,
+                        confidence=0.5
+                    )
+                continue
+            
+            # Score every sample of this window in one call
+            detections = await self._detect_anomalies(window_key, [batch_rows[i] for i in indices])
+            
+            for index, (anomaly_score, is_anomaly) in zip(indices, detections):
+                telemetry_data = samples[index]
+                
+                # Update statistics
+                self.stats["total_predictions"] += 1
+                if is_anomaly:
+                    self.stats["anomalies_detected"] += 1
+                
+                # Create result
+                result = AnomalyDetectionResult(
+                    uav_id=telemetry_data.uav_id,
+                    subsystem=telemetry_data.subsystem,
+                    anomaly_score=anomaly_score,
+                    is_anomaly=is_anomaly,
+                    features=batch_features[index],
+                    algorithm=self.algorithm,
+                    confidence=self._calculate_confidence(window_key, anomaly_score)
+                )
+                results[index] = result
+                
+                # Send to callbacks if anomaly detected
+                if is_anomaly:
+                    await self._handle_anomaly(result, telemetry_data)
         
-        return result
+        self.stats["batches_processed"] += 1
+        self.stats["batched_samples"] += len(samples)
+        self.stats["max_batch_size"] = max(self.stats["max_batch_size"], len(samples))
+        
+        return results
     
-    def _extract_features(self, telemetry_data: TelemetryData) -> Dict[str, float]:
+    def _extract_features(self, telemetry_data: TelemetryRecord) -> Dict[str, float]:
         """Extract features from telemetry data.
         
+        Uses the subsystem's compiled feature plan, so every sample of a
+        subsystem yields the same columns in the same order.
+        
         Args:
             telemetry_data: Telemetry data to extract features from
             
         Returns:
             Dictionary of feature names and values
         """
-        features = {}
-        data = telemetry_data.data
-        
-        # Extract common features
-        for feature_name in self.features:
-            feature_value = self._extract_feature_value(data, feature_name)
-            if feature_value is not None:
-                features[feature_name] = feature_value
-        
-        # Extract subsystem-specific features
-        subsystem_features = self._extract_subsystem_features(data, telemetry_data.subsystem)
-        features.update(subsystem_features)
-        
-        return features
+        plan = self.feature_compiler.get_plan(telemetry_data.subsystem, telemetry_data.data)
+        return plan.to_dict(plan.extract(telemetry_data.data))
     
-    def _extract_feature_value(self, data: Dict[str, Any], feature_name: str) -> Optional[float]:
-        """Extract a specific feature value from telemetry data.
+    def _model_key(self, window_key: str) -> str:
+        """Get the key of the model that scores a window.
+        
+        In fleet scope all windows of a subsystem share one model keyed by
+        the subsystem name. Streaming detectors keep per-window state, so
+        they always get a model of their own.
         
         Args:
-            data: Telemetry data dictionary
-            feature_name: Name of the feature to extract
+            window_key: Key for the data window
             
         Returns:
-            Feature value or None if not found
+            Model key
         """
-        # Common feature mappings
-        feature_mappings = {
-            "cpu_usage": ["system", "cpu_usage"],
-            "memory_usage": ["system", "memory_usage"],
-            "temperature": ["temperature", "battery", "temperature", "motors", "motor_1", "temperature"],
-            "voltage": ["voltage", "battery", "voltage", "motors", "motor_1", "voltage"],
-            "current": ["current", "battery", "current", "motors", "motor_1", "current"],
-            "altitude": ["position", "altitude", "altitude"],
-            "speed": ["velocity", "speed", "speed"],
-            "battery_level": ["battery", "state_of_charge", "remaining_capacity"]
-        }
-        
-        if feature_name not in feature_mappings:
-            return None
-        
-        # Navigate through nested data structure
-        current_data = data
-        for key in feature_mappings[feature_name]:
-            if isinstance(current_data, dict) and key in current_data:
-                current_data = current_data[key]
-            else:
-                return None
-        
-        # Convert to float if possible
-        try:
-            return float(current_data)
-        except (ValueError, TypeError):
-            return None
+        if self.model_scope == "fleet" and self.algorithm not in STREAMING_ALGORITHMS:
+            return self.window_subsystems[window_key]
+        return window_key
     
-    def _extract_subsystem_features(self, data: Dict[str, Any], subsystem: str) -> Dict[str, float]:
-        """Extract subsystem-specific features.
+    def _is_ready(self, window_key: str) -> bool:
+        """Check whether a window can be scored.
         
         Args:
-            data: Telemetry data dictionary
-            subsystem: Name of the subsystem
+            window_key: Key for the data window
             
         Returns:
-            Dictionary of subsystem-specific features
+            True once the window's model and its scaler have been fitted
         """
-        features = {}
-        
-        if subsystem == "Navigation":
-            # Navigation-specific features
-            if "position" in data:
-                pos = data["position"]
-                features["latitude"] = pos.get("latitude", 0.0)
-                features["longitude"] = pos.get("longitude", 0.0)
-                features["altitude"] = pos.get("altitude", 0.0)
-            
-            if "attitude" in data:
-                att = data["attitude"]
-                features["heading"] = att.get("heading", 0.0)
-                features["roll"] = att.get("roll", 0.0)
-                features["pitch"] = att.get("pitch", 0.0)
-        
-        elif subsystem == "Propulsion":
-            # Propulsion-specific features
-            if "motors" in data:
-                motors = data["motors"]
-                total_thrust = sum(motor.get("thrust", 0) for motor in motors.values())
-                features["total_thrust"] = total_thrust
-                
-                avg_temp = sum(motor.get("temperature", 0) for motor in motors.values()) / len(motors)
-                features["avg_motor_temp"] = avg_temp
-        
-        elif subsystem == "Power":
-            # Power-specific features
-            if "battery" in data:
-                battery = data["battery"]
-                features["battery_voltage"] = battery.get("voltage", 0.0)
-                features["battery_current"] = battery.get("current", 0.0)
-                features["battery_soc"] = battery.get("state_of_charge", 0.0)
-        
-        elif subsystem == "Communication":
-            # Communication-specific features
-            if "radio" in data:
-                radio = data["radio"]
-                features["rssi"] = radio.get("rssi", 0.0)
-                features["snr"] = radio.get("snr", 0.0)
-                features["packet_loss"] = radio.get("packet_loss", 0.0)
-        
-        return features
+        model_key = self.model_keys[window_key]
+        if isinstance(self.models[model_key], StreamingDetector):
+            return True
+        return model_key in self.trained_models and window_key in self.trained_windows
     
     def _create_model(self) -> Any:
         """Create a new anomaly detection model.
@@ -277,56 +423,169 @@ class AnomalyDetector:
                 gamma="scale"
             )
         elif self.algorithm == "local_outlier_factor":
+            # Novelty mode: fit() builds the neighbor index once per retrain
+            # and new samples are scored against it without refitting
             return LocalOutlierFactor(
-                n_neighbors=20,
-                contamination=0.1
+                n_neighbors=config.get("anomaly_detection.lof.n_neighbors", 20),
+                algorithm=config.get("anomaly_detection.lof.index", "kd_tree"),
+                leaf_size=config.get("anomaly_detection.lof.leaf_size", 30),
+                contamination=0.1,
+                novelty=True
+            )
+        elif self.algorithm == "zscore":
+            return WelfordZScore(z_scale=config.get("anomaly_detection.streaming.z_scale", 1.0))
+        elif self.algorithm == "ewma":
+            return EWMAChart(
+                alpha=config.get("anomaly_detection.streaming.ewma_alpha", 0.05),
+                z_scale=config.get("anomaly_detection.streaming.z_scale", 1.0)
+            )
+        elif self.algorithm == "half_space_trees":
+            return HalfSpaceTrees(
+                n_trees=config.get("anomaly_detection.streaming.hst_trees", 25),
+                depth=config.get("anomaly_detection.streaming.hst_depth", 8),
+                window=config.get("anomaly_detection.streaming.hst_window", 250),
+                z_scale=config.get("anomaly_detection.streaming.z_scale", 1.0),
+                seed=42
             )
         else:
             logger.warning(f"Unknown algorithm {self.algorithm}, using IsolationForest")
             return IsolationForest(contamination=0.1, random_state=42)
     
-    async def _retrain_model_if_needed(self, window_key: str) -> None:
-        """Retrain model if needed based on time interval.
+    def _retrain_model_if_needed(self, window_key: str) -> None:
+        """Start a background retrain if the window's model is due for one.
+        
+        A model is trained as soon as its data holds enough samples and then
+        retrained every retrain_interval. Scoring keeps using the current
+        model until the new one is swapped in.
         
         Args:
             window_key: Key for the data window
         """
-        now = datetime.now()
-        last_retrain = self.last_retrain[window_key]
+        model_key = self.model_keys[window_key]
+        if isinstance(self.models[model_key], StreamingDetector):
+            # Streaming detectors learn from every sample as it is scored
+            return
         
-        if (now - last_retrain).total_seconds() >= self.retrain_interval:
-            await self._retrain_model(window_key)
-            self.last_retrain[window_key] = now
-            self.stats["model_retrains"] += 1
+        if len(self.data_windows[window_key]) < self.min_train_samples:
+            return
+        
+        if model_key != window_key and window_key not in self.trained_windows:
+            # A UAV joining a trained fleet model only needs its own scaler
+            self.scalers[window_key] = StandardScaler().fit(self.data_windows[window_key].view())
+            self.trained_windows.add(window_key)
+        
+        if model_key in self._retrain_tasks:
+            return
+        
+        if model_key in self.trained_models and self.clock.now() < self.next_retrain[model_key]:
+            return
+        
+        self._retrain_tasks[model_key] = asyncio.create_task(self._retrain_model(model_key))
     
-    async def _retrain_model(self, window_key: str) -> None:
+    async def _retrain_model(self, model_key: str) -> None:
         """Retrain the anomaly detection model.
         
+        The fit runs in the retraining executor on a snapshot of the model's
+        windows; the fitted scalers and model replace the old ones together
+        once it finishes.
+        
         Args:
-            window_key: Key for the data window
+            model_key: Key of the model (the window key in window scope)
         """
-        if len(self.data_windows[window_key]) < 20:
-            return
-        
         try:
-            # Convert data window to numpy array
-            data_array = np.array(list(self.data_windows[window_key]))
+            windows = [
+                window_key for window_key, key in self.model_keys.items()
+                if key == model_key and len(self.data_windows[window_key]) >= self.min_train_samples
+            ]
+            if not windows:
+                return
             
-            # Scale the data
-            scaled_data = self.scalers[window_key].fit_transform(data_array)
+            # Inline fits use the windows' storage directly; pool workers get
+            # a snapshot since the windows keep filling while they run
+            data_arrays = [self.data_windows[window_key].view() for window_key in windows]
+            if self.retrain_executor != "inline":
+                data_arrays = [data_array.copy() for data_array in data_arrays]
+            algorithm = self.algorithm
+            fleet = model_key not in self.data_windows  # Window-scope models share their window's key
             
-            # Train the model
-            model = self.models[window_key]
-            if self.algorithm == "local_outlier_factor":
-                # LOF doesn't have fit method, it's used differently
-                pass
+            if fleet:
+                fit, args = _fit_fleet, (self._create_model(), data_arrays)
             else:
-                model.fit(scaled_data)
+                fit, args = _fit_window, (self._create_model(), data_arrays[0])
+            
+            started = time.perf_counter()
+            try:
+                if self.retrain_executor == "inline":
+                    scalers, model = fit(*args)
+                else:
+                    loop = asyncio.get_running_loop()
+                    scalers, model = await loop.run_in_executor(self._get_executor(), fit, *args)
+            except Exception as e:
+                logger.error(f"Error retraining model for {model_key}: {e}")
+                self.stats["failed_retrains"] += 1
+                self.next_retrain[model_key] = self.clock.now() + timedelta(seconds=self.retrain_interval)
+                return
+            latency = time.perf_counter() - started
             
-            logger.debug(f"Retrained model for {window_key}")
+            # Drop results trained for a replaced algorithm or a removed model
+            if algorithm != self.algorithm or model_key not in self.models:
+                return
             
-        except Exception as e:
-            logger.error(f"Error retraining model for {window_key}: {e}")
+            # Swap in the scalers and model together; scoring never sees a mix
+            if not fleet:
+                scalers = [scalers]
+            for window_key, scaler in zip(windows, scalers):
+                self.scalers[window_key] = scaler
+                self.trained_windows.add(window_key)
+            first_fit = model_key not in self.trained_models
+            self.models[model_key] = model
+            self.trained_models.add(model_key)
+            
+            now = self.clock.now()
+            self.last_retrain[model_key] = now
+            self.next_retrain[model_key] = now + timedelta(seconds=self._retrain_delay(model_key, first_fit))
+            
+            self.stats["model_retrains"] += 1
+            self.stats["retrain_time_total"] += latency
+            self.stats["max_retrain_latency"] = max(self.stats["max_retrain_latency"], latency)
+            
+            logger.debug(f"Retrained model for {model_key} on {len(windows)} window(s) in {latency * 1000:.1f}ms")
+            
+        finally:
+            if self._retrain_tasks.get(model_key) is asyncio.current_task():
+                del self._retrain_tasks[model_key]
+    
+    def _retrain_delay(self, model_key: str, first_fit: bool) -> float:
+        """Get the delay until a model's next retrain.
+        
+        Windows usually fill up together, so the first delay is stretched by
+        a per-model fraction of the interval to spread later retrains out.
+        
+        Args:
+            model_key: Key of the model
+            first_fit: Whether the model has just been trained for the first time
+            
+        Returns:
+            Delay in simulated seconds
+        """
+        if not (first_fit and self.stagger_retrains):
+            return self.retrain_interval
+        
+        phase = zlib.crc32(model_key.encode()) / 2**32
+        return self.retrain_interval * (1.0 + phase)
+    
+    def _get_executor(self) -> Executor:
+        """Get the executor used for retraining, creating it on first use.
+        
+        Returns:
+            Process or thread pool executor
+        """
+        if self._executor is None:
+            if self.retrain_executor == "thread":
+                self._executor = ThreadPoolExecutor(max_workers=self.retrain_workers)
+            else:
+                self._executor = ProcessPoolExecutor(max_workers=self.retrain_workers)
+        return self._executor
     
     async def _detect_anomaly(self, window_key: str, features: Dict[str, float]) -> tuple[float, bool]:
         """Detect anomaly in the given features.
@@ -338,48 +597,66 @@ class AnomalyDetector:
         Returns:
             Tuple of (anomaly_score, is_anomaly)
         """
+        return (await self._detect_anomalies(window_key, [list(features.values())]))[0]
+    
+    async def _detect_anomalies(self, window_key: str,
+                                feature_rows: List[Sequence[float]]) -> List[Tuple[float, bool]]:
+        """Detect anomalies for several samples of one window at once.
+        
+        Args:
+            window_key: Key for the data window
+            feature_rows: Feature values of each sample, in the window's column order
+            
+        Returns:
+            List of (anomaly_score, is_anomaly) tuples, one per sample
+        """
         try:
             # Convert features to array
-            feature_array = np.array([list(features.values())]).reshape(1, -1)
+            feature_array = np.array(feature_rows, dtype=np.float32)
+            
+            # Get model and make prediction
+            model = self.models[self.model_keys[window_key]]
+            
+            if isinstance(model, StreamingDetector):
+                # Scores are already in [0, 1]; the model learns as it scores
+                anomaly_scores = model.score_learn(feature_array)
+                is_anomaly = anomaly_scores > self.threshold
+                return list(zip(anomaly_scores.tolist(), is_anomaly.tolist()))
             
             # Scale the features
             scaled_features = self.scalers[window_key].transform(feature_array)
             
-            # Get model and make prediction
-            model = self.models[window_key]
-            
-            if self.algorithm == "isolation_forest":
-                anomaly_score = model.decision_function(scaled_features)[0]
-                is_anomaly = model.predict(scaled_features)[0] == -1
-            elif self.algorithm == "one_class_svm":
-                anomaly_score = model.decision_function(scaled_features)[0]
-                is_anomaly = model.predict(scaled_features)[0] == -1
+            if self.algorithm in ("isolation_forest", "one_class_svm"):
+                # predict() is just decision_function() < 0; avoid a second model pass
+                anomaly_scores = model.decision_function(scaled_features)
+                flagged = anomaly_scores < 0
             elif self.algorithm == "local_outlier_factor":
-                anomaly_score = model.score_samples(scaled_features)[0]
-                is_anomaly = model.fit_predict(scaled_features)[0] == -1
+                # score_samples() is the negated LOF; decision_function() only
+                # shifts it by the fitted offset, so one neighbor query suffices
+                anomaly_scores = model.score_samples(scaled_features)
+                flagged = anomaly_scores < model.offset_
             else:
-                anomaly_score = 0.0
-                is_anomaly = False
+                return [(0.0, False)] * len(feature_rows)
             
             # Normalize anomaly score to 0-1 range
             if self.algorithm == "isolation_forest":
                 # IsolationForest: higher score = more normal
-                anomaly_score = max(0, min(1, (anomaly_score + 0.5) / 1.0))
+                anomaly_scores = np.clip((anomaly_scores + 0.5) / 1.0, 0, 1)
             elif self.algorithm == "one_class_svm":
                 # OneClassSVM: higher score = more normal
-                anomaly_score = max(0, min(1, (anomaly_score + 1.0) / 2.0))
+                anomaly_scores = np.clip((anomaly_scores + 1.0) / 2.0, 0, 1)
             elif self.algorithm == "local_outlier_factor":
-                # LOF: lower score = more anomalous
-                anomaly_score = max(0, min(1, -anomaly_score))
+                # LOF is ~1 for inliers and grows with isolation; 2 maps to 0.5
+                anomaly_scores = np.clip(1.0 + 1.0 / np.minimum(anomaly_scores, -1.0), 0, 1)
             
             # Apply threshold
-            is_anomaly = is_anomaly or anomaly_score > self.threshold
+            is_anomaly = flagged | (anomaly_scores > self.threshold)
             
-            return anomaly_score, is_anomaly
+            return list(zip(anomaly_scores.tolist(), is_anomaly.tolist()))
             
         except Exception as e:
             logger.error(f"Error detecting anomaly: {e}")
-            return 0.0, False
+            return [(0.0, False)] * len(feature_rows)
     
     def _calculate_confidence(self, window_key: str, anomaly_score: float) -> float:
         """Calculate confidence in the anomaly detection result.
@@ -400,7 +677,7 @@ class AnomalyDetector:
         
         return (size_confidence + score_confidence) / 2
     
-    async def _handle_anomaly(self, result: AnomalyDetectionResult, telemetry_data: TelemetryData) -> None:
+    async def _handle_anomaly(self, result: AnomalyDetectionResult, telemetry_data: TelemetryRecord) -> None:
         """Handle detected anomaly.
         
         Args:
@@ -448,10 +725,23 @@ class AnomalyDetector:
         """
         stats = self.stats.copy()
         stats["data_windows"] = len(self.data_windows)
+        stats["window_memory_bytes"] = sum(window.nbytes for window in self.data_windows.values())
         stats["models"] = len(self.models)
         stats["enabled"] = self.enabled
         stats["algorithm"] = self.algorithm
         stats["threshold"] = self.threshold
+        stats["pending_samples"] = len(self._pending)
+        stats["feature_plans"] = len(self.feature_compiler.plans)
+        stats["feature_fallbacks"] = sum(plan.fallbacks for plan in self.feature_compiler.plans.values())
+        stats["retrain_queue_depth"] = len(self._retrain_tasks)
+        stats["trained_windows"] = len(self.trained_windows)
+        stats["model_scope"] = self.model_scope
+        stats["average_retrain_latency"] = (
+            stats["retrain_time_total"] / stats["model_retrains"] if stats["model_retrains"] else 0.0
+        )
+        stats["average_batch_size"] = (
+            stats["batched_samples"] / stats["batches_processed"] if stats["batches_processed"] else 0.0
+        )
         
         return stats
     
@@ -464,22 +754,24 @@ class AnomalyDetector:
         if "enabled" in config_updates:
             self.enabled = config_updates["enabled"]
         
-        if "algorithm" in config_updates:
-            self.algorithm = config_updates["algorithm"]
-            # Recreate all models with new algorithm
-            for window_key in self.models.keys():
-                self.models[window_key] = self._create_model()
+        if "model_scope" in config_updates:
+            self.model_scope = config_updates["model_scope"]
+        
+        if "algorithm" in config_updates or "model_scope" in config_updates:
+            self.algorithm = config_updates.get("algorithm", self.algorithm)
+            # Recreate all models with new algorithm and scope
+            self.model_keys = {window_key: self._model_key(window_key) for window_key in self.data_windows}
+            self.models = {model_key: self._create_model() for model_key in set(self.model_keys.values())}
+            self.trained_models.clear()
+            self.trained_windows.clear()
         
         if "threshold" in config_updates:
             self.threshold = config_updates["threshold"]
         
         if "window_size" in config_updates:
             new_window_size = config_updates["window_size"]
-            for window_key in self.data_windows.keys():
-                old_window = self.data_windows[window_key]
-                new_window = deque(maxlen=new_window_size)
-                new_window.extend(old_window)
-                self.data_windows[window_key] = new_window
+            for window in self.data_windows.values():
+                window.resize(new_window_size)
             self.window_size = new_window_size
         
         logger.info(f"Updated anomaly detection configuration: {config_updates}")
@@ -491,6 +783,20 @@ class AnomalyDetector:
     
     async def stop(self) -> None:
         """Stop the anomaly detection system."""
+        # Score whatever is still queued so no caller is left waiting
+        self._flush_pending()
+        if self._scorer is not None:
+            await asyncio.gather(self._scorer, return_exceptions=True)
+        
+        # Abandon queued retrains; the current models stay in place
+        for task in list(self._retrain_tasks.values()):
+            task.cancel()
+        if self._retrain_tasks:
+            await asyncio.gather(*self._retrain_tasks.values(), return_exceptions=True)
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        
         self.enabled = False
         logger.info("Anomaly detection system stopped")
     
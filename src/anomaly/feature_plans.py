@@ -0,0 +1,256 @@
+"""Compiled feature extraction plans for anomaly detection."""
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from loguru import logger
+
+
+# (feature name, path into the telemetry data, reducer); a "*" path element
+# iterates over the values of a dict and the reducer ("sum" or "mean")
+# combines the per-item values
+FeatureSpec = Tuple[str, Tuple[str, ...], Optional[str]]
+
+# Paths of the configurable common features, walked key by key
+COMMON_FEATURE_PATHS: Dict[str, Tuple[str, ...]] = {
+    "cpu_usage": ("system", "cpu_usage"),
+    "memory_usage": ("system", "memory_usage"),
+    "temperature": ("temperature", "battery", "temperature", "motors", "motor_1", "temperature"),
+    "voltage": ("voltage", "battery", "voltage", "motors", "motor_1", "voltage"),
+    "current": ("current", "battery", "current", "motors", "motor_1", "current"),
+    "altitude": ("position", "altitude", "altitude"),
+    "speed": ("velocity", "speed", "speed"),
+    "battery_level": ("battery", "state_of_charge", "remaining_capacity")
+}
+
+# Subsystem-specific features
+SUBSYSTEM_FEATURES: Dict[str, List[FeatureSpec]] = {
+    "Navigation": [
+        ("latitude", ("position", "latitude"), None),
+        ("longitude", ("position", "longitude"), None),
+        ("altitude", ("position", "altitude"), None),
+        ("heading", ("attitude", "heading"), None),
+        ("roll", ("attitude", "roll"), None),
+        ("pitch", ("attitude", "pitch"), None)
+    ],
+    "Propulsion": [
+        ("total_thrust", ("motors", "*", "thrust"), "sum"),
+        ("avg_motor_temp", ("motors", "*", "temperature"), "mean")
+    ],
+    "Power": [
+        ("battery_voltage", ("battery", "voltage"), None),
+        ("battery_current", ("battery", "current"), None),
+        ("battery_soc", ("battery", "state_of_charge"), None)
+    ],
+    "Communication": [
+        ("rssi", ("radio", "rssi"), None),
+        ("snr", ("radio", "snr"), None),
+        ("packet_loss", ("radio", "packet_loss"), None)
+    ],
+    "Sensor_Fusion": [
+        ("gps_accuracy", ("gps", "accuracy"), None),
+        ("gps_hdop", ("gps", "hdop"), None),
+        ("gps_satellites", ("gps", "satellites"), None),
+        ("baro_altitude", ("barometer", "altitude"), None),
+        ("imu_accel_z", ("imu", "accelerometer", "z"), None),
+        ("fusion_confidence", ("fusion_output", "confidence"), None)
+    ]
+}
+
+
+class FeaturePlan:
+    """Precompiled extractor for the features of one subsystem.
+    
+    The plan fixes the column order once and compiles all accessors into a
+    single function, so extracting a sample is one call with plain indexing
+    instead of a dictionary walk per feature.
+    """
+    
+    def __init__(self, subsystem: str, specs: Iterable[FeatureSpec]):
+        """Initialize feature plan.
+        
+        Args:
+            subsystem: Subsystem the plan extracts features for
+            specs: Feature specifications in column order
+        """
+        self.subsystem = subsystem
+        self.specs = list(specs)
+        self.columns = tuple(name for name, _, _ in self.specs)
+        self.fallbacks = 0
+        self._extract = _compile(subsystem, self.specs)
+    
+    def __len__(self) -> int:
+        return len(self.columns)
+    
+    def extract(self, data: Dict[str, Any]) -> Tuple[float, ...]:
+        """Extract a feature row from telemetry data.
+        
+        Samples that do not fit the compiled layout (missing keys, None
+        values) fall back to a tolerant walk that fills gaps with 0.0, so
+        every row has the same columns.
+        
+        Args:
+            data: Telemetry data dictionary
+            
+        Returns:
+            Feature values in column order
+        """
+        try:
+            return self._extract(data)
+        except (KeyError, TypeError, ValueError, AttributeError, ZeroDivisionError):
+            self.fallbacks += 1
+            return tuple(_evaluate(data, path, reducer) for _, path, reducer in self.specs)
+    
+    def to_dict(self, row: Tuple[float, ...]) -> Dict[str, float]:
+        """Label a feature row with its column names.
+        
+        Args:
+            row: Feature values in column order
+            
+        Returns:
+            Dictionary of feature names and values
+        """
+        return dict(zip(self.columns, row))
+
+
+class FeaturePlanCompiler:
+    """Builds and caches one FeaturePlan per subsystem."""
+    
+    def __init__(self, common_features: Iterable[str]):
+        """Initialize feature plan compiler.
+        
+        Args:
+            common_features: Names of the common features to extract
+        """
+        self.common_features = list(common_features)
+        self.plans: Dict[str, FeaturePlan] = {}
+    
+    def get_plan(self, subsystem: str, data: Dict[str, Any]) -> FeaturePlan:
+        """Get the plan for a subsystem, compiling it from a sample on first use.
+        
+        Args:
+            subsystem: Name of the subsystem
+            data: Sample telemetry data used to resolve the schema
+            
+        Returns:
+            Feature plan for the subsystem
+        """
+        plan = self.plans.get(subsystem)
+        if plan is None:
+            plan = self.compile(subsystem, data)
+            self.plans[subsystem] = plan
+        return plan
+    
+    def compile(self, subsystem: str, data: Dict[str, Any]) -> FeaturePlan:
+        """Compile a feature plan from a sample of a subsystem's telemetry.
+        
+        Common features are included when their path resolves to a number in
+        the sample; subsystem features when their top-level section exists.
+        Subsystem features override common features of the same name.
+        
+        Args:
+            subsystem: Name of the subsystem
+            data: Sample telemetry data
+            
+        Returns:
+            Compiled feature plan
+        """
+        specs: List[FeatureSpec] = []
+        positions: Dict[str, int] = {}
+        
+        for name in self.common_features:
+            path = COMMON_FEATURE_PATHS.get(name)
+            if path is None or _lookup(data, path) is None:
+                continue
+            positions[name] = len(specs)
+            specs.append((name, path, None))
+        
+        for spec in SUBSYSTEM_FEATURES.get(subsystem, []):
+            name, path, _ = spec
+            if path[0] not in data:
+                continue
+            if name in positions:
+                specs[positions[name]] = spec
+            else:
+                positions[name] = len(specs)
+                specs.append(spec)
+        
+        plan = FeaturePlan(subsystem, specs)
+        logger.debug(f"Compiled feature plan for {subsystem}: {plan.columns}")
+        return plan
+
+
+def _lookup(data: Any, path: Tuple[str, ...]) -> Optional[float]:
+    """Walk a plain path and convert the value found to float.
+    
+    Args:
+        data: Telemetry data dictionary
+        path: Keys to follow
+        
+    Returns:
+        Feature value or None if not found
+    """
+    for key in path:
+        if isinstance(data, dict) and key in data:
+            data = data[key]
+        else:
+            return None
+    
+    try:
+        return float(data)
+    except (ValueError, TypeError):
+        return None
+
+
+def _evaluate(data: Any, path: Tuple[str, ...], reducer: Optional[str]) -> float:
+    """Evaluate one feature spec without assuming the sample's layout.
+    
+    Args:
+        data: Telemetry data dictionary
+        path: Keys to follow, optionally containing one "*"
+        reducer: How to combine per-item values ("sum" or "mean")
+        
+    Returns:
+        Feature value, or 0.0 where the data is missing
+    """
+    if "*" not in path:
+        value = _lookup(data, path)
+        return value if value is not None else 0.0
+    
+    split = path.index("*")
+    container = data
+    for key in path[:split]:
+        container = container.get(key) if isinstance(container, dict) else None
+    if not isinstance(container, dict) or not container:
+        return 0.0
+    
+    values = [_evaluate(item, path[split + 1:], None) for item in container.values()]
+    total = sum(values)
+    return total / len(values) if reducer == "mean" else total
+
+
+def _expression(path: Tuple[str, ...], reducer: Optional[str]) -> str:
+    """Build the Python expression that reads one feature from ``data``."""
+    if "*" not in path:
+        return "data" + "".join(f"[{key!r}]" for key in path)
+    
+    split = path.index("*")
+    container = "data" + "".join(f"[{key!r}]" for key in path[:split])
+    item = "item" + "".join(f"[{key!r}]" for key in path[split + 1:])
+    total = f"sum({item} for item in {container}.values())"
+    return f"{total} / len({container})" if reducer == "mean" else total
+
+
+def _compile(subsystem: str, specs: List[FeatureSpec]):
+    """Compile feature specs into a single extraction function.
+    
+    Args:
+        subsystem: Subsystem name, used in the code object's filename
+        specs: Feature specifications in column order
+        
+    Returns:
+        Function mapping telemetry data to a tuple of floats
+    """
+    values = "".join(f"float({_expression(path, reducer)}), " for _, path, reducer in specs)
+    source = f"def extract(data):\n    return ({values})\n"
+    namespace: Dict[str, Any] = {}
+    exec(compile(source, f"<feature plan {subsystem}>", "exec"), namespace)
+    return namespace["extract"]
@@ -0,0 +1,89 @@
+"""Fixed-size NumPy ring buffer for anomaly detection data windows."""
+
+import numpy as np
+from typing import Sequence, Tuple
+
+
+class RingBuffer:
+    """Preallocated 2-D ring buffer holding the latest samples of a window.
+    
+    Rows are written in place into one contiguous float32 array, so appending
+    is O(1) and never allocates. Once full, the oldest row is overwritten.
+    """
+    
+    def __init__(self, capacity: int, columns: Sequence[str], dtype: type = np.float32):
+        """Initialize ring buffer.
+        
+        Args:
+            capacity: Maximum number of rows kept
+            columns: Column names, fixing the column order
+            dtype: Element type of the buffer
+        """
+        if capacity <= 0:
+            raise ValueError("Ring buffer capacity must be positive")
+        
+        self.columns: Tuple[str, ...] = tuple(columns)
+        self._data = np.zeros((capacity, len(self.columns)), dtype=dtype)
+        self._next = 0
+        self._count = 0
+    
+    def __len__(self) -> int:
+        return self._count
+    
+    @property
+    def capacity(self) -> int:
+        """Maximum number of rows kept."""
+        return self._data.shape[0]
+    
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the buffer's storage."""
+        return self._data.nbytes
+    
+    def append(self, row: Sequence[float]) -> None:
+        """Append a row, overwriting the oldest one when full.
+        
+        Args:
+            row: Values in column order
+        """
+        self._data[self._next] = row
+        self._next = (self._next + 1) % self.capacity
+        if self._count < self.capacity:
+            self._count += 1
+    
+    def view(self) -> np.ndarray:
+        """Get the stored rows without copying.
+        
+        Rows are in storage order, not arrival order, once the buffer has
+        wrapped; that is fine for fitting models, which ignore row order. The
+        view is overwritten by later appends.
+        
+        Returns:
+            Array of shape (len(self), len(self.columns))
+        """
+        return self._data[:self._count]
+    
+    def ordered(self) -> np.ndarray:
+        """Get a copy of the stored rows from oldest to newest.
+        
+        Returns:
+            Array of shape (len(self), len(self.columns))
+        """
+        if self._count < self.capacity:
+            return self._data[:self._count].copy()
+        return np.concatenate((self._data[self._next:], self._data[:self._next]))
+    
+    def resize(self, capacity: int) -> None:
+        """Change the capacity, keeping the most recent rows.
+        
+        Args:
+            capacity: New maximum number of rows
+        """
+        if capacity <= 0:
+            raise ValueError("Ring buffer capacity must be positive")
+        
+        rows = self.ordered()[-capacity:]
+        self._data = np.zeros((capacity, len(self.columns)), dtype=self._data.dtype)
+        self._data[:len(rows)] = rows
+        self._count = len(rows)
+        self._next = self._count % capacity
@@ -0,0 +1,340 @@
+"""Streaming anomaly detectors that learn one sample at a time."""
+
+import numpy as np
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import Dict, Optional, Tuple, Type
+
+
+class StreamingDetector(ABC):
+    """Base class for incremental anomaly detectors.
+    
+    Each sample is scored against the state learned so far and then folded
+    into that state, so the detector adapts continuously and never needs a
+    batch refit. Scores are in [0, 1], higher meaning more anomalous.
+    """
+    
+    def __init__(self, warmup: int = 10):
+        """Initialize streaming detector.
+        
+        Args:
+            warmup: Samples to learn from before scores are reported
+        """
+        self.warmup = warmup
+        self.samples_seen = 0
+    
+    def score_learn(self, rows: np.ndarray) -> np.ndarray:
+        """Score samples in arrival order, learning from each one after scoring it.
+        
+        Args:
+            rows: Samples, one row per sample
+            
+        Returns:
+            Anomaly score of each sample
+        """
+        rows = np.asarray(rows, dtype=np.float64)
+        if self.samples_seen == 0:
+            self._initialize(rows.shape[1])
+        
+        scores = np.zeros(len(rows))
+        for index, sample in enumerate(self._prepare(rows)):
+            if self.samples_seen >= self.warmup:
+                scores[index] = self._score(sample)
+            self._learn(sample)
+            self.samples_seen += 1
+        return scores
+    
+    def _prepare(self, rows: np.ndarray) -> np.ndarray:
+        """Precompute whatever can be done for a whole batch at once.
+        
+        Args:
+            rows: Samples, one row per sample
+            
+        Returns:
+            Per-sample inputs for _score and _learn
+        """
+        return rows
+    
+    @abstractmethod
+    def _initialize(self, n_features: int) -> None:
+        """Allocate state for the given number of features."""
+        pass
+    
+    @abstractmethod
+    def _score(self, sample: np.ndarray) -> float:
+        """Score one prepared sample against the current state."""
+        pass
+    
+    @abstractmethod
+    def _learn(self, sample: np.ndarray) -> None:
+        """Fold one prepared sample into the current state."""
+        pass
+
+
+def _z_to_score(z: float, z_scale: float) -> float:
+    """Map a z-score magnitude onto [0, 1); z == z_scale maps to 0.5."""
+    return z / (z + z_scale)
+
+
+class WelfordZScore(StreamingDetector):
+    """Running mean/variance (Welford's algorithm) z-score detector.
+    
+    A sample's score comes from its largest per-feature deviation from the
+    running mean, in running standard deviations.
+    """
+    
+    def __init__(self, z_scale: float = 1.0, warmup: int = 10):
+        """Initialize z-score detector.
+        
+        Args:
+            z_scale: Deviation (in standard deviations) that scores 0.5
+            warmup: Samples to learn from before scores are reported
+        """
+        super().__init__(warmup)
+        self.z_scale = z_scale
+        self.mean: Optional[np.ndarray] = None
+        self.m2: Optional[np.ndarray] = None
+    
+    def _initialize(self, n_features: int) -> None:
+        self.mean = np.zeros(n_features)
+        self.m2 = np.zeros(n_features)
+    
+    def _score(self, row: np.ndarray) -> float:
+        std = np.sqrt(self.m2 / max(self.samples_seen - 1, 1))
+        z = np.abs(row - self.mean) / np.maximum(std, 1e-9)
+        return _z_to_score(float(z.max()), self.z_scale)
+    
+    def _learn(self, row: np.ndarray) -> None:
+        delta = row - self.mean
+        self.mean += delta / (self.samples_seen + 1)
+        self.m2 += delta * (row - self.mean)
+
+
+class EWMAChart(StreamingDetector):
+    """Exponentially weighted moving average control chart.
+    
+    Tracks an exponentially weighted mean and variance per feature, so the
+    baseline follows slow drift (battery drain, climbing) while sudden
+    deviations still stand out.
+    """
+    
+    def __init__(self, alpha: float = 0.05, z_scale: float = 1.0, warmup: int = 10):
+        """Initialize EWMA chart.
+        
+        Args:
+            alpha: Weight of the newest sample in the moving averages
+            z_scale: Deviation (in standard deviations) that scores 0.5
+            warmup: Samples to learn from before scores are reported
+        """
+        super().__init__(warmup)
+        self.alpha = alpha
+        self.z_scale = z_scale
+        self.mean: Optional[np.ndarray] = None
+        self.variance: Optional[np.ndarray] = None
+    
+    def _initialize(self, n_features: int) -> None:
+        self.mean = np.zeros(n_features)
+        self.variance = np.zeros(n_features)
+    
+    def _score(self, row: np.ndarray) -> float:
+        z = np.abs(row - self.mean) / np.maximum(np.sqrt(self.variance), 1e-9)
+        return _z_to_score(float(z.max()), self.z_scale)
+    
+    def _learn(self, row: np.ndarray) -> None:
+        if self.samples_seen == 0:
+            self.mean[:] = row
+            return
+        delta = row - self.mean
+        self.mean += self.alpha * delta
+        self.variance = (1 - self.alpha) * (self.variance + self.alpha * delta * delta)
+
+
+class HalfSpaceTrees(StreamingDetector):
+    """Streaming half-space trees ensemble (Tan, Ting & Liu, 2011).
+    
+    Random complete binary trees split the (normalized) feature space; each
+    node counts how many samples of the current window fall into it. Counts
+    from the previous window act as the reference profile: samples landing
+    in sparsely populated regions score high. All trees are walked together
+    as arrays, so a sample costs O(depth) vectorized steps.
+    """
+    
+    def __init__(self, n_trees: int = 25, depth: int = 8, window: int = 250,
+                 size_limit: float = 0.1, z_scale: float = 1.0, seed: Optional[int] = 42):
+        """Initialize half-space trees.
+        
+        Args:
+            n_trees: Number of trees in the ensemble
+            depth: Depth of each tree
+            window: Samples per reference window
+            size_limit: Fraction of the window below which a node's mass
+                stops the walk
+            z_scale: Drop in log mass (in standard deviations) that scores 0.5
+            seed: Seed for the random tree structure
+        """
+        super().__init__(warmup=window)
+        self.n_trees = n_trees
+        self.depth = depth
+        self.window = window
+        self.size_limit = size_limit * window
+        self.z_scale = z_scale
+        self.seed = seed
+        
+        # Node masses never exceed the window size
+        n_nodes = 2 ** (depth + 1) - 1
+        mass_type = np.uint16 if window < 2 ** 16 else np.uint32
+        self.reference_mass = np.zeros((n_trees, n_nodes), dtype=mass_type)
+        self.latest_mass = np.zeros((n_trees, n_nodes), dtype=mass_type)
+        self._trees = np.arange(n_trees)
+        self._depth_weights = 2.0 ** np.arange(depth + 1)
+        
+        # Features are normalized with running statistics before the walk,
+        # and raw scores are judged against the running log-mass statistics
+        self._stats = WelfordZScore()
+        self._mass_stats = WelfordZScore()
+        self._mass_stats._initialize(1)
+    
+    def _initialize(self, n_features: int) -> None:
+        if self.seed is None:
+            structure = _build_half_spaces(self.n_trees, self.depth, n_features, None)
+        else:
+            structure = _shared_half_spaces(self.n_trees, self.depth, n_features, self.seed)
+        self.split_dims, self.split_values = structure
+        self._stats._initialize(n_features)
+    
+    def _normalize(self, rows: np.ndarray) -> np.ndarray:
+        """Map samples onto the unit cube; +-4 standard deviations span it.
+        
+        Values are not clipped: the trees' work spaces extend past the cube,
+        so splits beyond it can still isolate extreme samples.
+        """
+        stats = self._stats
+        std = np.sqrt(stats.m2 / max(stats.samples_seen - 1, 1))
+        z = (rows - stats.mean) / np.maximum(std, 1e-9)
+        return 0.5 + z / 8.0
+    
+    def _prepare(self, rows: np.ndarray) -> np.ndarray:
+        """Walk a whole batch through every tree at once.
+        
+        Samples are normalized with the running statistics from before the
+        batch, which are then updated with the batch. The first batch has no
+        statistics before it, so it seeds them and is normalized with them.
+        
+        Returns:
+            Node indices of shape (len(rows), depth + 1, n_trees)
+        """
+        seeding = self._stats.samples_seen == 0
+        if seeding:
+            for row in rows:
+                self._stats._learn(row)
+                self._stats.samples_seen += 1
+        
+        points = self._normalize(rows)
+        nodes = np.zeros((len(rows), self.n_trees), dtype=np.int64)
+        paths = [nodes]
+        for _ in range(self.depth):
+            dims = self.split_dims[self._trees, nodes]
+            go_right = np.take_along_axis(points, dims, axis=1) >= self.split_values[self._trees, nodes]
+            nodes = 2 * nodes + 1 + go_right
+            paths.append(nodes)
+        
+        if not seeding:
+            for row in rows:
+                self._stats._learn(row)
+                self._stats.samples_seen += 1
+        
+        return np.stack(paths, axis=1)
+    
+    def _score(self, path: np.ndarray) -> float:
+        mass = self.reference_mass[self._trees, path]
+        
+        # Each tree stops at the first node whose mass is below the size limit
+        below = mass < self.size_limit
+        terminal = np.where(below.any(axis=0), below.argmax(axis=0), self.depth)
+        raw = mass[terminal, self._trees] * self._depth_weights[terminal]
+        
+        # Averaging log mass per tree lets the trees that isolate a sample
+        # (mass 0) pull its score down sharply. Only unusually low mass is
+        # anomalous, so the z-score is one-sided.
+        log_mass = np.array([np.log1p(raw).mean()])
+        stats = self._mass_stats
+        score = 0.0
+        if stats.samples_seen > 1:
+            std = np.sqrt(stats.m2[0] / (stats.samples_seen - 1))
+            z = max(0.0, (stats.mean[0] - log_mass[0]) / max(std, 1e-9))
+            score = _z_to_score(z, self.z_scale)
+        stats._learn(log_mass)
+        stats.samples_seen += 1
+        return score
+    
+    def _learn(self, path: np.ndarray) -> None:
+        self.latest_mass[self._trees, path] += 1
+        
+        # Window boundary: the window just filled becomes the reference
+        if (self.samples_seen + 1) % self.window == 0:
+            self.reference_mass, self.latest_mass = self.latest_mass, self.reference_mass
+            self.latest_mass[:] = 0
+
+
+def _build_half_spaces(n_trees: int, depth: int, n_features: int,
+                       seed: Optional[int]) -> Tuple[np.ndarray, np.ndarray]:
+    """Build the random split structure of a half-space trees ensemble.
+    
+    Each inner node splits a randomly chosen dimension at the middle of the
+    node's range; every tree works in a randomly perturbed copy of the unit
+    cube, as in the original paper.
+    
+    Args:
+        n_trees: Number of trees
+        depth: Depth of each tree
+        n_features: Number of features
+        seed: Seed for the random structure
+        
+    Returns:
+        Tuple of (split dimensions, split values), each (n_trees, inner nodes)
+    """
+    rng = np.random.default_rng(seed)
+    n_inner = 2 ** depth - 1
+    trees = np.arange(n_trees)
+    
+    split_dims = rng.integers(0, n_features, size=(n_trees, n_inner))
+    centers = rng.random((n_trees, n_features))
+    spans = 2 * np.maximum(centers, 1 - centers)
+    
+    split_values = np.zeros((n_trees, n_inner))
+    bounds_low = np.repeat((centers - spans)[:, None, :], n_inner, axis=1)
+    bounds_high = np.repeat((centers + spans)[:, None, :], n_inner, axis=1)
+    for node in range(n_inner):
+        dims = split_dims[:, node]
+        split_values[:, node] = (bounds_low[trees, node, dims] + bounds_high[trees, node, dims]) / 2
+        for child, side in ((2 * node + 1, "left"), (2 * node + 2, "right")):
+            if child >= n_inner:
+                continue
+            bounds_low[:, child] = bounds_low[:, node]
+            bounds_high[:, child] = bounds_high[:, node]
+            if side == "left":
+                bounds_high[trees, child, dims] = split_values[:, node]
+            else:
+                bounds_low[trees, child, dims] = split_values[:, node]
+    
+    split_dims.flags.writeable = False
+    split_values.flags.writeable = False
+    return split_dims, split_values
+
+
+@lru_cache(maxsize=None)
+def _shared_half_spaces(n_trees: int, depth: int, n_features: int,
+                        seed: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Build a seeded split structure once and share it between detectors.
+    
+    Only the mass counters differ between windows, so sharing the read-only
+    structure keeps per-window memory down to the counters.
+    """
+    return _build_half_spaces(n_trees, depth, n_features, seed)
+
+
+STREAMING_ALGORITHMS: Dict[str, Type[StreamingDetector]] = {
+    "zscore": WelfordZScore,
+    "ewma": EWMAChart,
+    "half_space_trees": HalfSpaceTrees
+}
@@ -10,22 +10,42 @@ import dash_bootstrap_components as dbc
 import plotly.graph_objs as go
 import plotly.express as px
 from plotly.subplots import make_subplots
+import numpy as np
 import pandas as pd
 
+from ..monitoring.telemetry_ring import TelemetryRing
+from ..storage.query_engine import TelemetryQueryEngine
 from ..utils.config import config
-from ..utils.models import TelemetryData, Alert, SeverityLevel
+from ..utils.models import Telemetry, Alert, SeverityLevel
 
 
 class UAVDashboard:
     """Web-based dashboard for UAV simulator."""
     
-    def __init__(self, simulator=None):
+    # Ring features plotted as a record's value, in order of preference
+    PLOT_FEATURES = ("battery_voltage", "altitude", "total_thrust")
+    
+    # Recorded (subsystem, field) charted as telemetry, in order of preference
+    PLOT_FIELDS = (
+        ("Power", "battery.voltage"),
+        ("Navigation", "position.altitude"),
+        ("Propulsion", "overall.total_thrust")
+    )
+    
+    def __init__(self, simulator=None, telemetry_ring: Optional[TelemetryRing] = None,
+                 query_engine: Optional[TelemetryQueryEngine] = None):
         """Initialize dashboard.
         
         Args:
             simulator: UAV simulator instance
+            telemetry_ring: Shared-memory ring to chart telemetry from (by
+                default the configured ring is attached once it exists)
+            query_engine: Query engine over recorded telemetry to chart
+                from (defaults to the simulator's, if it records)
         """
         self.simulator = simulator
+        self.telemetry_ring = telemetry_ring
+        self.query_engine = query_engine or getattr(simulator, "query_engine", None)
         self.app = dash.Dash(
             __name__,
             external_stylesheets=[dbc.themes.BOOTSTRAP],
@@ -37,6 +57,11 @@ class UAVDashboard:
         self.port = config.get("dashboard.port", 8050)
         self.refresh_interval = config.get("dashboard.refresh_interval", 1000)
         self.max_data_points = config.get("dashboard.max_data_points", 1000)
+        self.chart_window = timedelta(seconds=config.get("dashboard.chart_window", 300))
+        self.shared_memory_name = (
+            config.get("dashboard.shared_memory.name", "uav_telemetry")
+            if config.get("dashboard.shared_memory.enabled", False) else None
+        )
         
         # Data storage
         self.telemetry_data: Dict[str, List[Dict]] = {}
@@ -278,8 +303,36 @@ class UAVDashboard:
         def update_telemetry_chart(n):
             """Update telemetry chart."""
             fig = go.Figure()
-            
-            if self.telemetry_data:
+            records = None if self.query_engine is not None else self._ring_records()
+            
+            if self.query_engine is not None:
+                for subsystem, field in self.PLOT_FIELDS:
+                    series = self.query_engine.downsample(field, self.max_data_points, subsystems=[subsystem],
+                                                          **self._recent_window([subsystem]))
+                    if len(series["rows"]):
+                        break
+                for uav_id in np.unique(series["uav_id"]):
+                    rows = series["uav_id"] == uav_id
+                    fig.add_trace(go.Scatter(
+                        x=series["bucket"][rows],
+                        y=series[f"{field}_mean"][rows],
+                        mode='lines',
+                        name=uav_id,
+                        line=dict(width=2)
+                    ))
+            elif records is not None:
+                timestamps = self._ring_timestamps(records)
+                values = self._ring_values(records)
+                for uav_id in np.unique(records["uav_id"]):
+                    rows = records["uav_id"] == uav_id
+                    fig.add_trace(go.Scatter(
+                        x=timestamps[rows],
+                        y=values[rows],
+                        mode='lines',
+                        name=uav_id.decode(),
+                        line=dict(width=2)
+                    ))
+            elif self.telemetry_data:
                 for uav_id, data in self.telemetry_data.items():
                     if data:
                         df = pd.DataFrame(data[-self.max_data_points:])
@@ -307,8 +360,40 @@ class UAVDashboard:
         def update_anomaly_chart(n):
             """Update anomaly detection chart."""
             fig = go.Figure()
+            records = None if self.query_engine is not None else self._ring_records()
             
-            if self.anomaly_data:
+            if self.query_engine is not None:
+                series = self.query_engine.downsample(
+                    "anomaly_score", self.max_data_points, aggregation="max", by=("uav_id", "subsystem"),
+                    **self._recent_window()
+                )
+                keys = np.char.add(np.char.add(series["uav_id"], "_"), series["subsystem"])
+                scored = ~np.isnan(series["anomaly_score_max"])
+                for key in np.unique(keys[scored]):
+                    rows = scored & (keys == key)
+                    fig.add_trace(go.Scatter(
+                        x=series["bucket"][rows],
+                        y=series["anomaly_score_max"][rows],
+                        mode='lines+markers',
+                        name=f"{key} Anomaly Score",
+                        line=dict(width=2),
+                        marker=dict(size=4)
+                    ))
+            elif records is not None:
+                records = records[~np.isnan(records["anomaly_score"])]
+                timestamps = self._ring_timestamps(records)
+                keys = np.char.add(np.char.add(records["uav_id"], b"_"), records["subsystem"])
+                for key in np.unique(keys):
+                    rows = keys == key
+                    fig.add_trace(go.Scatter(
+                        x=timestamps[rows],
+                        y=records["anomaly_score"][rows],
+                        mode='lines+markers',
+                        name=f"{key.decode()} Anomaly Score",
+                        line=dict(width=2),
+                        marker=dict(size=4)
+                    ))
+            elif self.anomaly_data:
                 for uav_id, data in self.anomaly_data.items():
                     if data:
                         df = pd.DataFrame(data[-self.max_data_points:])
@@ -495,12 +580,15 @@ class UAVDashboard:
                     )
             return False
     
-    def add_telemetry_data(self, telemetry_data: TelemetryData) -> None:
+    def add_telemetry_data(self, telemetry_data: Telemetry) -> None:
         """Add telemetry data to dashboard.
         
         Args:
             telemetry_data: Telemetry data to add
         """
+        if self.query_engine is not None:
+            return  # Charted from the recording
+        
         uav_id = telemetry_data.uav_id
         subsystem = telemetry_data.subsystem
         
@@ -567,6 +655,55 @@ class UAVDashboard:
         if len(self.performance_data) > self.max_data_points:
             self.performance_data = self.performance_data[-self.max_data_points:]
     
+    def _recent_window(self, subsystems: Optional[List[str]] = None) -> Dict[str, datetime]:
+        """Get the query time range covering the last chart_window of a recording.
+        
+        Bounding the start lets the query engine skip every older chunk.
+        
+        Args:
+            subsystems: Subsystems to include (None for all)
+            
+        Returns:
+            start/end filters, or none if nothing is recorded yet
+        """
+        bounds = self.query_engine.time_range(subsystems)
+        if bounds is None:
+            return {}
+        return {"start": max(bounds[0], bounds[1] - self.chart_window), "end": bounds[1]}
+    
+    def _ring_records(self) -> Optional[np.ndarray]:
+        """Get the latest records from the shared-memory ring.
+        
+        Returns:
+            Latest records, or None when no ring is available
+        """
+        if self.telemetry_ring is None and self.shared_memory_name:
+            try:
+                self.telemetry_ring = TelemetryRing.attach(self.shared_memory_name)
+            except FileNotFoundError:
+                return None  # The simulator has not created it yet
+        
+        if self.telemetry_ring is None:
+            return None
+        return self.telemetry_ring.latest(self.max_data_points)
+    
+    def _ring_timestamps(self, records: np.ndarray) -> pd.DatetimeIndex:
+        """Convert ring timestamps to local datetimes for plotting."""
+        local_zone = datetime.now().astimezone().tzinfo
+        return pd.to_datetime(records["timestamp"], unit="s", utc=True).tz_convert(local_zone)
+    
+    def _ring_values(self, records: np.ndarray) -> np.ndarray:
+        """Pick one value per ring record for plotting.
+        
+        Mirrors _extract_telemetry_value: battery voltage, then altitude,
+        then total thrust, otherwise 0.0.
+        """
+        values = np.full(len(records), np.nan)
+        for name in self.PLOT_FEATURES:
+            missing = np.isnan(values)
+            values[missing] = self.telemetry_ring.feature(records[missing], name)
+        return np.nan_to_num(values)
+    
     def _extract_telemetry_value(self, data: Dict[str, Any]) -> float:
         """Extract a single value from telemetry data for plotting.
         
@@ -1,7 +1,6 @@
 """Fault injection and failure simulation manager."""
 
 import asyncio
-import random
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional, Callable
 from enum import Enum
@@ -9,6 +8,7 @@ from loguru import logger
 
 from ..utils.models import FaultScenario, Alert, SeverityLevel
 from ..utils.config import config
+from ..utils.clock import SimulationClock, get_clock, create_rng
 
 
 class FaultType(str, Enum):
@@ -98,8 +98,14 @@ class FaultType(str, Enum):
 class FaultManager:
     """Manages fault injection and failure simulation."""
     
-    def __init__(self):
-        """Initialize fault manager."""
+    def __init__(self, clock: Optional[SimulationClock] = None):
+        """Initialize fault manager.
+        
+        Args:
+            clock: Simulation clock (defaults to the shared clock)
+        """
+        self.clock = clock if clock is not None else get_clock()
+        self.rng = create_rng("fault_manager")
         self.enabled = config.get("fault_injection.enabled", True)
         self.max_concurrent_faults = config.get("fault_injection.max_concurrent_faults", 3)
         
@@ -209,8 +215,8 @@ class FaultManager:
             "fault_type": fault_type,
             "parameters": parameters or {},
             "duration": duration or 30,
-            "start_time": datetime.now(),
-            "end_time": datetime.now() + timedelta(seconds=duration or 30),
+            "start_time": self.clock.now(),
+            "end_time": self.clock.now() + timedelta(seconds=duration or 30),
             "severity": self._get_fault_severity(fault_type)
         }
         
@@ -231,6 +237,7 @@ class FaultManager:
         
         # Create alert
         alert = Alert(
+            timestamp=self.clock.now(),
             uav_id=uav_id,
             subsystem=subsystem,
             severity=fault_data["severity"],
@@ -269,11 +276,12 @@ class FaultManager:
         self.stats["active_faults"] = len(self.active_faults)
         
         # Calculate duration
-        duration = (datetime.now() - fault_data["start_time"]).total_seconds()
+        duration = (self.clock.now() - fault_data["start_time"]).total_seconds()
         self._update_average_duration(duration)
         
         # Create alert
         alert = Alert(
+            timestamp=self.clock.now(),
             uav_id=uav_id,
             subsystem=subsystem,
             severity=SeverityLevel.LOW,
@@ -312,15 +320,15 @@ class FaultManager:
                 await self._inject_random_faults()
                 
                 # Wait before next iteration
-                await asyncio.sleep(1.0)
+                await self.clock.sleep(1.0)
                 
             except Exception as e:
                 logger.error(f"Error in fault injection loop: {e}")
-                await asyncio.sleep(5.0)
+                await self.clock.sleep(5.0)
     
     async def _check_expired_faults(self) -> None:
         """Check for and clear expired faults."""
-        now = datetime.now()
+        now = self.clock.now()
         expired_faults = []
         
         for fault_key, fault_data in self.active_faults.items():
@@ -345,9 +353,9 @@ class FaultManager:
                 continue
             
             # Check probability
-            if random.random() < scenario.probability / 1000:  # Convert to per-second probability
+            if self.rng.random() < scenario.probability / 1000:  # Convert to per-second probability
                 # Select random UAV (assuming we have UAVs available)
-                uav_id = f"UAV_{random.randint(1, 5)}"  # This should be dynamic
+                uav_id = f"UAV_{self.rng.randint(1, 5)}"  # This should be dynamic
                 
                 # Inject fault
                 await self.inject_fault(
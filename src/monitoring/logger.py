@@ -1,17 +1,230 @@
 """Advanced logging system for UAV simulator."""
 
+import atexit
 import os
+import queue
 import sys
 import json
+import threading
+import time
+import zipfile
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from loguru import logger
 from loguru._logger import Logger
 
 from ..utils.config import config
 
 
+_STOP = object()
+
+
+class JsonLinesWriter:
+    """Batched JSON-lines log file written from a dedicated thread.
+    
+    Used as a loguru sink or fed directly through ``submit``: the logging
+    call only puts the record on a bounded queue, and the writer thread
+    serializes whole batches and writes each with a single call. When the
+    queue is full the record is dropped and counted instead of blocking
+    the caller.
+    """
+    
+    def __init__(self, path: str, queue_size: int = 65536, batch_size: int = 512,
+                 flush_interval: float = 0.5, rotation_mb: float = 100, retention_days: float = 30,
+                 compression: bool = True):
+        """Initialize the writer.
+        
+        Args:
+            path: Log file to append to
+            queue_size: Records held for the writer before new ones are dropped
+            batch_size: Records written per batch at most
+            flush_interval: Seconds a partial batch waits for more records
+            rotation_mb: Size at which the file is rotated (0 to never rotate)
+            retention_days: Age at which rotated files are deleted (0 to keep them)
+            compression: Whether rotated files are zipped
+        """
+        self.path = Path(path)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_bytes = int(rotation_mb * 2**20)
+        self.retention = retention_days * 86400
+        self.compression = compression
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._thread: Optional[threading.Thread] = None
+        
+        self.stats = {
+            "written": 0,
+            "dropped": 0,
+            "batches": 0,
+            "rotations": 0,
+            "expired": 0,
+            "write_errors": 0
+        }
+    
+    def start(self) -> None:
+        """Start the writer thread."""
+        if self._thread is not None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+    
+    def sink(self, message) -> None:
+        """loguru sink queuing each record for the writer thread.
+        
+        Args:
+            message: Message formatted by loguru, carrying its record
+        """
+        record = message.record
+        self.submit((record["time"].timestamp(), record["level"].name, record["name"], record["function"],
+                     record["line"], str(message).rstrip("\n"), record["extra"]))
+    
+    def submit(self, entry: Tuple) -> bool:
+        """Queue a record without blocking.
+        
+        Args:
+            entry: (epoch seconds, level, module, function, line, message, extra) tuple
+            
+        Returns:
+            False if the queue was full and the record was dropped
+        """
+        try:
+            self._queue.put_nowait(entry)
+        except queue.Full:
+            self.stats["dropped"] += 1
+            return False
+        return True
+    
+    def flush(self) -> None:
+        """Block until every queued record has been written."""
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.join()
+    
+    def close(self) -> None:
+        """Write the remaining records and stop the writer thread."""
+        if self._thread is None:
+            return
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join()
+        self._thread = None
+        atexit.unregister(self.close)
+    
+    def _run(self) -> None:
+        """Writer thread: collect batches and append them to the file."""
+        handle = open(self.path, "a", encoding="utf-8")
+        running = True
+        while running:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size and batch[-1] is not _STOP:
+                try:
+                    batch.append(self._queue.get(timeout=max(deadline - time.monotonic(), 0)))
+                except queue.Empty:
+                    break
+            if batch[-1] is _STOP:
+                running = False
+                batch.pop()
+            
+            try:
+                handle.write("".join(map(self._line, batch)))
+                handle.flush()
+                self.stats["written"] += len(batch)
+                self.stats["batches"] += 1
+                if self.max_bytes and handle.tell() >= self.max_bytes:
+                    handle = self._rotate(handle)
+            except OSError:
+                self.stats["write_errors"] += 1
+            
+            for _ in range(len(batch) + (not running)):
+                self._queue.task_done()
+        handle.close()
+    
+    def _rotate(self, handle):
+        """Move the full log file aside, reopen it and prune old rotated files.
+        
+        Args:
+            handle: Open handle of the full file
+            
+        Returns:
+            Handle of the new, empty file
+        """
+        handle.close()
+        stamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S_%f")
+        rotated = self.path.with_name(f"{self.path.stem}.{stamp}{self.path.suffix}")
+        self.path.rename(rotated)
+        self.stats["rotations"] += 1
+        handle = open(self.path, "a", encoding="utf-8")
+        
+        if self.compression:
+            with zipfile.ZipFile(f"{rotated}.zip", "w", zipfile.ZIP_DEFLATED) as archive:
+                archive.write(rotated, rotated.name)
+            rotated.unlink()
+        if self.retention > 0:
+            expired = time.time() - self.retention
+            for old in self.path.parent.glob(f"{self.path.stem}.*{self.path.suffix}*"):
+                if old.stat().st_mtime < expired:
+                    old.unlink()
+                    self.stats["expired"] += 1
+        return handle
+    
+    @staticmethod
+    def _line(entry: Tuple) -> str:
+        """Serialize a queued record as one compact JSON line."""
+        timestamp, level, module, function, line, message, extra = entry
+        fields = {
+            "time": datetime.fromtimestamp(timestamp).astimezone().isoformat(),
+            "level": level,
+            "source": f"{module}:{function}:{line}",
+            "message": message,
+            **extra
+        }
+        return json.dumps(fields, separators=(",", ":"), default=str) + "\n"
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get writer statistics.
+        
+        Returns:
+            Dictionary containing writer statistics
+        """
+        return {**self.stats, "queued": self._queue.qsize()}
+
+
+class LogSampler:
+    """Keeps 1 in N log records of each configured type."""
+    
+    def __init__(self, rates: Optional[Dict[str, int]] = None):
+        """Initialize the sampler.
+        
+        Args:
+            rates: Log type to N, keeping every Nth record of that type
+        """
+        self.rates = {log_type: int(every) for log_type, every in (rates or {}).items() if every and every > 1}
+        self.seen: Dict[str, int] = {}
+        self.sampled_out: Dict[str, int] = {}
+    
+    def keep(self, log_type: str) -> bool:
+        """Decide whether to log the next record of a type.
+        
+        Args:
+            log_type: Type of the record
+            
+        Returns:
+            True for the first record of the type and every Nth after it
+        """
+        every = self.rates.get(log_type)
+        if every is None:
+            return True
+        seen = self.seen.get(log_type, 0)
+        self.seen[log_type] = seen + 1
+        if seen % every == 0:
+            return True
+        self.sampled_out[log_type] = self.sampled_out.get(log_type, 0) + 1
+        return False
+
+
 class UAVLogger:
     """Advanced logging system for UAV simulator."""
     
@@ -25,6 +238,22 @@ class UAVLogger:
         log_path = Path(self.log_file)
         log_path.parent.mkdir(parents=True, exist_ok=True)
         
+        # Asynchronous JSON-lines file logging and per-type sampling
+        logging_config = config.get("monitoring.logging", {}) or {}
+        self.sampler = LogSampler(logging_config.get("sampling"))
+        self.writer: Optional[JsonLinesWriter] = None
+        if logging_config.get("async", True):
+            self.writer = JsonLinesWriter(
+                self.log_file,
+                queue_size=logging_config.get("queue_size", 65536),
+                batch_size=logging_config.get("batch_size", 512),
+                flush_interval=logging_config.get("flush_interval", 0.5),
+                rotation_mb=logging_config.get("rotation_mb", 100),
+                retention_days=logging_config.get("retention_days", 30),
+                compression=logging_config.get("compression", True)
+            )
+            self.writer.start()
+        
         # Configure loguru
         self._configure_logger()
         
@@ -55,15 +284,20 @@ class UAVLogger:
         )
         
         # Add file handler
-        logger.add(
-            self.log_file,
-            level=self.log_level,
-            format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} | {message}",
-            rotation="100 MB",
-            retention="30 days",
-            compression="zip",
-            encoding="utf-8"
-        )
+        if self.writer is not None:
+            logger.add(self.writer.sink, level=self.log_level, format="{message}")
+            self._direct_telemetry = logger.level(self.log_level).no <= logger.level("INFO").no
+        else:
+            self._direct_telemetry = False
+            logger.add(
+                self.log_file,
+                level=self.log_level,
+                format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} | {message}",
+                rotation="100 MB",
+                retention="30 days",
+                compression="zip",
+                encoding="utf-8"
+            )
         
         # Add error file handler
         error_log_file = str(Path(self.log_file).parent / "errors.log")
@@ -98,6 +332,17 @@ class UAVLogger:
             subsystem: Subsystem name
             data: Telemetry data
         """
+        if not self.sampler.keep("telemetry"):
+            return
+        
+        # Telemetry is the bulk of the log: in async mode it skips loguru and
+        # the console and goes straight to the JSON-lines writer
+        if self._direct_telemetry:
+            self.writer.submit((time.time(), "INFO", __name__, "log_telemetry", sys._getframe().f_lineno,
+                                f"Telemetry: {subsystem} for UAV {uav_id}",
+                                {"uav_id": uav_id, "subsystem": subsystem, "log_type": "telemetry"}))
+            return
+        
         logger.bind(
             uav_id=uav_id,
             subsystem=subsystem,
@@ -114,6 +359,9 @@ class UAVLogger:
             anomaly_score: Anomaly score
             features: Features used for detection
         """
+        if not self.sampler.keep("anomaly"):
+            return
+        
         logger.bind(
             uav_id=uav_id,
             subsystem=subsystem,
@@ -131,6 +379,9 @@ class UAVLogger:
             fault_type: Type of fault
             parameters: Fault parameters
         """
+        if not self.sampler.keep("fault"):
+            return
+        
         logger.bind(
             uav_id=uav_id,
             subsystem=subsystem,
@@ -149,6 +400,9 @@ class UAVLogger:
             message: Alert message
             data: Alert data
         """
+        if not self.sampler.keep("alert"):
+            return
+        
         # Check alert cooldown
         alert_key = f"{uav_id}_{subsystem}_{severity}"
         now = datetime.now()
@@ -179,7 +433,7 @@ class UAVLogger:
             unit: Unit of measurement
             metadata: Additional metadata
         """
-        if not self.enabled:
+        if not self.enabled or not self.sampler.keep("performance"):
             return
         
         metadata = metadata or {}
@@ -202,6 +456,9 @@ class UAVLogger:
             message: Event message
             data: Event data
         """
+        if not self.sampler.keep("system_event"):
+            return
+        
         logger.bind(
             log_type="system_event",
             event_type=event_type
@@ -217,6 +474,9 @@ class UAVLogger:
             target: Target of the action
             data: Action data
         """
+        if not self.sampler.keep("user_action"):
+            return
+        
         logger.bind(
             log_type="user_action",
             user_id=user_id,
@@ -234,6 +494,9 @@ class UAVLogger:
             severity: Event severity
             data: Event data
         """
+        if not self.sampler.keep("security_event"):
+            return
+        
         log_level = "ERROR" if severity == "high" else "WARNING"
         
         logger.bind(
@@ -253,6 +516,9 @@ class UAVLogger:
             response_time: Response time in seconds
             user_id: User identifier (optional)
         """
+        if not self.sampler.keep("api_request"):
+            return
+        
         log_level = "ERROR" if status_code >= 400 else "INFO"
         
         logger.bind(
@@ -274,6 +540,9 @@ class UAVLogger:
             duration: Operation duration in seconds
             success: Whether operation was successful
         """
+        if not self.sampler.keep("database_operation"):
+            return
+        
         log_level = "ERROR" if not success else "INFO"
         
         logger.bind(
@@ -295,6 +564,9 @@ class UAVLogger:
             duration: Operation duration in seconds
             data: Additional data
         """
+        if not self.sampler.keep("external_service"):
+            return
+        
         log_level = "ERROR" if status == "failed" else "INFO"
         
         logger.bind(
@@ -342,10 +614,21 @@ class UAVLogger:
             "log_file_size": log_path.stat().st_size if log_path.exists() else 0,
             "performance_tracking_enabled": self.enabled,
             "alert_cooldown": self.alert_cooldown,
-            "active_alert_cooldowns": len(self.last_alerts)
+            "active_alert_cooldowns": len(self.last_alerts),
+            "async": self.writer is not None,
+            "sampling_rates": dict(self.sampler.rates),
+            "sampled_out": dict(self.sampler.sampled_out)
         }
+        if self.writer is not None:
+            stats["writer"] = self.writer.get_statistics()
         
         return stats
+    
+    def flush(self) -> None:
+        """Wait for queued log records to reach their files."""
+        if self.writer is not None:
+            self.writer.flush()
+        logger.complete()
 
 
 # Global logger instance
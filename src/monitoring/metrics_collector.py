@@ -10,14 +10,20 @@ from loguru import logger
 
 from ..utils.models import PerformanceMetrics, Alert, SeverityLevel
 from ..utils.config import config
+from ..utils.clock import SimulationClock, get_clock
 from .logger import uav_logger
 
 
 class MetricsCollector:
     """Collects and monitors system performance metrics."""
     
-    def __init__(self):
-        """Initialize metrics collector."""
+    def __init__(self, clock: Optional[SimulationClock] = None):
+        """Initialize metrics collector.
+        
+        Args:
+            clock: Simulation clock (defaults to the shared clock)
+        """
+        self.clock = clock if clock is not None else get_clock()
         self.enabled = config.get("monitoring.performance_tracking.enabled", True)
         self.collection_interval = config.get("monitoring.monitoring_interval", 1.0)
         self.retention_period = config.get("monitoring.metrics_retention", 86400)
@@ -93,12 +99,12 @@ class MetricsCollector:
                 await self._send_metrics(metrics)
                 
                 # Wait for next collection
-                await asyncio.sleep(self.collection_interval)
+                await self.clock.sleep(self.collection_interval)
                 
             except Exception as e:
                 logger.error(f"Error in metrics collection: {e}")
                 self.stats["collection_errors"] += 1
-                await asyncio.sleep(self.collection_interval)
+                await self.clock.sleep(self.collection_interval)
     
     async def _collect_metrics(self) -> PerformanceMetrics:
         """Collect system performance metrics.
@@ -131,6 +137,7 @@ class MetricsCollector:
             error_rate = self._calculate_error_rate()
             
             metrics = PerformanceMetrics(
+                timestamp=self.clock.now(),
                 cpu_usage=cpu_usage,
                 memory_usage=memory_usage,
                 disk_usage=disk_usage,
@@ -153,6 +160,7 @@ class MetricsCollector:
             logger.error(f"Error collecting metrics: {e}")
             # Return default metrics
             return PerformanceMetrics(
+                timestamp=self.clock.now(),
                 cpu_usage=0.0,
                 memory_usage=0.0,
                 disk_usage=0.0,
@@ -253,6 +261,7 @@ class MetricsCollector:
             metrics: Performance metrics
         """
         alert = Alert(
+            timestamp=self.clock.now(),
             uav_id="SYSTEM",
             subsystem="Performance",
             severity=alert_data["severity"],
@@ -262,7 +271,7 @@ class MetricsCollector:
                 "metric_type": alert_data["type"],
                 "current_value": alert_data["value"],
                 "threshold": alert_data["threshold"],
-                "timestamp": datetime.now().isoformat()
+                "timestamp": self.clock.now().isoformat()
             }
         )
         
@@ -316,7 +325,7 @@ class MetricsCollector:
             collection_time: Time taken to collect metrics
         """
         self.stats["total_metrics_collected"] += 1
-        self.stats["last_collection_time"] = datetime.now()
+        self.stats["last_collection_time"] = self.clock.now()
         
         # Update average collection time
         if self.stats["total_metrics_collected"] == 1:
@@ -411,7 +420,7 @@ class MetricsCollector:
         Returns:
             Dictionary containing metrics summary
         """
-        cutoff_time = datetime.now() - timedelta(hours=hours)
+        cutoff_time = self.clock.now() - timedelta(hours=hours)
         
         # Filter metrics by time (simplified - assumes recent metrics)
         recent_metrics = list(self.metrics_history)[-min(3600, len(self.metrics_history)):]
@@ -0,0 +1,866 @@
+"""Columnar on-disk telemetry recording and memory-mapped replay."""
+
+import asyncio
+import heapq
+import json
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+from loguru import logger
+
+from ..utils.clock import SimulationClock, get_clock
+from ..utils.config import config
+from ..utils.models import SystemStatus, TelemetryRecord
+
+
+FORMAT_VERSION = 2
+INDEX_FILE = "index.json"
+
+# Column kinds stored as plain numeric arrays, with min/max in the index
+NUMERIC_KINDS = ("bool", "int", "float")
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+# Stored for absent timestamps; NumPy reads it back as NaT
+_NO_TIME = np.iinfo(np.int64).min
+
+# Placeholder for payload fields a record does not have
+_MISSING = object()
+
+
+def to_micros(timestamp: datetime) -> int:
+    """Convert a naive timestamp to integer microseconds since the epoch, exactly."""
+    return (timestamp - _EPOCH) // _MICROSECOND
+
+
+def from_micros(micros: int) -> datetime:
+    """Convert integer microseconds since the epoch back to a naive timestamp."""
+    return _EPOCH + timedelta(microseconds=micros)
+
+
+def _as_datetimes(micros: np.ndarray) -> List[Optional[datetime]]:
+    """Convert microseconds since the epoch to timestamps (None for _NO_TIME)."""
+    return np.asarray(micros).astype("datetime64[us]").tolist()
+
+
+def _flatten(data: Dict[str, Any], prefix: Tuple[str, ...] = ()) -> Iterator[Tuple[Tuple[str, ...], Any]]:
+    """Yield (key path, value) for every leaf of a nested payload."""
+    for key, value in data.items():
+        path = prefix + (key,)
+        if isinstance(value, dict) and value:
+            yield from _flatten(value, path)
+        else:
+            yield path, value
+
+
+def _access(path: Tuple[str, ...]) -> str:
+    """Build the Python expression that reads a key path from ``data``."""
+    return "data" + "".join(f"[{key!r}]" for key in path)
+
+
+def _compile_extractor(paths: Tuple[Tuple[str, ...], ...]):
+    """Compile a function reading every leaf of one payload layout.
+    
+    The function checks the size of every nested dict, so a payload with
+    extra, missing or restructured fields raises (KeyError, TypeError or
+    ValueError) instead of being read incompletely.
+    
+    Args:
+        paths: Leaf key paths, in column order
+        
+    Returns:
+        Function mapping a payload to a tuple of leaf values
+    """
+    sizes: Dict[Tuple[str, ...], set] = {(): set()}
+    for path in paths:
+        for depth in range(len(path)):
+            sizes.setdefault(path[:depth], set()).add(path[depth])
+    checks = " and ".join(f"len({_access(prefix)}) == {len(keys)}" for prefix, keys in sizes.items())
+    values = "".join(f"{_access(path)}, " for path in paths)
+    source = (f"def extract(data):\n"
+              f"    if not ({checks}):\n"
+              f"        raise ValueError('payload layout changed')\n"
+              f"    return ({values})\n")
+    namespace: Dict[str, Any] = {}
+    exec(compile(source, "<telemetry recorder layout>", "exec"), namespace)
+    return namespace["extract"]
+
+
+def _compile_builder(paths: Tuple[Tuple[str, ...], ...]):
+    """Compile a function rebuilding payloads of one layout from columns.
+    
+    Args:
+        paths: Leaf key paths, in column order
+        
+    Returns:
+        Function mapping a list of column value lists to a list of payloads
+        
+    Raises:
+        ValueError: If a path is both a leaf and a nested dict
+    """
+    tree: Dict[str, Any] = {}
+    for number, path in enumerate(paths):
+        node = tree
+        for key in path[:-1]:
+            node = node.setdefault(key, {})
+            if not isinstance(node, dict):
+                raise ValueError(f"Conflicting payload path {path}")
+        if path[-1] in node:
+            raise ValueError(f"Conflicting payload path {path}")
+        node[path[-1]] = number
+    
+    def literal(node: Dict[str, Any]) -> str:
+        return "{" + ", ".join(
+            f"{key!r}: {literal(value) if isinstance(value, dict) else f'v{value}'}" for key, value in node.items()
+        ) + "}"
+    
+    if not paths:
+        return lambda columns: []
+    names = "".join(f"v{number}, " for number in range(len(paths)))
+    source = f"def build(columns):\n    return [{literal(tree)} for {names} in zip(*columns)]\n"
+    namespace: Dict[str, Any] = {}
+    exec(compile(source, "<telemetry replay layout>", "exec"), namespace)
+    return namespace["build"]
+
+
+def _json_default(value: Any) -> Any:
+    """Encode values JSON lacks a type for, e.g. timestamps nested in lists."""
+    if isinstance(value, datetime):
+        return {"$datetime": value.isoformat()}
+    return str(value)
+
+
+def _json_hook(value: Dict[str, Any]) -> Any:
+    """Decode values written by _json_default."""
+    if len(value) == 1 and "$datetime" in value:
+        return datetime.fromisoformat(value["$datetime"])
+    return value
+
+
+_DECODER = json.JSONDecoder(object_hook=_json_hook)
+
+
+def _range(values: np.ndarray) -> Optional[List[float]]:
+    """Get [min, max] of a numeric column, ignoring NaN (None if it has no values)."""
+    values = np.asarray(values, dtype=np.float64)
+    values = values[~np.isnan(values)]
+    if not len(values):
+        return None
+    return [float(values.min()), float(values.max())]
+
+
+def _kind(values: List[Any]) -> str:
+    """Pick the narrowest column kind that holds every present value."""
+    types = {type(value) for value in values if value is not _MISSING}
+    if types <= {bool}:
+        return "bool"
+    if types <= {int}:
+        return "int"
+    if types <= {int, float}:
+        return "float"
+    if types <= {str}:
+        return "category"
+    if types <= {datetime, type(None)} and all(
+            value.tzinfo is None for value in values if isinstance(value, datetime)):
+        return "datetime"
+    return "json"
+
+
+def _encode(values: List[Any], kind: str) -> Tuple[Dict[str, np.ndarray], Dict[str, Any]]:
+    """Encode one column of a chunk.
+    
+    Args:
+        values: Column values, _MISSING where a record lacks the field
+        kind: Column kind from _kind()
+        
+    Returns:
+        Tuple of (arrays by file suffix, extra column metadata)
+    """
+    arrays: Dict[str, np.ndarray] = {}
+    meta: Dict[str, Any] = {}
+    present = [value is not _MISSING for value in values]
+    if not all(present):
+        arrays["mask"] = np.array(present, dtype=bool)
+    
+    if kind == "bool":
+        arrays["values"] = np.array([value is True for value in values], dtype=bool)
+    elif kind in ("int", "float"):
+        fill = 0 if kind == "int" else np.nan
+        arrays["values"] = np.array([fill if value is _MISSING else value for value in values],
+                                    dtype=np.int64 if kind == "int" else np.float64)
+    elif kind == "category":
+        categories: Dict[str, int] = {}
+        codes = [categories.setdefault(value, len(categories)) if value is not _MISSING else 0
+                 for value in values]
+        arrays["values"] = np.array(codes, dtype=np.uint32)
+        meta["categories"] = list(categories)
+    elif kind == "datetime":
+        arrays["values"] = np.array([to_micros(value) if isinstance(value, datetime) else _NO_TIME
+                                     for value in values], dtype=np.int64)
+    else:
+        encoded = [b"null" if value is _MISSING else json.dumps(value, default=_json_default).encode()
+                   for value in values]
+        arrays["offsets"] = np.cumsum([0] + [len(blob) for blob in encoded], dtype=np.uint64)
+        arrays["values"] = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+    return arrays, meta
+
+
+class TelemetryRecorder:
+    """Append telemetry to chunked, per-subsystem columnar files.
+    
+    Records are buffered per subsystem and written as a chunk once
+    chunk_rows have accumulated. A chunk is a directory of NumPy arrays,
+    one per payload field (plus the record fields), sorted by timestamp;
+    repeated strings are dictionary-encoded and irregular values (lists,
+    mixed types) are stored as JSON. The recording's index.json lists every
+    complete chunk with its time range and is replaced atomically after
+    each chunk, so a recording cut short by a crash is readable up to its
+    last chunk. Chunks are encoded and written on a background thread.
+    """
+    
+    def __init__(self, directory: Optional[str] = None, chunk_rows: Optional[int] = None):
+        """Initialize telemetry recorder.
+        
+        Args:
+            directory: Recording directory (defaults to a new timestamped
+                directory under the configured recordings directory)
+            chunk_rows: Records per chunk (defaults to configuration)
+        """
+        if directory is None:
+            root = config.get("monitoring.recording.directory", "data/recordings")
+            directory = os.path.join(root, datetime.now().strftime("%Y%m%d_%H%M%S"))
+        self.directory = Path(directory)
+        self.chunk_rows = max(1, chunk_rows or config.get("monitoring.recording.chunk_rows", 4096))
+        
+        self._buffers: Dict[str, List[TelemetryRecord]] = {}
+        self._chunks: List[Dict[str, Any]] = []
+        self._pending: List[Future] = []
+        self._extractors: Dict[Tuple[Tuple[str, ...], ...], Callable] = {}
+        self._tails: Dict[str, RecordedChunk] = {}
+        self._inflight: Dict[int, Tuple[str, List[TelemetryRecord]]] = {}
+        self._inflight_tails: Dict[int, RecordedChunk] = {}
+        self._submissions = 0
+        self._lock = threading.Lock()
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="telemetry-recorder")
+        self._closed = False
+        
+        self.stats = {
+            "records_recorded": 0,
+            "chunks_written": 0,
+            "bytes_written": 0,
+            "write_errors": 0
+        }
+        
+        self.directory.mkdir(parents=True, exist_ok=True)
+        logger.info(f"Recording telemetry to {self.directory}")
+    
+    def append(self, telemetry_data: TelemetryRecord) -> None:
+        """Buffer a record, writing its subsystem's chunk once full.
+        
+        Args:
+            telemetry_data: Telemetry record (its payload is not copied)
+        """
+        if self._closed:
+            return
+        buffer = self._buffers.setdefault(telemetry_data.subsystem, [])
+        buffer.append(telemetry_data)
+        self.stats["records_recorded"] += 1
+        if len(buffer) >= self.chunk_rows:
+            self._submit(telemetry_data.subsystem)
+    
+    async def record(self, telemetry_data: TelemetryRecord) -> None:
+        """Telemetry callback that records every sample.
+        
+        Args:
+            telemetry_data: Telemetry record
+        """
+        self.append(telemetry_data)
+    
+    def _submit(self, subsystem: str) -> None:
+        """Hand a subsystem's buffered records to the writer thread."""
+        rows = self._buffers.pop(subsystem, None)
+        self._tails.pop(subsystem, None)
+        if rows:
+            submission = self._submissions
+            self._submissions += 1
+            with self._lock:
+                self._inflight[submission] = (subsystem, rows)
+            self._pending = [future for future in self._pending if not future.done()]
+            self._pending.append(self._writer.submit(self._write_chunk, subsystem, rows, submission))
+    
+    def flush(self) -> None:
+        """Write every buffered record and wait for the writes to finish."""
+        for subsystem in list(self._buffers):
+            self._submit(subsystem)
+        for future in self._pending:
+            future.result()
+        self._pending.clear()
+    
+    def close(self) -> None:
+        """Flush and stop recording."""
+        if self._closed:
+            return
+        self.flush()
+        self._closed = True
+        self._writer.shutdown()
+        logger.info(f"Recorded {self.stats['records_recorded']} telemetry records in "
+                    f"{self.stats['chunks_written']} chunks to {self.directory}")
+    
+    def _encode_chunk(self, subsystem: str, rows: List[TelemetryRecord]
+                      ) -> Tuple[Dict[str, np.ndarray], Dict[str, Any], Dict[str, Any]]:
+        """Encode records of one subsystem as a chunk.
+        
+        Args:
+            subsystem: Subsystem name
+            rows: Records of the subsystem, in any order
+            
+        Returns:
+            Tuple of (arrays by name, chunk metadata, index entry without
+            the chunk's path)
+        """
+        rows = sorted(rows, key=lambda record: record.timestamp)
+        
+        # Pivot the payloads into columns with the first record's layout,
+        # falling back to a field-by-field walk if the layout varies
+        paths = tuple(path for path, _ in _flatten(rows[0].data))
+        extract = self._extractors.get(paths)
+        if extract is None:
+            extract = self._extractors[paths] = _compile_extractor(paths)
+        try:
+            table = [extract(record.data) for record in rows]
+            payload = dict(zip(paths, map(list, zip(*table))))
+        except (KeyError, TypeError, ValueError):
+            payload = self._pivot(rows)
+        
+        timestamps = np.array([to_micros(record.timestamp) for record in rows], dtype=np.int64)
+        scores = np.array([np.nan if record.anomaly_score is None else record.anomaly_score
+                           for record in rows], dtype=np.float64)
+        columns = [
+            (("$uav_id",), "category", [record.uav_id for record in rows]),
+            (("$status",), "category", [record.status.value for record in rows])
+        ]
+        columns.extend((path, _kind(values), values) for path, values in payload.items())
+        
+        column_meta = []
+        arrays = {"timestamp": timestamps, "anomaly_score": scores}
+        stats = {"anomaly_score": _range(scores)}
+        for number, (path, kind, values) in enumerate(columns):
+            encoded, meta = _encode(values, kind)
+            column_meta.append({"path": list(path), "kind": kind, **meta})
+            arrays.update({f"c{number:04d}.{suffix}": array for suffix, array in encoded.items()})
+            if kind in NUMERIC_KINDS:
+                present = encoded["values"] if "mask" not in encoded else encoded["values"][encoded["mask"]]
+                stats[".".join(path)] = _range(present)
+        
+        entry = {
+            "subsystem": subsystem,
+            "rows": len(rows),
+            "start": int(timestamps[0]),
+            "end": int(timestamps[-1]),
+            "uav_ids": column_meta[0]["categories"],
+            "stats": {name: bounds for name, bounds in stats.items() if bounds is not None}
+        }
+        return arrays, {"subsystem": subsystem, "rows": len(rows), "columns": column_meta}, entry
+    
+    def _write_chunk(self, subsystem: str, rows: List[TelemetryRecord], submission: int) -> None:
+        """Encode and write one chunk, then publish it in the index.
+        
+        Args:
+            subsystem: Subsystem name
+            rows: Records of the subsystem, in arrival order
+            submission: Number the chunk was submitted under, to retire
+                it from the in-flight chunks once published
+        """
+        try:
+            arrays, meta, entry = self._encode_chunk(subsystem, rows)
+            
+            with self._lock:
+                chunk_id = len(self._chunks)
+            relative = Path(subsystem) / f"{chunk_id:06d}"
+            chunk_dir = self.directory / relative
+            chunk_dir.mkdir(parents=True, exist_ok=True)
+            
+            written = 0
+            for name, array in arrays.items():
+                np.save(chunk_dir / f"{name}.npy", array)
+                written += array.nbytes
+            with open(chunk_dir / "meta.json", "w") as handle:
+                json.dump(meta, handle)
+            
+            with self._lock:
+                self._chunks.append({"path": relative.as_posix(), **entry})
+                self._write_index()
+                self._inflight.pop(submission, None)
+                self.stats["chunks_written"] += 1
+                self.stats["bytes_written"] += written
+        except Exception as e:
+            with self._lock:
+                self._inflight.pop(submission, None)
+            self.stats["write_errors"] += 1
+            logger.error(f"Error writing {subsystem} telemetry chunk: {e}")
+    
+    def tail(self, subsystems: Optional[Iterable[str]] = None) -> List["RecordedChunk"]:
+        """Get the records not yet written as in-memory chunks.
+        
+        Args:
+            subsystems: Subsystems to include (None for all)
+            
+        Returns:
+            In-memory chunks of the submitted but unwritten chunks and of
+            the buffered records
+        """
+        return self.snapshot(subsystems)[1]
+    
+    def snapshot(self, subsystems: Optional[Iterable[str]] = None) -> Tuple[int, List["RecordedChunk"]]:
+        """Get how many chunks are written and the rest of the recording.
+        
+        Lets queries over a live recording see the most recent telemetry
+        exactly once: the first written chunks of the index plus the
+        returned chunks cover every record, even while the writer thread
+        publishes a chunk. A tail is only re-encoded once new records arrive.
+        
+        Args:
+            subsystems: Subsystems to include (None for all)
+            
+        Returns:
+            Tuple of (number of chunks in the index, in-memory chunks of
+            the records not in them)
+        """
+        wanted = set(subsystems) if subsystems is not None else None
+        with self._lock:
+            written = len(self._chunks)
+            inflight = dict(self._inflight)
+        
+        chunks = []
+        for submission in list(self._inflight_tails):
+            if submission not in inflight:
+                del self._inflight_tails[submission]
+        for submission, (subsystem, rows) in inflight.items():
+            if wanted is not None and subsystem not in wanted:
+                continue
+            cached = self._inflight_tails.get(submission)
+            if cached is None:
+                cached = self._inflight_tails[submission] = self._encode_tail(subsystem, rows)
+            chunks.append(cached)
+        
+        for subsystem, buffer in list(self._buffers.items()):
+            if (wanted is not None and subsystem not in wanted) or not buffer:
+                continue
+            rows = list(buffer)
+            cached = self._tails.get(subsystem)
+            if cached is None or cached.rows != len(rows):
+                cached = self._tails[subsystem] = self._encode_tail(subsystem, rows)
+            chunks.append(cached)
+        return written, chunks
+    
+    def _encode_tail(self, subsystem: str, rows: List[TelemetryRecord]) -> "RecordedChunk":
+        """Encode unwritten records as an in-memory chunk."""
+        arrays, meta, entry = self._encode_chunk(subsystem, rows)
+        return RecordedChunk(entry, meta=meta, arrays=arrays)
+    
+    @staticmethod
+    def _pivot(rows: List[TelemetryRecord]) -> Dict[Tuple[str, ...], List[Any]]:
+        """Pivot payloads of varying layouts into columns, in first-seen field order."""
+        payload: Dict[Tuple[str, ...], List[Any]] = {}
+        for index, record in enumerate(rows):
+            for path, value in _flatten(record.data):
+                column = payload.get(path)
+                if column is None:
+                    column = payload[path] = [_MISSING] * index
+                column.append(value)
+            for column in payload.values():
+                if len(column) <= index:
+                    column.append(_MISSING)
+        return payload
+    
+    def _write_index(self) -> None:
+        """Atomically replace the recording's chunk index."""
+        temporary = self.directory / f"{INDEX_FILE}.tmp"
+        with open(temporary, "w") as handle:
+            json.dump({"version": FORMAT_VERSION, "chunks": self._chunks}, handle)
+        os.replace(temporary, self.directory / INDEX_FILE)
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get recorder statistics.
+        
+        Returns:
+            Dictionary with recorder statistics
+        """
+        return {
+            **self.stats,
+            "directory": str(self.directory),
+            "buffered_records": sum(len(buffer) for buffer in self._buffers.values())
+        }
+
+
+class RecordedChunk:
+    """One chunk of a recording.
+    
+    Arrays are memory-mapped from the chunk's directory on first use, or
+    held in memory for a recorder's unwritten tail.
+    """
+    
+    def __init__(self, entry: Dict[str, Any], directory: Optional[Path] = None,
+                 meta: Optional[Dict[str, Any]] = None, arrays: Optional[Dict[str, np.ndarray]] = None,
+                 sequence: Optional[int] = None):
+        """Initialize recorded chunk.
+        
+        Args:
+            entry: Chunk's entry in the recording index: time range, row
+                count, UAVs and [min, max] of every numeric field
+            directory: Recording directory (None for an in-memory chunk)
+            meta: Chunk metadata, for an in-memory chunk
+            arrays: Chunk arrays by name, for an in-memory chunk
+            sequence: Position of the chunk in the recording index (None
+                for an in-memory chunk)
+        """
+        self.subsystem = entry["subsystem"]
+        self.sequence = sequence
+        self.rows = entry["rows"]
+        self.start = entry["start"]
+        self.end = entry["end"]
+        self.uav_ids: List[str] = entry["uav_ids"]
+        self.stats: Dict[str, List[float]] = entry["stats"]
+        self._directory = directory / entry["path"] if directory is not None else None
+        self._meta = meta
+        self._arrays = arrays if arrays is not None else {}
+        self._memory = arrays is not None
+        self._numbers: Optional[Dict[str, int]] = None
+    
+    @property
+    def columns(self) -> List[Dict[str, Any]]:
+        """Column metadata, in column order."""
+        if self._meta is None:
+            with open(self._directory / "meta.json") as handle:
+                self._meta = json.load(handle)
+        return self._meta["columns"]
+    
+    def has(self, name: str) -> bool:
+        """Check whether the chunk has an array."""
+        if self._memory or name in self._arrays:
+            return name in self._arrays
+        return (self._directory / f"{name}.npy").exists()
+    
+    def array(self, name: str) -> np.ndarray:
+        """Memory-map one of the chunk's arrays (mapped once, as chunks never change)."""
+        array = self._arrays.get(name)
+        if array is None:
+            array = self._arrays[name] = np.load(self._directory / f"{name}.npy", mmap_mode="r")
+        return array
+    
+    def timestamps(self) -> np.ndarray:
+        """Memory-map the chunk's time index (microseconds since the epoch)."""
+        return self.array("timestamp")
+    
+    def number(self, field: str) -> Optional[int]:
+        """Get the column number of a dotted payload field name, if present."""
+        if self._numbers is None:
+            self._numbers = {".".join(column["path"]): number
+                             for number, column in enumerate(self.columns) if number > 1}
+        return self._numbers.get(field)
+    
+    def values(self, field: str, rows: slice) -> Optional[np.ndarray]:
+        """Read a numeric field as an array.
+        
+        Args:
+            field: Dotted payload field name, or "anomaly_score"
+            rows: Rows to read
+            
+        Returns:
+            Values, NaN where a record lacks the field; None if the chunk
+            has no such numeric field
+        """
+        if field == "anomaly_score":
+            return np.asarray(self.array("anomaly_score")[rows])
+        number = self.number(field)
+        if number is None or self.columns[number]["kind"] not in NUMERIC_KINDS:
+            return None
+        values = np.asarray(self.array(f"c{number:04d}.values")[rows])
+        if self.has(f"c{number:04d}.mask"):
+            values = np.where(self.array(f"c{number:04d}.mask")[rows], values, np.nan)
+        return values
+    
+    def decode(self, number: int, rows: slice) -> Tuple[List[Any], Optional[np.ndarray]]:
+        """Decode a column back to Python values.
+        
+        Args:
+            number: Column number
+            rows: Rows to decode
+            
+        Returns:
+            Tuple of (values, presence flags or None if always present)
+        """
+        column = self.columns[number]
+        kind = column["kind"]
+        prefix = f"c{number:04d}"
+        mask = None
+        if self.has(f"{prefix}.mask"):
+            mask = self.array(f"{prefix}.mask")[rows].tolist()
+        
+        values = self.array(f"{prefix}.values")
+        if kind == "json":
+            offsets = self.array(f"{prefix}.offsets")[rows.start:rows.stop + 1].tolist()
+            # JSON is written ASCII-only, so byte offsets are character offsets
+            text = values[offsets[0]:offsets[-1]].tobytes().decode("ascii")
+            base = offsets[0]
+            return [_DECODER.decode(text[begin - base:end - base])
+                    for begin, end in zip(offsets, offsets[1:])], mask
+        
+        values = values[rows]
+        if kind == "category":
+            categories = column["categories"]
+            return [categories[code] for code in values.tolist()], mask
+        if kind == "datetime":
+            return _as_datetimes(values), mask
+        return values.tolist(), mask
+    
+    def records(self, rows: slice, builders: Dict[Tuple[Tuple[str, ...], ...], Callable]) -> Iterator[TelemetryRecord]:
+        """Rebuild the records of a row range.
+        
+        Args:
+            rows: Rows to rebuild
+            builders: Cache of compiled payload builders by layout, shared
+                across chunks
+                
+        Yields:
+            Telemetry records in timestamp order
+        """
+        timestamps = _as_datetimes(self.timestamps()[rows])
+        scores = self.array("anomaly_score")[rows].tolist()
+        uav_ids = self.decode(0, rows)[0]
+        statuses = [SystemStatus(value) for value in self.decode(1, rows)[0]]
+        payload = [(tuple(column["path"]),) + self.decode(number, rows)
+                   for number, column in enumerate(self.columns) if number > 1]
+        
+        # Chunks whose records all share one layout are rebuilt by a compiled
+        # builder; the others field by field
+        paths = tuple(path for path, _, _ in payload)
+        build = builders.get(paths)
+        if build is None and all(mask is None for _, _, mask in payload):
+            try:
+                build = builders[paths] = _compile_builder(paths)
+            except ValueError:
+                build = None
+        if build is not None and all(mask is None for _, _, mask in payload):
+            payloads = build([values for _, values, _ in payload])
+        else:
+            payloads = [self._nest(payload, row) for row in range(len(timestamps))]
+        
+        for data, uav_id, status, timestamp, score in zip(payloads, uav_ids, statuses, timestamps, scores):
+            yield TelemetryRecord(self.subsystem, uav_id, data, status, timestamp,
+                                  None if score != score else score)
+    
+    @staticmethod
+    def _nest(payload: List[Tuple[Tuple[str, ...], List[Any], Optional[List[bool]]]], row: int) -> Dict[str, Any]:
+        """Rebuild one payload from decoded columns, leaving out absent fields."""
+        data: Dict[str, Any] = {}
+        for path, values, mask in payload:
+            if mask is not None and not mask[row]:
+                continue
+            node = data
+            for key in path[:-1]:
+                node = node.setdefault(key, {})
+            node[path[-1]] = values[row]
+        return data
+
+
+def load_chunks(directory: Path) -> List[RecordedChunk]:
+    """Load the chunks listed in a recording's index.
+    
+    Args:
+        directory: Recording directory
+        
+    Returns:
+        Chunks ordered by their earliest timestamp
+    """
+    with open(directory / INDEX_FILE) as handle:
+        index = json.load(handle)
+    if index.get("version") != FORMAT_VERSION:
+        raise ValueError(f"Unsupported telemetry recording version: {index.get('version')}")
+    
+    chunks = [RecordedChunk(entry, directory, sequence=sequence)
+              for sequence, entry in enumerate(index["chunks"])]
+    chunks.sort(key=lambda chunk: chunk.start)
+    return chunks
+
+
+class TelemetryReplay:
+    """Read a recording back through memory-mapped columns.
+    
+    Records are rebuilt only for the chunks and rows a query touches, in
+    timestamp order across subsystems, and can be fed to telemetry
+    callbacks at any speed to reproduce a run.
+    """
+    
+    def __init__(self, directory: str, clock: Optional[SimulationClock] = None):
+        """Initialize telemetry replay.
+        
+        Args:
+            directory: Recording directory
+            clock: Simulation clock that paces play() (defaults to the
+                shared clock)
+        """
+        self.directory = Path(directory)
+        self.clock = clock or get_clock()
+        self.chunks = load_chunks(self.directory)
+        
+        self._builders: Dict[Tuple[Tuple[str, ...], ...], Callable] = {}
+        
+        self.stats = {
+            "records_replayed": 0,
+            "replays_completed": 0
+        }
+    
+    def __len__(self) -> int:
+        return sum(chunk.rows for chunk in self.chunks)
+    
+    @property
+    def subsystems(self) -> List[str]:
+        """Subsystems in the recording."""
+        return sorted({chunk.subsystem for chunk in self.chunks})
+    
+    @property
+    def start(self) -> Optional[datetime]:
+        """Timestamp of the earliest record."""
+        return from_micros(min(chunk.start for chunk in self.chunks)) if self.chunks else None
+    
+    @property
+    def end(self) -> Optional[datetime]:
+        """Timestamp of the latest record."""
+        return from_micros(max(chunk.end for chunk in self.chunks)) if self.chunks else None
+    
+    def _select(self, start: Optional[datetime], end: Optional[datetime],
+                subsystems: Optional[Iterable[str]]) -> Iterator[Tuple[RecordedChunk, slice]]:
+        """Yield (chunk, row range) for the chunks overlapping a time window."""
+        low = to_micros(start) if start is not None else None
+        high = to_micros(end) if end is not None else None
+        wanted = set(subsystems) if subsystems is not None else None
+        for chunk in self.chunks:
+            if wanted is not None and chunk.subsystem not in wanted:
+                continue
+            if (low is not None and chunk.end < low) or (high is not None and chunk.start > high):
+                continue
+            
+            timestamps = chunk.timestamps()
+            first = int(np.searchsorted(timestamps, low, "left")) if low is not None else 0
+            last = int(np.searchsorted(timestamps, high, "right")) if high is not None else chunk.rows
+            if first < last:
+                yield chunk, slice(first, last)
+    
+    def records(self, start: Optional[datetime] = None, end: Optional[datetime] = None,
+                subsystems: Optional[Iterable[str]] = None,
+                uav_ids: Optional[Iterable[str]] = None) -> Iterator[TelemetryRecord]:
+        """Iterate over recorded telemetry in timestamp order.
+        
+        Args:
+            start: Earliest timestamp (inclusive)
+            end: Latest timestamp (inclusive)
+            subsystems: Subsystems to include (None for all)
+            uav_ids: UAVs to include (None for all)
+        
+        Yields:
+            Rebuilt telemetry records
+        """
+        streams = [chunk.records(rows, self._builders) for chunk, rows in self._select(start, end, subsystems)]
+        wanted = set(uav_ids) if uav_ids is not None else None
+        for record in heapq.merge(*streams, key=lambda record: record.timestamp):
+            if wanted is None or record.uav_id in wanted:
+                yield record
+    
+    def columns(self, subsystem: str, fields: Optional[Iterable[str]] = None,
+                start: Optional[datetime] = None, end: Optional[datetime] = None) -> Dict[str, np.ndarray]:
+        """Get a subsystem's numeric payload fields as arrays, without rebuilding records.
+        
+        Args:
+            subsystem: Subsystem name
+            fields: Dotted field names to read (None for every numeric field)
+            start: Earliest timestamp (inclusive)
+            end: Latest timestamp (inclusive)
+            
+        Returns:
+            Arrays by dotted field name, plus "timestamp" (datetime64[us])
+            and "anomaly_score"; fields a chunk lacks are NaN
+        """
+        selected = list(self._select(start, end, [subsystem]))
+        wanted = set(fields) if fields is not None else None
+        names: Dict[str, None] = {"timestamp": None, "anomaly_score": None}
+        if fields is not None:
+            names.update(dict.fromkeys(fields))
+        parts: List[Tuple[int, Dict[str, np.ndarray]]] = []
+        for chunk, rows in selected:
+            arrays = {
+                "timestamp": np.asarray(chunk.timestamps()[rows]).astype("datetime64[us]"),
+                "anomaly_score": chunk.values("anomaly_score", rows)
+            }
+            for number, column in enumerate(chunk.columns):
+                name = ".".join(column["path"])
+                if number > 1 and (wanted is None or name in wanted):
+                    values = chunk.values(name, rows)
+                    if values is not None:
+                        arrays[name] = values
+            names.update(dict.fromkeys(arrays))
+            parts.append((rows.stop - rows.start, arrays))
+        
+        return {
+            name: np.concatenate([arrays[name] if name in arrays else np.full(size, np.nan)
+                                  for size, arrays in parts]) if parts else np.array([], dtype=np.float64)
+            for name in names
+        }
+    
+    async def play(self, callback: Callable[[TelemetryRecord], Awaitable[None]],
+                   speed: Optional[float] = 1.0, **query: Any) -> int:
+        """Feed recorded telemetry to a telemetry callback.
+        
+        Args:
+            callback: Async callback that receives each TelemetryRecord, e.g.
+                TelemetryManager.publish_telemetry to reach every registered
+                consumer
+            speed: Playback speed relative to the recorded simulated time
+                (None or 0 to play as fast as the callback accepts records)
+            **query: Filters passed to records()
+            
+        Returns:
+            Number of records replayed
+        """
+        replayed = 0
+        origin = None
+        started = self.clock.time()
+        for record in self.records(**query):
+            if speed:
+                if origin is None:
+                    origin = record.timestamp
+                delay = (record.timestamp - origin).total_seconds() / speed - (self.clock.time() - started)
+                if delay > 0:
+                    await self.clock.sleep(delay)
+            elif replayed % 1000 == 0:
+                await asyncio.sleep(0)
+            
+            try:
+                await callback(record)
+            except Exception as e:
+                logger.error(f"Error in replay callback: {e}")
+            replayed += 1
+            self.stats["records_replayed"] += 1
+        
+        self.stats["replays_completed"] += 1
+        logger.info(f"Replayed {replayed} telemetry records from {self.directory}")
+        return replayed
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get replay statistics.
+        
+        Returns:
+            Dictionary with replay statistics
+        """
+        return {
+            **self.stats,
+            "directory": str(self.directory),
+            "records": len(self),
+            "chunks": len(self.chunks)
+        }
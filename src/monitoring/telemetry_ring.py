@@ -0,0 +1,323 @@
+"""Shared-memory telemetry ring for out-of-process readers."""
+
+import json
+from datetime import datetime
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from loguru import logger
+
+from ..anomaly.feature_plans import FeaturePlanCompiler
+from ..utils.config import config
+from ..utils.models import SystemStatus, TelemetryRecord
+
+
+MAGIC = 0x55415652  # "UAVR"
+VERSION = 1
+MAX_FEATURES = 16
+SCHEMA_BYTES = 16384
+SCHEMA_RETRIES = 1000
+
+HEADER_DTYPE = np.dtype([
+    ("magic", "<u4"),
+    ("version", "<u4"),
+    ("capacity", "<u8"),
+    ("head", "<u8"),
+    ("schema_version", "<u8"),
+    ("schema_length", "<u8")
+])
+
+# One telemetry sample; features are the anomaly detector's feature plan
+# columns for the subsystem, in plan order (see TelemetryRing.columns)
+RECORD_DTYPE = np.dtype([
+    ("sequence", "<u8"),
+    ("timestamp", "<f8"),
+    ("uav_id", "S16"),
+    ("subsystem", "S16"),
+    ("status", "u1"),
+    ("n_features", "u1"),
+    ("anomaly_score", "<f4"),
+    ("features", "<f4", (MAX_FEATURES,))
+])
+
+SCHEMA_OFFSET = 64
+RECORDS_OFFSET = SCHEMA_OFFSET + SCHEMA_BYTES
+
+STATUSES = list(SystemStatus)
+_STATUS_CODES = {status: code for code, status in enumerate(STATUSES)}
+
+# Segments created by this process, which its resource tracker owns
+_created: set = set()
+
+
+class TelemetryRing:
+    """Fixed-width telemetry records in a shared-memory ring buffer.
+    
+    One process writes and any number of processes read. Readers map the
+    same segment, so a read is a copy out of a NumPy array over shared
+    memory: nothing is pickled and nothing crosses a socket. Every slot
+    carries the sequence number of the record in it, and readers check it
+    again after copying, so records the writer overwrote mid-read are
+    dropped instead of returned torn.
+    """
+    
+    def __init__(self, memory: shared_memory.SharedMemory, owner: bool):
+        """Initialize telemetry ring over a mapped segment.
+        
+        Use create() or attach() rather than calling this directly.
+        
+        Args:
+            memory: Shared-memory segment holding the ring
+            owner: Whether this process created the segment (and writes to it)
+        """
+        self._memory = memory
+        self.owner = owner
+        self._header = np.ndarray((), HEADER_DTYPE, memory.buf, 0)
+        if int(self._header["magic"]) != MAGIC or int(self._header["version"]) != VERSION:
+            self._release()
+            memory.close()
+            raise ValueError(f"Shared memory segment {memory.name} is not a version {VERSION} telemetry ring")
+        
+        self.records = np.ndarray((int(self._header["capacity"]),), RECORD_DTYPE, memory.buf, RECORDS_OFFSET)
+        self._columns: Dict[str, Tuple[str, ...]] = {}
+        self._schema_version = 0
+        self._compiler: Optional[FeaturePlanCompiler] = None
+        if owner:
+            self._compiler = FeaturePlanCompiler(config.get("anomaly_detection.features", []))
+    
+    @classmethod
+    def create(cls, name: Optional[str] = None, capacity: Optional[int] = None) -> "TelemetryRing":
+        """Create a ring in a new shared-memory segment.
+        
+        Args:
+            name: Segment name (None for a random one)
+            capacity: Number of records kept (defaults to configuration)
+            
+        Returns:
+            Writable telemetry ring
+        """
+        if capacity is None:
+            capacity = config.get("dashboard.shared_memory.capacity", 65536)
+        if capacity <= 0:
+            raise ValueError("Ring capacity must be positive")
+        
+        size = RECORDS_OFFSET + capacity * RECORD_DTYPE.itemsize
+        memory = shared_memory.SharedMemory(name=name, create=True, size=size)
+        header = np.ndarray((), HEADER_DTYPE, memory.buf, 0)
+        header[()] = (MAGIC, VERSION, capacity, 0, 0, 0)
+        del header
+        _created.add(memory.name)
+        
+        logger.info(f"Created telemetry ring {memory.name} ({capacity} records, {size / 2**20:.1f} MB)")
+        return cls(memory, owner=True)
+    
+    @classmethod
+    def attach(cls, name: str) -> "TelemetryRing":
+        """Map an existing ring for reading.
+        
+        Args:
+            name: Segment name
+            
+        Returns:
+            Read-only telemetry ring
+        """
+        memory = shared_memory.SharedMemory(name=name)
+        # Readers in other processes must not unlink the writer's segment
+        # when they exit
+        if memory.name not in _created:
+            resource_tracker.unregister(memory._name, "shared_memory")
+        return cls(memory, owner=False)
+    
+    @property
+    def name(self) -> str:
+        """Shared-memory segment name."""
+        return self._memory.name
+    
+    @property
+    def capacity(self) -> int:
+        """Number of records kept."""
+        return len(self.records)
+    
+    @property
+    def head(self) -> int:
+        """Number of records written so far."""
+        return int(self._header["head"])
+    
+    def write(self, record: TelemetryRecord) -> None:
+        """Append a record, overwriting the oldest one when full.
+        
+        Args:
+            record: Telemetry record
+        """
+        plan = self._compiler.get_plan(record.subsystem, record.data)
+        if record.subsystem not in self._columns:
+            self._publish_columns(record.subsystem, plan.columns[:MAX_FEATURES])
+        features = plan.extract(record.data)[:MAX_FEATURES]
+        
+        head = int(self._header["head"])
+        index = head % len(self.records)
+        sequences = self.records["sequence"]
+        
+        # Invalidate the slot first, so a reader copying it meanwhile drops it
+        sequences[index] = 0
+        self.records[index] = (
+            0,
+            record.timestamp.timestamp(),
+            record.uav_id,
+            record.subsystem,
+            _STATUS_CODES[record.status],
+            len(features),
+            np.nan if record.anomaly_score is None else record.anomaly_score,
+            features + (0.0,) * (MAX_FEATURES - len(features))
+        )
+        sequences[index] = head + 1
+        self._header["head"] = head + 1
+    
+    def write_many(self, records: Iterable[TelemetryRecord]) -> None:
+        """Append several records in order.
+        
+        Args:
+            records: Telemetry records
+        """
+        for record in records:
+            self.write(record)
+    
+    def read(self, cursor: int = 0) -> Tuple[np.ndarray, int]:
+        """Copy the records written since a cursor.
+        
+        Args:
+            cursor: Value of head after the previous read (0 for everything
+                still retained)
+                
+        Returns:
+            Tuple of (records in write order, new cursor); records that
+            were overwritten before they could be read are skipped
+        """
+        head = self.head
+        capacity = len(self.records)
+        start = max(cursor, head - capacity)
+        if start >= head:
+            return self.records[:0].copy(), head
+        
+        first, last = start % capacity, (head - 1) % capacity + 1
+        if first < last:
+            copied = self.records[first:last].copy()
+        else:
+            copied = np.concatenate((self.records[first:], self.records[:last]))
+        
+        # A slot is intact if it held the expected record both before and
+        # after the copy
+        expected = np.arange(start + 1, head + 1, dtype=np.uint64)
+        live = self.records["sequence"][np.arange(start, head) % capacity]
+        intact = (copied["sequence"] == expected) & (live == expected)
+        return copied[intact], head
+    
+    def latest(self, count: int) -> np.ndarray:
+        """Copy the most recent records.
+        
+        Args:
+            count: Maximum number of records
+            
+        Returns:
+            Records in write order
+        """
+        return self.read(max(0, self.head - count))[0]
+    
+    def _publish_columns(self, subsystem: str, columns: Tuple[str, ...]) -> None:
+        """Record a subsystem's feature columns in the schema block."""
+        self._columns[subsystem] = columns
+        schema = json.dumps(self._columns).encode()
+        if len(schema) > SCHEMA_BYTES:
+            raise ValueError("Telemetry ring schema does not fit its block")
+        
+        # Seqlock: the version is odd while the block is being rewritten
+        version = int(self._header["schema_version"])
+        self._header["schema_version"] = version + 1
+        self._memory.buf[SCHEMA_OFFSET:SCHEMA_OFFSET + len(schema)] = schema
+        self._header["schema_length"] = len(schema)
+        self._header["schema_version"] = version + 2
+    
+    def columns(self, subsystem: str) -> Tuple[str, ...]:
+        """Get the feature column names of a subsystem.
+        
+        Args:
+            subsystem: Subsystem name
+            
+        Returns:
+            Names of the record's features, in order
+        """
+        # Retry while the writer holds the block (odd version) or rewrote it
+        # during the copy; after that many retries, keep the last columns read
+        for _ in range(SCHEMA_RETRIES):
+            version = int(self._header["schema_version"])
+            if version == self._schema_version:
+                break
+            if version % 2:
+                continue
+            length = int(self._header["schema_length"])
+            schema = bytes(self._memory.buf[SCHEMA_OFFSET:SCHEMA_OFFSET + min(length, SCHEMA_BYTES)])
+            if int(self._header["schema_version"]) != version:
+                continue
+            self._columns = {name: tuple(columns) for name, columns in json.loads(schema).items()}
+            self._schema_version = version
+            break
+        return self._columns.get(subsystem, ())
+    
+    def feature(self, records: np.ndarray, name: str) -> np.ndarray:
+        """Get one feature of a batch of records, whatever their subsystems.
+        
+        Args:
+            records: Records returned by read() or latest()
+            name: Feature column name
+            
+        Returns:
+            Feature values, NaN for records whose subsystem lacks the feature
+        """
+        values = np.full(len(records), np.nan)
+        for subsystem in np.unique(records["subsystem"]):
+            columns = self.columns(subsystem.decode())
+            if name in columns:
+                rows = records["subsystem"] == subsystem
+                values[rows] = records["features"][rows, columns.index(name)]
+        return values
+    
+    def as_dicts(self, records: np.ndarray) -> List[Dict[str, Any]]:
+        """Convert records to telemetry data points, e.g. for reports.
+        
+        Args:
+            records: Records returned by read() or latest()
+            
+        Returns:
+            Data points with the features as their data
+        """
+        points = []
+        for record in records:
+            subsystem = record["subsystem"].decode()
+            score = float(record["anomaly_score"])
+            columns = self.columns(subsystem)
+            points.append({
+                "timestamp": datetime.fromtimestamp(float(record["timestamp"])).isoformat(),
+                "uav_id": record["uav_id"].decode(),
+                "subsystem": subsystem,
+                "status": STATUSES[record["status"]].value,
+                "anomaly_score": None if np.isnan(score) else score,
+                "data": dict(zip(columns, record["features"][:record["n_features"]].tolist()))
+            })
+        return points
+    
+    def _release(self) -> None:
+        """Drop the NumPy views so the segment can be closed."""
+        self._header = None
+        self.records = None
+    
+    def close(self) -> None:
+        """Unmap the segment, unlinking it if this process created it."""
+        if self._memory is None:
+            return
+        self._release()
+        self._memory.close()
+        if self.owner:
+            self._memory.unlink()
+            _created.discard(self._memory.name)
+        self._memory = None
@@ -6,6 +6,7 @@ import csv
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Any, Optional
+import numpy as np
 import pandas as pd
 from jinja2 import Template
 import plotly.graph_objs as go
@@ -13,15 +14,32 @@ import plotly.express as px
 from plotly.subplots import make_subplots
 from loguru import logger
 
+from ..monitoring.telemetry_ring import TelemetryRing
+from ..storage.query_engine import TelemetryQueryEngine
+from ..utils.clock import SimulationClock, get_clock
 from ..utils.config import config
-from ..utils.models import TelemetryData, Alert, SeverityLevel
+from ..utils.models import Telemetry, TelemetryRecord, Alert, SeverityLevel, to_telemetry_model
 
 
 class ReportGenerator:
     """Automated report generator for UAV simulator."""
     
-    def __init__(self):
-        """Initialize report generator."""
+    # Telemetry summarized ahead of each fault in fault reports
+    PRE_FAULT_WINDOW = timedelta(minutes=5)
+    
+    def __init__(self, telemetry_ring: Optional[TelemetryRing] = None,
+                 query_engine: Optional[TelemetryQueryEngine] = None, clock: Optional[SimulationClock] = None):
+        """Initialize report generator.
+        
+        Args:
+            telemetry_ring: Shared-memory ring to read telemetry from, so
+                reports can run outside the simulator process
+            query_engine: Query engine over recorded telemetry; when given,
+                telemetry statistics are queried from the recording instead
+                of kept in memory
+            clock: Simulation clock timestamping anomalies and faults added
+                without a timestamp, in the recording's time
+        """
         self.reports_dir = Path("reports")
         self.reports_dir.mkdir(exist_ok=True)
         
@@ -36,18 +54,29 @@ class ReportGenerator:
         self.alert_data: List[Dict] = []
         self.performance_data: List[Dict] = []
         
+        # Shared-memory telemetry is pulled in at report time
+        self.telemetry_ring = telemetry_ring
+        self._ring_cursor = 0
+        self.query_engine = query_engine
+        self.clock = clock or get_clock()
+        
         # Report configuration
         self.report_formats = ["html", "json", "csv", "pdf"]
         self.default_format = "html"
         
         logger.info("ReportGenerator initialized")
     
-    def add_telemetry_data(self, telemetry_data: TelemetryData) -> None:
+    def add_telemetry_data(self, telemetry_data: Telemetry) -> None:
         """Add telemetry data for reporting.
         
         Args:
-            telemetry_data: Telemetry data to add
+            telemetry_data: Telemetry record or model to add; records are
+                validated here, as reports leave the simulator
         """
+        if self.query_engine is not None:
+            return  # Already recorded
+        
+        telemetry_data = to_telemetry_model(telemetry_data)
         data_point = {
             "timestamp": telemetry_data.timestamp.isoformat(),
             "uav_id": telemetry_data.uav_id,
@@ -58,6 +87,54 @@ class ReportGenerator:
         }
         self.telemetry_data.append(data_point)
     
+    def sync_telemetry_ring(self) -> int:
+        """Pull the telemetry written to the shared-memory ring since the last sync.
+        
+        Returns:
+            Number of telemetry points added
+        """
+        if self.telemetry_ring is None or self.query_engine is not None:
+            return 0
+        
+        records, self._ring_cursor = self.telemetry_ring.read(self._ring_cursor)
+        self.telemetry_data.extend(self.telemetry_ring.as_dicts(records))
+        return len(records)
+    
+    @staticmethod
+    def _telemetry_point(telemetry_data: TelemetryRecord) -> Dict[str, Any]:
+        """Convert a recorded telemetry record to a report data point."""
+        return {
+            "timestamp": telemetry_data.timestamp.isoformat(),
+            "uav_id": telemetry_data.uav_id,
+            "subsystem": telemetry_data.subsystem,
+            "status": telemetry_data.status.value,
+            "anomaly_score": telemetry_data.anomaly_score,
+            "data": telemetry_data.data
+        }
+    
+    def _pre_fault_summary(self, fault: Dict[str, Any]) -> Dict[str, Any]:
+        """Summarize a faulted subsystem's recorded telemetry ahead of the fault.
+        
+        Args:
+            fault: Fault data point
+            
+        Returns:
+            Sample count and anomaly score statistics over PRE_FAULT_WINDOW
+        """
+        injected = datetime.fromisoformat(fault["timestamp"])
+        result = self.query_engine.aggregate(
+            ["anomaly_score"], ["max", "mean"], by=[], subsystems=[fault["subsystem"]],
+            uav_ids=[fault["uav_id"]], start=injected - self.PRE_FAULT_WINDOW, end=injected
+        )
+        if not len(result["rows"]):
+            return {"samples": 0}
+        max_score, mean_score = result["anomaly_score_max"][0], result["anomaly_score_mean"][0]
+        return {
+            "samples": int(result["rows"][0]),
+            "max_anomaly_score": None if np.isnan(max_score) else float(max_score),
+            "mean_anomaly_score": None if np.isnan(mean_score) else float(mean_score)
+        }
+    
     def add_anomaly_data(self, uav_id: str, subsystem: str, anomaly_score: float, 
                         features: Dict[str, Any], timestamp: datetime = None) -> None:
         """Add anomaly detection data for reporting.
@@ -70,7 +147,7 @@ class ReportGenerator:
             timestamp: Detection timestamp
         """
         data_point = {
-            "timestamp": (timestamp or datetime.now()).isoformat(),
+            "timestamp": (timestamp or self.clock.now()).isoformat(),
             "uav_id": uav_id,
             "subsystem": subsystem,
             "anomaly_score": anomaly_score,
@@ -90,7 +167,7 @@ class ReportGenerator:
             timestamp: Injection timestamp
         """
         data_point = {
-            "timestamp": (timestamp or datetime.now()).isoformat(),
+            "timestamp": (timestamp or self.clock.now()).isoformat(),
             "uav_id": uav_id,
             "subsystem": subsystem,
             "fault_type": fault_type,
@@ -290,24 +367,36 @@ class ReportGenerator:
     
     async def _generate_system_status_data(self) -> Dict[str, Any]:
         """Generate system status report data."""
+        self.sync_telemetry_ring()
+        
         # Calculate statistics
-        total_telemetry = len(self.telemetry_data)
         total_anomalies = len(self.anomaly_data)
         total_faults = len(self.fault_data)
         total_alerts = len(self.alert_data)
         
-        # UAV statistics
-        uav_ids = set(data["uav_id"] for data in self.telemetry_data)
-        subsystem_counts = {}
-        for data in self.telemetry_data:
-            subsystem = data["subsystem"]
-            subsystem_counts[subsystem] = subsystem_counts.get(subsystem, 0) + 1
-        
-        # Status distribution
-        status_counts = {}
-        for data in self.telemetry_data:
-            status = data["status"]
-            status_counts[status] = status_counts.get(status, 0) + 1
+        if self.query_engine is not None:
+            # Counted over the recording, mostly from its index
+            subsystem_counts = self.query_engine.counts("subsystem")
+            status_counts = self.query_engine.counts("status")
+            uav_ids = set(self.query_engine.counts("uav_id"))
+            total_telemetry = sum(subsystem_counts.values())
+            recent_telemetry = [self._telemetry_point(record) for record in self.query_engine.latest(100)]
+        else:
+            total_telemetry = len(self.telemetry_data)
+            recent_telemetry = self.telemetry_data[-100:]
+            
+            # UAV statistics
+            uav_ids = set(data["uav_id"] for data in self.telemetry_data)
+            subsystem_counts = {}
+            for data in self.telemetry_data:
+                subsystem = data["subsystem"]
+                subsystem_counts[subsystem] = subsystem_counts.get(subsystem, 0) + 1
+            
+            # Status distribution
+            status_counts = {}
+            for data in self.telemetry_data:
+                status = data["status"]
+                status_counts[status] = status_counts.get(status, 0) + 1
         
         # Alert severity distribution
         severity_counts = {}
@@ -331,7 +420,7 @@ class ReportGenerator:
                 "alert_severity_distribution": severity_counts
             },
             "data": {
-                "telemetry_data": self.telemetry_data[-100:],  # Last 100 points
+                "telemetry_data": recent_telemetry,  # Last 100 points
                 "anomaly_data": self.anomaly_data[-50:],  # Last 50 anomalies
                 "fault_data": self.fault_data[-50:],  # Last 50 faults
                 "alert_data": self.alert_data[-50:]  # Last 50 alerts
@@ -409,8 +498,11 @@ class ReportGenerator:
             subsystem = data["subsystem"]
             subsystem_faults[subsystem] = subsystem_faults.get(subsystem, 0) + 1
         
-        # Recent faults
+        # Recent faults, with the faulted subsystem's telemetry leading up to them
         recent_faults = sorted(self.fault_data, key=lambda x: x["timestamp"], reverse=True)[:20]
+        if self.query_engine is not None:
+            recent_faults = [{**fault, "pre_fault_telemetry": self._pre_fault_summary(fault)}
+                             for fault in recent_faults]
         
         return {
             "report_type": "Fault Injection",
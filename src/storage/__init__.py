@@ -0,0 +1 @@
+# Recorded telemetry storage and queries
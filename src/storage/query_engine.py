@@ -0,0 +1,434 @@
+"""Time-series queries over recorded telemetry."""
+
+import heapq
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..monitoring.telemetry_recorder import (
+    INDEX_FILE, RecordedChunk, TelemetryRecorder, from_micros, load_chunks, to_micros
+)
+from ..utils.models import TelemetryRecord
+
+
+# Row predicates: (field, operator, value)
+Predicate = Tuple[str, str, float]
+
+OPERATORS: Dict[str, Callable[[np.ndarray, float], np.ndarray]] = {
+    "<": np.less,
+    "<=": np.less_equal,
+    ">": np.greater,
+    ">=": np.greater_equal,
+    "==": np.equal,
+    "!=": np.not_equal
+}
+
+AGGREGATIONS = ("min", "max", "mean", "sum", "count")
+
+# Columns that can be grouped on besides time buckets
+GROUP_KEYS = ("uav_id", "subsystem", "status")
+
+
+def _may_match(bounds: List[float], operator: str, value: float) -> bool:
+    """Check whether a chunk with a field's [min, max] can hold a matching row."""
+    low, high = bounds
+    if operator == "<":
+        return low < value
+    if operator == "<=":
+        return low <= value
+    if operator == ">":
+        return high > value
+    if operator == ">=":
+        return high >= value
+    if operator == "==":
+        return low <= value <= high
+    return not low == high == value
+
+
+class TelemetryQueryEngine:
+    """Time-series queries over a telemetry recording.
+    
+    Predicates are pushed down to the recording's index: chunks outside
+    the time range, of other subsystems or UAVs, or whose per-field
+    min/max rule out a ``where`` predicate are skipped without being
+    opened, and only the columns a query names are read from the chunks
+    that remain. Results are NumPy column arrays, so aggregations and
+    downsampling run vectorized instead of over lists of dicts.
+    
+    Over a live recording, pass the recorder as well so queries also see
+    the records it has not written yet.
+    
+    Example, the hottest motor per UAV in the 5 minutes before a fault::
+    
+        engine.aggregate(["motors.motor_1.temperature"], ["max"], subsystems=["Propulsion"],
+                         start=fault_time - timedelta(minutes=5), end=fault_time)
+    """
+    
+    def __init__(self, directory: Optional[str] = None, recorder: Optional[TelemetryRecorder] = None):
+        """Initialize telemetry query engine.
+        
+        Args:
+            directory: Recording directory (defaults to the recorder's)
+            recorder: Recorder writing the recording, to include its
+                unwritten tail in queries
+        """
+        if directory is None and recorder is None:
+            raise ValueError("A recording directory or recorder is required")
+        self.directory = Path(directory) if directory is not None else recorder.directory
+        self.recorder = recorder
+        self._chunks: List[RecordedChunk] = []
+        self._index_mtime: Optional[int] = None
+        self._builders: Dict[Tuple[Tuple[str, ...], ...], Callable] = {}
+        
+        self.stats = {
+            "queries": 0,
+            "chunks_scanned": 0,
+            "chunks_skipped": 0,
+            "rows_scanned": 0,
+            "rows_matched": 0
+        }
+    
+    def refresh(self) -> None:
+        """Reload the recording's index if it changed since the last query."""
+        try:
+            mtime = (self.directory / INDEX_FILE).stat().st_mtime_ns
+        except FileNotFoundError:
+            return  # Nothing written yet
+        if mtime != self._index_mtime:
+            self._chunks = load_chunks(self.directory)
+            self._index_mtime = mtime
+    
+    def _candidates(self, subsystems: Optional[Iterable[str]]) -> List[RecordedChunk]:
+        """Get the written chunks and the recorder's tail for some subsystems.
+        
+        Args:
+            subsystems: Subsystems to include (None for all)
+            
+        Returns:
+            Chunks of the subsystems
+        """
+        wanted = set(subsystems) if subsystems is not None else None
+        if self.recorder is None:
+            self.refresh()
+            return [chunk for chunk in self._chunks if wanted is None or chunk.subsystem in wanted]
+        
+        # Chunks the writer publishes after the snapshot are still in its
+        # tail, so only the index entries written by then are read from disk
+        written, tail = self.recorder.snapshot(wanted)
+        self.refresh()
+        if len(self._chunks) < written:
+            self._index_mtime = None  # Rewritten within the mtime resolution
+            self.refresh()
+        chunks = [chunk for chunk in self._chunks
+                  if chunk.sequence < written and (wanted is None or chunk.subsystem in wanted)]
+        chunks.extend(tail)
+        return chunks
+    
+    def _select(self, subsystems: Optional[Iterable[str]], start: Optional[datetime], end: Optional[datetime],
+                uav_ids: Optional[Iterable[str]], where: Sequence[Predicate]
+                ) -> Iterator[Tuple[RecordedChunk, slice]]:
+        """Yield (chunk, row range) for every chunk a query may match.
+        
+        Args:
+            subsystems: Subsystems to include (None for all)
+            start: Earliest timestamp (inclusive)
+            end: Latest timestamp (inclusive)
+            uav_ids: UAVs to include (None for all)
+            where: Row predicates
+        
+        Yields:
+            Chunks that could not be ruled out from the index, with the
+            row range inside the time window
+        """
+        low = to_micros(start) if start is not None else None
+        high = to_micros(end) if end is not None else None
+        uavs = set(uav_ids) if uav_ids is not None else None
+        
+        for chunk in self._candidates(subsystems):
+            if (
+                (low is not None and chunk.end < low)
+                or (high is not None and chunk.start > high)
+                or (uavs is not None and uavs.isdisjoint(chunk.uav_ids))
+                or not all(field in chunk.stats and _may_match(chunk.stats[field], operator, value)
+                           for field, operator, value in where)
+            ):
+                self.stats["chunks_skipped"] += 1
+                continue
+            
+            timestamps = chunk.timestamps()
+            first = int(np.searchsorted(timestamps, low, "left")) if low is not None else 0
+            last = int(np.searchsorted(timestamps, high, "right")) if high is not None else chunk.rows
+            if first < last:
+                self.stats["chunks_scanned"] += 1
+                self.stats["rows_scanned"] += last - first
+                yield chunk, slice(first, last)
+            else:
+                self.stats["chunks_skipped"] += 1
+    
+    def scan(self, fields: Iterable[str] = (), subsystems: Optional[Iterable[str]] = None,
+             start: Optional[datetime] = None, end: Optional[datetime] = None,
+             uav_ids: Optional[Iterable[str]] = None, where: Sequence[Predicate] = ()) -> Dict[str, np.ndarray]:
+        """Read the matching rows of a few columns.
+        
+        Args:
+            fields: Dotted payload field names (or "anomaly_score") to read
+            subsystems: Subsystems to include (None for all)
+            start: Earliest timestamp (inclusive)
+            end: Latest timestamp (inclusive)
+            uav_ids: UAVs to include (None for all)
+            where: Row predicates (field, operator, value) that must all
+                hold; rows lacking a field never match
+                
+        Returns:
+            Arrays "timestamp" (datetime64[us]), "uav_id", "subsystem",
+            "status" and one float array per field, NaN where a record
+            lacks the field
+        """
+        fields = list(fields)
+        for _, operator, _ in where:
+            if operator not in OPERATORS:
+                raise ValueError(f"Unknown operator: {operator}")
+        self.stats["queries"] += 1
+        
+        uavs = set(uav_ids) if uav_ids is not None else None
+        parts: List[Dict[str, np.ndarray]] = []
+        for chunk, rows in self._select(subsystems, start, end, uavs, where):
+            keep = np.ones(rows.stop - rows.start, dtype=bool)
+            uav_codes = np.asarray(chunk.array("c0000.values")[rows])
+            if uavs is not None:
+                keep &= np.isin(uav_codes, [code for code, uav_id in enumerate(chunk.uav_ids) if uav_id in uavs])
+            for field, operator, value in where:
+                values = chunk.values(field, rows)
+                if values is None:
+                    keep[:] = False
+                    break
+                with np.errstate(invalid="ignore"):
+                    keep &= OPERATORS[operator](values, value) & ~np.isnan(values.astype(np.float64))
+            if not keep.any():
+                continue
+            
+            status_categories = np.asarray(chunk.columns[1]["categories"])
+            part = {
+                "timestamp": np.asarray(chunk.timestamps()[rows])[keep].astype("datetime64[us]"),
+                "uav_id": np.asarray(chunk.uav_ids)[uav_codes[keep]],
+                "subsystem": np.full(int(keep.sum()), chunk.subsystem),
+                "status": status_categories[np.asarray(chunk.array("c0001.values")[rows])[keep]]
+            }
+            for field in fields:
+                values = chunk.values(field, rows)
+                part[field] = (values[keep].astype(np.float64) if values is not None
+                               else np.full(len(part["timestamp"]), np.nan))
+            parts.append(part)
+        
+        names = ["timestamp", "uav_id", "subsystem", "status"] + fields
+        if not parts:
+            empty = {"timestamp": np.array([], dtype="datetime64[us]"), "uav_id": np.array([], dtype=str),
+                     "subsystem": np.array([], dtype=str), "status": np.array([], dtype=str)}
+            return {name: empty.get(name, np.array([], dtype=np.float64)) for name in names}
+        
+        result = {name: np.concatenate([part[name] for part in parts]) for name in names}
+        self.stats["rows_matched"] += len(result["timestamp"])
+        return result
+    
+    def aggregate(self, fields: Iterable[str], aggregations: Iterable[str] = ("min", "max", "mean"),
+                  by: Iterable[str] = ("uav_id",), bucket: Optional[float] = None,
+                  **filters: Any) -> Dict[str, np.ndarray]:
+        """Aggregate fields per group and, optionally, per time bucket.
+        
+        Args:
+            fields: Dotted payload field names (or "anomaly_score")
+            aggregations: Any of "min", "max", "mean", "sum" and "count"
+                (non-missing values); NaN is ignored
+            by: Columns to group on, from "uav_id", "subsystem" and
+                "status" (empty for one group)
+            bucket: Time bucket width in seconds (None for no time
+                buckets); buckets are aligned to the start filter if given
+            **filters: Filters passed to scan()
+            
+        Returns:
+            One entry per group, sorted by group: the group columns,
+            "bucket" (bucket start, datetime64[us]) when bucketing, "rows",
+            and "<field>_<aggregation>" for each field and aggregation
+        """
+        fields, aggregations, by = list(fields), list(aggregations), list(by)
+        for name in aggregations:
+            if name not in AGGREGATIONS:
+                raise ValueError(f"Unknown aggregation: {name}")
+        for name in by:
+            if name not in GROUP_KEYS:
+                raise ValueError(f"Cannot group by {name}")
+        
+        columns = self.scan(fields, **filters)
+        timestamps = columns["timestamp"].astype(np.int64)
+        
+        # Number the groups: one code column per key, unique over the rows
+        codes = []
+        labels = []
+        for name in by:
+            values, inverse = np.unique(columns[name], return_inverse=True)
+            labels.append(values)
+            codes.append(inverse)
+        if bucket is not None:
+            width = max(1, round(bucket * 1e6))
+            origin = to_micros(filters["start"]) if filters.get("start") is not None else 0
+            buckets, inverse = np.unique((timestamps - origin) // width, return_inverse=True)
+            labels.append((origin + buckets * width).astype("datetime64[us]"))
+            codes.append(inverse)
+        
+        if codes and len(timestamps):
+            # Fold the key codes into one integer per row (mixed radix)
+            key = np.zeros(len(timestamps), dtype=np.int64)
+            for code, label in zip(codes, labels):
+                key = key * len(label) + code
+            folded, inverse = np.unique(key, return_inverse=True)
+            inverse = inverse.reshape(-1)
+            groups = np.empty((len(folded), len(codes)), dtype=np.int64)
+            for position in range(len(codes) - 1, -1, -1):
+                folded, groups[:, position] = np.divmod(folded, len(labels[position]))
+        else:
+            groups = np.zeros((1 if len(timestamps) else 0, len(codes)), dtype=np.int64)
+            inverse = np.zeros(len(timestamps), dtype=np.int64)
+        
+        result: Dict[str, np.ndarray] = {}
+        for position, name in enumerate(by + (["bucket"] if bucket is not None else [])):
+            result[name] = labels[position][groups[:, position]]
+        
+        order = np.argsort(inverse, kind="stable")
+        starts = np.flatnonzero(np.r_[True, np.diff(inverse[order]) != 0]) if len(order) else np.array([], dtype=np.int64)
+        result["rows"] = np.diff(np.r_[starts, len(order)])
+        for field in fields:
+            values = columns[field][order]
+            present = ~np.isnan(values)
+            with np.errstate(invalid="ignore", divide="ignore"):
+                count = np.add.reduceat(present, starts) if len(starts) else np.array([], dtype=np.int64)
+                total = np.add.reduceat(np.where(present, values, 0.0), starts) if len(starts) else np.array([])
+                for name in aggregations:
+                    if name == "count":
+                        output = count
+                    elif name == "sum":
+                        output = total
+                    elif name == "mean":
+                        output = total / count
+                    elif not len(starts):
+                        output = np.array([])
+                    else:
+                        output = (np.fmin if name == "min" else np.fmax).reduceat(values, starts)
+                    result[f"{field}_{name}"] = output
+        return result
+    
+    def downsample(self, field: str, points: int, aggregation: str = "mean",
+                   by: Iterable[str] = ("uav_id",), **filters: Any) -> Dict[str, np.ndarray]:
+        """Reduce a field to at most a number of time buckets per group, e.g. for charts.
+        
+        Args:
+            field: Dotted payload field name (or "anomaly_score")
+            points: Maximum number of buckets over the queried time range
+            aggregation: Aggregation applied per bucket
+            by: Columns to group on
+            **filters: Filters passed to scan()
+            
+        Returns:
+            Result of aggregate() with time buckets
+        """
+        if filters.get("start") is None or filters.get("end") is None:
+            bounds = self.time_range(filters.get("subsystems"))
+            if bounds is None:
+                return self.aggregate([field], [aggregation], by, bucket=1.0, **filters)
+            filters["start"] = filters.get("start") or bounds[0]
+            filters["end"] = filters.get("end") or bounds[1]
+        
+        # Wide enough that the end of the range falls in the last bucket
+        span = to_micros(filters["end"]) - to_micros(filters["start"])
+        width = max(0, span) // max(1, points) + 1
+        return self.aggregate([field], [aggregation], by, bucket=width / 1e6, **filters)
+    
+    def counts(self, by: str = "subsystem", **filters: Any) -> Dict[str, int]:
+        """Count matching records per value of a column.
+        
+        Args:
+            by: Column to count by: "uav_id", "subsystem" or "status"
+            **filters: Filters passed to scan()
+            
+        Returns:
+            Record count by value
+        """
+        if by == "subsystem" and not filters:
+            # Answered from the index alone
+            totals: Dict[str, int] = {}
+            for chunk in self._candidates(None):
+                totals[chunk.subsystem] = totals.get(chunk.subsystem, 0) + chunk.rows
+            return totals
+        
+        result = self.aggregate([], [], [by], **filters)
+        return dict(zip(result[by].tolist(), result["rows"].tolist()))
+    
+    def time_range(self, subsystems: Optional[Iterable[str]] = None) -> Optional[Tuple[datetime, datetime]]:
+        """Get the earliest and latest recorded timestamps.
+        
+        Args:
+            subsystems: Subsystems to include (None for all)
+            
+        Returns:
+            Tuple of (start, end), or None if nothing is recorded
+        """
+        chunks = self._candidates(subsystems)
+        if not chunks:
+            return None
+        return from_micros(min(chunk.start for chunk in chunks)), from_micros(max(chunk.end for chunk in chunks))
+    
+    def latest(self, count: int, subsystems: Optional[Iterable[str]] = None) -> List[TelemetryRecord]:
+        """Rebuild the most recent records.
+        
+        Args:
+            count: Maximum number of records
+            subsystems: Subsystems to include (None for all)
+            
+        Returns:
+            Records in timestamp order
+        """
+        self.stats["queries"] += 1
+        candidates = sorted(self._candidates(subsystems), key=lambda chunk: chunk.end, reverse=True)
+        if not candidates or count <= 0:
+            return []
+        
+        # Newest chunks first, until the count newest timestamps seen so far
+        # are all later than the end of every remaining chunk
+        newest = np.empty(0, dtype=np.int64)
+        selected = []
+        for chunk in candidates:
+            if len(newest) >= count and chunk.end < newest[0]:
+                break
+            timestamps = np.asarray(chunk.timestamps())
+            first = int(np.searchsorted(timestamps, newest[0], "left")) if len(newest) >= count else 0
+            selected.append((chunk, first))
+            newest = np.concatenate([newest, timestamps[first:]])
+            if len(newest) > count:
+                newest = np.partition(newest, -count)[-count:]
+            newest.sort()
+        self.stats["chunks_scanned"] += len(selected)
+        self.stats["chunks_skipped"] += len(candidates) - len(selected)
+        
+        # Only rows at or after the count-th newest timestamp are rebuilt
+        cutoff = int(newest[0])
+        streams = []
+        for chunk, _ in selected:
+            if chunk.end >= cutoff:
+                first = int(np.searchsorted(chunk.timestamps(), cutoff, "left"))
+                self.stats["rows_scanned"] += chunk.rows - first
+                streams.append(chunk.records(slice(first, chunk.rows), self._builders))
+        records = list(heapq.merge(*streams, key=lambda record: record.timestamp))
+        return records[-count:]
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get query engine statistics.
+        
+        Returns:
+            Dictionary with query engine statistics
+        """
+        return {
+            **self.stats,
+            "directory": str(self.directory),
+            "chunks": len(self._chunks)
+        }
@@ -1,5 +1,6 @@
 """Configuration management utilities."""
 
+import copy
 import yaml
 import os
 from pathlib import Path
@@ -21,10 +22,12 @@ class ConfigManager:
         
         self.config_path = Path(config_path)
         self._config: Dict[str, Any] = {}
+        self._subsystems: Optional[Dict[str, Dict[str, Any]]] = None
         self.load_config()
     
     def load_config(self) -> None:
         """Load configuration from YAML file."""
+        self._subsystems = None
         try:
             if self.config_path.exists():
                 with open(self.config_path, 'r') as file:
@@ -73,6 +76,26 @@ class ConfigManager:
             config = config[k]
         
         config[keys[-1]] = value
+        if keys[0] == "uav":
+            self._subsystems = None
+    
+    def get_subsystem(self, name: str) -> Dict[str, Any]:
+        """Get the uav.subsystems entry for a subsystem.
+        
+        Entries are indexed by name on first use, so creating thousands of
+        agents does not rescan the list for every one of them.
+        
+        Args:
+            name: Subsystem name
+            
+        Returns:
+            Subsystem configuration (empty if the subsystem is not configured)
+        """
+        if self._subsystems is None:
+            self._subsystems = {
+                subsystem.get("name"): subsystem for subsystem in self.get("uav.subsystems", None) or []
+            }
+        return self._subsystems.get(name, {})
     
     def _get_default_config(self) -> Dict[str, Any]:
         """Get default configuration."""
@@ -102,6 +125,23 @@ class ConfigManager:
         """Reload configuration from file."""
         self.load_config()
         logger.info("Configuration reloaded")
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Get a copy of the whole configuration, including runtime changes.
+        
+        Returns:
+            Configuration dictionary
+        """
+        return copy.deepcopy(self._config)
+    
+    def load_dict(self, settings: Dict[str, Any]) -> None:
+        """Replace the configuration with a dictionary, e.g. from to_dict().
+        
+        Args:
+            settings: Configuration dictionary
+        """
+        self._config = copy.deepcopy(settings)
+        self._subsystems = None
 
 
 # Global configuration instance
@@ -1,7 +1,8 @@
 """Data models for UAV telemetry and system state."""
 
+import copy
 from datetime import datetime
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Union
 from enum import Enum
 from pydantic import BaseModel, Field
 import uuid
@@ -34,6 +35,106 @@ class TelemetryData(BaseModel):
     anomaly_score: Optional[float] = None
 
 
+class TelemetryRecord:
+    """Lightweight telemetry sample for the internal hot path.
+    
+    Same fields as TelemetryData but a plain __slots__ class: constructing
+    one does no validation and no copying, so agents can emit tens of
+    thousands per second. Convert with to_model() wherever telemetry leaves
+    the simulator (API, reports); the Pydantic-style helpers below keep
+    existing callers working on records directly.
+    """
+    
+    __slots__ = ("timestamp", "subsystem", "uav_id", "data", "status", "anomaly_score")
+    
+    def __init__(self, subsystem: str, uav_id: str, data: Dict[str, Any],
+                 status: SystemStatus = SystemStatus.NOMINAL, timestamp: Optional[datetime] = None,
+                 anomaly_score: Optional[float] = None):
+        """Initialize telemetry record.
+        
+        Args:
+            subsystem: Name of the subsystem
+            uav_id: UAV identifier
+            data: Subsystem telemetry payload (not copied)
+            status: Subsystem status
+            timestamp: Sample time (defaults to now)
+            anomaly_score: Anomaly score, once scored
+        """
+        self.timestamp = timestamp if timestamp is not None else datetime.now()
+        self.subsystem = subsystem
+        self.uav_id = uav_id
+        self.data = data
+        self.status = status
+        self.anomaly_score = anomaly_score
+    
+    def __repr__(self) -> str:
+        return (f"TelemetryRecord(uav_id={self.uav_id!r}, subsystem={self.subsystem!r}, "
+                f"timestamp={self.timestamp!r}, status={self.status!r}, anomaly_score={self.anomaly_score!r})")
+    
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, (TelemetryRecord, TelemetryData)):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+    
+    @classmethod
+    def from_model(cls, model: TelemetryData) -> "TelemetryRecord":
+        """Create a record from a validated TelemetryData model.
+        
+        Args:
+            model: Telemetry model
+            
+        Returns:
+            Record sharing the model's payload
+        """
+        return cls(model.subsystem, model.uav_id, model.data, model.status, model.timestamp, model.anomaly_score)
+    
+    def to_model(self) -> TelemetryData:
+        """Validate the record into a TelemetryData model.
+        
+        Returns:
+            Telemetry model
+        """
+        return TelemetryData(
+            timestamp=self.timestamp,
+            subsystem=self.subsystem,
+            uav_id=self.uav_id,
+            data=self.data,
+            status=self.status,
+            anomaly_score=self.anomaly_score
+        )
+    
+    def model_copy(self, deep: bool = False) -> "TelemetryRecord":
+        """Copy the record; a deep copy also copies the payload."""
+        data = copy.deepcopy(self.data) if deep else self.data
+        return TelemetryRecord(self.subsystem, self.uav_id, data, self.status, self.timestamp, self.anomaly_score)
+    
+    def model_dump(self, **kwargs: Any) -> Dict[str, Any]:
+        """Dump the record as TelemetryData would."""
+        return self.to_model().model_dump(**kwargs)
+    
+    def model_dump_json(self, **kwargs: Any) -> str:
+        """Serialize the record as TelemetryData would."""
+        return self.to_model().model_dump_json(**kwargs)
+
+
+# Anything carrying telemetry: records internally, models at the boundaries
+Telemetry = Union[TelemetryRecord, TelemetryData]
+
+
+def to_telemetry_model(telemetry: Telemetry) -> TelemetryData:
+    """Validate telemetry at an external boundary.
+    
+    Args:
+        telemetry: Telemetry record or model
+        
+    Returns:
+        Telemetry model
+    """
+    if isinstance(telemetry, TelemetryRecord):
+        return telemetry.to_model()
+    return telemetry
+
+
 class Alert(BaseModel):
     """Alert model for system notifications."""
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
@@ -0,0 +1,183 @@
+"""Immutable telemetry payload snapshots with structural sharing."""
+
+from typing import Any
+
+
+class FrozenDict(dict):
+    """Read-only dict used for published telemetry payloads.
+    
+    A real dict subclass, so lookups, iteration, isinstance checks and
+    serialization behave exactly as for the agent's plain dicts.
+    """
+    
+    __slots__ = ()
+    
+    def _readonly(self, *args: Any, **kwargs: Any) -> None:
+        raise TypeError("Telemetry snapshots are read-only; thaw() them to edit")
+    
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+    
+    def __reduce__(self):
+        return FrozenDict, (dict(self),)
+    
+    def __copy__(self) -> "FrozenDict":
+        return self
+
+
+class FrozenList(list):
+    """Read-only list used for published telemetry payloads."""
+    
+    __slots__ = ()
+    
+    def _readonly(self, *args: Any, **kwargs: Any) -> None:
+        raise TypeError("Telemetry snapshots are read-only; thaw() them to edit")
+    
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _readonly
+    append = extend = insert = pop = remove = clear = sort = reverse = _readonly
+    
+    def __reduce__(self):
+        return FrozenList, (list(self),)
+    
+    def __copy__(self) -> "FrozenList":
+        return self
+
+
+_FROZEN = (FrozenDict, FrozenList)
+
+
+def freeze(value: Any, previous: Any = None) -> Any:
+    """Snapshot a payload, sharing every unchanged subtree with the previous one.
+    
+    Frozen subtrees are immutable, so they are reused as they are; plain
+    dicts and lists are compared with the matching subtree of ``previous``
+    and reused when equal. Only subtrees that changed are copied, so the
+    memory cost of a snapshot is proportional to what changed.
+    
+    Args:
+        value: Payload to snapshot (dicts, lists and scalars)
+        previous: Snapshot of the same payload's previous state, if any
+        
+    Returns:
+        Frozen snapshot of the payload
+    """
+    value_type = type(value)
+    if value_type is FrozenDict or value_type is FrozenList:
+        return value
+    
+    if isinstance(value, dict):
+        if type(previous) is not FrozenDict:
+            previous = None
+        
+        # Sections of scalars are compared shallowly and copied in one go
+        if not _has_containers(dict.values(value)):
+            if previous is not None and dict.__eq__(previous, value) is True:
+                return previous
+            return FrozenDict(value)
+        
+        # Otherwise copy the node and snapshot each nested container in turn
+        snapshot = FrozenDict(value)
+        for key in [key for key, child in dict.items(snapshot) if isinstance(child, _CONTAINERS)]:
+            child_previous = dict.get(previous, key) if previous is not None else None
+            dict.__setitem__(snapshot, key, freeze(dict.__getitem__(snapshot, key), child_previous))
+        
+        # Reused children compare by identity, so this is a shallow check
+        if previous is not None and dict.__eq__(previous, snapshot) is True:
+            return previous
+        return snapshot
+    
+    if isinstance(value, list):
+        if type(previous) is not FrozenList or len(previous) != len(value):
+            previous = None
+        
+        if not _has_containers(list.__iter__(value)):
+            if previous is not None and list.__eq__(previous, value) is True:
+                return previous
+            return FrozenList(list.__iter__(value))
+        
+        snapshot = FrozenList(list.__iter__(value))
+        for index, child in enumerate(list.__iter__(snapshot)):
+            if isinstance(child, _CONTAINERS):
+                child_previous = list.__getitem__(previous, index) if previous is not None else None
+                list.__setitem__(snapshot, index, freeze(child, child_previous))
+        
+        if previous is not None and list.__eq__(previous, snapshot) is True:
+            return previous
+        return snapshot
+    
+    return value
+
+
+_CONTAINERS = (dict, list)
+_SCALARS = frozenset((float, int, bool, str, type(None)))
+
+
+def _has_containers(values: Any) -> bool:
+    """Check for nested containers, testing each distinct type only once."""
+    types = set(map(type, values))
+    if types <= _SCALARS:
+        return False
+    return any(issubclass(value_type, _CONTAINERS) for value_type in types)
+
+
+class _CowDict(dict):
+    """Editable copy of a frozen dict; children are copied when accessed."""
+    
+    __slots__ = ()
+    
+    def __getitem__(self, key: Any) -> Any:
+        value = dict.__getitem__(self, key)
+        if type(value) in _FROZEN:
+            value = thaw(value)
+            dict.__setitem__(self, key, value)
+        return value
+    
+    def get(self, key: Any, default: Any = None) -> Any:
+        return self[key] if key in self else default
+    
+    def values(self):
+        return [self[key] for key in dict.keys(self)]
+    
+    def items(self):
+        return [(key, self[key]) for key in dict.keys(self)]
+
+
+class _CowList(list):
+    """Editable copy of a frozen list; elements are copied when accessed."""
+    
+    __slots__ = ()
+    
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        value = list.__getitem__(self, index)
+        if type(value) in _FROZEN:
+            value = thaw(value)
+            list.__setitem__(self, index, value)
+        return value
+    
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+
+def thaw(snapshot: Any) -> Any:
+    """Get an editable copy-on-write view of a snapshot.
+    
+    Only the node itself is copied; nested nodes are copied the first time
+    they are accessed, so editing one leaf copies just the path to it. Pass
+    the edited result back through freeze() to get a snapshot that still
+    shares every untouched subtree.
+    
+    Args:
+        snapshot: Frozen payload
+        
+    Returns:
+        Editable payload
+    """
+    if type(snapshot) is FrozenDict:
+        return _CowDict(snapshot)
+    if type(snapshot) is FrozenList:
+        return _CowList(snapshot)
+    return snapshot
+
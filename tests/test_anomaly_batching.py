@@ -0,0 +1,90 @@
+"""Tests for micro-batched anomaly detection."""
+
+import pytest
+import asyncio
+
+# Add src to path
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from src.anomaly.anomaly_detector import AnomalyDetector
+from src.agents.power_agent import PowerAgent
+
+
+async def _train(detector: AnomalyDetector, agents, samples: int = 30) -> None:
+    """Fill every window and fit its model."""
+    for _ in range(samples):
+        telemetry = [await agent.generate_telemetry() for agent in agents]
+        await asyncio.gather(*(detector.process_telemetry(t) for t in telemetry))
+    for window_key in detector.data_windows:
+        await detector._retrain_model(window_key)
+
+
+class TestAnomalyBatching:
+    """Test suite for micro-batched anomaly scoring."""
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_samples_share_a_batch(self):
+        """Samples submitted together should be scored in one batch."""
+        detector = AnomalyDetector()
+        agents = [PowerAgent(f"UAV_{i:03d}") for i in range(20)]
+        
+        telemetry = [await agent.generate_telemetry() for agent in agents]
+        results = await asyncio.gather(*(detector.process_telemetry(t) for t in telemetry))
+        
+        stats = detector.get_statistics()
+        assert [r.uav_id for r in results] == [t.uav_id for t in telemetry]
+        assert stats["batches_processed"] == 1
+        assert stats["max_batch_size"] == 20
+        assert stats["pending_samples"] == 0
+    
+    @pytest.mark.asyncio
+    async def test_batched_scores_match_unbatched(self):
+        """Batching should not change the score of any sample."""
+        detector = AnomalyDetector()
+        agents = [PowerAgent(f"UAV_{i:03d}") for i in range(5)]
+        await _train(detector, agents)
+        
+        telemetry = [await agent.generate_telemetry() for agent in agents for _ in range(3)]
+        
+        detector.batching_enabled = False
+        expected = [await detector._detect_anomaly(f"{t.uav_id}_{t.subsystem}", detector._extract_features(t))
+                    for t in telemetry]
+        
+        detector.batching_enabled = True
+        results = await asyncio.gather(*(detector.process_telemetry(t) for t in telemetry))
+        
+        for result, (score, _) in zip(results, expected):
+            assert result.anomaly_score == pytest.approx(score)
+    
+    @pytest.mark.asyncio
+    async def test_stop_flushes_pending_samples(self):
+        """Stopping the detector should resolve queued samples."""
+        detector = AnomalyDetector()
+        detector.max_batch_delay = 60.0
+        
+        future = detector.submit_telemetry(await PowerAgent("UAV_001").generate_telemetry())
+        await detector.stop()
+        
+        assert future.done()
+        assert future.result().uav_id == "UAV_001"
+    
+    @pytest.mark.asyncio
+    async def test_backlog_is_capped(self):
+        """Samples beyond max_pending should skip the oldest queued ones, unscored."""
+        detector = AnomalyDetector()
+        detector.max_pending = 5
+        agents = [PowerAgent(f"UAV_{i:03d}") for i in range(12)]
+        
+        # Nothing is scored until the loop runs, as when scoring falls behind
+        futures = [detector.submit_telemetry(await agent.generate_telemetry()) for agent in agents]
+        assert detector.get_statistics()["pending_samples"] == 5
+        assert all(future.done() for future in futures[:7])
+        
+        results = await asyncio.gather(*futures)
+        stats = detector.get_statistics()
+        assert [result.uav_id for result in results] == [agent.uav_id for agent in agents]
+        assert [result.confidence for result in results[:7]] == [0.0] * 7
+        assert stats["dropped_samples"] == 7 and stats["batched_samples"] == 5
+        assert stats["pending_samples"] == 0
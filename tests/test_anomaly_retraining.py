@@ -0,0 +1,86 @@
+"""Tests for background anomaly model retraining."""
+
+import pytest
+import asyncio
+import time
+
+# Add src to path
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from src.anomaly.anomaly_detector import AnomalyDetector
+from src.agents.power_agent import PowerAgent
+
+
+async def _fill(detector: AnomalyDetector, agents, samples: int) -> None:
+    """Feed every agent's window with fresh samples."""
+    for _ in range(samples):
+        telemetry = [await agent.generate_telemetry() for agent in agents]
+        await asyncio.gather(*(detector.process_telemetry(t) for t in telemetry))
+
+
+class TestAnomalyRetraining:
+    """Test suite for background retraining."""
+    
+    @pytest.mark.asyncio
+    async def test_retraining_does_not_block_event_loop(self):
+        """Scoring should continue while models train in worker processes."""
+        detector = AnomalyDetector()
+        agents = [PowerAgent(f"UAV_{i:03d}") for i in range(8)]
+        
+        gaps = []
+        
+        async def heartbeat():
+            last = time.perf_counter()
+            while True:
+                await asyncio.sleep(0.005)
+                now = time.perf_counter()
+                gaps.append(now - last)
+                last = now
+        
+        beat = asyncio.create_task(heartbeat())
+        await _fill(detector, agents, 25)
+        while detector.get_statistics()["retrain_queue_depth"]:
+            await asyncio.sleep(0.01)
+        beat.cancel()
+        
+        stats = detector.get_statistics()
+        assert stats["trained_windows"] == 8
+        assert stats["model_retrains"] == 8
+        assert stats["average_retrain_latency"] > 0
+        assert max(gaps) < 0.1
+        
+        await detector.stop()
+    
+    @pytest.mark.asyncio
+    async def test_old_model_is_used_until_swap(self):
+        """A window keeps its current model while a retrain is in flight."""
+        detector = AnomalyDetector()
+        agent = PowerAgent("UAV_001")
+        window_key = "UAV_001_Power"
+        
+        await _fill(detector, [agent], 20)
+        await detector._retrain_tasks[window_key]
+        model = detector.models[window_key]
+        
+        detector.next_retrain[window_key] = detector.clock.now()
+        result = await detector.process_telemetry(await agent.generate_telemetry())
+        
+        assert window_key in detector._retrain_tasks
+        assert result.confidence != 0.5
+        assert detector.models[window_key] is model
+        
+        await detector._retrain_tasks[window_key]
+        assert detector.models[window_key] is not model
+        
+        await detector.stop()
+    
+    def test_retrains_are_staggered(self):
+        """Windows trained together should not come due together again."""
+        detector = AnomalyDetector()
+        delays = {detector._retrain_delay(f"UAV_{i:03d}_Power", first_fit=True) for i in range(50)}
+        
+        assert len(delays) == 50
+        assert all(detector.retrain_interval <= d < 2 * detector.retrain_interval for d in delays)
+        assert detector._retrain_delay("UAV_001_Power", first_fit=False) == detector.retrain_interval
@@ -0,0 +1,63 @@
+"""Tests for bulk UAV management."""
+
+import pytest
+
+# Add src to path
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from src.agents.telemetry_manager import TelemetryManager
+from src.utils.config import config
+
+
+class TestBulkUAVs:
+    """Test suite for add_uavs/remove_uavs."""
+    
+    @pytest.mark.asyncio
+    async def test_add_uavs_skips_duplicates(self):
+        """Bulk adds should create every new UAV once and report which were added."""
+        manager = TelemetryManager()
+        await manager.add_uav("UAV_001", ["Power"])
+        
+        added = await manager.add_uavs(["UAV_001", "UAV_002", "UAV_003", "UAV_002"], ["Power", "Propulsion"])
+        
+        assert added == ["UAV_002", "UAV_003"]
+        assert list(manager.uavs["UAV_001"]) == ["Power"]
+        assert list(manager.uavs["UAV_003"]) == ["Power", "Propulsion"]
+    
+    @pytest.mark.asyncio
+    async def test_bounded_start_and_stop(self):
+        """Agents should be started and stopped in bulk, a few at a time."""
+        manager = TelemetryManager()
+        manager.startup_concurrency = 3
+        await manager.start()
+        try:
+            await manager.add_uavs([f"UAV_{i:03d}" for i in range(10)], ["Power", "Navigation"])
+            agents = [agent for uav in manager.uavs.values() for agent in uav.values()]
+            assert len(agents) == 20
+            assert all(agent.is_running for agent in agents)
+            assert all(manager.scheduler.is_registered(agent) for agent in agents)
+            
+            removed = await manager.remove_uavs(["UAV_000", "UAV_001", "UAV_404"])
+            assert removed == ["UAV_000", "UAV_001"]
+            assert len(manager.uavs) == 8
+            assert sum(agent.is_running for agent in agents) == 16
+        finally:
+            await manager.stop()
+        
+        assert not any(agent.is_running for agent in agents)
+    
+    def test_subsystem_config_cache_follows_updates(self):
+        """Cached subsystem lookups should see configuration changes."""
+        subsystems = config.get("uav.subsystems")
+        assert config.get_subsystem("Power")["telemetry_rate"] == 15
+        assert config.get_subsystem("Unknown") == {}
+        
+        try:
+            config.set("uav.subsystems", [dict(subsystems[0], name="Power", telemetry_rate=7)])
+            assert config.get_subsystem("Power")["telemetry_rate"] == 7
+        finally:
+            config.set("uav.subsystems", subsystems)
+        
+        assert config.get_subsystem("Power")["telemetry_rate"] == 15
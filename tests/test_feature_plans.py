@@ -0,0 +1,58 @@
+"""Tests for compiled feature extraction plans."""
+
+import pytest
+
+# Add src to path
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from src.anomaly.feature_plans import FeaturePlanCompiler
+from src.agents.navigation_agent import NavigationAgent
+from src.agents.propulsion_agent import PropulsionAgent
+
+
+class TestFeaturePlans:
+    """Test suite for FeaturePlanCompiler."""
+    
+    @pytest.mark.asyncio
+    async def test_plan_matches_telemetry_values(self):
+        """Compiled accessors should read the same values as the payload."""
+        compiler = FeaturePlanCompiler(["altitude", "speed"])
+        telemetry = await PropulsionAgent("UAV_001").generate_telemetry()
+        motors = telemetry.data["motors"].values()
+        
+        plan = compiler.get_plan("Propulsion", telemetry.data)
+        features = plan.to_dict(plan.extract(telemetry.data))
+        
+        assert plan.columns == ("total_thrust", "avg_motor_temp")
+        assert features["total_thrust"] == pytest.approx(sum(m["thrust"] for m in motors))
+        assert features["avg_motor_temp"] == pytest.approx(sum(m["temperature"] for m in motors) / len(motors))
+    
+    @pytest.mark.asyncio
+    async def test_plan_is_compiled_once_per_subsystem(self):
+        """Every sample of a subsystem should reuse the same plan."""
+        compiler = FeaturePlanCompiler([])
+        agent = NavigationAgent("UAV_001")
+        
+        first = compiler.get_plan("Navigation", (await agent.generate_telemetry()).data)
+        second = compiler.get_plan("Navigation", (await agent.generate_telemetry()).data)
+        
+        assert first is second
+        assert first.columns == ("latitude", "longitude", "altitude", "heading", "roll", "pitch")
+    
+    @pytest.mark.asyncio
+    async def test_missing_values_keep_column_layout(self):
+        """Samples with missing fields should still fill every column."""
+        compiler = FeaturePlanCompiler([])
+        telemetry = await NavigationAgent("UAV_001").generate_telemetry()
+        plan = compiler.get_plan("Navigation", telemetry.data)
+        
+        del telemetry.data["attitude"]["roll"]
+        telemetry.data["position"]["altitude"] = None
+        row = plan.extract(telemetry.data)
+        
+        assert len(row) == len(plan)
+        assert row[2] == 0.0 and row[4] == 0.0
+        assert row[0] == telemetry.data["position"]["latitude"]
+        assert plan.fallbacks == 1
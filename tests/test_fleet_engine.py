@@ -0,0 +1,113 @@
+"""Tests for the vectorized fleet-state engine."""
+
+import pytest
+import asyncio
+import numpy as np
+
+# Add src to path
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from src.agents.fleet_engine import FleetStateEngine
+from src.agents.power_agent import PowerAgent
+from src.agents.propulsion_agent import PropulsionAgent
+from src.agents.navigation_agent import NavigationAgent
+from src.agents.telemetry_manager import TelemetryManager
+
+
+def _keys(data):
+    """Flatten the nested key layout of a telemetry payload."""
+    keys = set()
+    for key, value in data.items():
+        keys.add(key)
+        if isinstance(value, dict):
+            keys.update(f"{key}.{sub}" for sub in _keys(value))
+    return keys
+
+
+class TestFleetStateEngine:
+    """Test suite for FleetStateEngine."""
+    
+    @pytest.mark.asyncio
+    async def test_payload_layout_matches_agents(self):
+        """Materialized telemetry should have the per-agent layout."""
+        engine = FleetStateEngine(seed=1)
+        
+        for agent_class in (PowerAgent, PropulsionAgent, NavigationAgent):
+            reference = await agent_class("REF").generate_telemetry()
+            agent = agent_class("UAV_001")
+            await engine.attach(agent)
+            
+            group = engine.groups[agent.subsystem_name]
+            group.step()
+            telemetry = group.materialize("UAV_001")
+            
+            assert telemetry.subsystem == reference.subsystem
+            assert _keys(telemetry.data) == _keys(reference.data)
+    
+    @pytest.mark.asyncio
+    async def test_step_updates_whole_fleet(self):
+        """One step should advance every UAV row."""
+        engine = FleetStateEngine(seed=1)
+        for i in range(100):
+            await engine.attach(PropulsionAgent(f"UAV_{i:03d}"))
+        
+        before = engine.get_state("Propulsion")["rpm"].copy()
+        engine.groups["Propulsion"].step()
+        after = engine.get_state("Propulsion")["rpm"]
+        
+        assert after.shape == (100, 4)
+        assert (before != after).all()
+    
+    @pytest.mark.asyncio
+    async def test_remove_keeps_rows_consistent(self):
+        """Removing a UAV should not disturb other rows."""
+        engine = FleetStateEngine(seed=1)
+        agents = [NavigationAgent(f"UAV_{i:03d}") for i in range(3)]
+        for agent in agents:
+            await engine.attach(agent)
+        
+        group = engine.groups["Navigation"]
+        last_latitude = group.materialize("UAV_002").data["position"]["latitude"]
+        
+        engine.detach(agents[0])
+        
+        assert len(group) == 2
+        assert not group.contains("UAV_000")
+        assert group.materialize("UAV_002").data["position"]["latitude"] == last_latitude
+    
+    @pytest.mark.asyncio
+    async def test_same_seed_same_state(self):
+        """Identical seeds should produce identical fleet state."""
+        states = []
+        for _ in range(2):
+            engine = FleetStateEngine(seed=42)
+            for i in range(10):
+                await engine.attach(PowerAgent(f"UAV_{i:03d}"))
+            for _ in range(5):
+                engine.groups["Power"].step()
+            states.append(engine.get_state("Power").copy())
+        
+        assert np.array_equal(states[0], states[1])
+    
+    @pytest.mark.asyncio
+    async def test_manager_publishes_fleet_telemetry_with_faults(self):
+        """Fleet-driven agents should still publish and apply faults."""
+        manager = TelemetryManager(use_fleet_engine=True)
+        received = []
+        
+        async def on_telemetry(telemetry):
+            if telemetry.subsystem == "Power":
+                received.append(telemetry)
+        
+        manager.register_telemetry_callback(on_telemetry)
+        await manager.add_uav("UAV_001", ["Power", "Communication"])
+        await manager.inject_fault("UAV_001", "Power", {"type": "battery_failure"})
+        await manager.start()
+        await asyncio.sleep(0.3)
+        await manager.stop()
+        
+        assert received
+        assert all(t.data["battery"]["voltage"] == 0.0 for t in received)
+        assert manager.get_fleet_engine_statistics()["subsystems"]["Power"]["uavs"] == 1
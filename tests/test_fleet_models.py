@@ -0,0 +1,77 @@
+"""Tests for fleet-level anomaly models."""
+
+import pytest
+import asyncio
+
+# Add src to path
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from src.anomaly.anomaly_detector import AnomalyDetector
+from src.agents.power_agent import PowerAgent
+from src.agents.communication_agent import CommunicationAgent
+
+
+async def _feed(detector: AnomalyDetector, agents, samples: int) -> None:
+    """Feed every agent's window and wait for queued retrains."""
+    for _ in range(samples):
+        telemetry = [await agent.generate_telemetry() for agent in agents]
+        await asyncio.gather(*(detector.process_telemetry(t) for t in telemetry))
+    while detector._retrain_tasks:
+        await asyncio.sleep(0.01)
+
+
+class TestFleetModels:
+    """Test suite for fleet model scope."""
+
+    @pytest.mark.asyncio
+    async def test_one_model_per_subsystem(self):
+        """All UAVs of a subsystem should share one fitted model."""
+        detector = AnomalyDetector()
+        detector.update_configuration({"model_scope": "fleet"})
+        agents = [cls(f"UAV_{i:03d}") for i in range(10) for cls in (PowerAgent, CommunicationAgent)]
+
+        await _feed(detector, agents, 25)
+        result = await detector.process_telemetry(await agents[0].generate_telemetry())
+
+        stats = detector.get_statistics()
+        assert stats["models"] == 2
+        assert stats["trained_windows"] == 20
+        assert detector.trained_models == {"Power", "Communication"}
+        assert result.confidence != 0.5
+
+        await detector.stop()
+
+    @pytest.mark.asyncio
+    async def test_windows_keep_their_own_scalers(self):
+        """Each UAV should be normalized by its own data."""
+        detector = AnomalyDetector()
+        detector.update_configuration({"model_scope": "fleet"})
+        agents = [PowerAgent(f"UAV_{i:03d}") for i in range(3)]
+
+        await _feed(detector, agents, 25)
+
+        scalers = [detector.scalers[f"{agent.uav_id}_Power"] for agent in agents]
+        assert len({id(scaler) for scaler in scalers}) == 3
+        means = {tuple(scaler.mean_) for scaler in scalers}
+        assert len(means) == 3
+        assert all(scaler.n_samples_seen_ < 3 * 20 for scaler in scalers)
+
+        await detector.stop()
+
+    @pytest.mark.asyncio
+    async def test_late_uav_joins_trained_fleet_model(self):
+        """A UAV added later should be scored once it has its own scaler."""
+        detector = AnomalyDetector()
+        detector.update_configuration({"model_scope": "fleet"})
+        await _feed(detector, [PowerAgent(f"UAV_{i:03d}") for i in range(3)], 25)
+        retrains = detector.get_statistics()["model_retrains"]
+
+        late = PowerAgent("UAV_999")
+        await _feed(detector, [late], 20)
+
+        assert "UAV_999_Power" in detector.trained_windows
+        assert detector.get_statistics()["model_retrains"] == retrains
+
+        await detector.stop()
@@ -0,0 +1,139 @@
+"""Tests for the geofence engine and no-fly zone enforcement."""
+
+import json
+import math
+import numpy as np
+import pytest
+
+# Add src to path
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from src.agents.geofence import GeofenceEngine
+from src.agents.spatial_index import METERS_PER_DEGREE
+from src.agents.telemetry_manager import TelemetryManager
+
+
+def _point_in_polygon(x: float, y: float, ring: np.ndarray) -> bool:
+    """Reference even-odd test over a projected ring."""
+    inside = False
+    for (ax, ay), (bx, by) in zip(ring, np.roll(ring, -1, axis=0)):
+        if (ay > y) != (by > y) and x < ax + (y - ay) * (bx - ax) / (by - ay):
+            inside = not inside
+    return inside
+
+
+def _segment_distance(x: float, y: float, ring: np.ndarray) -> float:
+    """Reference distance from a point to a ring's edges."""
+    best = math.inf
+    for a, b in zip(ring, np.roll(ring, -1, axis=0)):
+        edge = b - a
+        t = min(1.0, max(0.0, float(np.dot((x, y) - a, edge) / np.dot(edge, edge))))
+        best = min(best, math.hypot(*((x, y) - (a + t * edge))))
+    return best
+
+
+class TestGeofenceEngine:
+    """Test suite for GeofenceEngine."""
+    
+    def test_evaluate_matches_brute_force(self):
+        """Grid lookups should equal checking every zone."""
+        rng = np.random.default_rng(11)
+        engine = GeofenceEngine(cell_size=800.0)
+        for _ in range(40):
+            lat, lon = 34.0 + rng.uniform(-0.05, 0.05), -118.0 + rng.uniform(-0.05, 0.05)
+            engine.add_circle(lat, lon, rng.uniform(50, 600))
+        for _ in range(40):
+            lat, lon = 34.0 + rng.uniform(-0.05, 0.05), -118.0 + rng.uniform(-0.05, 0.05)
+            angles = np.sort(rng.uniform(0, 2 * math.pi, 6))
+            radius = rng.uniform(100, 900, 6) / METERS_PER_DEGREE
+            engine.add_polygon(np.column_stack([lat + radius * np.sin(angles), lon + radius * np.cos(angles)]))
+        
+        latitude = 34.0 + rng.uniform(-0.06, 0.06, 500)
+        longitude = -118.0 + rng.uniform(-0.06, 0.06, 500)
+        result = engine.evaluate(latitude, longitude)
+        
+        # Reference: signed distance to every zone in the engine's projection
+        x, y = engine._project(latitude, longitude)
+        for point in range(len(latitude)):
+            signed = []
+            for circle in range(len(engine._circles)):
+                center = engine._circle_xy[circle]
+                signed.append(math.hypot(x[point] - center[0], y[point] - center[1])
+                              - engine._circle_radius[circle])
+            for polygon in range(len(engine._polygons)):
+                ring = engine._vertex_xy[engine._vertex_start[polygon]:engine._vertex_start[polygon + 1]]
+                distance = _segment_distance(x[point], y[point], ring)
+                signed.append(-distance if _point_in_polygon(x[point], y[point], ring) else distance)
+            
+            expected = min(signed)
+            assert result["inside"][point] == (expected < 0)
+            if expected <= 800.0:
+                assert result["distance"][point] == pytest.approx(expected)
+            else:
+                assert math.isinf(result["distance"][point]) and result["zone"][point] == -1
+        
+        assert result["inside"].any() and not result["inside"].all()
+        assert engine.stats["pairs_checked"] < len(latitude) * len(engine)
+    
+    def test_load_geojson_and_mission_zones(self, tmp_path):
+        """GeoJSON polygons, points and mission constraints should become zones."""
+        square = [[-118.01, 33.99], [-117.99, 33.99], [-117.99, 34.01], [-118.01, 34.01], [-118.01, 33.99]]
+        path = tmp_path / "airspace.geojson"
+        path.write_text(json.dumps({"type": "FeatureCollection", "features": [
+            {"type": "Feature", "properties": {"id": "airport"},
+             "geometry": {"type": "Polygon", "coordinates": [square]}},
+            {"type": "Feature", "properties": {"id": "stadium", "radius": 300},
+             "geometry": {"type": "Point", "coordinates": [-118.2, 34.1]}},
+            {"type": "Feature", "properties": {"id": "road"},
+             "geometry": {"type": "LineString", "coordinates": square[:2]}}
+        ]}))
+        
+        engine = GeofenceEngine(cell_size=1000.0)
+        assert engine.load_geojson(str(path)) == 2
+        zones = [{"lat": 34.1, "lon": -118.3, "radius": 1000}]
+        assert engine.add_no_fly_zones(zones) == engine.add_no_fly_zones(zones)
+        assert len(engine) == 3
+        
+        assert engine.contains(34.0, -118.0) == "airport"
+        assert engine.contains(34.1 + 200 / METERS_PER_DEGREE, -118.2) == "stadium"
+        assert engine.contains(34.1, -118.3).startswith("nfz_")
+        assert engine.contains(34.05, -118.1) is None
+        
+        engine.check_fleet(["A", "B"], [34.0, 34.0 + 0.0105], [-118.0, -118.0])
+        assert engine.status("A")["inside"] and engine.status("A")["distance"] < 0
+        outside = engine.status("B")
+        assert outside["zone_id"] == "airport" and outside["distance"] == pytest.approx(55.5, abs=0.5)
+        assert engine.status("C") is None
+    
+    @pytest.mark.asyncio
+    async def test_manager_enforces_mission_no_fly_zones(self):
+        """Entering a mission's no-fly zone should count a violation and alert."""
+        manager = TelemetryManager(use_scheduler=False, use_bus=False, use_geofence=True)
+        alerts = []
+        
+        async def on_alert(alert):
+            alerts.append(alert)
+        
+        manager.register_alert_callback(on_alert)
+        await manager.add_uavs(["UAV_A"], subsystems=["Navigation", "Mission_Planning", "Safety_Systems"])
+        agents = manager.uavs["UAV_A"]
+        zone = agents["Mission_Planning"].mission_constraints["no_fly_zones"][0]
+        assert len(manager.geofence) == 1
+        
+        navigation, mission, safety = (agents[name] for name in ("Navigation", "Mission_Planning", "Safety_Systems"))
+        violations = mission.mission_performance["constraint_violations"]
+        for lat in (zone["lat"] + 0.1, zone["lat"], zone["lat"], zone["lat"] + 0.1, zone["lat"]):
+            navigation.latitude, navigation.longitude = lat, zone["lon"]
+            await manager.geofence.tick()
+            mission._update_mission_performance()
+            await safety.generate_telemetry()
+        
+        assert mission.mission_performance["constraint_violations"] == violations + 2
+        assert safety.emergency_systems["geofence_violation"] is True
+        entered = [alert for alert in alerts if alert.message.startswith("Geofence violation")]
+        assert len(entered) == 2
+        assert entered[0].data["fault_type"] == "geofence_failure"
+        assert entered[0].data["depth"] == pytest.approx(zone["radius"], rel=1e-6)
+        assert manager.get_geofence_statistics()["violations"] == 1
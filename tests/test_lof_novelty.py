@@ -0,0 +1,66 @@
+"""Tests for novelty-mode local outlier factor detection."""
+
+import pytest
+import asyncio
+
+# Add src to path
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from src.anomaly.anomaly_detector import AnomalyDetector
+from src.agents.power_agent import PowerAgent
+
+
+async def _train(detector: AnomalyDetector, agent: PowerAgent, samples: int = 40) -> str:
+    """Fill the agent's window and fit its model."""
+    for _ in range(samples):
+        await detector.process_telemetry(await agent.generate_telemetry())
+    window_key = f"{agent.uav_id}_{agent.subsystem_name}"
+    await detector._retrain_model(window_key)
+    return window_key
+
+
+class TestLOFNovelty:
+    """Test suite for the local outlier factor path."""
+    
+    @pytest.mark.asyncio
+    async def test_scoring_reuses_fitted_index(self):
+        """Scoring new samples should not refit the model or its neighbor index."""
+        detector = AnomalyDetector()
+        detector.update_configuration({"algorithm": "local_outlier_factor"})
+        agent = PowerAgent("UAV_001")
+        window_key = await _train(detector, agent)
+        
+        model = detector.models[window_key]
+        index = model._tree
+        assert model.novelty
+        
+        results = [await detector.process_telemetry(await agent.generate_telemetry()) for _ in range(10)]
+        
+        assert detector.models[window_key] is model
+        assert model._tree is index
+        assert all(0.0 <= result.anomaly_score <= 1.0 for result in results)
+        
+        await detector.stop()
+    
+    @pytest.mark.asyncio
+    async def test_outlier_scores_above_inliers(self):
+        """A sample far from the fitted window should score as anomalous."""
+        detector = AnomalyDetector()
+        detector.update_configuration({"algorithm": "local_outlier_factor"})
+        agent = PowerAgent("UAV_001")
+        window_key = await _train(detector, agent)
+        
+        window = detector.data_windows[window_key]
+        normal = window.view().mean(axis=0)
+        outlier = normal * [0.5, 3.0, 1.0]
+        (normal_score, normal_flag), (outlier_score, outlier_flag) = await detector._detect_anomalies(
+            window_key, [normal.tolist(), outlier.tolist()]
+        )
+        
+        assert not normal_flag
+        assert outlier_flag
+        assert outlier_score > detector.threshold > normal_score
+        
+        await detector.stop()
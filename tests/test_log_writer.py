@@ -0,0 +1,85 @@
+"""Tests for the batched JSON-lines log writer and log sampling."""
+
+import json
+import os
+from datetime import datetime
+from loguru import logger
+
+# Add src to path
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from src.monitoring.logger import JsonLinesWriter, LogSampler
+
+
+START = datetime(2024, 5, 1, 12, 0, 0)
+
+
+class TestJsonLinesWriter:
+    """Test suite for JsonLinesWriter and LogSampler."""
+    
+    def test_loguru_records_written_as_json_lines(self, tmp_path):
+        """Records logged through the sink should land as one compact JSON object per line."""
+        writer = JsonLinesWriter(tmp_path / "app.log", batch_size=4, flush_interval=0.01)
+        writer.start()
+        handler = logger.add(writer.sink, format="{message}")
+        try:
+            for index in range(10):
+                logger.bind(uav_id=f"UAV_{index}", log_type="telemetry").info(f"sample {index}")
+            logger.bind(log_type="alert").warning("hot motor")
+            writer.flush()
+        finally:
+            logger.remove(handler)
+            writer.close()
+        
+        lines = (tmp_path / "app.log").read_text().splitlines()
+        entries = [json.loads(line) for line in lines]
+        assert [entry["message"] for entry in entries[:2]] == ["sample 0", "sample 1"]
+        assert entries[3]["uav_id"] == "UAV_3" and entries[3]["log_type"] == "telemetry"
+        assert entries[-1]["level"] == "WARNING"
+        assert ":test_loguru_records_written_as_json_lines:" in entries[-1]["source"]
+        assert ", " not in lines[0]
+        
+        stats = writer.get_statistics()
+        assert stats["written"] == 11 and stats["dropped"] == 0 and stats["queued"] == 0
+        assert 3 <= stats["batches"] <= 11
+    
+    def test_full_queue_drops_and_rotation(self, tmp_path):
+        """A full queue should drop new records; an oversized file should rotate."""
+        writer = JsonLinesWriter(tmp_path / "app.log", queue_size=3, rotation_mb=100 / 2**20)
+        for index in range(5):
+            writer.submit((START.timestamp(), "INFO", "tests", "fn", index, f"record {index}", {}))
+        assert writer.get_statistics()["queued"] == 3
+        assert writer.stats["dropped"] == 2
+        
+        writer.start()
+        writer.close()
+        assert writer.stats["written"] == 3
+        assert writer.stats["rotations"] >= 1
+        assert len(list(tmp_path.glob("app.*.log.zip"))) == writer.stats["rotations"]
+    
+    def test_rotation_deletes_expired_files(self, tmp_path):
+        """Rotated files past the retention age should be deleted after the next rotation."""
+        expired = tmp_path / "app.2024-01-01_00-00-00_000000.log.zip"
+        expired.write_bytes(b"")
+        os.utime(expired, (0, 0))
+        kept = tmp_path / "app.2024-01-02_00-00-00_000000.log"
+        kept.write_text("")
+        writer = JsonLinesWriter(tmp_path / "app.log", rotation_mb=100 / 2**20, retention_days=1,
+                                 compression=False)
+        writer.submit((START.timestamp(), "INFO", "tests", "fn", 0, "record " * 20, {}))
+        
+        writer.start()
+        writer.close()
+        assert not expired.exists() and kept.exists()
+        assert writer.stats["expired"] == 1
+        assert len(list(tmp_path.glob("app.*.log"))) == 2
+    
+    def test_sampler_keeps_one_in_n(self):
+        """Configured types should keep every Nth record; other types all records."""
+        sampler = LogSampler({"telemetry": 3, "alert": 1})
+        kept = [sampler.keep("telemetry") for _ in range(7)]
+        assert kept == [True, False, False, True, False, False, True]
+        assert all(sampler.keep("alert") for _ in range(5))
+        assert sampler.sampled_out == {"telemetry": 4}
@@ -0,0 +1,90 @@
+"""Tests for copy-on-write telemetry payload snapshots."""
+
+import pytest
+import copy
+import json
+import pickle
+
+# Add src to path
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from src.agents.power_agent import PowerAgent
+from src.agents.data_storage_agent import DataStorageAgent
+from src.utils.snapshot import FrozenDict, FrozenList, freeze, thaw
+
+
+class TestPayloadSnapshots:
+    """Test suite for payload snapshots."""
+    
+    def test_snapshots_are_read_only(self):
+        """Snapshots should reject edits but behave like plain containers otherwise."""
+        snapshot = freeze({"battery": {"voltage": 12.0}, "cells": [3.7, 3.8]})
+        
+        with pytest.raises(TypeError):
+            snapshot["battery"]["voltage"] = 0.0
+        with pytest.raises(TypeError):
+            snapshot["cells"].append(3.9)
+        
+        assert isinstance(snapshot["battery"], dict)
+        assert json.loads(json.dumps(snapshot)) == snapshot
+        assert pickle.loads(pickle.dumps(snapshot)) == snapshot
+        assert copy.deepcopy(snapshot) == snapshot
+    
+    def test_unchanged_subtrees_are_shared(self):
+        """Only the sections that changed should be copied."""
+        state = {"battery": {"voltage": 12.0}, "solar": {"power": 5.0}, "cells": [{"v": 3.7}]}
+        first = freeze(state)
+        
+        state["battery"]["voltage"] = 11.9
+        second = freeze(state, first)
+        
+        assert second["battery"] is not first["battery"]
+        assert second["solar"] is first["solar"]
+        assert second["cells"] is first["cells"]
+        assert freeze(state, second) is second
+    
+    def test_thaw_copies_only_touched_path(self):
+        """Edits through a thawed view should leave the snapshot intact."""
+        snapshot = freeze({"radio": {"rssi": -60.0}, "network": {"links": [{"up": True}]}})
+        
+        edited = thaw(snapshot)
+        edited["radio"]["rssi"] = -100.0
+        for link in edited["network"]["links"]:
+            link["up"] = False
+        result = freeze(edited)
+        
+        assert snapshot["radio"]["rssi"] == -60.0
+        assert snapshot["network"]["links"][0]["up"] is True
+        assert result["radio"]["rssi"] == -100.0
+        assert type(result["network"]["links"]) is FrozenList
+        assert type(result) is FrozenDict
+    
+    @pytest.mark.asyncio
+    async def test_faults_do_not_corrupt_agent_state(self):
+        """Publishing a faulted sample should not write into the agent's state."""
+        agent = PowerAgent("UAV_001")
+        await agent.inject_fault({"type": "voltage_drop", "drop_factor": 0.5})
+        
+        await agent.tick()
+        voltage = agent.battery_data["voltage"]
+        published = agent._telemetry_history[-1]
+        
+        assert published.data["battery"]["voltage"] == pytest.approx(voltage * 0.5)
+        assert agent._last_payload["battery"]["voltage"] == voltage
+    
+    @pytest.mark.asyncio
+    async def test_history_keeps_each_sample(self):
+        """History entries should not change as the agent keeps running."""
+        agent = DataStorageAgent("UAV_001")
+        await agent.inject_fault({"type": "storage_failure"})
+        for _ in range(5):
+            await agent.tick()
+        
+        history = agent._telemetry_history
+        assert len({id(record.data) for record in history}) == 5
+        assert all(
+            record.data["storage_devices"]["primary_ssd"]["status"] == "failed" for record in history
+        )
+        assert all(device["status"] != "failed" for device in agent.storage_devices.values())
@@ -0,0 +1,124 @@
+"""Tests for the coupled flight physics core."""
+
+import numpy as np
+import pytest
+
+# Add src to path
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from src.agents.physics import FlightPhysics
+from src.agents.telemetry_manager import TelemetryManager
+
+
+def _run(physics: FlightPhysics, seconds: float) -> None:
+    """Step the physics for a span of simulated time."""
+    for _ in range(int(seconds * physics.telemetry_rate)):
+        physics.step(1.0 / physics.telemetry_rate)
+
+
+class TestFlightPhysics:
+    """Test suite for FlightPhysics."""
+    
+    def test_thrust_attitude_and_battery_are_coupled(self):
+        """Thrust sets speed, surfaces set attitude, and power draw drains the battery."""
+        physics = FlightPhysics(rate=50.0, seed=1)
+        for uav_id in ("A", "B", "C"):
+            physics.add(uav_id, latitude=34.0, longitude=-118.0, altitude=200.0, heading=0.0, speed=15.0)
+        physics._wander_targets = lambda state, dt: None  # hold the commanded targets
+        physics.command("B", heading=90.0, altitude=260.0)
+        physics.command("C", speed=25.0)
+        
+        _run(physics, 2.0)
+        b = physics.row("B")
+        assert b["surfaces"][1] > 0 > b["surfaces"][0]  # differential aileron into the turn
+        assert b["roll"] > 10 and b["surfaces"][2] > 0 and b["pitch"] > 0
+        
+        _run(physics, 28.0)
+        a, b, c = physics.row("A"), physics.row("B"), physics.row("C")
+        assert b["heading"] == pytest.approx(90.0, abs=1.0) and abs(b["roll"]) < 1.0
+        assert b["altitude"] > 250.0
+        assert a["speed"] == pytest.approx(15.0, abs=0.5) and c["speed"] == pytest.approx(25.0, abs=0.5)
+        
+        # Faster flight needs more thrust, more power and more charge
+        assert c["thrust"].sum() == pytest.approx(FlightPhysics.DRAG * c["speed"] ** 2, rel=0.05)
+        assert c["total_power"] > a["total_power"]
+        assert c["state_of_charge"] < a["state_of_charge"] < 90.0
+        used = (4500.0 - a["remaining_capacity"]) * 3.6  # As
+        assert used / 30.0 == pytest.approx(a["current"], rel=0.05)
+        
+        # Losing a motor costs thrust, so speed drops; an empty battery stops the motors
+        physics.set_motor_health("A", [0.0, 1.0, 1.0, 1.0])
+        physics.row("C")["remaining_capacity"] = 0.0
+        _run(physics, 10.0)
+        a, c = physics.row("A"), physics.row("C")
+        assert a["rpm"][0] == pytest.approx(0.0, abs=1.0) and a["thrust"][0] == 0.0
+        assert a["speed"] < 15.0 and a["rpm"][1] > physics.row("B")["rpm"][1]
+        assert c["thrust"].sum() < 1.0 and c["speed"] < 15.0 and c["vertical_speed"] < 0
+    
+    @pytest.mark.asyncio
+    async def test_agents_read_the_shared_physics(self):
+        """Navigation, Propulsion, Power and Flight_Control report one coupled state."""
+        manager = TelemetryManager(use_scheduler=False, use_bus=False, use_route_engine=False, use_physics=True)
+        await manager.add_uavs(["UAV_A"], subsystems=["Navigation", "Propulsion", "Power", "Flight_Control"])
+        agents = manager.uavs["UAV_A"]
+        physics = manager.physics
+        row = physics.row("UAV_A")
+        assert row["latitude"] == agents["Navigation"].latitude
+        
+        physics.command("UAV_A", heading=(row["heading"] + 60) % 360)
+        _run(physics, 3.0)
+        navigation = (await agents["Navigation"].generate_telemetry()).data
+        propulsion = (await agents["Propulsion"].generate_telemetry()).data
+        power = (await agents["Power"].generate_telemetry()).data
+        flight = (await agents["Flight_Control"].generate_telemetry()).data
+        
+        assert navigation["position"]["latitude"] == row["latitude"]
+        assert navigation["velocity"]["speed"] == row["speed"]
+        assert navigation["attitude"]["roll"] == flight["flight_dynamics"]["bank_angle"] == row["roll"]
+        assert flight["control_surfaces"]["aileron_right"] == row["surfaces"][1]
+        assert propulsion["overall"]["total_thrust"] == pytest.approx(row["thrust"].sum())
+        assert propulsion["overall"]["power_consumption"] == pytest.approx(row["propulsion_power"])
+        assert power["power_distribution"]["propulsion"] == pytest.approx(row["propulsion_power"])
+        assert power["battery"]["state_of_charge"] == row["state_of_charge"] < 90.0
+        
+        # The Power agent's other loads are what the physics drains alongside the motors
+        loads = sum(power["power_distribution"][name] for name in ("avionics", "communication", "payload", "sensors"))
+        assert row["load_power"] == pytest.approx(loads - power["solar"]["power"])
+        
+        # A propulsion fault takes thrust out of the airframe
+        await agents["Propulsion"].inject_fault({"type": "motor_failure", "motor_id": "motor_2"})
+        assert list(row["motor_health"]) == [1.0, 0.0, 1.0, 1.0]
+        await agents["Propulsion"].clear_fault()
+        assert list(row["motor_health"]) == [1.0] * 4
+        
+        await manager.remove_uav("UAV_A")
+        assert "UAV_A" not in physics and len(physics) == 0
+    
+    @pytest.mark.asyncio
+    async def test_fleet_engine_groups_are_coupled(self):
+        """Vectorized fleet models take their coupled fields from the physics arrays."""
+        manager = TelemetryManager(use_scheduler=False, use_bus=False, use_fleet_engine=True, use_physics=True)
+        uav_ids = [f"UAV_{i:03d}" for i in range(20)]
+        await manager.add_uavs(uav_ids, subsystems=["Navigation", "Propulsion", "Power"])
+        physics = manager.physics
+        groups = manager.fleet_engine.groups
+        
+        _run(physics, 5.0)
+        for group in groups.values():
+            group.step()
+        rows = physics.rows(groups["Navigation"].uav_ids)
+        assert np.array_equal(groups["Navigation"].state["latitude"], physics.state["latitude"][rows])
+        assert np.array_equal(groups["Navigation"].state["gyro"][:, 2], physics.state["turn_rate"][rows])
+        
+        rows = physics.rows(groups["Propulsion"].uav_ids)
+        assert np.allclose(groups["Propulsion"].state["total_thrust"], physics.state["thrust"][rows].sum(axis=1))
+        
+        power = groups["Power"]
+        rows = physics.rows(power.uav_ids)
+        assert np.array_equal(power.state["state_of_charge"], physics.state["state_of_charge"][rows])
+        assert np.all(power.state["state_of_charge"] < 90.0)
+        record = power.materialize("UAV_005").data
+        assert record["power_distribution"]["propulsion"] == pytest.approx(physics.row("UAV_005")["propulsion_power"])
+        assert manager.get_physics_statistics()["uavs"] == 20
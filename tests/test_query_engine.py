@@ -0,0 +1,123 @@
+"""Tests for the recorded telemetry query engine."""
+
+from datetime import datetime, timedelta
+import threading
+import numpy as np
+import pytest
+
+# Add src to path
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from src.monitoring.telemetry_recorder import TelemetryRecorder
+from src.storage.query_engine import TelemetryQueryEngine
+from src.utils.models import SystemStatus, TelemetryRecord
+
+
+START = datetime(2024, 5, 1, 12, 0, 0)
+
+
+@pytest.fixture
+def recorder(tmp_path):
+    """400 Propulsion samples, one per second over 4 UAVs, in chunks of 50."""
+    recorder = TelemetryRecorder(tmp_path, chunk_rows=50)
+    for second in range(400):
+        status = SystemStatus.WARNING if second % 10 == 0 else SystemStatus.NOMINAL
+        recorder.append(TelemetryRecord(
+            "Propulsion", f"UAV_{second % 4}", {"motors": {"motor_1": {"temperature": float(second)}}},
+            status=status, timestamp=START + timedelta(seconds=second), anomaly_score=second / 400
+        ))
+    recorder.flush()
+    yield recorder
+    recorder.close()
+
+
+class TestTelemetryQueryEngine:
+    """Test suite for TelemetryQueryEngine."""
+    
+    def test_windowed_aggregate_skips_chunks(self, recorder):
+        """A per-UAV max over a time window should only open the chunks it covers."""
+        engine = TelemetryQueryEngine(recorder.directory)
+        
+        result = engine.aggregate(["motors.motor_1.temperature"], ["max", "mean", "count"],
+                                  subsystems=["Propulsion"], start=START + timedelta(seconds=100),
+                                  end=START + timedelta(seconds=199))
+        
+        assert result["uav_id"].tolist() == ["UAV_0", "UAV_1", "UAV_2", "UAV_3"]
+        assert result["motors.motor_1.temperature_max"].tolist() == [196.0, 197.0, 198.0, 199.0]
+        assert result["motors.motor_1.temperature_mean"].tolist() == [148.0, 149.0, 150.0, 151.0]
+        assert result["motors.motor_1.temperature_count"].tolist() == [25, 25, 25, 25]
+        assert engine.stats["chunks_scanned"] == 2
+        assert engine.stats["chunks_skipped"] == 6
+        
+        # Min/max indexes rule out chunks for value predicates and UAVs
+        hot = engine.scan(["motors.motor_1.temperature"], uav_ids=["UAV_1"],
+                          where=[("motors.motor_1.temperature", ">", 380)])
+        assert hot["motors.motor_1.temperature"].tolist() == [381.0, 385.0, 389.0, 393.0, 397.0]
+        assert engine.stats["chunks_scanned"] == 3
+        assert len(engine.scan(where=[("motors.motor_1.temperature", ">", 1000)])["timestamp"]) == 0
+    
+    def test_downsample_counts_and_latest(self, recorder):
+        """Downsampling should bound buckets per group; counts and latest should cover the recording."""
+        engine = TelemetryQueryEngine(recorder.directory)
+        
+        series = engine.downsample("anomaly_score", 10, aggregation="max", uav_ids=["UAV_2"])
+        assert len(series["bucket"]) == 10
+        assert series["bucket"][0] == np.datetime64(START, "us")
+        assert series["rows"].sum() == 100
+        assert series["anomaly_score_max"][-1] == pytest.approx(398 / 400)
+        
+        assert engine.counts() == {"Propulsion": 400}
+        assert engine.counts("status") == {"nominal": 360, "warning": 40}
+        assert [record.timestamp for record in engine.latest(3)] == [
+            START + timedelta(seconds=second) for second in (397, 398, 399)
+        ]
+        
+        by_bucket = engine.aggregate(["motors.motor_1.temperature"], ["min"], by=[], bucket=100)
+        assert by_bucket["motors.motor_1.temperature_min"].tolist() == [0.0, 100.0, 200.0, 300.0]
+    
+    def test_latest_reads_only_newest_chunks(self, recorder):
+        """Latest should rebuild records from the newest chunks that hold them."""
+        engine = TelemetryQueryEngine(recorder.directory)
+        
+        assert engine.latest(60)[0].timestamp == START + timedelta(seconds=340)
+        assert engine.stats["chunks_scanned"] == 2
+        assert engine.stats["rows_scanned"] == 60
+    
+    def test_live_recording_includes_unwritten_tail(self, recorder):
+        """Queries through a recorder should see records it has not written yet."""
+        engine = TelemetryQueryEngine(recorder=recorder)
+        recorder.append(TelemetryRecord("Power", "UAV_9", {"battery": {"voltage": 21.5}},
+                                        timestamp=START + timedelta(seconds=500)))
+        
+        assert engine.counts() == {"Propulsion": 400, "Power": 1}
+        assert engine.scan(["battery.voltage"], subsystems=["Power"])["battery.voltage"].tolist() == [21.5]
+        assert engine.latest(1)[0].uav_id == "UAV_9"
+        assert engine.time_range() == (START, START + timedelta(seconds=500))
+    
+    def test_live_queries_see_each_record_once(self, tmp_path):
+        """Chunks being written and the refilled buffer should neither repeat nor drop records."""
+        recorder = TelemetryRecorder(tmp_path, chunk_rows=4)
+        engine = TelemetryQueryEngine(recorder=recorder)
+        gate = threading.Event()
+        recorder._writer.submit(gate.wait)  # Hold chunks in flight
+        
+        def seconds():
+            timestamps = engine.scan(subsystems=["Power"])["timestamp"]
+            return ((timestamps - np.datetime64(START, "us")) // np.timedelta64(1, "s")).tolist()
+        
+        try:
+            for second in range(10):
+                recorder.append(TelemetryRecord("Power", "UAV_0", {"battery": {"voltage": 20.0 + second}},
+                                                timestamp=START + timedelta(seconds=second)))
+                assert seconds() == list(range(second + 1))
+            assert engine.counts() == {"Power": 10}
+            assert engine.latest(1)[0].timestamp == START + timedelta(seconds=9)
+        finally:
+            gate.set()
+        
+        recorder.flush()
+        assert recorder.get_statistics()["chunks_written"] == 3
+        assert seconds() == list(range(10))
+        recorder.close()
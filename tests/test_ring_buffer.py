@@ -0,0 +1,65 @@
+"""Tests for the data window ring buffer."""
+
+import pytest
+import numpy as np
+
+# Add src to path
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from src.anomaly.ring_buffer import RingBuffer
+from src.anomaly.anomaly_detector import AnomalyDetector
+from src.agents.power_agent import PowerAgent
+
+
+class TestRingBuffer:
+    """Test suite for RingBuffer."""
+    
+    def test_keeps_latest_rows(self):
+        """A full buffer should keep the most recent rows in order."""
+        buffer = RingBuffer(3, ["a", "b"])
+        for i in range(5):
+            buffer.append((i, -i))
+        
+        assert len(buffer) == 3
+        assert buffer.ordered()[:, 0].tolist() == [2, 3, 4]
+        assert sorted(buffer.view()[:, 0].tolist()) == [2, 3, 4]
+    
+    def test_view_is_zero_copy(self):
+        """view() should expose the buffer's storage."""
+        buffer = RingBuffer(4, ["a"])
+        buffer.append((1.0,))
+        
+        assert np.shares_memory(buffer.view(), buffer._data)
+        assert buffer.view().dtype == np.float32
+    
+    def test_resize_keeps_most_recent_rows(self):
+        """Shrinking and growing should keep the newest rows."""
+        buffer = RingBuffer(5, ["a"])
+        for i in range(7):
+            buffer.append((i,))
+        
+        buffer.resize(2)
+        assert buffer.ordered()[:, 0].tolist() == [5, 6]
+        
+        buffer.resize(4)
+        buffer.append((7,))
+        assert buffer.ordered()[:, 0].tolist() == [5, 6, 7]
+    
+    @pytest.mark.asyncio
+    async def test_detector_windows_resize_with_configuration(self):
+        """update_configuration(window_size=...) should resize every window."""
+        detector = AnomalyDetector()
+        agent = PowerAgent("UAV_001")
+        for _ in range(30):
+            await detector.process_telemetry(await agent.generate_telemetry())
+        
+        window = detector.data_windows["UAV_001_Power"]
+        detector.update_configuration({"window_size": 10})
+        
+        assert window.capacity == 10
+        assert len(window) == 10
+        assert window.columns == ("battery_voltage", "battery_current", "battery_soc")
+        
+        await detector.stop()
@@ -0,0 +1,124 @@
+"""Tests for the route engine and waypoint progress wiring."""
+
+import math
+import numpy as np
+import pytest
+
+# Add src to path
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from src.agents.route_engine import RouteEngine, haversine, EARTH_RADIUS
+from src.agents.telemetry_manager import TelemetryManager
+
+
+def _east(meters: float, latitude: float) -> float:
+    """Longitude offset of a distance east at a latitude."""
+    return math.degrees(meters / (EARTH_RADIUS * math.cos(math.radians(latitude))))
+
+
+def _survey(n: int, spacing: float = 0.002):
+    """Lawnmower survey pattern of n waypoints."""
+    return [{"lat": 34.0 + spacing * (i // 2), "lon": -118.0 + 0.01 * ((i + 1) // 2 % 2)} for i in range(n)]
+
+
+class TestRouteEngine:
+    """Test suite for RouteEngine."""
+    
+    def test_progress_on_a_leg(self):
+        """Along-track, cross-track and remaining distance follow the leg geometry."""
+        route = [{"lat": 34.0, "lon": -118.0}, {"lat": 34.01, "lon": -118.0},
+                 {"lat": 34.01, "lon": -117.99}, {"lat": 34.0, "lon": -117.99}]
+        legs = [haversine(a["lat"], a["lon"], b["lat"], b["lon"]) for a, b in zip(route, route[1:])]
+        engine = RouteEngine(window=4)
+        engine.set_route("A", route)
+        engine.set_route("B", route)
+        
+        # A is halfway up the first leg, 100 m right of track; B is left of the second leg
+        engine.update(["A", "B", "C"], [34.005, 34.0105], [-118.0 + _east(100, 34.005), -117.995])
+        a = engine.progress("A")
+        assert a["leg"] == 0 and a["next_waypoint"] == 1 and a["total_waypoints"] == 4
+        assert a["along_track"] == pytest.approx(legs[0] / 2, abs=1.0)
+        assert a["cross_track_error"] == pytest.approx(100.0, abs=0.1)
+        assert a["total_distance"] == pytest.approx(sum(legs))
+        assert a["distance_remaining"] == pytest.approx(sum(legs) - a["along_track"])
+        assert a["distance_to_target"] == pytest.approx(haversine(34.005, -118.0 + _east(100, 34.005), 34.01, -118.0))
+        
+        b = engine.progress("B")
+        assert b["leg"] == 1 and b["next_waypoint"] == 2
+        assert b["cross_track_error"] == pytest.approx(-haversine(34.01, -117.995, 34.0105, -117.995), rel=1e-3)
+        assert b["bearing_to_target"] == pytest.approx(96.9, abs=0.1)  # east, a little south
+        assert engine.progress("C") is None
+        
+        assert engine.waypoint_at("A", 0.0) == 1
+        assert engine.waypoint_at("A", legs[0] + 1.0) == 2
+        assert engine.waypoint_at("A", 1e9) == 3
+        assert engine.waypoint_at("C", 0.0) is None
+        
+        # Changing another route keeps the last update of unchanged ones
+        engine.set_route("C", route)
+        engine.remove_route("A")
+        assert engine.progress("B") == b
+        assert engine.progress("A") is None and engine.progress("C") is None
+        engine.set_route("B", route)
+        assert engine.progress("B") is None
+    
+    def test_fleet_follows_long_routes_forward(self):
+        """Thousands of waypoints per route: each UAV is tracked leg by leg."""
+        rng = np.random.default_rng(2)
+        engine = RouteEngine(window=3)
+        uav_ids = [f"UAV_{i:03d}" for i in range(50)]
+        routes = {uav_id: _survey(2000 + 10 * i) for i, uav_id in enumerate(uav_ids)}
+        for uav_id, route in routes.items():
+            engine.set_route(uav_id, route)
+        
+        # Walk every UAV up its route one waypoint per update, slightly off track
+        for step in range(1, 40):
+            latitude = [routes[uav_id][step]["lat"] + rng.uniform(-1e-5, 1e-5) for uav_id in uav_ids]
+            longitude = [routes[uav_id][step]["lon"] + rng.uniform(-1e-5, 1e-5) for uav_id in uav_ids]
+            engine.update(uav_ids, latitude, longitude)
+            
+            for uav_id, lat, lon in zip(uav_ids[::7], latitude[::7], longitude[::7]):
+                progress = engine.progress(uav_id)
+                route = routes[uav_id]
+                travelled = sum(haversine(a["lat"], a["lon"], b["lat"], b["lon"])
+                                for a, b in zip(route[:step], route[1:step + 1]))
+                assert progress["along_track"] == pytest.approx(travelled, abs=3.0)
+                assert abs(progress["cross_track_error"]) < 3.0
+                assert progress["next_waypoint"] in (step, step + 1)
+        
+        assert engine.stats["legs_checked"] == 39 * 50 * 3
+        engine.remove_route("UAV_000")
+        engine.update(uav_ids, latitude, longitude)
+        assert engine.progress("UAV_000") is None and engine.get_statistics()["tracked"] == 49
+    
+    @pytest.mark.asyncio
+    async def test_manager_derives_mission_progress_and_guidance(self):
+        """Mission progress and autopilot guidance come from the tracked route."""
+        manager = TelemetryManager(use_scheduler=False, use_bus=False, use_route_engine=True)
+        await manager.add_uavs(["UAV_A"], subsystems=["Navigation", "Mission_Planning", "Flight_Control"])
+        agents = manager.uavs["UAV_A"]
+        mission, flight = agents["Mission_Planning"], agents["Flight_Control"]
+        waypoints = mission.waypoint_data["waypoints"]
+        
+        # Put the UAV on the third leg (waypoints 3 -> 4) of the mission
+        navigation = agents["Navigation"]
+        navigation.latitude = (waypoints[2]["lat"] + waypoints[3]["lat"]) / 2
+        navigation.longitude = (waypoints[2]["lon"] + waypoints[3]["lon"]) / 2
+        await manager.route_engine.tick()
+        
+        data = (await mission.generate_telemetry()).data
+        assert data["waypoints"]["current_waypoint"] == 4
+        assert [wp["completed"] for wp in data["waypoints"]["waypoints"]] == [True] * 3 + [False] * 5
+        total = manager.route_engine.progress("UAV_A")["total_distance"] / 1000
+        assert data["progress"]["distance_traveled"] + data["progress"]["distance_remaining"] == pytest.approx(total)
+        
+        autopilot = (await flight.generate_telemetry()).data["autopilot"]
+        assert autopilot["waypoint_active"] == 4 and autopilot["total_waypoints"] == 8
+        assert autopilot["distance_to_target"] == pytest.approx(
+            haversine(navigation.latitude, navigation.longitude, waypoints[3]["lat"], waypoints[3]["lon"]))
+        assert abs(autopilot["cross_track_error"]) < 5.0
+        
+        await manager.remove_uav("UAV_A")
+        assert "UAV_A" not in manager.route_engine and len(manager.route_engine) == 0
@@ -0,0 +1,132 @@
+"""Tests for the batched EKF behind sensor fusion telemetry."""
+
+import numpy as np
+import pytest
+
+# Add src to path
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from src.agents import ekf
+from src.agents.fleet_engine import FleetStateEngine, SensorFusionFleetModel
+from src.agents.sensor_fusion_agent import SensorFusionAgent
+
+
+def _position_std(P: np.ndarray) -> np.ndarray:
+    """Horizontal position standard deviation of a covariance stack."""
+    return np.sqrt(P[:, 0, 0] + P[:, 1, 1])
+
+
+class TestSensorFusionEKF:
+    """Test suite for the sensor fusion EKF."""
+    
+    def test_batched_update_matches_single_filter(self):
+        """A stacked update should equal running each filter on its own."""
+        rng = np.random.default_rng(3)
+        x = rng.normal(0, 10, (5, ekf.STATE_SIZE))
+        P = ekf.initial_covariance(5) * rng.uniform(0.5, 2.0, (5, 1, 1))
+        gps = x[:, ekf.POSITION] + rng.normal(0, 3, (5, 3))
+        rows = np.array([0, 2, 4])
+        
+        batched_x, batched_P = x.copy(), P.copy()
+        ekf.predict(batched_x, batched_P, np.zeros((5, 3)), np.full(5, 0.1), 0.1)
+        nis = ekf.update_gps(batched_x, batched_P, rows, gps[rows], np.full(3, 2.0), np.full(3, 3.0))
+        
+        for i, row in enumerate(rows):
+            single_x, single_P = x[row:row + 1].copy(), P[row:row + 1].copy()
+            ekf.predict(single_x, single_P, np.zeros((1, 3)), np.array([0.1]), 0.1)
+            single = ekf.update_gps(single_x, single_P, np.array([0]), gps[row:row + 1],
+                                    np.array([2.0]), np.array([3.0]))
+            assert np.allclose(batched_x[row], single_x[0])
+            assert np.allclose(batched_P[row], single_P[0])
+            assert nis[i] == pytest.approx(single[0])
+        
+        # Rows without a fix only went through the predict
+        assert np.all(np.diagonal(batched_P[1], axis1=0, axis2=1) > np.diagonal(P[1], axis1=0, axis2=1))
+    
+    def test_scalar_filter_matches_batched(self):
+        """The pure-Python filter of standalone agents should equal the batched one."""
+        rng = np.random.default_rng(4)
+        root = rng.normal(0, 1, (4, ekf.STATE_SIZE, ekf.STATE_SIZE))
+        P = root @ root.transpose(0, 2, 1) + np.eye(ekf.STATE_SIZE)
+        x = rng.normal(0, 10, (4, ekf.STATE_SIZE))
+        x[:, ekf.YAW] %= 2 * np.pi
+        accel, gyro = rng.normal(0, 3, (4, 3)), rng.normal(0, 0.1, 4)
+        gps, field = rng.normal(0, 10, (4, 3)), rng.normal(0, 20, (4, 2))
+        rows = np.arange(4)
+        
+        scalar = [(x[i].tolist(), P[i].tolist()) for i in rows]
+        ekf.predict(x, P, accel, gyro, 0.05)
+        nis = np.column_stack([
+            ekf.update_gps(x, P, rows, gps, np.full(4, 2.0), np.full(4, 3.0)),
+            ekf.update_baro(x, P, rows, gps[:, 2] + 1.0),
+            ekf.update_mag(x, P, rows, field, 24.0)
+        ])
+        for i, (single_x, single_P) in enumerate(scalar):
+            ekf.predict_one(single_x, single_P, accel[i].tolist(), gyro[i], 0.05)
+            assert ekf.update_gps_one(single_x, single_P, gps[i].tolist(), 2.0, 3.0) == pytest.approx(nis[i, 0])
+            assert ekf.update_baro_one(single_x, single_P, gps[i, 2] + 1.0) == pytest.approx(nis[i, 1])
+            assert ekf.update_mag_one(single_x, single_P, field[i].tolist(), 24.0) == pytest.approx(nis[i, 2])
+            assert np.allclose(single_x, x[i]) and np.allclose(single_P, P[i])
+    
+    def test_filter_tracks_truth_and_diverges_without_aiding(self):
+        """Fused estimates follow the trajectory; faulted filters lose it, divergence fastest."""
+        model = SensorFusionFleetModel()
+        rng = np.random.default_rng(5)
+        state = np.zeros(100, dtype=model.dtype)
+        model.initialize(state, rng)
+        for _ in range(300):
+            model.step(state, 1 / 30, rng)
+        
+        error = np.linalg.norm(state["x"][:, ekf.POSITION] - state["true_position"], axis=1)
+        heading = np.abs((state["x"][:, ekf.YAW] - state["true_yaw"] + np.pi) % (2 * np.pi) - np.pi)
+        assert np.median(error) < 3.0 and np.median(np.degrees(heading)) < 2.0
+        assert np.mean(error < 3 * _position_std(state["P"]) + 1.0) > 0.9
+        
+        assert len(set(model.FAULT_BITS.values())) == len(model.FAULT_BITS)
+        state["faults"][:25] = model.FAULT_BITS["kalman_filter_divergence"]
+        state["faults"][25:50] = model.FAULT_BITS["fusion_algorithm_failure"]
+        before = _position_std(state["P"])
+        for _ in range(600):
+            model.step(state, 1 / 30, rng)
+        after = _position_std(state["P"])
+        
+        assert np.all(after[:50] > before[:50] * 3)
+        assert np.median(after[:25]) > 3 * np.median(after[25:50])
+        health = [model.to_dict(row)["sensor_health"]["kalman_filter_converged"] for row in state]
+        assert not any(health[:50]) and all(health[50:])
+        
+        # Fault-free filters stay consistent: horizontal errors within 3 sigma
+        # and GPS innovations averaging their 3 degrees of freedom
+        horizontal = np.linalg.norm(state["x"][50:, :2] - state["true_position"][50:, :2], axis=1)
+        assert np.all(horizontal < 3 * after[50:])
+        assert 2.0 < np.mean(state["nis"][50:]) < 4.0
+    
+    @pytest.mark.asyncio
+    async def test_agent_fault_reaches_fleet_filter(self):
+        """Faults injected into the agent cut its fleet row off from aiding."""
+        engine = FleetStateEngine(seed=2)
+        agents = [SensorFusionAgent(f"UAV_{i:03d}") for i in range(20)]
+        await agents[0].inject_fault({"type": "kalman_filter_divergence"})
+        for agent in agents:
+            await engine.attach(agent)
+        
+        group = engine.groups["Sensor_Fusion"]
+        for _ in range(600):
+            group.step()
+        
+        faulted = group.materialize("UAV_000").data
+        healthy = group.materialize("UAV_001").data
+        assert faulted["sensor_health"]["kalman_filter_converged"] is False
+        assert faulted["fusion_output"]["uncertainty"]["position"] > 10.0
+        assert healthy["fusion_output"]["uncertainty"]["position"] < faulted["fusion_output"]["uncertainty"]["position"]
+        
+        await agents[0].clear_fault()
+        assert group.row("UAV_000")["faults"] == 0
+        for _ in range(300):
+            group.step()
+        assert group.materialize("UAV_000").data["fusion_output"]["uncertainty"]["position"] < 10.0
+        
+        standalone = await SensorFusionAgent("UAV_X").generate_telemetry()
+        assert set(standalone.data) == set(healthy)
@@ -0,0 +1,81 @@
+"""Tests for multi-process fleet sharding."""
+
+import asyncio
+import pytest
+
+# Add src to path
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from src.agents.sharding import ShardedFleet, shard_for
+
+
+class TestSharding:
+    """Test suite for ShardedFleet."""
+    
+    def test_shard_assignment_is_stable_and_spread(self):
+        """UAVs should map to the same shard every time, spread over all shards."""
+        uav_ids = [f"UAV_{i:03d}" for i in range(200)]
+        assignment = [shard_for(uav_id, 4) for uav_id in uav_ids]
+        
+        assert assignment == [shard_for(uav_id, 4) for uav_id in uav_ids]
+        assert all(assignment.count(shard) > 20 for shard in range(4))
+    
+    @pytest.mark.asyncio
+    async def test_fleet_runs_across_processes(self):
+        """Shards should simulate their UAVs and stream scored telemetry back."""
+        fleet = ShardedFleet(shards=2)
+        received = []
+        
+        async def collect(telemetry_data):
+            received.append(telemetry_data)
+        
+        fleet.register_telemetry_callback(collect)
+        await fleet.start()
+        try:
+            uav_ids = [f"UAV_{i:03d}" for i in range(6)]
+            added = await fleet.add_uavs(uav_ids + ["UAV_000"], ["Power"])
+            assert sorted(added) == uav_ids
+            assert fleet.get_uav_count() == 6
+            assert len({snapshot["pid"] for snapshot in fleet._status}) == 2
+            
+            await fleet.inject_fault("UAV_004", "Power", {"type": "voltage_drop", "drop_factor": 0.5})
+            await asyncio.sleep(1.0)
+            await fleet.refresh_status()
+            assert fleet.get_uav_status("UAV_004")["Power"]["fault_active"]
+            assert len(await fleet.get_telemetry("UAV_004", "Power", count=2)) == 2
+        finally:
+            await fleet.stop()
+        
+        assert {record.uav_id for record in received} == set(uav_ids)
+        assert fleet.get_statistics()["telemetry_received"] == len(received)
+        assert fleet.get_statistics()["shards_lost"] == 0
+    
+    @pytest.mark.asyncio
+    async def test_slow_consumer_and_lost_shard_stay_bounded(self):
+        """Batches beyond the queue size are dropped, and a dead shard leaves no pending request."""
+        fleet = ShardedFleet(shards=1)
+        fleet.event_queue_size = 2
+        gate = asyncio.Event()
+        
+        async def stuck(telemetry_data):
+            await gate.wait()
+        
+        fleet.register_telemetry_callback(stuck)
+        await fleet.start()
+        try:
+            await fleet.add_uavs(["UAV_000", "UAV_001"], ["Power"])
+            await asyncio.sleep(1.0)
+            assert fleet.get_statistics()["pending_batches"] <= 2
+            assert fleet.get_statistics()["batches_dropped"] > 0
+            
+            fleet._processes[0].kill()
+            fleet._processes[0].join()
+            with pytest.raises(RuntimeError):
+                await fleet.get_telemetry("UAV_000", "Power")
+            assert fleet._pending == {}
+            assert fleet.get_statistics()["shards_lost"] == 1
+        finally:
+            gate.set()
+            await fleet.stop()
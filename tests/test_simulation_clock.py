@@ -0,0 +1,101 @@
+"""Tests for simulation clocks and deterministic replays."""
+
+import pytest
+import asyncio
+import hashlib
+import time
+from datetime import datetime
+
+# Add src to path
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from src.agents.telemetry_manager import TelemetryManager
+from src.fault_injection.fault_manager import FaultManager
+from src.utils.clock import SimulationClock, VirtualClock, VIRTUAL_EPOCH, run_virtual, set_clock
+from src.utils.config import config
+
+
+def _run_mission(seed: int, duration: float) -> str:
+    """Run a short virtual-time mission and hash its telemetry stream."""
+    config.set("system.seed", seed)
+    digest = hashlib.sha256()
+    
+    async def mission():
+        clock = VirtualClock()
+        set_clock(clock)
+        manager = TelemetryManager(clock=clock)
+        
+        async def on_telemetry(telemetry):
+            digest.update(telemetry.model_dump_json().encode())
+        
+        manager.register_telemetry_callback(on_telemetry)
+        for i in range(3):
+            await manager.add_uav(f"UAV_{i:03d}")
+        await manager.start()
+        await clock.sleep(duration)
+        await manager.stop()
+    
+    try:
+        run_virtual(mission())
+    finally:
+        config.set("system.seed", None)
+        set_clock(None)
+    
+    return digest.hexdigest()
+
+
+class TestSimulationClock:
+    """Test suite for simulation clocks."""
+    
+    def test_virtual_time_runs_faster_than_real_time(self):
+        """An hour of virtual sleeps should finish almost instantly."""
+        clock = VirtualClock()
+        
+        async def sleeper():
+            for _ in range(3600):
+                await clock.sleep(1.0)
+            return clock.now()
+        
+        started = time.perf_counter()
+        end = run_virtual(sleeper())
+        
+        assert end == datetime(2024, 1, 1, 1, 0, 0)
+        assert time.perf_counter() - started < 5.0
+    
+    @pytest.mark.asyncio
+    async def test_simulation_speed_scales_wall_clock(self):
+        """Simulated time should run at the configured speed."""
+        clock = SimulationClock(speed=20.0, start=VIRTUAL_EPOCH)
+        clock.time()
+        
+        await clock.sleep(4.0)
+        
+        assert clock.time() == pytest.approx(4.0, abs=0.5)
+    
+    def test_same_seed_gives_identical_telemetry(self):
+        """Identical seeds should produce byte-identical telemetry streams."""
+        first = _run_mission(seed=11, duration=20.0)
+        second = _run_mission(seed=11, duration=20.0)
+        other = _run_mission(seed=12, duration=20.0)
+        
+        assert first == second
+        assert first != other
+    
+    def test_fault_expiry_follows_simulated_time(self):
+        """Faults should expire after their simulated duration."""
+        async def scenario():
+            clock = VirtualClock()
+            manager = FaultManager(clock=clock)
+            await manager.inject_fault("UAV_001", "Power", "battery_failure", duration=30)
+            
+            await clock.sleep(29.0)
+            await manager._check_expired_faults()
+            active_before = len(manager.get_active_faults())
+            
+            await clock.sleep(2.0)
+            await manager._check_expired_faults()
+            return active_before, len(manager.get_active_faults())
+        
+        assert run_virtual(scenario()) == (1, 0)
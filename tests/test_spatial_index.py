@@ -0,0 +1,94 @@
+"""Tests for the fleet spatial index and collision avoidance wiring."""
+
+import math
+import numpy as np
+import pytest
+
+# Add src to path
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from src.agents.spatial_index import FleetSpatialIndex, METERS_PER_DEGREE
+from src.agents.telemetry_manager import TelemetryManager
+
+
+def _brute_force(index: FleetSpatialIndex) -> np.ndarray:
+    """All-pairs distances over the index's projected positions."""
+    xyz = index._xyz
+    distances = np.linalg.norm(xyz[:, None, :] - xyz[None, :, :], axis=2)
+    np.fill_diagonal(distances, np.inf)
+    return distances
+
+
+class TestFleetSpatialIndex:
+    """Test suite for FleetSpatialIndex."""
+    
+    def test_nearest_and_within_match_all_pairs(self):
+        """Grid answers should equal an all-pairs search."""
+        rng = np.random.default_rng(3)
+        n = 400
+        index = FleetSpatialIndex(cell_size=300.0)
+        uav_ids = [f"UAV_{i:03d}" for i in range(n)]
+        index.update(uav_ids, 34.05 + rng.uniform(-0.03, 0.03, n), -118.24 + rng.uniform(-0.03, 0.03, n),
+                     rng.uniform(100, 500, n), rng.uniform(0, 360, n))
+        
+        distances = _brute_force(index)
+        for row, uav_id in enumerate(uav_ids):
+            nearest = index.nearest(uav_id)
+            closest = int(np.argmin(distances[row]))
+            if distances[row, closest] <= 300.0:
+                assert nearest["uav_id"] == uav_ids[closest]
+                assert nearest["distance"] == pytest.approx(distances[row, closest])
+            else:
+                assert nearest["uav_id"] is None and math.isinf(nearest["distance"])
+        
+        # Radius queries reach past one cell
+        expected = sorted(np.flatnonzero(distances[7] <= 800.0), key=lambda other: distances[7, other])
+        assert [neighbor["uav_id"] for neighbor in index.within("UAV_007", 800.0)] == [
+            uav_ids[other] for other in expected
+        ]
+        pairs = index.pairs_within(150.0)
+        assert len(pairs) == int(np.triu(distances <= 150.0, 1).sum())
+        assert all(distance <= 150.0 for _, _, distance in pairs)
+        assert index.nearest("UAV_999") is None
+    
+    def test_bearing_and_vertical_offset(self):
+        """Neighbors should be described relative to the querying UAV."""
+        index = FleetSpatialIndex(cell_size=500.0)
+        east = 100 / (METERS_PER_DEGREE * math.cos(math.radians(34.0)))
+        index.update(["A", "B", "C"], [34.0, 34.0, 34.1], [-118.0, -118.0 + east, -118.0],
+                     [200.0, 250.0, 200.0], [90.0, 0.0, 0.0])
+        
+        nearest = index.nearest("A")
+        assert nearest["uav_id"] == "B"
+        assert nearest["bearing"] == pytest.approx(90.0, abs=0.5)
+        assert nearest["vertical_offset"] == pytest.approx(50.0)
+        assert nearest["distance"] == pytest.approx(math.hypot(100, 50), rel=1e-2)
+        assert nearest["heading"] == 90.0
+        assert index.nearest("C")["uav_id"] is None
+    
+    @pytest.mark.asyncio
+    async def test_collision_avoidance_uses_fleet_positions(self):
+        """Safety agents should report the nearest UAV from Navigation positions."""
+        manager = TelemetryManager(use_scheduler=False, use_bus=False, use_spatial_index=True)
+        await manager.add_uavs(["UAV_A", "UAV_B", "UAV_C"], subsystems=["Navigation", "Safety_Systems"])
+        
+        navigation = {uav_id: agents["Navigation"] for uav_id, agents in manager.uavs.items()}
+        for uav_id, north in (("UAV_A", 0.0), ("UAV_B", 60.0), ("UAV_C", 5000.0)):
+            agent = navigation[uav_id]
+            agent.latitude, agent.longitude = 34.0 + north / METERS_PER_DEGREE, -118.0
+            agent.altitude, agent.heading = 300.0, 0.0
+        await manager.spatial_index.tick()
+        
+        safety = manager.uavs["UAV_A"]["Safety_Systems"]
+        safety.collision_avoidance["detection_range"] = 200.0
+        data = (await safety.generate_telemetry()).data["collision_avoidance"]
+        assert data["obstacle_detected"] is True
+        assert data["obstacle_distance"] == pytest.approx(60.0)
+        assert data["obstacle_direction"] == pytest.approx(0.0, abs=1e-6)
+        assert data["avoidance_maneuver"] == "turn_left"
+        
+        far = manager.uavs["UAV_C"]["Safety_Systems"]
+        assert (await far.generate_telemetry()).data["collision_avoidance"]["obstacle_detected"] is False
+        assert manager.get_spatial_index_statistics()["uavs"] == 3
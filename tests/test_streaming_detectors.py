@@ -0,0 +1,73 @@
+"""Tests for streaming anomaly detectors."""
+
+import pytest
+import numpy as np
+
+# Add src to path
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from src.anomaly.streaming import STREAMING_ALGORITHMS, HalfSpaceTrees
+from src.anomaly.anomaly_detector import AnomalyDetector
+from src.agents.sensor_fusion_agent import SensorFusionAgent
+
+
+class TestStreamingDetectors:
+    """Test suite for streaming detectors."""
+    
+    @pytest.mark.parametrize("algorithm", sorted(STREAMING_ALGORITHMS))
+    def test_spike_scores_above_normal_samples(self, algorithm):
+        """A large spike should score higher than typical samples."""
+        rng = np.random.default_rng(7)
+        detector = STREAMING_ALGORITHMS[algorithm]()
+        detector.score_learn(rng.normal(size=(1000, 4)))
+        
+        normal = detector.score_learn(rng.normal(size=(200, 4)))
+        spike = detector.score_learn(np.array([[0.0, 0.0, 10.0, 0.0]]))[0]
+        
+        assert np.all((normal >= 0) & (normal <= 1))
+        assert spike > 0.8
+        assert spike > np.quantile(normal, 0.99)
+    
+    def test_half_space_trees_share_structure(self):
+        """Seeded detectors should share one read-only split structure."""
+        first, second = HalfSpaceTrees(seed=3), HalfSpaceTrees(seed=3)
+        first.score_learn(np.zeros((1, 5)))
+        second.score_learn(np.ones((1, 5)))
+        
+        assert first.split_values is second.split_values
+        assert not first.split_values.flags.writeable
+        assert first.latest_mass is not second.latest_mass
+    
+    def test_half_space_trees_learn_seed_batch_once(self):
+        """The batch seeding the normalization statistics should be counted once."""
+        rows = np.random.default_rng(8).normal(5.0, 2.0, (40, 3))
+        detector = HalfSpaceTrees(window=20)
+        detector.score_learn(rows[:30])
+        detector.score_learn(rows[30:])
+        
+        stats = detector._stats
+        assert stats.samples_seen == 40
+        assert np.allclose(stats.mean, rows.mean(axis=0))
+        assert np.allclose(stats.m2 / (stats.samples_seen - 1), rows.var(axis=0, ddof=1))
+        assert detector.reference_mass[:, 0].tolist() == [20] * detector.n_trees
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("algorithm", sorted(STREAMING_ALGORITHMS))
+    async def test_detector_scores_without_retraining(self, algorithm):
+        """Streaming algorithms should score straight away and never retrain."""
+        detector = AnomalyDetector()
+        detector.update_configuration({"algorithm": algorithm})
+        agent = SensorFusionAgent("UAV_001")
+        
+        for _ in range(300):
+            result = await detector.process_telemetry(await agent.generate_telemetry())
+        
+        stats = detector.get_statistics()
+        assert stats["model_retrains"] == 0
+        assert stats["retrain_queue_depth"] == 0
+        assert stats["total_predictions"] > 0
+        assert len(result.features) == 6
+        
+        await detector.stop()
@@ -0,0 +1,146 @@
+"""Tests for the bounded telemetry bus."""
+
+import pytest
+import asyncio
+import time
+
+# Add src to path
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from src.agents.telemetry_bus import TelemetryBus
+from src.agents.telemetry_manager import TelemetryManager
+
+
+class TestTelemetryBus:
+    """Test suite for the telemetry bus."""
+    
+    @pytest.mark.asyncio
+    async def test_slow_consumer_does_not_stall_producer(self):
+        """Publishing should not wait for a slow consumer; only it falls behind."""
+        bus = TelemetryBus(queue_size=100, overflow="drop_oldest", workers=1)
+        fast, slow = [], []
+        release = asyncio.Event()
+        
+        async def on_fast(item):
+            fast.append(item)
+        
+        async def on_slow(item):
+            await release.wait()
+            slow.append(item)
+        
+        bus.subscribe("fast", on_fast)
+        bus.subscribe("slow", on_slow)
+        await bus.start()
+        
+        started = time.perf_counter()
+        for i in range(50):
+            await bus.publish(i)
+        elapsed = time.perf_counter() - started
+        await asyncio.sleep(0.01)
+        
+        stats = bus.get_statistics()
+        assert elapsed < 0.05
+        assert fast == list(range(50))
+        assert stats["consumers"]["slow"]["lag"] == 50
+        assert stats["consumers"]["fast"]["lag"] == 0
+        assert bus.lagging_consumers() == ["slow"]
+        
+        release.set()
+        await bus.stop()
+        assert slow == list(range(50))
+    
+    @pytest.mark.asyncio
+    async def test_drop_oldest_keeps_latest_items(self):
+        """A full drop_oldest queue should evict the oldest items and count them."""
+        bus = TelemetryBus(queue_size=10, overflow="drop_oldest")
+        received = []
+        
+        async def on_item(item):
+            received.append(item)
+        
+        bus.subscribe("consumer", on_item)
+        for i in range(25):
+            await bus.publish(i)
+        await bus.start()
+        await bus.stop()
+        
+        assert received == list(range(15, 25))
+        assert bus.get_statistics()["consumers"]["consumer"]["dropped"] == 15
+    
+    @pytest.mark.asyncio
+    async def test_block_applies_backpressure(self):
+        """A full block queue should hold the producer until the consumer catches up."""
+        bus = TelemetryBus(queue_size=2, overflow="block")
+        received = []
+        
+        async def on_item(item):
+            await asyncio.sleep(0.001)
+            received.append(item)
+        
+        bus.subscribe("consumer", on_item)
+        await bus.start()
+        for i in range(20):
+            await bus.publish(i)
+            assert bus.subscriptions["consumer"].lag <= 3
+        await bus.stop()
+        
+        stats = bus.get_statistics()["consumers"]["consumer"]
+        assert received == list(range(20))
+        assert stats["dropped"] == 0
+        assert stats["blocked_publishes"] > 0
+    
+    @pytest.mark.asyncio
+    async def test_stuck_consumer_does_not_hang_stop(self):
+        """A draining stop should give up on a stuck consumer after the drain timeout."""
+        bus = TelemetryBus(queue_size=10, drain_timeout=0.1)
+        received = []
+        
+        async def on_fast(item):
+            received.append(item)
+        
+        bus.subscribe("fast", on_fast)
+        bus.subscribe("stuck", lambda item: asyncio.Event().wait())
+        await bus.start()
+        for i in range(5):
+            await bus.publish(i)
+        
+        await asyncio.wait_for(bus.stop(), 2.0)
+        
+        stats = bus.get_statistics()["consumers"]
+        assert received == list(range(5))
+        assert stats["stuck"]["dropped"] == 5 and stats["stuck"]["lag"] == 0
+    
+    @pytest.mark.asyncio
+    async def test_sample_thins_stream_under_pressure(self):
+        """A sample consumer should keep every Nth item once half full."""
+        bus = TelemetryBus(queue_size=8, overflow="sample", sample_every=4)
+        bus.subscribe("consumer", lambda item: asyncio.sleep(0))
+        for i in range(20):
+            await bus.publish(i)
+        
+        stats = bus.get_statistics()["consumers"]["consumer"]
+        assert stats["sampled_out"] > 0
+        assert stats["published"] + stats["sampled_out"] == 20
+        assert stats["lag"] <= 8
+    
+    @pytest.mark.asyncio
+    async def test_manager_delivers_through_bus(self):
+        """Manager callbacks should receive telemetry via named bus consumers."""
+        manager = TelemetryManager(use_bus=True)
+        received = []
+        
+        async def on_telemetry(telemetry):
+            received.append(telemetry)
+        
+        manager.register_telemetry_callback(on_telemetry, name="recorder")
+        await manager.add_uav("UAV_001", ["Power"])
+        await manager.start()
+        await asyncio.sleep(0.3)
+        await manager.stop()
+        
+        stats = manager.get_bus_statistics()["consumers"]["recorder"]
+        assert received
+        assert stats["delivered"] == len(received)
+        assert stats["lag"] == 0
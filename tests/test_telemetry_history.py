@@ -0,0 +1,90 @@
+"""Tests for the per-agent telemetry history ring."""
+
+import pytest
+from datetime import datetime, timedelta
+
+# Add src to path
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from src.agents.history import TelemetryHistory
+from src.agents.navigation_agent import NavigationAgent
+from src.agents.power_agent import PowerAgent
+from src.agents.telemetry_manager import TelemetryManager
+from src.utils.clock import SimulationClock
+from src.utils.models import TelemetryRecord
+
+
+START = datetime(2024, 1, 1)
+
+
+def _record(second: int) -> TelemetryRecord:
+    """Build a record stamped the given number of seconds after START."""
+    return TelemetryRecord("Power", "UAV_001", {"second": second}, timestamp=START + timedelta(seconds=second))
+
+
+class TestTelemetryHistory:
+    """Test suite for TelemetryHistory."""
+    
+    def test_keeps_most_recent_records(self):
+        """A full ring should overwrite its oldest records in place."""
+        history = TelemetryHistory(5)
+        slots = history._slots
+        for second in range(12):
+            history.append(_record(second))
+        
+        assert len(history) == 5
+        assert history._slots is slots
+        assert [r.data["second"] for r in history] == [7, 8, 9, 10, 11]
+        assert [r.data["second"] for r in history.latest(3)] == [9, 10, 11]
+        assert history[-1].data["second"] == 11
+        assert history[0].data["second"] == 7
+    
+    def test_time_range_queries(self):
+        """Range queries should find records by timestamp across the wrap point."""
+        history = TelemetryHistory(10)
+        for second in range(25):
+            history.append(_record(second))
+        
+        def seconds(start, end):
+            return [r.data["second"] for r in history.between(start, end)]
+        
+        assert seconds(START + timedelta(seconds=18), START + timedelta(seconds=21)) == [18, 19, 20]
+        assert seconds(START + timedelta(seconds=23), None) == [23, 24]
+        assert seconds(None, START + timedelta(seconds=16)) == [15]
+        assert seconds(START, START + timedelta(seconds=5)) == []
+    
+    def test_resize_keeps_latest(self):
+        """Resizing should keep the most recent records in order."""
+        history = TelemetryHistory(4)
+        for second in range(6):
+            history.append(_record(second))
+        
+        history.resize(2)
+        history.append(_record(6))
+        
+        assert [r.data["second"] for r in history] == [5, 6]
+    
+    def test_depth_comes_from_subsystem_config(self):
+        """Agents should size their history from the subsystem configuration."""
+        assert NavigationAgent("UAV_001").telemetry_history.capacity == 600
+        assert PowerAgent("UAV_001").telemetry_history.capacity == 100
+    
+    @pytest.mark.asyncio
+    async def test_manager_serves_time_range(self):
+        """The manager should answer lookbacks from agent histories."""
+        clock = SimulationClock(speed=1000.0)
+        manager = TelemetryManager(clock=clock)
+        await manager.add_uav("UAV_001", ["Power"])
+        agent = manager.uavs["UAV_001"]["Power"]
+        for _ in range(50):
+            await agent.tick()
+            await clock.sleep(1.0)
+        
+        cutoff = agent.telemetry_history[-1].timestamp - timedelta(seconds=20)
+        recent = await manager.get_telemetry("UAV_001", start=cutoff)
+        
+        assert len(await manager.get_telemetry("UAV_001")) == 10
+        assert recent == [record for record in agent.telemetry_history if record.timestamp >= cutoff]
+        assert 0 < len(recent) < 50
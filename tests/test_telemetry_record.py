@@ -0,0 +1,57 @@
+"""Tests for the lightweight telemetry record."""
+
+import pytest
+
+# Add src to path
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from src.agents.power_agent import PowerAgent
+from src.utils.models import TelemetryData, TelemetryRecord, SystemStatus, to_telemetry_model
+
+
+class TestTelemetryRecord:
+    """Test suite for TelemetryRecord."""
+    
+    @pytest.mark.asyncio
+    async def test_agents_emit_records(self):
+        """Agents should emit unvalidated records on the hot path."""
+        telemetry = await PowerAgent("UAV_001").generate_telemetry()
+        
+        assert isinstance(telemetry, TelemetryRecord)
+        assert not hasattr(telemetry, "__dict__")
+        assert telemetry.status == SystemStatus.NOMINAL
+    
+    @pytest.mark.asyncio
+    async def test_model_round_trip(self):
+        """Converting to the Pydantic model and back should keep every field."""
+        record = await PowerAgent("UAV_001").generate_telemetry()
+        record.anomaly_score = 0.25
+        
+        model = record.to_model()
+        
+        assert isinstance(model, TelemetryData)
+        assert TelemetryRecord.from_model(model) == record
+        assert record.model_dump_json() == model.model_dump_json()
+    
+    @pytest.mark.asyncio
+    async def test_deep_copy_isolates_payload(self):
+        """A deep copy should not share nested payload dicts."""
+        record = await PowerAgent("UAV_001").generate_telemetry()
+        shallow = record.model_copy()
+        deep = record.model_copy(deep=True)
+        
+        deep.data["battery"]["voltage"] = -1.0
+        
+        assert shallow.data is record.data
+        assert record.data["battery"]["voltage"] != -1.0
+    
+    def test_boundary_conversion_validates(self):
+        """Records should only be validated when converted at a boundary."""
+        record = TelemetryRecord("Power", "UAV_001", data=None)
+        model = TelemetryData(subsystem="Power", uav_id="UAV_001", data={})
+        
+        with pytest.raises(ValueError):
+            to_telemetry_model(record)
+        assert to_telemetry_model(model) is model
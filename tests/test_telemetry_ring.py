@@ -0,0 +1,99 @@
+"""Tests for the shared-memory telemetry ring."""
+
+import subprocess
+import numpy as np
+import pytest
+
+# Add src to path
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from src.monitoring.telemetry_ring import TelemetryRing
+from src.utils.models import SystemStatus, TelemetryRecord
+
+
+def _record(uav_id: str, voltage: float, anomaly_score=None) -> TelemetryRecord:
+    data = {"battery": {"voltage": voltage, "current": 2.0, "state_of_charge": 0.8}}
+    return TelemetryRecord("Power", uav_id, data, anomaly_score=anomaly_score)
+
+
+@pytest.fixture
+def ring():
+    ring = TelemetryRing.create(capacity=8)
+    yield ring
+    ring.close()
+
+
+class TestTelemetryRing:
+    """Test suite for TelemetryRing."""
+    
+    def test_records_round_trip(self, ring):
+        """Written records should read back as fixed-width rows with named features."""
+        ring.write(_record("UAV_001", 22.5, anomaly_score=0.25))
+        ring.write(TelemetryRecord("Navigation", "UAV_002", {"position": {"altitude": 120.0}},
+                                   status=SystemStatus.WARNING))
+        
+        records, cursor = ring.read()
+        
+        assert cursor == 2
+        assert records["uav_id"].tolist() == [b"UAV_001", b"UAV_002"]
+        assert ring.feature(records, "battery_voltage")[0] == pytest.approx(22.5)
+        assert np.isnan(ring.feature(records, "battery_voltage")[1])
+        assert ring.feature(records, "altitude")[1] == pytest.approx(120.0)
+        
+        points = ring.as_dicts(records)
+        assert points[0]["anomaly_score"] == pytest.approx(0.25)
+        assert points[1]["anomaly_score"] is None
+        assert points[1]["status"] == "warning"
+    
+    def test_wraparound_and_cursors(self, ring):
+        """Readers should get only retained, intact records past their cursor."""
+        ring.write_many(_record("UAV_001", float(i)) for i in range(20))
+        
+        records, cursor = ring.read()
+        assert records["sequence"].tolist() == list(range(13, 21))
+        assert ring.feature(records, "battery_voltage").tolist() == list(range(12, 20))
+        
+        ring.write_many(_record("UAV_001", float(i)) for i in range(3))
+        assert len(ring.read(cursor)[0]) == 3
+        assert len(ring.latest(5)) == 5
+        
+        # A slot the writer is rewriting is skipped rather than returned torn
+        ring.records["sequence"][ring.head % ring.capacity] = 0
+        assert len(ring.read()[0]) == 7
+    
+    def test_schema_read_waits_for_writer(self, ring):
+        """Readers should keep the last schema while the writer rewrites the block."""
+        reader = TelemetryRing.attach(ring.name)
+        try:
+            ring.write(_record("UAV_001", 22.5))
+            assert reader.columns("Power")[0] == "battery_voltage"
+            
+            # An odd version marks the block as mid-rewrite
+            ring.write(TelemetryRecord("Navigation", "UAV_002", {"position": {"altitude": 120.0}}))
+            ring._header["schema_version"] += 1
+            assert reader.columns("Navigation") == ()
+            ring._header["schema_version"] += 1
+            assert "altitude" in reader.columns("Navigation")
+        finally:
+            reader.close()
+    
+    def test_reader_in_another_process(self, ring):
+        """Another process should read the ring by name without any serialization."""
+        ring.write_many(_record(f"UAV_{i:03d}", 20.0 + i) for i in range(5))
+        
+        code = (
+            "from src.monitoring.telemetry_ring import TelemetryRing\n"
+            f"ring = TelemetryRing.attach({ring.name!r})\n"
+            "records = ring.latest(10)\n"
+            "print(len(records), ring.feature(records, 'battery_voltage').sum())\n"
+            "ring.close()\n"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code], cwd=Path(__file__).parent.parent,
+            capture_output=True, text=True, check=True
+        ).stdout.split()
+        
+        assert output == ["5", "110.0"]
+        assert len(ring.read()[0]) == 5  # The reader left the segment in place